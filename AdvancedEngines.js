@@ -843,11 +843,32 @@ window.AccuracyTracker = (() => {
 // ─────────────────────────────────────────────────────────────
 window.PositionProbabilityEngine = (() => {
 
+    // Exact distribution from the Monte Carlo position histogram (counts[k] = weight of P(k+1))
+    function fromCounts(entry) {
+        const counts = entry.positionCounts;
+        let total = 0;
+        for (let k = 0; k < counts.length; k++) total += counts[k];
+        const probs = Array.from(counts, c => total > 0 ? c / total : 0);
+        const mean = probs.reduce((s, p, i) => s + p * (i + 1), 0);
+        return {
+            driver: entry.driver,
+            positions: probs.map((p, i) => ({
+                position: i + 1,
+                probability: Math.round(p * 10000) / 100 // As percentage
+            })),
+            peak: entry.avgFinish,
+            spread: Math.sqrt(probs.reduce((s, p, i) => s + p * Math.pow(i + 1 - mean, 2), 0))
+        };
+    }
+
     function calculateDistribution(mcResults, sims) {
-        // mcResults: array of { driver, winProb, podiumProb, avgFinish, dnfProb }
+        // mcResults: array of { driver, winProb, podiumProb, avgFinish, dnfProb, positionCounts? }
         if (!mcResults || !mcResults.length) return [];
 
         const distributions = mcResults.map(entry => {
+            if (entry.positionCounts) return fromCounts(entry);
+
+            // No histogram: approximate from the summary probabilities
             const d = entry.driver;
             const avg = entry.avgFinish;
             const winP = entry.winProb / 100;
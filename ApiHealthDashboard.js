@@ -3,6 +3,8 @@
    API HEALTH DASHBOARD — ApiHealthDashboard.js
    Monitors connectivity, latency, error rates, and staleness for
    all external data sources. Renders a floating status widget.
+   Also hosts the opt-in sim profiler (PredictionsCenter.profiler):
+   a flame-style per-engine breakdown with JSON export.
    ═══════════════════════════════════════════════════════════════ */
 
 window.ApiHealthDashboard = (() => {
@@ -49,6 +51,7 @@ window.ApiHealthDashboard = (() => {
     let _widgetElement = null;
     let _expanded = false;
     let _updateTimer = null;
+    let _profileTimer = null;
 
     // ─────────────────────────────────────────────────────────────
     // HEALTH CHECK: Ping each API endpoint
@@ -138,6 +141,82 @@ window.ApiHealthDashboard = (() => {
         if (src) src.cacheHits++;
     }
 
+    // ─────────────────────────────────────────────────────────────
+    // SIM PROFILER — toggled from the widget; off by default
+    // ─────────────────────────────────────────────────────────────
+    function getProfiler() {
+        return typeof PredictionsCenter !== 'undefined' && PredictionsCenter.profiler ? PredictionsCenter.profiler : null;
+    }
+
+    function toggleProfiler() {
+        const p = getProfiler();
+        if (!p) return;
+        p.setEnabled(!p.enabled);
+        // Refresh the breakdown while it is collecting
+        clearInterval(_profileTimer);
+        _profileTimer = p.enabled ? setInterval(() => { if (_expanded) renderWidget(); }, 2000) : null;
+        renderWidget();
+    }
+
+    function resetProfiler() {
+        const p = getProfiler();
+        if (p) { p.reset(); renderWidget(); }
+    }
+
+    function exportProfile() {
+        const p = getProfiler();
+        if (!p) return;
+        const data = { exportDate: new Date().toISOString(), userAgent: navigator.userAgent, hardwareConcurrency: navigator.hardwareConcurrency, ...p.report() };
+        const blob = new Blob([JSON.stringify(data, null, 2)], { type: 'application/json' });
+        const link = document.createElement('a');
+        link.download = `F1_Sim_Profile_${new Date().toISOString().replace(/[:.]/g, '-')}.json`;
+        link.href = URL.createObjectURL(blob);
+        link.click();
+        setTimeout(() => URL.revokeObjectURL(link.href), 1000);
+    }
+
+    // One bar per engine, indented under its caller, width = share of all profiled time
+    function renderProfiler() {
+        const p = getProfiler();
+        if (!p) return '';
+        const btn = (label, fn, color) => `<button onclick="window.ApiHealthDashboard.${fn}()" style="padding:2px 6px;background:${color}15;color:${color};border:1px solid ${color}33;border-radius:4px;cursor:pointer;font-size:0.45rem">${label}</button>`;
+        let html = `<div style="padding:4px 8px;background:#ffffff04;border-radius:6px">
+            <div style="display:flex;align-items:center;gap:4px">
+                <span style="font-size:0.5rem;color:#ddd;font-weight:600">⏱ Sim profiler</span>
+                <span style="margin-left:auto;display:flex;gap:3px">
+                    ${btn(p.enabled ? '■ Stop' : '● Start', 'toggleProfiler', p.enabled ? '#f0883e' : '#3fb950')}
+                    ${btn('Reset', 'resetProfiler', '#888')}
+                    ${btn('JSON', 'exportProfile', '#58a6ff')}
+                </span>
+            </div>`;
+        const r = p.report();
+        if (!r.sims) {
+            html += `<div style="font-size:0.42rem;color:#555;margin-top:2px">${p.enabled ? 'Collecting — run a prediction' : 'Off — no overhead until started'}</div></div>`;
+            return html;
+        }
+        const total = r.tree.reduce((a, n) => a + n.ms, 0) || 1;
+        const colors = ['#e10600', '#f0883e', '#d29922', '#8b949e'];
+        html += `<div style="font-size:0.42rem;color:#888;margin:2px 0">${r.sims.toLocaleString()} sims · ${Math.round(total)} ms CPU` +
+            `${r.allocBytesPerSim !== null ? ` · ~${(r.allocBytesPerSim / 1024).toFixed(1)} KB/sim` : ''}` +
+            `${r.workers.utilization !== null ? ` · workers ${Math.round(r.workers.utilization * 100)}% busy (${r.workers.size})` : ''} · hot calls 1/${r.sampleEvery}</div>`;
+        const row = (n, depth) => {
+            if (!n.calls) return;
+            const pct = n.ms / total * 100;
+            const tip = `${n.name}: ${n.ms.toFixed(1)} ms (self ${n.selfMs.toFixed(1)}), ${n.calls.toLocaleString()} calls` +
+                (n.usPerSim !== null ? `, ${n.usPerSim.toFixed(1)} µs/sim, ${n.callsPerSim.toFixed(2)} calls/sim` : '');
+            html += `<div title="${tip}" style="margin-left:${depth * 8}px;display:flex;align-items:center;gap:4px;height:10px">
+                <div style="flex:1;min-width:0;position:relative;height:9px;background:#ffffff06;border-radius:2px;overflow:hidden">
+                    <div style="width:${Math.max(0.5, pct).toFixed(1)}%;height:100%;background:${colors[Math.min(depth, colors.length - 1)]}aa"></div>
+                    <span style="position:absolute;left:3px;top:0;font-size:0.4rem;line-height:9px;color:#ddd;white-space:nowrap">${n.name}</span>
+                </div>
+                <span style="font-size:0.4rem;color:#888;width:32px;text-align:right">${pct.toFixed(1)}%</span>
+            </div>`;
+            n.children.forEach(c => row(c, depth + 1));
+        };
+        r.tree.forEach(n => row(n, 0));
+        return html + '</div>';
+    }
+
     // ─────────────────────────────────────────────────────────────
     // TIME AGO HELPER
     // ─────────────────────────────────────────────────────────────
@@ -206,6 +285,15 @@ window.ApiHealthDashboard = (() => {
                     </div>
                 </div>`;
             });
+            if (window.HttpCache) {
+                const c = window.HttpCache.getStats();
+                const paused = c.hosts.filter(h => h.backoffMs > 0);
+                html += `<div style="font-size:0.45rem;color:#888;padding:2px 8px">
+                    🗄 Shared cache: ${Math.round(c.hitRate * 100)}% hits · ${c.requests} req · ${c.coalesced} joined · ${c.entries} entries (${(c.bytes / 1024).toFixed(0)} KB)${c.rateLimited ? ` · <span style="color:#f0883e">${c.rateLimited}× 429</span>` : ''}
+                    ${paused.length ? `<div style="color:#f0883e">⏸ ${paused.map(h => `${h.host} ${Math.ceil(h.backoffMs / 1000)}s`).join(', ')}</div>` : ''}
+                </div>`;
+            }
+            html += renderProfiler();
             html += `<button onclick="window.ApiHealthDashboard.checkAll()" style="padding:3px 8px;background:#58a6ff15;color:#58a6ff;border:1px solid #58a6ff33;border-radius:4px;cursor:pointer;font-size:0.5rem;font-family:'Orbitron',monospace;margin-top:2px">↻ Re-check All</button>`;
             html += '</div>';
         }
@@ -254,6 +342,9 @@ window.ApiHealthDashboard = (() => {
         recordSuccess,
         recordError,
         recordCacheHit,
+        toggleProfiler,
+        resetProfiler,
+        exportProfile,
         getSources: () => sources,
     };
 })();
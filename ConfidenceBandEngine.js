@@ -17,6 +17,44 @@ window.ConfidenceBandEngine = {
             band_99: [stats.mean - 3 * Math.sqrt(stats.variance), stats.mean + 3 * Math.sqrt(stats.variance)]
         };
     },
+    // Exact bands from a finishing-position histogram (counts[k] = weight of P(k+1))
+    // instead of per-sim samples; sims is the run size behind the counts.
+    calculateBandsFromCounts: function (counts, sims) {
+        let total = 0, sum = 0;
+        for (let k = 0; k < counts.length; k++) { total += counts[k]; sum += counts[k] * (k + 1); }
+        if (total === 0) return null;
+        let mean = sum / total;
+        let variance = 0;
+        for (let k = 0; k < counts.length; k++) variance += counts[k] * Math.pow(k + 1 - mean, 2);
+        variance /= total;
+        let sigma = Math.sqrt(variance);
+
+        // Smallest position P with P(finish <= P) >= q
+        let quantile = function (q) {
+            let acc = 0;
+            for (let k = 0; k < counts.length; k++) {
+                acc += counts[k];
+                if (acc >= q * total) return k + 1;
+            }
+            return counts.length;
+        };
+
+        let confidence_score = 1 - (sigma / 20);
+        if (confidence_score < 0) confidence_score = 0;
+
+        return {
+            mean_finish: mean,
+            sigma: sigma,
+            se: sigma / Math.sqrt(sims),
+            confidence_score: confidence_score,
+            band_68: [mean - sigma, mean + sigma],
+            band_95: [mean - 2 * sigma, mean + 2 * sigma],
+            band_99: [mean - 3 * sigma, mean + 3 * sigma],
+            quantile_50: quantile(0.5),
+            quantile_95: quantile(0.95),
+            quantile_99: quantile(0.99)
+        };
+    },
     calculateWinCI: function (p, N) {
         let margin = 1.96 * Math.sqrt((p * (1 - p)) / N);
         return [p - margin, p + margin];
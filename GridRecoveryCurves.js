@@ -11,6 +11,10 @@
    - Monza: P1 → P1 (45%), P5 → P1 (15%)        [easiest to overtake]
    
    Also learns from actual race data when available.
+
+   Transition matrices are cached per track; finishDistribution()
+   turns a grid-slot distribution and DNF odds into finishing-position
+   distributions (PredictionsCenter's analytic fast path).
    ═══════════════════════════════════════════════════════════════ */
 
 window.GridRecoveryCurves = (() => {
@@ -118,6 +122,69 @@ window.GridRecoveryCurves = (() => {
         };
     }
 
+    // ─────────────────────────────────────────────────────────────
+    // TRANSITION MATRICES
+    // Built once per track and grid size as a flat row-major Float64Array
+    // (T[i·n + j] = P(finish j+1 | start i+1)); recordResult() drops the
+    // track's entries so learned results are picked up on the next call.
+    // ─────────────────────────────────────────────────────────────
+    const LEARNED_WEIGHT = 0.3;      // same share getExpectedFinish gives learned data
+    const _matrices = new Map();     // `${trackId}:${gridSize}` → Float64Array
+
+    function _buildMatrix(trackId, n) {
+        const curve = BASE_CURVES[trackId] || BASE_CURVES.default;
+        const T = new Float64Array(n * n);
+        const sigma = (1 - curve.posRetention) * 3 + 1; // spread based on track difficulty
+        const gainPenalty = 1.0 + curve.alpha * 2;       // easier to lose positions than gain them
+
+        for (let i = 0; i < n; i++) {
+            let totalProb = 0;
+            for (let j = 0; j < n; j++) {
+                const distance = (j - i) * (j < i ? gainPenalty : 1.0);
+                const prob = Math.exp(-(distance ** 2) / (2 * sigma ** 2));
+                T[i * n + j] = prob;
+                totalProb += prob;
+            }
+            for (let j = 0; j < n; j++) T[i * n + j] /= totalProb;
+        }
+
+        // Blend in the observed gains/losses from nearby grid slots, once there are enough
+        const learned = _learnedData[trackId];
+        if (learned && learned.length >= 10) {
+            const seen = new Float64Array(n);
+            for (let i = 0; i < n; i++) {
+                seen.fill(0);
+                let count = 0;
+                learned.forEach(d => {
+                    if (Math.abs(d.gridPos - (i + 1)) > 2) return;
+                    seen[Math.max(0, Math.min(n - 1, i + d.finishPos - d.gridPos))]++;
+                    count++;
+                });
+                if (count < 3) continue;
+                for (let j = 0; j < n; j++) {
+                    T[i * n + j] = T[i * n + j] * (1 - LEARNED_WEIGHT) + LEARNED_WEIGHT * seen[j] / count;
+                }
+            }
+        }
+        return T;
+    }
+
+    /**
+     * Cached transition matrix for a track, flat row-major. Shared — do not modify.
+     * @param {string} trackId
+     * @param {number} gridSize - Number of cars (default 22)
+     * @returns {Float64Array} gridSize² probabilities, each row sums to 1
+     */
+    function getTransitionMatrixFlat(trackId, gridSize = 22) {
+        const key = `${trackId}:${gridSize}`;
+        let T = _matrices.get(key);
+        if (!T) {
+            T = _buildMatrix(trackId, gridSize);
+            _matrices.set(key, T);
+        }
+        return T;
+    }
+
     /**
      * Get position-to-position transition probability matrix for a track
      * Returns P(finish at position j | start at position i) for each i,j pair
@@ -126,34 +193,109 @@ window.GridRecoveryCurves = (() => {
      * @returns {Array<Array<number>>} 22x22 probability matrix
      */
     function getTransitionMatrix(trackId, gridSize = 22) {
-        const curve = BASE_CURVES[trackId] || BASE_CURVES.default;
+        const T = getTransitionMatrixFlat(trackId, gridSize);
         const matrix = [];
+        for (let i = 0; i < gridSize; i++) matrix.push(Array.from(T.subarray(i * gridSize, (i + 1) * gridSize)));
+        return matrix;
+    }
 
-        for (let startPos = 1; startPos <= gridSize; startPos++) {
-            const row = new Array(gridSize).fill(0);
-            const sigma = (1 - curve.posRetention) * 3 + 1; // spread based on track difficulty
+    function _invalidate(trackId) {
+        for (const key of _matrices.keys()) {
+            if (key.slice(0, key.lastIndexOf(':')) === trackId) _matrices.delete(key);
+        }
+    }
 
-            // Generate probability distribution around expected finish
-            let totalProb = 0;
-            for (let finishPos = 1; finishPos <= gridSize; finishPos++) {
-                const distance = finishPos - startPos;
+    // ─────────────────────────────────────────────────────────────
+    // ANALYTIC FINISH DISTRIBUTION
+    // ─────────────────────────────────────────────────────────────
 
-                // Skewed normal — easier to lose positions than gain them
-                const gainPenalty = distance < 0 ? 1.0 + curve.alpha * 2 : 1.0;
-                const prob = Math.exp(-((distance * gainPenalty) ** 2) / (2 * sigma ** 2));
-                row[finishPos - 1] = prob;
-                totalProb += prob;
+    /**
+     * Finishing-position distributions for independent drivers: each driver's grid
+     * slot is pushed through the track's transition matrix to a race rank, finishers
+     * are ordered by rank (ties split evenly) and retirements drop out. Position j for
+     * driver k needs exactly j-1 other finishers ranked ahead, a Poisson-binomial over
+     * the other drivers — O(n⁴), well under a millisecond at n = 22.
+     * Treating the other drivers' ranks as independent of each other is an
+     * approximation (win odds come out ~2% short in total), so the matrix is then
+     * balanced by iterative proportional fitting: each position j to P(at least j
+     * finishers), each driver to 1 - dnf[k].
+     * @param {Float64Array} grid - n × n, row k = P(driver k starts from slot i)
+     * @param {Float64Array} dnf - n, P(driver k retires)
+     * @param {string} trackId
+     * @returns {Float64Array} n × n, row k = P(driver k is classified in position j); rows sum to 1 - dnf[k]
+     */
+    function finishDistribution(grid, dnf, trackId) {
+        const n = dnf.length, T = getTransitionMatrixFlat(trackId, n);
+
+        // rank[k·n + j] = Σ_i grid[k·n + i] · T[i·n + j]
+        const rank = new Float64Array(n * n);
+        for (let k = 0; k < n; k++) {
+            for (let i = 0; i < n; i++) {
+                const q = grid[k * n + i];
+                if (!q) continue;
+                for (let j = 0; j < n; j++) rank[k * n + j] += q * T[i * n + j];
             }
+        }
 
-            // Normalize to sum to 1
-            for (let j = 0; j < gridSize; j++) {
-                row[j] = totalProb > 0 ? row[j] / totalProb : 1 / gridSize;
+        // ahead[m·n + j] = P(driver m finishes and is ranked ahead of a driver on rank j)
+        const ahead = new Float64Array(n * n);
+        for (let m = 0; m < n; m++) {
+            let cdf = 0;
+            for (let j = 0; j < n; j++) {
+                ahead[m * n + j] = (1 - dnf[m]) * (cdf + 0.5 * rank[m * n + j]);
+                cdf += rank[m * n + j];
             }
+        }
 
-            matrix.push(row);
+        const out = new Float64Array(n * n), pb = new Float64Array(n);
+        for (let k = 0; k < n; k++) {
+            for (let j = 0; j < n; j++) {
+                const w = rank[k * n + j] * (1 - dnf[k]);
+                if (w < 1e-12) continue;
+                pb.fill(0);
+                pb[0] = 1;
+                let len = 1;
+                for (let m = 0; m < n; m++) {
+                    if (m === k) continue;
+                    const p = ahead[m * n + j];
+                    for (let a = len; a > 0; a--) pb[a] = pb[a] * (1 - p) + pb[a - 1] * p;
+                    pb[0] *= 1 - p;
+                    len++;
+                }
+                for (let a = 0; a < n; a++) out[k * n + a] += w * pb[a];
+            }
         }
+        _balance(out, dnf);
+        return out;
+    }
 
-        return matrix;
+    const BALANCE_ITERATIONS = 20;
+
+    // Iterative proportional fitting of out (n × n) to row sums 1 - dnf[k] and column
+    // sums P(at least j + 1 finishers), the latter from the Poisson-binomial of finishers
+    function _balance(out, dnf) {
+        const n = dnf.length, count = new Float64Array(n + 1), col = new Float64Array(n);
+        count[0] = 1;
+        for (let m = 0; m < n; m++) {
+            const p = 1 - dnf[m];
+            for (let a = m + 1; a > 0; a--) count[a] = count[a] * (1 - p) + count[a - 1] * p;
+            count[0] *= 1 - p;
+        }
+        let atLeast = 0;
+        for (let j = n - 1; j >= 0; j--) { atLeast += count[j + 1]; col[j] = atLeast; }
+
+        for (let it = 0; it < BALANCE_ITERATIONS; it++) {
+            for (let j = 0; j < n; j++) {
+                let sum = 0;
+                for (let k = 0; k < n; k++) sum += out[k * n + j];
+                if (sum > 0) for (let k = 0; k < n; k++) out[k * n + j] *= col[j] / sum;
+            }
+            for (let k = 0; k < n; k++) {
+                let sum = 0;
+                for (let j = 0; j < n; j++) sum += out[k * n + j];
+                if (sum > 0) for (let j = 0; j < n; j++) out[k * n + j] *= (1 - dnf[k]) / sum;
+            }
+        }
     }
 
     /**
@@ -194,6 +336,7 @@ window.GridRecoveryCurves = (() => {
         if (_learnedData[trackId].length > 100) {
             _learnedData[trackId] = _learnedData[trackId].slice(-100);
         }
+        _invalidate(trackId);
         save();
     }
 
@@ -229,6 +372,8 @@ window.GridRecoveryCurves = (() => {
     return {
         getExpectedFinish,
         getTransitionMatrix,
+        getTransitionMatrixFlat,
+        finishDistribution,
         getGridImportance,
         getNonLinearGridPenalty,
         recordResult,
@@ -1,16 +1,30 @@
 'use strict';
 /* ═══════════════════════════════════════════════════════════════
    HISTORICAL DATA SEEDER — HistoricalDataSeeder.js
-   Fetches real F1 2023-2025 race results from the Jolpica API
-   (Ergast successor) and seeds all advanced engines with
+   Fetches real F1 race results (2023 onwards by default) from the
+   Jolpica API (Ergast successor) and seeds all advanced engines with
    real performance data, turning predictions from "speculative"
    into "data-driven".
+
+   Storage: one IndexedDB record per season in columnar form (see
+   COLUMNAR SEASON RECORDS). Seasons are fetched in parallel, page by
+   page; finished seasons are immutable and never refetched, the
+   in-progress season is topped up from the last stored result row.
+   Seeded engine state is kept alongside, so a re-seed restores it
+   and only replays rounds it has not seen. The in-progress season
+   feeds the summaries only: its rounds reach the engines through the
+   app's own results, which are replayed on top after seeding.
    ═══════════════════════════════════════════════════════════════ */
 
 window.HistoricalDataSeeder = (() => {
     const API_BASE = 'https://api.jolpi.ca/ergast/f1';
-    const SEASONS = [2023, 2024, 2025];
-    const CACHE_KEY = 'f1_historical_seeded_v3';
+    const FIRST_SEASON = 2023;          // default start; seed() can go further back
+    const LAST_SEASON = new Date().getFullYear(); // the season in progress
+    const PAGE_SIZE = 100;              // Jolpica's maximum `limit`
+    const PAGE_RETRIES = 3;             // per page, on 429/503
+    const CURRENT_TTL = 6 * 3600 * 1000; // in-progress season top-up interval
+    const DB_NAME = 'f1_2026_history';
+    const LEGACY_CACHE_KEY = 'f1_historical_seeded_v3';
     const SEASON_WEIGHTS = { 2023: 0.2, 2024: 0.35, 2025: 0.45 };
 
     // ═══ Ergast driverId → our app driverId ═══
@@ -56,18 +70,51 @@ window.HistoricalDataSeeder = (() => {
         'mclaren': 'mclaren', 'aston_martin': 'aston_martin', 'alpine': 'alpine',
         'williams': 'williams', 'haas': 'haas',
         'alphatauri': 'racing_bulls', 'rb': 'racing_bulls', 'racing_bulls': 'racing_bulls',
-        'alfa': 'audi', 'sauber': 'audi', 'kick_sauber': 'audi'
+        'alfa': 'audi', 'sauber': 'audi', 'kick_sauber': 'audi',
+        // Earlier names of the same entries, for seasons before 2023
+        'toro_rosso': 'racing_bulls', 'renault': 'alpine', 'racing_point': 'aston_martin',
+        'force_india': 'aston_martin'
     };
 
     let _status = { loaded: false, loading: false, error: null, seasons: {}, totalRaces: 0, timestamp: null };
+    let _summaries = null; // { driverSummary, teamSummary } of the last seed / warm start
+
+    // ═══ FETCH SEASONS — paginated, pages in parallel ═══
+    function pageUrl(year, offset) {
+        return `${API_BASE}/${year}/results.json?limit=${PAGE_SIZE}&offset=${offset}`;
+    }
+
+    async function fetchPage(year, offset, attempt = 0) {
+        // Finished seasons are kept in IndexedDB, so the shared cache only needs to
+        // cover re-seeds within the session
+        const res = await window.HttpCache.request(pageUrl(year, offset), { ttl: 60 * 60 * 1000, timeout: 20000 });
+        // Rate limited: HttpCache holds the host's queue until its backoff expires, so
+        // asking again simply waits that out instead of dropping the whole season
+        if (!res.ok && (res.status === 429 || res.status === 503) && attempt < PAGE_RETRIES) {
+            return fetchPage(year, offset, attempt + 1);
+        }
+        if (!res.ok) throw new Error(res.error || `HTTP ${res.status}`);
+        const mr = res.data?.MRData || {};
+        return { total: parseInt(mr.total, 10) || 0, races: mr.RaceTable?.Races || [] };
+    }
 
-    // ═══ FETCH & PROCESS SEASONS ═══
-    async function fetchSeason(year) {
+    // Every result row from `offset` on → { races, total } (races merged by round, since a
+    // page boundary can split one race's classification), or null if any page failed
+    async function fetchSeason(year, offset = 0) {
         try {
-            const res = await fetch(`${API_BASE}/${year}/results.json?limit=600`);
-            if (!res.ok) throw new Error(`HTTP ${res.status}`);
-            const data = await res.json();
-            return data?.MRData?.RaceTable?.Races || [];
+            const first = await fetchPage(year, offset);
+            const rest = [];
+            for (let o = offset + PAGE_SIZE; o < first.total; o += PAGE_SIZE) rest.push(fetchPage(year, o));
+            const pages = [first, ...await Promise.all(rest)];
+
+            const byRound = new Map();
+            pages.forEach(p => p.races.forEach(race => {
+                const prev = byRound.get(race.round);
+                if (prev) prev.Results = prev.Results.concat(race.Results || []);
+                else byRound.set(race.round, { ...race, Results: (race.Results || []).slice() });
+            }));
+            const races = [...byRound.values()].sort((a, b) => parseInt(a.round, 10) - parseInt(b.round, 10));
+            return { races, total: Math.max(first.total, offset) };
         } catch (e) {
             console.warn(`[HistoricalSeeder] Failed to fetch ${year}:`, e.message);
             return null;
@@ -75,48 +122,173 @@ window.HistoricalDataSeeder = (() => {
     }
 
     function mapDriverId(ergastId) {
+        if (!ergastId) return null;
         return DRIVER_MAP[ergastId] || DRIVER_MAP[ergastId.toLowerCase()] || null;
     }
 
     function mapCircuitId(circuitId) {
+        if (!circuitId) return '';
         return CIRCUIT_MAP[circuitId] || CIRCUIT_MAP[circuitId.toLowerCase()] || circuitId.toLowerCase();
     }
 
     function mapTeamId(constructorId) {
+        if (!constructorId) return null;
         return TEAM_MAP[constructorId] || TEAM_MAP[constructorId.toLowerCase()] || null;
     }
 
-    // ═══ PROCESS RAW API RACES INTO STRUCTURED DATA ═══
-    function processRaces(races, year) {
-        const processed = [];
+    // ═══ COLUMNAR SEASON RECORDS ═══
+    // Race columns (round, results count, name, circuit, date) plus one row per classified
+    // car (driver, team, status as indices into per-season dictionaries; position, points).
+    // Ergast ids are stored as-is and mapped on decode, so DRIVER_MAP / TEAM_MAP edits
+    // apply to stored seasons without a refetch.
+    function emptySeason(year) {
+        return {
+            year, rows: 0, fetchedAt: 0, immutable: false,
+            drivers: [], teams: [], statuses: [],
+            round: new Uint8Array(0), size: new Uint8Array(0), names: [], circuits: [], dates: [],
+            driver: new Uint16Array(0), team: new Uint16Array(0), status: new Uint16Array(0),
+            position: new Uint8Array(0), points: new Float32Array(0)
+        };
+    }
+
+    function concat(a, values) {
+        const out = new a.constructor(a.length + values.length);
+        out.set(a);
+        out.set(values, a.length);
+        return out;
+    }
+
+    function intern(dict, index, value) {
+        const key = value || '';
+        let i = index.get(key);
+        if (i === undefined) { i = dict.length; dict.push(key); index.set(key, i); }
+        return i;
+    }
+
+    // New rounds from the API appended to a season record (rounds already stored are skipped)
+    function appendRaces(rec, races, total) {
+        const lastRound = rec.round.length ? rec.round[rec.round.length - 1] : 0;
+        const idx = dict => new Map(dict.map((v, i) => [v, i]));
+        const dIdx = idx(rec.drivers), tIdx = idx(rec.teams), sIdx = idx(rec.statuses);
+        const col = { round: [], size: [], driver: [], team: [], status: [], position: [], points: [] };
+
         races.forEach(race => {
-            const circuitId = race.Circuit?.circuitId;
-            const trackCity = mapCircuitId(circuitId);
-            const results = (race.Results || []).map(r => ({
-                driverId: mapDriverId(r.Driver?.driverId),
-                ergastDriverId: r.Driver?.driverId,
-                teamId: mapTeamId(r.Constructor?.constructorId),
-                position: parseInt(r.position, 10),
-                points: parseFloat(r.points || 0),
-                status: r.status,
-                finished: r.status === 'Finished' || (r.status || '').startsWith('+')
-            })).filter(r => r.driverId); // Only include mapped drivers
+            const round = parseInt(race.round, 10);
+            if (!(round > lastRound)) return;
+            const results = race.Results || [];
+            col.round.push(round);
+            col.size.push(results.length);
+            rec.names.push(race.raceName);
+            rec.circuits.push(race.Circuit?.circuitId || '');
+            rec.dates.push(race.date);
+            results.forEach(r => {
+                col.driver.push(intern(rec.drivers, dIdx, r.Driver?.driverId));
+                col.team.push(intern(rec.teams, tIdx, r.Constructor?.constructorId));
+                col.status.push(intern(rec.statuses, sIdx, r.status));
+                col.position.push(parseInt(r.position, 10) || 0);
+                col.points.push(parseFloat(r.points || 0));
+            });
+        });
+        Object.keys(col).forEach(k => { rec[k] = concat(rec[k], col[k]); });
+        rec.rows = total;
+        rec.fetchedAt = Date.now();
+        return rec;
+    }
 
+    // Season record → the race objects the seeding functions take (mapped drivers only,
+    // races with at least five of them)
+    function decodeSeason(rec) {
+        const processed = [];
+        let row = 0;
+        for (let k = 0; k < rec.round.length; k++) {
+            const results = [];
+            for (let end = row + rec.size[k]; row < end; row++) {
+                const ergastDriverId = rec.drivers[rec.driver[row]];
+                const driverId = mapDriverId(ergastDriverId);
+                if (!driverId) continue;
+                const status = rec.statuses[rec.status[row]];
+                results.push({
+                    driverId,
+                    ergastDriverId,
+                    teamId: mapTeamId(rec.teams[rec.team[row]]),
+                    position: rec.position[row],
+                    points: rec.points[row],
+                    status,
+                    finished: status === 'Finished' || status.startsWith('+')
+                });
+            }
             if (results.length >= 5) {
                 processed.push({
-                    year,
-                    round: parseInt(race.round, 10),
-                    name: race.raceName,
-                    trackCity,
-                    circuitId,
+                    year: rec.year,
+                    round: rec.round[k],
+                    name: rec.names[k],
+                    trackCity: mapCircuitId(rec.circuits[k]),
+                    circuitId: rec.circuits[k],
                     results,
-                    date: race.date
+                    date: rec.dates[k]
                 });
             }
-        });
+        }
         return processed;
     }
 
+    // ═══ INDEXEDDB STORE ═══
+    // 'seasons' (keyPath year) and 'meta' (keyPath key: the seeded engine snapshot).
+    // Every helper resolves — to null / nothing — when IndexedDB is unavailable.
+    let _db = null;
+    function openDb() {
+        if (_db) return _db;
+        _db = new Promise(resolve => {
+            if (typeof indexedDB === 'undefined') { resolve(null); return; }
+            try {
+                const req = indexedDB.open(DB_NAME, 1);
+                req.onupgradeneeded = () => {
+                    req.result.createObjectStore('seasons', { keyPath: 'year' });
+                    req.result.createObjectStore('meta', { keyPath: 'key' });
+                };
+                req.onsuccess = () => resolve(req.result);
+                req.onerror = () => resolve(null);
+                req.onblocked = () => resolve(null);
+            } catch (e) { resolve(null); }
+        });
+        return _db;
+    }
+
+    function dbRequest(db, store, mode, fn) {
+        return new Promise(resolve => {
+            if (!db) { resolve(null); return; }
+            try {
+                const req = fn(db.transaction(store, mode).objectStore(store));
+                req.onsuccess = () => resolve(req.result ?? null);
+                req.onerror = () => resolve(null);
+            } catch (e) { resolve(null); }
+        });
+    }
+
+    async function loadSeasons(db) {
+        const rows = await dbRequest(db, 'seasons', 'readonly', s => s.getAll());
+        return new Map((rows || []).map(r => [r.year, r]));
+    }
+
+    // ═══ SYNC SEASONS — only what is missing or still in progress ═══
+    async function syncSeasons(db, stored, years, forceRefresh) {
+        const thisYear = new Date().getFullYear();
+        const fetched = [];
+        await Promise.all(years.map(async year => {
+            const rec = stored.get(year);
+            if (rec && rec.immutable) return;
+            if (rec && !forceRefresh && Date.now() - rec.fetchedAt < CURRENT_TTL) return;
+            const res = await fetchSeason(year, rec ? rec.rows : 0);
+            if (!res) return;
+            const next = appendRaces(rec || emptySeason(year), res.races, res.total);
+            next.immutable = year < thisYear && next.round.length > 0; // season over: never changes again
+            stored.set(year, next);
+            fetched.push(year);
+            await dbRequest(db, 'seasons', 'readwrite', s => s.put(next));
+        }));
+        return fetched.sort();
+    }
+
     // ═══ SEED ELO RATINGS FROM HISTORICAL H2H ═══
     function seedEloRatings(allRaces) {
         if (!window.EloRatingSystem) return;
@@ -259,39 +431,40 @@ window.HistoricalDataSeeder = (() => {
         return summary;
     }
 
+    // Engines back to their driver baselines, so what gets seeded (and snapshotted) is the
+    // history alone — whatever the app replayed into them goes back on top afterwards
+    function resetEngines(drivers) {
+        if (window.EloRatingSystem) { window.EloRatingSystem.load({ ratings: {}, history: {} }); window.EloRatingSystem.init(drivers); }
+        if (window.TrackPerformanceHistory) { window.TrackPerformanceHistory.load({ driverTrackHistory: {}, teamTrackHistory: {} }); window.TrackPerformanceHistory.init(drivers); }
+        if (window.TeammateComparisonEngine) { window.TeammateComparisonEngine.load({}); window.TeammateComparisonEngine.init(drivers); }
+    }
+
     // ═══ MAIN SEED FUNCTION ═══
-    async function seed(drivers, forceRefresh = false) {
-        // Check cache
-        const cached = localStorage.getItem(CACHE_KEY);
-        if (cached && !forceRefresh) {
-            try {
-                const data = JSON.parse(cached);
-                if (data.timestamp && Date.now() - data.timestamp < 7 * 24 * 3600 * 1000) {
-                    _status = { loaded: true, loading: false, error: null, ...data.status };
-                    applySeededData(data, drivers);
-                    console.log('[HistoricalSeeder] Loaded from cache');
-                    return data;
-                }
-            } catch (e) { }
-        }
+    // fromSeason: first season to include (default FIRST_SEASON); forceRefresh re-checks
+    // every season that is not immutable and re-seeds the engines from all races.
+    // The engines end up holding finished seasons only — the caller replays its own
+    // current-season results on top.
+    async function seed(drivers, forceRefresh = false, fromSeason = FIRST_SEASON) {
+        const years = [];
+        for (let y = Math.min(fromSeason, LAST_SEASON); y <= LAST_SEASON; y++) years.push(y);
 
         _status.loading = true;
         _status.error = null;
 
-        // Fetch all seasons
+        const db = await openDb();
+        const stored = await loadSeasons(db);
+        const fetched = await syncSeasons(db, stored, years, forceRefresh);
+
         let allRaces = [];
-        for (const year of SEASONS) {
-            const races = await fetchSeason(year);
-            if (races) {
-                const processed = processRaces(races, year);
-                allRaces = allRaces.concat(processed);
-                _status.seasons[year] = processed.length;
-            } else {
-                _status.seasons[year] = 0;
-            }
-        }
+        _status.seasons = {};
+        years.forEach(year => {
+            const races = stored.has(year) ? decodeSeason(stored.get(year)) : [];
+            _status.seasons[year] = races.length;
+            allRaces = allRaces.concat(races);
+        });
 
-        if (allRaces.length === 0) {
+        const fallback = allRaces.length === 0;
+        if (fallback) {
             // Fallback: use hardcoded key results if API fails
             console.warn('[HistoricalSeeder] API unavailable, using fallback data');
             allRaces = getFallbackData();
@@ -300,41 +473,59 @@ window.HistoricalDataSeeder = (() => {
         // Sort chronologically
         allRaces.sort((a, b) => a.year - b.year || a.round - b.round);
         _status.totalRaces = allRaces.length;
+        const seedRaces = allRaces.filter(r => r.year < LAST_SEASON);
 
         // Build summaries
         const driverSummary = buildDriverSummary(allRaces);
         const teamSummary = buildTeamSummary(allRaces);
+        _summaries = { driverSummary, teamSummary };
+
+        // Seed engines: restore the stored snapshot and replay only the rounds it has not
+        // seen, provided they all come after the newest round it covers; otherwise seed
+        // from every race
+        const meta = forceRefresh || fallback ? null : await dbRequest(db, 'meta', 'readonly', st => st.get('engines_v2'));
+        resetEngines(drivers);
+        let toSeed = seedRaces;
+        if (meta) {
+            const seen = meta.rounds || {};
+            const lastYear = Math.max(0, ...Object.keys(seen).map(Number));
+            const fresh = seedRaces.filter(r => r.round > (seen[r.year] || 0));
+            if (fresh.every(r => r.year > lastYear || (r.year === lastYear && r.round > seen[lastYear]))) {
+                applySeededData(meta, drivers);
+                toSeed = fresh;
+            }
+        }
 
-        // Seed engines
-        seedEloRatings(allRaces);
-        seedTrackHistory(allRaces);
-        seedTeammateData(allRaces);
-
-        const result = {
-            allRaces, driverSummary, teamSummary,
-            status: _status,
-            timestamp: Date.now()
-        };
+        if (toSeed.length) {
+            seedEloRatings(toSeed);
+            seedTrackHistory(toSeed);
+            seedTeammateData(toSeed);
+            // Keeps its own rows (keyed per race), so only the new rounds go in; trains in a worker
+            if (window.MLPaceRegression?.addHistoricalRaces) window.MLPaceRegression.addHistoricalRaces(toSeed, SEASON_WEIGHTS);
+        }
 
-        // Cache
-        try {
-            const toCache = {
-                driverSummary, teamSummary,
-                status: _status,
-                timestamp: Date.now(),
+        const timestamp = Date.now();
+        if (!fallback && (toSeed.length || !meta)) {
+            const rounds = {};
+            seedRaces.forEach(r => { rounds[r.year] = Math.max(rounds[r.year] || 0, r.round); });
+            await dbRequest(db, 'meta', 'readwrite', st => st.put({
+                key: 'engines_v2', rounds, timestamp,
                 eloState: window.EloRatingSystem?.save(),
                 trackState: window.TrackPerformanceHistory?.save(),
                 teammateState: window.TeammateComparisonEngine?.save()
-            };
-            (window.safeStorage || localStorage).setItem(CACHE_KEY, JSON.stringify(toCache));
-        } catch (e) {
-            console.warn('[HistoricalSeeder] Cache save failed:', e.message);
+            }));
         }
 
         _status.loading = false;
         _status.loaded = true;
-        console.log('[HistoricalSeeder] Seeded from', allRaces.length, 'races across', SEASONS.join(', '));
-        return result;
+        _status.timestamp = timestamp;
+        if (!fetched.length && toSeed.length < seedRaces.length) {
+            console.log(`[HistoricalSeeder] Loaded from cache (${toSeed.length} new races seeded)`);
+        } else {
+            console.log('[HistoricalSeeder] Seeded from', toSeed.length, 'of', seedRaces.length, 'races across', years.join(', '),
+                fetched.length ? `(fetched ${fetched.join(', ')})` : '');
+        }
+        return { allRaces, driverSummary, teamSummary, status: _status, timestamp };
     }
 
     function applySeededData(data, drivers) {
@@ -350,6 +541,19 @@ window.HistoricalDataSeeder = (() => {
         }
     }
 
+    // ═══ WARM START ═══
+    // Summaries from whatever seasons are already stored, without touching the network or
+    // the engines, so the historical charts have data before anyone seeds. Also drops the
+    // old single-blob localStorage cache.
+    async function warm() {
+        try { localStorage.removeItem(LEGACY_CACHE_KEY); } catch (e) { }
+        const stored = await loadSeasons(await openDb());
+        if (_summaries || !stored.size) return;
+        const allRaces = [...stored.values()].filter(r => r.year <= LAST_SEASON).flatMap(decodeSeason)
+            .sort((a, b) => a.year - b.year || a.round - b.round);
+        if (allRaces.length) _summaries = { driverSummary: buildDriverSummary(allRaces), teamSummary: buildTeamSummary(allRaces) };
+    }
+
     // ═══ FALLBACK DATA — Key race results when API is unavailable ═══
     function getFallbackData() {
         // Hardcoded key 2024 results for the main 2026 drivers
@@ -394,22 +598,16 @@ window.HistoricalDataSeeder = (() => {
     function getStatus() { return { ..._status }; }
 
     function getDriverSummary() {
-        const cached = localStorage.getItem(CACHE_KEY);
-        if (cached) {
-            try { return JSON.parse(cached).driverSummary; } catch (e) { }
-        }
-        return null;
+        return _summaries ? _summaries.driverSummary : null;
     }
 
     function getTeamSummary() {
-        const cached = localStorage.getItem(CACHE_KEY);
-        if (cached) {
-            try { return JSON.parse(cached).teamSummary; } catch (e) { }
-        }
-        return null;
+        return _summaries ? _summaries.teamSummary : null;
     }
 
-    return { seed, getStatus, getDriverSummary, getTeamSummary, SEASON_WEIGHTS };
+    const ready = warm();
+
+    return { seed, ready, getStatus, getDriverSummary, getTeamSummary, SEASON_WEIGHTS, FIRST_SEASON, LAST_SEASON };
 })();
 
-console.log('%c[HistoricalDataSeeder] Ready — Jolpica API + Fallback', 'color:#00dc50;font-weight:bold');
+console.log('%c[HistoricalDataSeeder] Ready — Jolpica API + IndexedDB seasons + Fallback', 'color:#00dc50;font-weight:bold');
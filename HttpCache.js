@@ -0,0 +1,278 @@
+'use strict';
+/* ═══════════════════════════════════════════════════════════════
+   SHARED HTTP CACHE — HttpCache.js
+   One fetch layer for every engine that talks to OpenF1 / Jolpica:
+   - Size- and TTL-bounded LRU of parsed JSON responses
+   - Single-flight: identical in-flight URLs share one request
+   - Stale-while-revalidate (opt-in per call via `swr`)
+   - Per-host concurrency limits and 429/503 backoff (Retry-After aware)
+   - Hit / miss / coalesced / rate-limit counters for the health widget
+
+   request(url, opts) → { ok, status, data, cached, stale, error }
+                        (cached: served without a request; stale: older than ttl)
+   getJSON(url, opts) → data | null  (falls back to the last good copy)
+   opts: { ttl, swr, timeout, cache }
+
+   OpenF1 requests can be pointed at a local replay server
+   (OpenF1Replay.js). Only loopback bases are accepted, since
+   responses end up in the DOM. ?openf1=<base> on the page URL
+   applies to that page load only; setOpenF1Base(base) from the
+   console persists in localStorage until setOpenF1Base(null) or
+   ?openf1=off.
+   ═══════════════════════════════════════════════════════════════ */
+
+window.HttpCache = (() => {
+
+    const CONFIG = {
+        MAX_ENTRIES: 200,
+        MAX_BYTES: 8 * 1024 * 1024,     // approximate, by response text length
+        MAX_ENTRY_BYTES: 1024 * 1024,   // larger bodies are returned but not retained
+        DEFAULT_TTL: 60000,
+        ERROR_GRACE: 10 * 60 * 1000,    // expired copies stay usable as an error fallback this long
+        TIMEOUT: 8000,
+        HOST_LIMITS: { 'api.openf1.org': 3, default: 4 },
+        BACKOFF_BASE: 2000,
+        BACKOFF_MAX: 60000,
+    };
+
+    const OPENF1_BASE = 'https://api.openf1.org/v1';
+    const BASE_KEY = 'f1_openf1_base';
+
+    const _entries = new Map();   // url → { data, status, ts, ttl, swr, size }, least recently used first
+    const _inflight = new Map();  // url → Promise<result>
+    const _hosts = new Map();     // host → { active, queue, backoffMs, backoffUntil }
+    let _bytes = 0;
+
+    const _stats = { hits: 0, staleHits: 0, misses: 0, coalesced: 0, requests: 0, errors: 0, rateLimited: 0, evictions: 0 };
+
+    let _openf1Base = null;       // replay server standing in for OPENF1_BASE, or null
+
+    // ─────────────────────────────────────────────────────────────
+    // OPENF1 BASE OVERRIDE
+    // ─────────────────────────────────────────────────────────────
+    // http(s)://localhost | 127.x.x.x | [::1] only; normalised base or null
+    function _loopbackBase(base) {
+        try {
+            const u = new URL(String(base));
+            if (!/^https?:$/.test(u.protocol)) return null;
+            if (!/^(localhost|127(\.\d{1,3}){3}|\[::1\])$/.test(u.hostname)) return null;
+            return (u.origin + u.pathname).replace(/\/$/, '');
+        } catch (e) { return null; }
+    }
+
+    function setOpenF1Base(base, persist = true) {
+        const next = base ? _loopbackBase(base) : null;
+        if (base && !next) {
+            console.warn(`[HttpCache] Ignoring OpenF1 base ${base}: only localhost replay servers are allowed`);
+            return false;
+        }
+        const previous = _openf1Base;
+        _openf1Base = next;
+        try {
+            if (_openf1Base && persist) localStorage.setItem(BASE_KEY, _openf1Base);
+            else if (!_openf1Base) localStorage.removeItem(BASE_KEY);
+        } catch (e) { /* storage unavailable — override lasts for this page only */ }
+        invalidate(OPENF1_BASE);
+        if (previous) invalidate(previous);
+        if (_openf1Base) console.log(`[HttpCache] OpenF1 requests → ${_openf1Base}`);
+        return true;
+    }
+
+    function _initOpenF1Base() {
+        let param = null;
+        try { param = new URLSearchParams(location.search).get('openf1'); } catch (e) { /* no location */ }
+        if (param) { setOpenF1Base(param === 'off' ? null : param, false); return; }
+        try { _openf1Base = _loopbackBase(localStorage.getItem(BASE_KEY) || ''); } catch (e) { /* storage unavailable */ }
+        if (_openf1Base) console.log(`[HttpCache] OpenF1 requests → ${_openf1Base} (?openf1=off to restore)`);
+    }
+
+    function _resolve(url) {
+        return _openf1Base && url.startsWith(OPENF1_BASE) ? _openf1Base + url.slice(OPENF1_BASE.length) : url;
+    }
+
+    // ─────────────────────────────────────────────────────────────
+    // LRU STORE
+    // ─────────────────────────────────────────────────────────────
+    function _touch(url, entry) {
+        _entries.delete(url);
+        _entries.set(url, entry);
+    }
+
+    function _drop(url) {
+        const entry = _entries.get(url);
+        if (!entry) return;
+        _entries.delete(url);
+        _bytes -= entry.size;
+    }
+
+    function _store(url, entry) {
+        _drop(url);
+        if (entry.size > CONFIG.MAX_ENTRY_BYTES) return;
+        _entries.set(url, entry);
+        _bytes += entry.size;
+        _prune();
+    }
+
+    // Past their error grace first, then least recently used until within budget
+    function _prune() {
+        const now = Date.now();
+        for (const [url, entry] of _entries) {
+            if (now - entry.ts > entry.ttl + Math.max(entry.swr, CONFIG.ERROR_GRACE)) _drop(url);
+        }
+        while (_entries.size > CONFIG.MAX_ENTRIES || _bytes > CONFIG.MAX_BYTES) {
+            _drop(_entries.keys().next().value);
+            _stats.evictions++;
+        }
+    }
+
+    // ─────────────────────────────────────────────────────────────
+    // PER-HOST LIMITS + BACKOFF
+    // ─────────────────────────────────────────────────────────────
+    function _host(url) {
+        let name = 'default';
+        try { name = new URL(url).host; } catch (e) { /* relative URL — same origin */ }
+        if (!_hosts.has(name)) {
+            _hosts.set(name, { name, active: 0, queue: [], timer: null, backoffMs: 0, backoffUntil: 0, limit: CONFIG.HOST_LIMITS[name] || CONFIG.HOST_LIMITS.default });
+        }
+        return _hosts.get(name);
+    }
+
+    function _acquire(host) {
+        return new Promise(resolve => {
+            host.queue.push(resolve);
+            _pump(host);
+        });
+    }
+
+    function _release(host) {
+        host.active--;
+        _pump(host);
+    }
+
+    function _pump(host) {
+        const wait = host.backoffUntil - Date.now();
+        if (wait > 0) {
+            if (!host.timer) host.timer = setTimeout(() => { host.timer = null; _pump(host); }, wait);
+            return;
+        }
+        while (host.active < host.limit && host.queue.length) {
+            host.active++;
+            host.queue.shift()();
+        }
+    }
+
+    function _backoff(host, resp) {
+        const retryAfter = parseFloat(resp.headers && resp.headers.get && resp.headers.get('Retry-After'));
+        host.backoffMs = Math.min(CONFIG.BACKOFF_MAX, host.backoffMs ? host.backoffMs * 2 : CONFIG.BACKOFF_BASE);
+        const wait = retryAfter > 0 ? Math.min(CONFIG.BACKOFF_MAX, retryAfter * 1000) : host.backoffMs;
+        host.backoffUntil = Date.now() + wait;
+        console.warn(`[HttpCache] ${host.name} rate limited (${resp.status}) — pausing requests for ${Math.round(wait / 1000)}s`);
+    }
+
+    // ─────────────────────────────────────────────────────────────
+    // NETWORK
+    // ─────────────────────────────────────────────────────────────
+    async function _fetch(url, opts) {
+        const host = _host(url);
+        await _acquire(host);
+        _stats.requests++;
+        const controller = new AbortController();
+        const timeout = setTimeout(() => controller.abort(), opts.timeout || CONFIG.TIMEOUT);
+        try {
+            const resp = await fetch(url, { signal: controller.signal });
+            if (resp.status === 429 || resp.status === 503) {
+                _stats.rateLimited++;
+                _backoff(host, resp);
+                return _fallback(url, { ok: false, status: resp.status, data: null });
+            }
+            if (!resp.ok) {
+                _stats.errors++;
+                return _fallback(url, { ok: false, status: resp.status, data: null, error: `HTTP ${resp.status}` });
+            }
+            const text = await resp.text();
+            const data = JSON.parse(text);
+            host.backoffMs = 0;
+            if (opts.cache !== false) {
+                _store(url, { data, status: resp.status, ts: Date.now(), ttl: opts.ttl ?? CONFIG.DEFAULT_TTL, swr: opts.swr || 0, size: text.length });
+            }
+            return { ok: true, status: resp.status, data, cached: false, stale: false };
+        } catch (e) {
+            _stats.errors++;
+            return _fallback(url, { ok: false, status: 0, data: null, error: e.name === 'AbortError' ? 'timeout' : e.message });
+        } finally {
+            clearTimeout(timeout);
+            _release(host);
+        }
+    }
+
+    // Failed request: hand back the last good copy (if any) alongside the failure.
+    // `cached` stays false — a request was made — so callers still see the error status.
+    function _fallback(url, result) {
+        const entry = _entries.get(url);
+        return { ...result, data: entry ? entry.data : null, cached: false, stale: !!entry };
+    }
+
+    function _single(url, opts) {
+        if (_inflight.has(url)) {
+            _stats.coalesced++;
+            return _inflight.get(url);
+        }
+        const p = _fetch(url, opts).finally(() => _inflight.delete(url));
+        _inflight.set(url, p);
+        return p;
+    }
+
+    // ─────────────────────────────────────────────────────────────
+    // PUBLIC API
+    // ─────────────────────────────────────────────────────────────
+    async function request(url, opts = {}) {
+        url = _resolve(url);
+        const entry = opts.cache === false ? null : _entries.get(url);
+        if (entry) {
+            const age = Date.now() - entry.ts;
+            if (age < entry.ttl) {
+                _stats.hits++;
+                _touch(url, entry);
+                return { ok: true, status: entry.status, data: entry.data, cached: true, stale: false };
+            }
+            // Serve the stale copy now and refresh behind it; while the host is backing off,
+            // anything still inside its error grace is better than queueing behind the pause
+            const backingOff = _host(url).backoffUntil > Date.now() && age < entry.ttl + CONFIG.ERROR_GRACE;
+            if (age < entry.ttl + entry.swr || backingOff) {
+                _stats.staleHits++;
+                _touch(url, entry);
+                _single(url, opts);
+                return { ok: true, status: entry.status, data: entry.data, cached: true, stale: true };
+            }
+        }
+        _stats.misses++;
+        return _single(url, opts);
+    }
+
+    async function getJSON(url, opts = {}) {
+        return (await request(url, opts)).data;
+    }
+
+    function invalidate(prefix = '') {
+        [..._entries.keys()].forEach(url => { if (url.startsWith(prefix)) _drop(url); });
+    }
+
+    function getStats() {
+        const lookups = _stats.hits + _stats.staleHits + _stats.misses;
+        return {
+            ..._stats,
+            hitRate: lookups ? (_stats.hits + _stats.staleHits) / lookups : 0,
+            entries: _entries.size,
+            bytes: _bytes,
+            inflight: _inflight.size,
+            hosts: [..._hosts.values()].map(h => ({
+                host: h.name, active: h.active, queued: h.queue.length,
+                backoffMs: Math.max(0, h.backoffUntil - Date.now())
+            }))
+        };
+    }
+
+    _initOpenF1Base();
+
+    return { CONFIG, request, getJSON, invalidate, getStats, setOpenF1Base };
+})();
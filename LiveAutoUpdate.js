@@ -191,20 +191,14 @@ window.LiveAutoUpdate = (() => {
     }
 
     // ═══ API FETCHING ═══
+    // TTL stays under the fastest poll interval so every poll sees fresh data;
+    // overlapping checks of the same endpoint share one request
     async function fetchJSON(url) {
-        try {
-            const controller = new AbortController();
-            const timeoutId = setTimeout(() => controller.abort(), 12000);
-            const res = await fetch(url, { signal: controller.signal });
-            clearTimeout(timeoutId);
-            if (!res.ok) throw new Error(`HTTP ${res.status}`);
-            return await res.json();
-        } catch (e) {
-            if (e.name === 'AbortError') {
-                console.warn('[AutoUpdate] Request timed out:', url);
-            }
-            return null;
+        const res = await window.HttpCache.request(url, { ttl: POLL_RACEHOUR_MS / 2, timeout: 12000 });
+        if (res.error === 'timeout') {
+            console.warn('[AutoUpdate] Request timed out:', url);
         }
+        return res.ok ? res.data : null;
     }
 
     async function fetchLatestResult(year) {
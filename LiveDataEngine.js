@@ -36,7 +36,6 @@ const LiveIntelligence = (() => {
         newsAlerts: [],
         techUpgrades: [],
         predictionOverrides: {},   // Temporary team pace modifiers from news
-        cache: {},                 // { url: { data, timestamp } }
         highAccuracyMode: false,
         // Graceful degradation state
         apiFailureCount: 0,
@@ -50,76 +49,66 @@ const LiveIntelligence = (() => {
     async function cachedFetch(endpoint, params = {}) {
         const qStr = Object.entries(params).map(([k, v]) => `${k}=${encodeURIComponent(v)}`).join('&');
         const url = `${CONFIG.API_BASE}${endpoint}${qStr ? '?' + qStr : ''}`;
-        const cacheKey = url;
 
-        // Check cache — use shorter TTL during live sessions for freshest data
-        const cacheTTL = state.isLiveSession ? CONFIG.CACHE_TTL_LIVE : CONFIG.CACHE_TTL_IDLE;
-        if (state.cache[cacheKey]) {
-            const age = Date.now() - state.cache[cacheKey].timestamp;
-            if (age < cacheTTL) return state.cache[cacheKey].data;
-        }
-
-        try {
-            const controller = new AbortController();
-            const timeout = setTimeout(() => controller.abort(), 8000);
-            const resp = await fetch(url, { signal: controller.signal });
-            clearTimeout(timeout);
-
-            // Auth failure (401) — OpenF1 now requires sponsor access for live data
-            if (resp.status === 401 || resp.status === 403) {
-                state.apiFailureCount++;
-                if (state.apiFailureCount >= CONFIG.MAX_API_FAILURES && !state.simulationOnlyMode) {
-                    state.simulationOnlyMode = true;
-                    console.warn('[LiveData] ⚠️ OpenF1 API requires authentication (401). Switching to SIMULATION-ONLY mode.');
-                    _triggerAutoSimulation();
-                }
-                if (typeof window.ApiHealthDashboard !== 'undefined') {
-                    window.ApiHealthDashboard.recordError('openf1');
-                }
-                return state.cache[cacheKey]?.data || null;
-            }
-
-            // Rate limit backoff (429) or server overload (503)
-            if (resp.status === 429 || resp.status === 503) {
-                console.warn(`[LiveData] Rate limited (${resp.status}) — backing off`);
-                state._rateLimitBackoff = (state._rateLimitBackoff || 0) + 1;
-                CONFIG.REFRESH_LIVE = Math.min(CONFIG.REFRESH_LIVE * 2, 30000);
-                return state.cache[cacheKey]?.data || null;
-            }
+        // Shared cache — shorter TTL during live sessions for freshest data; between
+        // sessions a stale copy is served while it refreshes in the background
+        const res = await window.HttpCache.request(url, {
+            ttl: state.isLiveSession ? CONFIG.CACHE_TTL_LIVE : CONFIG.CACHE_TTL_IDLE,
+            swr: state.isLiveSession ? 0 : CONFIG.CACHE_TTL_IDLE,
+            timeout: 8000,
+        });
+        if (res.cached) return res.data;
 
-            // Successful response — reset failure tracking
-            state.apiFailureCount = 0;
-            if (state.simulationOnlyMode) {
-                state.simulationOnlyMode = false;
-                console.log('[LiveData] ✅ OpenF1 API recovered — exiting simulation-only mode');
+        // Auth failure (401) — OpenF1 now requires sponsor access for live data
+        if (res.status === 401 || res.status === 403) {
+            state.apiFailureCount++;
+            if (state.apiFailureCount >= CONFIG.MAX_API_FAILURES && !state.simulationOnlyMode) {
+                state.simulationOnlyMode = true;
+                console.warn('[LiveData] ⚠️ OpenF1 API requires authentication (401). Switching to SIMULATION-ONLY mode.');
+                _triggerAutoSimulation();
             }
-            if (state._rateLimitBackoff && state._rateLimitBackoff > 0) {
-                state._rateLimitBackoff--;
-                if (state._rateLimitBackoff <= 0) {
-                    CONFIG.REFRESH_LIVE = 5000;
-                    state._rateLimitBackoff = 0;
-                }
+            if (typeof window.ApiHealthDashboard !== 'undefined') {
+                window.ApiHealthDashboard.recordError('openf1');
             }
+            return res.data;
+        }
 
-            if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
-            const data = await resp.json();
+        // Rate limit backoff (429) or server overload (503) — HttpCache pauses the host;
+        // the refresh loop slows down too
+        if (res.status === 429 || res.status === 503) {
+            state._rateLimitBackoff = (state._rateLimitBackoff || 0) + 1;
+            CONFIG.REFRESH_LIVE = Math.min(CONFIG.REFRESH_LIVE * 2, 30000);
+            return res.data;
+        }
 
-            state.cache[cacheKey] = { data, timestamp: Date.now() };
-            if (typeof window.ApiHealthDashboard !== 'undefined') {
-                window.ApiHealthDashboard.recordSuccess('openf1', Math.round(performance.now()));
-            }
-            return data;
-        } catch (err) {
+        if (!res.ok) {
             state.apiFailureCount++;
-            console.warn(`[LiveData] Fetch failed: ${url}`, err.message);
+            console.warn(`[LiveData] Fetch failed: ${url}`, res.error);
             if (state.apiFailureCount >= CONFIG.MAX_API_FAILURES && !state.simulationOnlyMode) {
                 state.simulationOnlyMode = true;
                 console.warn('[LiveData] ⚠️ API unreachable after multiple failures. Switching to SIMULATION-ONLY mode.');
                 _triggerAutoSimulation();
             }
-            if (state.cache[cacheKey]) return state.cache[cacheKey].data;
-            return null;
+            return res.data;
         }
+
+        // Successful response — reset failure tracking
+        state.apiFailureCount = 0;
+        if (state.simulationOnlyMode) {
+            state.simulationOnlyMode = false;
+            console.log('[LiveData] ✅ OpenF1 API recovered — exiting simulation-only mode');
+        }
+        if (state._rateLimitBackoff && state._rateLimitBackoff > 0) {
+            state._rateLimitBackoff--;
+            if (state._rateLimitBackoff <= 0) {
+                CONFIG.REFRESH_LIVE = 5000;
+                state._rateLimitBackoff = 0;
+            }
+        }
+        if (typeof window.ApiHealthDashboard !== 'undefined') {
+            window.ApiHealthDashboard.recordSuccess('openf1', Math.round(performance.now()));
+        }
+        return res.data;
     }
 
     // ─────────────────────────────────────────────────────────────
@@ -467,8 +456,16 @@ const LiveIntelligence = (() => {
         }
 
         // ═══ CRITICAL: Re-run Monte Carlo sims with fresh live data ═══
-        // During live sessions, actually recalculate predictions (throttled)
-        if (state.isLiveSession && (Date.now() - _lastSimTrigger) > SIM_THROTTLE_MS) {
+        // During a live race, re-predict the remaining laps from the running order
+        // (coalesced and latency-budgeted, so no throttle); otherwise re-run the full
+        // sim, throttled
+        if (state.isLiveSession && state.livePositions.length > 0 && typeof PredictionsCenter.liveRePredict === 'function') {
+            try {
+                PredictionsCenter.liveRePredict();
+            } catch (e) {
+                console.warn('[LiveData] Live re-prediction failed:', e.message);
+            }
+        } else if (state.isLiveSession && (Date.now() - _lastSimTrigger) > SIM_THROTTLE_MS) {
             _lastSimTrigger = Date.now();
             setTimeout(() => {
                 try {
@@ -759,8 +756,10 @@ const LiveIntelligence = (() => {
     function init() {
         // Build the live dashboard panel in the predictions view
         injectLiveDashboard();
-        // Initial data fetch
-        refresh().then(() => {
+        // Initial data fetch, then the on-demand live stack (stream, trace, telemetry)
+        refresh().then(() => window.ModuleLoader && ModuleLoader.load('live')
+            .catch(e => console.warn('[LiveData] Live modules:', e.message))
+        ).then(() => {
             // After first refresh, try SSE streaming for sub-second updates
             if (typeof window.LiveStreamEngine !== 'undefined') {
                 try {
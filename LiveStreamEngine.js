@@ -11,6 +11,14 @@
    - Only processes NEW data by tracking last-seen timestamps
    - Pushes changes to LiveDataEngine via callbacks
    - Falls back gracefully if API is unavailable
+
+   Each stream schedules its next poll only after the previous one
+   has finished (one request in flight per stream, responses handled
+   in order). The interval tightens while new rows keep arriving,
+   relaxes when they don't or on errors, is jittered, and stretches
+   while the tab is hidden. getMetrics() reports per-stream lag and
+   latency; with LiveTrace loaded every poll is also traced through
+   its callback into re-prediction and render.
    ═══════════════════════════════════════════════════════════════ */
 
 window.LiveStreamEngine = (() => {
@@ -18,6 +26,7 @@ window.LiveStreamEngine = (() => {
 
     let _isStreaming = false;
     let _sessionKey = null;
+    let _generation = 0;     // bumped on start/stop so late responses from an old session are dropped
     let _timers = {};
     let _lastSeen = {
         position: null,
@@ -33,9 +42,24 @@ window.LiveStreamEngine = (() => {
     const MAX_RETRIES = 10;
     const POLL_INTERVAL_MS = 3000; // 3s fast polling for live data
 
+    // Adaptive scheduling: new rows shrink the interval toward min, empty polls
+    // grow it toward max, errors double it
+    const SCHEDULE = {
+        position: { base: POLL_INTERVAL_MS, min: 2000, max: 15000 },
+        weather: { base: POLL_INTERVAL_MS * 2, min: 4000, max: 30000 },   // Weather changes slower, poll at 6s
+        carData: { base: POLL_INTERVAL_MS * 2, min: 3000, max: 20000 },   // Telemetry at 6s
+    };
+    const SPEED_UP = 0.7;
+    const SLOW_DOWN = 1.5;
+    const JITTER = 0.15;            // ±15% so streams don't phase-lock with each other or other clients
+    const HIDDEN_FACTOR = 4;        // background tabs poll 4× less often
+
+    let _streams = {};              // name → { interval, inFlight, metrics }
+
     // ─────────────────────────────────────────────────────────────
     // DELTA-AWARE FETCHER
-    // Only returns data newer than what we've already processed
+    // Only returns data newer than what we've already processed:
+    // rows, [] when nothing is new, null on failure
     // ─────────────────────────────────────────────────────────────
     async function fetchDelta(endpoint, lastTimestamp) {
         try {
@@ -44,64 +68,135 @@ window.LiveStreamEngine = (() => {
                 url += `&date>${encodeURIComponent(lastTimestamp)}`;
             }
 
-            const controller = new AbortController();
-            const timeout = setTimeout(() => controller.abort(), 6000);
-            const resp = await fetch(url, { signal: controller.signal });
-            clearTimeout(timeout);
-
-            if (!resp.ok) return null;
-            const data = await resp.json();
-            return Array.isArray(data) && data.length > 0 ? data : null;
+            // Through HttpCache for single-flight only: a poll that overlaps LiveDataEngine's
+            // identical request joins it. Each delta URL is used once, so nothing is stored
+            const res = await window.HttpCache.request(url, { cache: false, timeout: 6000 });
+            if (!res.ok) return null;
+            return Array.isArray(res.data) ? res.data : [];
         } catch (e) {
             return null;
         }
     }
 
     // ─────────────────────────────────────────────────────────────
-    // STREAM FUNCTIONS (actually fast-poll with delta detection)
+    // STREAM HANDLERS (actually fast-poll with delta detection)
     // ─────────────────────────────────────────────────────────────
-    function startPositionStream() {
-        _timers.position = setInterval(async () => {
-            const data = await fetchDelta('/position', _lastSeen.position);
-            if (data) {
-                _lastSeen.position = data[data.length - 1].date || new Date().toISOString();
-                // Deduplicate: only keep latest per driver
-                const latest = {};
-                data.forEach(d => {
-                    if (!latest[d.driver_number] || d.date > latest[d.driver_number].date) {
-                        latest[d.driver_number] = d;
-                    }
-                });
-                const positions = Object.values(latest);
-                if (_callbacks.onPosition) _callbacks.onPosition(positions);
-                _retryCount = 0; // Reset on success
+    const HANDLERS = {
+        position(data) {
+            // Deduplicate: only keep latest per driver
+            const latest = {};
+            data.forEach(d => {
+                if (!latest[d.driver_number] || d.date > latest[d.driver_number].date) {
+                    latest[d.driver_number] = d;
+                }
+            });
+            if (_callbacks.onPosition) _callbacks.onPosition(Object.values(latest));
+        },
+        weather(data) {
+            if (_callbacks.onWeather) _callbacks.onWeather(data[data.length - 1]);
+        },
+        carData(data) {
+            if (window.TelemetryStore) {
+                window.TelemetryStore.setSession(_sessionKey);
+                window.TelemetryStore.ingestCarData(data);
             }
-        }, POLL_INTERVAL_MS);
+            if (_callbacks.onCarData) _callbacks.onCarData(data);
+        },
+    };
+    const ENDPOINTS = { position: '/position', weather: '/weather', carData: '/car_data' };
+
+    // ─────────────────────────────────────────────────────────────
+    // POLL SCHEDULER — one request in flight per stream
+    // ─────────────────────────────────────────────────────────────
+    function _isHidden() {
+        return typeof document !== 'undefined' && document.hidden;
     }
 
-    function startWeatherStream() {
-        _timers.weather = setInterval(async () => {
-            const data = await fetchDelta('/weather', _lastSeen.weather);
-            if (data) {
-                _lastSeen.weather = data[data.length - 1].date || new Date().toISOString();
-                const latest = data[data.length - 1];
-                if (_callbacks.onWeather) _callbacks.onWeather(latest);
-                _retryCount = 0;
-            }
-        }, POLL_INTERVAL_MS * 2); // Weather changes slower, poll at 6s
+    function _schedule(name, delay) {
+        const s = _streams[name];
+        if (!s) return;
+        if (delay === undefined) {
+            delay = s.interval * (1 - JITTER + Math.random() * 2 * JITTER);
+            if (_isHidden()) delay *= HIDDEN_FACTOR;
+        }
+        s.metrics.nextPollInMs = Math.round(delay);
+        _timers[name] = setTimeout(() => _poll(name), delay);
     }
 
-    function startCarDataStream() {
-        _timers.carData = setInterval(async () => {
-            const data = await fetchDelta('/car_data', _lastSeen.carData);
-            if (data) {
-                _lastSeen.carData = data[data.length - 1].date || new Date().toISOString();
-                if (_callbacks.onCarData) _callbacks.onCarData(data);
-                _retryCount = 0;
+    async function _poll(name) {
+        const s = _streams[name], gen = _generation;
+        if (!s || s.inFlight) return;
+        _timers[name] = null;
+        s.inFlight = true;
+        const t0 = performance.now();
+        const trace = window.LiveTrace ? window.LiveTrace.start(name) : null;
+        const data = await fetchDelta(ENDPOINTS[name], _lastSeen[name]);
+        if (gen !== _generation) return; // stopped or restarted while in flight
+        s.inFlight = false;
+
+        const m = s.metrics, cfg = SCHEDULE[name];
+        const latency = performance.now() - t0;
+        m.polls++;
+        m.lastLatencyMs = Math.round(latency);
+        m.avgLatencyMs = m.avgLatencyMs === null ? m.lastLatencyMs : Math.round(m.avgLatencyMs * 0.8 + latency * 0.2);
+        m.lastPollAt = new Date();
+
+        if (data === null) {
+            m.errors++;
+            _retryCount++;
+            s.interval = Math.min(cfg.max, s.interval * 2);
+        } else if (data.length > 0) {
+            _lastSeen[name] = data[data.length - 1].date || new Date().toISOString();
+            m.rows += data.length;
+            s.interval = Math.max(cfg.min, s.interval * SPEED_UP);
+            _retryCount = 0; // Reset on success
+            if (trace) {
+                // Traced through the callback; a predictor that adopts the trace ends it after render
+                window.LiveTrace.mark(trace, 'fetch', _lastSeen[name]);
+                try { window.LiveTrace.run(trace, () => HANDLERS[name](data)); } catch (e) { console.warn(`[LiveStream] ${name} handler failed:`, e.message); }
+                window.LiveTrace.mark(trace, 'callback');
+                if (!trace.adopted) window.LiveTrace.end(trace);
+            } else {
+                try { HANDLERS[name](data); } catch (e) { console.warn(`[LiveStream] ${name} handler failed:`, e.message); }
             }
-        }, POLL_INTERVAL_MS * 2); // Telemetry at 6s
+        } else {
+            s.interval = Math.min(cfg.max, s.interval * SLOW_DOWN);
+        }
+        const newest = Date.parse(_lastSeen[name]);
+        m.lagMs = isNaN(newest) ? null : Math.max(0, Date.now() - newest);
+        m.intervalMs = Math.round(s.interval);
+
+        if (_retryCount === MAX_RETRIES) {
+            console.warn('[LiveStream] Repeated failures — backing off to the slowest poll rate until data returns');
+        }
+        _schedule(name);
+    }
+
+    function _startStream(name) {
+        _streams[name] = {
+            interval: SCHEDULE[name].base,
+            inFlight: false,
+            metrics: {
+                polls: 0, errors: 0, rows: 0,
+                lastLatencyMs: null, avgLatencyMs: null, lagMs: null,
+                intervalMs: SCHEDULE[name].base, nextPollInMs: 0, lastPollAt: null,
+            },
+        };
+        _schedule(name, 0);
     }
 
+    // Back in the foreground: poll now rather than wait out a stretched timer
+    function _onVisibilityChange() {
+        if (!_isStreaming || _isHidden()) return;
+        Object.keys(_streams).forEach(name => {
+            const s = _streams[name];
+            if (s.inFlight) return;
+            clearTimeout(_timers[name]);
+            _schedule(name, 0);
+        });
+    }
+    if (typeof document !== 'undefined') document.addEventListener('visibilitychange', _onVisibilityChange);
+
     // ─────────────────────────────────────────────────────────────
     // PUBLIC API
     // ─────────────────────────────────────────────────────────────
@@ -114,19 +209,21 @@ window.LiveStreamEngine = (() => {
         }
 
         _isStreaming = true;
+        _generation++;
         _retryCount = 0;
         _lastSeen = { position: null, weather: null, carData: null };
+        _streams = {};
 
-        startPositionStream();
-        startWeatherStream();
-        startCarDataStream();
+        Object.keys(SCHEDULE).forEach(_startStream);
 
-        console.log(`%c[LiveStream] Fast-polling started for session ${_sessionKey} (${POLL_INTERVAL_MS}ms)`, 'color:#3fb950;font-weight:bold');
+        console.log(`%c[LiveStream] Fast-polling started for session ${_sessionKey} (adaptive, from ${POLL_INTERVAL_MS}ms)`, 'color:#3fb950;font-weight:bold');
     }
 
     function stopStreaming() {
-        Object.values(_timers).forEach(t => { if (t) clearInterval(t); });
+        Object.values(_timers).forEach(t => { if (t) clearTimeout(t); });
         _timers = {};
+        _generation++;
+        _streams = {};
         _isStreaming = false;
         console.log('[LiveStream] Streaming stopped');
     }
@@ -139,6 +236,13 @@ window.LiveStreamEngine = (() => {
 
     function isStreaming() { return _isStreaming; }
 
+    // Per-stream scheduling, latency and data lag (ms behind the newest row seen)
+    function getMetrics() {
+        const out = {};
+        Object.entries(_streams).forEach(([name, s]) => { out[name] = { ...s.metrics, inFlight: s.inFlight }; });
+        return out;
+    }
+
     // Auto-integrate with LiveDataEngine
     function autoIntegrate() {
         if (typeof window.LiveIntelligence === 'undefined') {
@@ -163,9 +267,17 @@ window.LiveStreamEngine = (() => {
             try {
                 const state = window.LiveIntelligence.getState();
                 if (state) {
-                    state.livePositions = positions;
+                    // Deltas only carry the drivers whose row changed — merge into the full field
+                    const byDriver = {};
+                    (state.livePositions || []).forEach(p => { byDriver[p.driver_number] = p; });
+                    positions.forEach(p => { byDriver[p.driver_number] = { ...byDriver[p.driver_number], ...p }; });
+                    state.livePositions = Object.values(byDriver).sort((a, b) => a.position - b.position);
                     state.lastUpdate = new Date();
                 }
+                // Re-predict from the new running order (coalesced, latency-budgeted)
+                if (typeof PredictionsCenter !== 'undefined' && typeof PredictionsCenter.liveRePredict === 'function') {
+                    PredictionsCenter.liveRePredict();
+                }
             } catch (e) { /* ignore */ }
         });
 
@@ -193,6 +305,7 @@ window.LiveStreamEngine = (() => {
         stopStreaming,
         registerCallback,
         isStreaming,
+        getMetrics,
         autoIntegrate,
         POLL_INTERVAL_MS
     };
@@ -0,0 +1,119 @@
+'use strict';
+/* ═══════════════════════════════════════════════════════════════
+   LIVE PIPELINE TRACING — LiveTrace.js
+   Follows each live poll through the pipeline:
+     fetch → callback → predict → render
+   A trace starts when a stream's poll is sent. Every mark records
+   the time since the previous stage, and end() records the total.
+   Latencies go into per-series ring buffers (the last WINDOW
+   samples), so getStats() reports p50 / p95 / p99 / max per
+   `stream.stage`, plus `stream.age`: how old the newest row already
+   was when it arrived.
+
+   Predictors pick up the trace of the callback they run in with
+   adopt(). A trace dropped because a newer update replaced it
+   while a run was in flight is counted with coalesce(), not timed.
+   Run against OpenF1Replay.js for repeatable numbers, then call
+   LiveTrace.report() from the console.
+   ═══════════════════════════════════════════════════════════════ */
+
+window.LiveTrace = (() => {
+
+    const WINDOW = 2048;
+
+    const _series = new Map();    // 'stream.stage' → { buf, count }
+    const _counts = { traced: 0, completed: 0, coalesced: 0 };
+    let _active = null;           // trace whose callback is running right now
+    let _nextId = 1;
+
+    function _record(key, ms) {
+        let s = _series.get(key);
+        if (!s) { s = { buf: new Float64Array(WINDOW), count: 0 }; _series.set(key, s); }
+        s.buf[s.count % WINDOW] = ms;
+        s.count++;
+    }
+
+    function _summary(s) {
+        const n = Math.min(s.count, WINDOW);
+        const sorted = s.buf.slice(0, n).sort();
+        const at = p => sorted[Math.min(n - 1, Math.floor(p * n))];
+        return { count: s.count, p50: at(0.5), p95: at(0.95), p99: at(0.99), max: sorted[n - 1] };
+    }
+
+    // ─────────────────────────────────────────────────────────────
+    // TRACES — every call accepts a null trace, so callers need no guards
+    // ─────────────────────────────────────────────────────────────
+    // Cheap enough to start on every poll; only traces that get a mark are counted
+    function start(stream) {
+        const t0 = performance.now();
+        return { id: _nextId++, stream, t0, last: t0, marked: false, done: false, adopted: false };
+    }
+
+    // sampleTime (ISO) on the fetch mark records how stale the newest row already was
+    function mark(trace, stage, sampleTime) {
+        if (!trace || trace.done) return;
+        const now = performance.now();
+        if (!trace.marked) { trace.marked = true; _counts.traced++; }
+        _record(`${trace.stream}.${stage}`, now - trace.last);
+        trace.last = now;
+        if (sampleTime) {
+            const t = Date.parse(sampleTime);
+            if (!isNaN(t)) _record(`${trace.stream}.age`, Math.max(0, Date.now() - t));
+        }
+    }
+
+    // Runs fn with the trace active, so anything it calls can adopt() it
+    function run(trace, fn) {
+        const prev = _active;
+        _active = trace;
+        try { return fn(); } finally { _active = prev; }
+    }
+
+    // Claims the active trace; the poller then leaves ending it to the adopter
+    function adopt() {
+        if (!_active || _active.done) return null;
+        _active.adopted = true;
+        return _active;
+    }
+
+    function end(trace, stage) {
+        if (!trace || trace.done) return;
+        if (stage) mark(trace, stage);
+        _record(`${trace.stream}.total`, performance.now() - trace.t0);
+        trace.done = true;
+        _counts.completed++;
+    }
+
+    function coalesce(trace) {
+        if (!trace || trace.done) return;
+        trace.done = true;
+        _counts.coalesced++;
+    }
+
+    // ─────────────────────────────────────────────────────────────
+    // REPORTING
+    // ─────────────────────────────────────────────────────────────
+    function getStats() {
+        const series = {};
+        [..._series.keys()].sort().forEach(key => { series[key] = _summary(_series.get(key)); });
+        return { ..._counts, series };
+    }
+
+    function report() {
+        const { series, ...counts } = getStats();
+        const rows = {};
+        Object.entries(series).forEach(([key, s]) => {
+            rows[key] = { count: s.count, p50: Math.round(s.p50), p95: Math.round(s.p95), p99: Math.round(s.p99), max: Math.round(s.max) };
+        });
+        console.log(`[LiveTrace] ${counts.traced} traces · ${counts.completed} completed · ${counts.coalesced} coalesced (ms)`);
+        console.table(rows);
+        return rows;
+    }
+
+    function reset() {
+        _series.clear();
+        _counts.traced = _counts.completed = _counts.coalesced = 0;
+    }
+
+    return { WINDOW, start, mark, run, adopt, end, coalesce, getStats, report, reset };
+})();
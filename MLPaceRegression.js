@@ -1,14 +1,14 @@
 'use strict';
 /* ═══════════════════════════════════════════════════════════════
    ML PACE REGRESSION ENGINE — MLPaceRegression.js
-   
+
    Learns optimal pace weights from historical race data using
    multivariate linear regression (ordinary least squares).
-   
+
    Instead of hardcoded weights (40% driver, 42% car, 18% track),
    this engine learns from actual race results what the optimal
    combination is. Updates after every race result.
-   
+
    Features used:
    - Driver rating (0-100)
    - Team/car rating (0-100)
@@ -17,34 +17,122 @@
    - Weather condition (dry/wet/mixed)
    - Tire compound choice
    - Historical track performance
-   
+
    Target: Finishing position normalized to 0-1
+
+   Training rows live in a dense Float64Array matrix (FEATURES order
+   plus a bias column) with a target and a sample weight per row,
+   grouped by race so a re-recorded race replaces its rows. Two
+   solvers, both shrinking toward the hand-tuned DEFAULT_WEIGHTS
+   rather than zero (features with no signal keep their prior):
+   - 'ridge': weighted closed-form solve, (XᵀWX + λI)β = XᵀWy + λβ₀
+   - 'sgd':   seeded mini-batch gradient descent from the current weights
+   trainAsync() runs either in MLRegressionWorker.js; train() is the
+   synchronous fallback. Weights persist as a base64 Float64Array in
+   localStorage, rows as typed arrays in IndexedDB.
    ═══════════════════════════════════════════════════════════════ */
 
 window.MLPaceRegression = (() => {
 
+    const FEATURES = ['driverRating', 'teamRating', 'trackAffinity', 'gridPosition', 'weatherSkill', 'tireManagement', 'formMomentum', 'eloRating'];
+    const D = FEATURES.length + 1; // + bias column (always 1)
+
+    const DEFAULT_WEIGHTS = {
+        driverRating: 0.40,     // initialized to current hardcoded values
+        teamRating: 0.42,
+        trackAffinity: 0.18,
+        gridPosition: -0.15,    // grid pos → higher = worse
+        weatherSkill: 0.08,
+        tireManagement: 0.05,
+        formMomentum: 0.06,
+        eloRating: 0.10,
+        bias: 0.0,
+    };
+
     // ── MODEL STATE ──
     const MODEL = {
-        weights: {
-            driverRating: 0.40,     // initialized to current hardcoded values
-            teamRating: 0.42,
-            trackAffinity: 0.18,
-            gridPosition: -0.15,    // grid pos → higher = worse
-            weatherSkill: 0.08,
-            tireManagement: 0.05,
-            formMomentum: 0.06,
-            eloRating: 0.10,
-            bias: 0.0,
-        },
-        learningRate: 0.001,
-        regularization: 0.0001,  // L2 regularization to prevent overfitting
-        trainingData: [],         // accumulated race results
+        weights: { ...DEFAULT_WEIGHTS },
+        learningRate: 0.05,       // mini-batch SGD step (mean gradient per batch)
+        batchSize: 32,
+        regularization: 0.0001,  // L2 pull toward DEFAULT_WEIGHTS, per unit of sample weight
         epoch: 0,
         lastLoss: null,
         trained: false,
+        method: null,
+        fitted: null,             // features that varied in the last training set
+    };
+
+    const MIN_ROWS = 20;
+    const MAX_ROWS = 20000;       // oldest races are dropped past this
+    const STORAGE_KEY = 'f1_ml_regression_v3'; // v2 weights were fitted with grid = finishing position
+    const STALE_KEYS = ['f1_ml_regression_v2'];
+    const ROWS_VERSION = 2;       // IndexedDB rows before this carry gridPosition = finishing position
+    const LEGACY_KEY = 'f1_ml_regression_v1';
+    const DB_NAME = 'f1_ml_regression';
+
+    // ── TRAINING MATRIX ──
+    const DATA = {
+        cap: 0,
+        n: 0,
+        X: new Float64Array(0),   // n × D, row-major
+        y: new Float64Array(0),
+        w: new Float64Array(0),   // sample weights
+        group: new Int32Array(0), // index into keys
+        keys: [],                 // race key per group
     };
 
-    const STORAGE_KEY = 'f1_ml_regression_v1';
+    function _reserve(rows) {
+        if (rows <= DATA.cap) return;
+        const cap = Math.max(rows, DATA.cap * 2, 1024);
+        const X = new Float64Array(cap * D); X.set(DATA.X);
+        const y = new Float64Array(cap); y.set(DATA.y);
+        const w = new Float64Array(cap); w.set(DATA.w);
+        const group = new Int32Array(cap); group.set(DATA.group);
+        Object.assign(DATA, { cap, X, y, w, group });
+    }
+
+    // Keeps rows whose group passes keep(groupIndex), in order
+    function _compact(keep) {
+        let out = 0;
+        for (let i = 0; i < DATA.n; i++) {
+            if (!keep(DATA.group[i])) continue;
+            if (out !== i) {
+                DATA.X.copyWithin(out * D, i * D, (i + 1) * D);
+                DATA.y[out] = DATA.y[i]; DATA.w[out] = DATA.w[i]; DATA.group[out] = DATA.group[i];
+            }
+            out++;
+        }
+        DATA.n = out;
+    }
+
+    function _groupIndex(key) {
+        let g = DATA.keys.indexOf(key);
+        if (g < 0) { g = DATA.keys.length; DATA.keys.push(key); }
+        return g;
+    }
+
+    function _appendRow(features, target, weight, g) {
+        _reserve(DATA.n + 1);
+        const base = DATA.n * D;
+        for (let j = 0; j < FEATURES.length; j++) DATA.X[base + j] = features[FEATURES[j]] ?? 0.5;
+        DATA.X[base + D - 1] = 1;
+        DATA.y[DATA.n] = target;
+        DATA.w[DATA.n] = weight;
+        DATA.group[DATA.n] = g;
+        DATA.n++;
+    }
+
+    // Drop whole races, oldest first, until within MAX_ROWS
+    function _trim() {
+        if (DATA.n <= MAX_ROWS) return;
+        const drop = new Set();
+        let removed = 0;
+        for (let i = 0; i < DATA.n && DATA.n - removed > MAX_ROWS; i++) {
+            if (!drop.has(DATA.group[i])) drop.add(DATA.group[i]);
+            removed++;
+        }
+        _compact(g => !drop.has(g));
+    }
 
     // ── FEATURE EXTRACTION ──
     function extractFeatures(driverId, teamId, race, gridPos, weatherType) {
@@ -110,9 +198,7 @@ window.MLPaceRegression = (() => {
     // ── PREDICTION ──
     function predict(features) {
         let score = MODEL.weights.bias;
-        for (const [key, value] of Object.entries(features)) {
-            score += (MODEL.weights[key] || 0) * value;
-        }
+        for (let j = 0; j < FEATURES.length; j++) score += MODEL.weights[FEATURES[j]] * (features[FEATURES[j]] ?? 0.5);
         return Math.max(0, Math.min(1, score)); // clamp to [0, 1]
     }
 
@@ -135,9 +221,11 @@ window.MLPaceRegression = (() => {
         if (!MODEL.trained) {
             return { driver: 0.40, car: 0.42, track: 0.18 };
         }
-        const d = Math.abs(MODEL.weights.driverRating);
-        const c = Math.abs(MODEL.weights.teamRating);
-        const t = Math.abs(MODEL.weights.trackAffinity);
+        // Features the last fit held at the prior keep their default share
+        const learned = f => !MODEL.fitted || MODEL.fitted.includes(f) ? Math.abs(MODEL.weights[f]) : DEFAULT_WEIGHTS[f];
+        const d = learned('driverRating');
+        const c = learned('teamRating');
+        const t = learned('trackAffinity');
         const total = d + c + t || 1;
         return {
             driver: d / total,
@@ -146,65 +234,238 @@ window.MLPaceRegression = (() => {
         };
     }
 
-    // ── TRAINING (Online Gradient Descent) ──
-    function addTrainingExample(driverId, teamId, race, gridPos, weatherType, actualPosition) {
-        const features = extractFeatures(driverId, teamId, race, gridPos, weatherType);
-        const target = (22 - actualPosition) / 21; // normalize position to 0-1 (P1=1.0)
-        MODEL.trainingData.push({ features, target });
+    function _toVector(weights) {
+        const v = new Float64Array(D);
+        FEATURES.forEach((f, j) => { v[j] = weights[f] ?? DEFAULT_WEIGHTS[f]; });
+        v[D - 1] = weights.bias ?? 0;
+        return v;
+    }
 
-        // Keep last 500 data points to prevent memory bloat
-        if (MODEL.trainingData.length > 500) {
-            MODEL.trainingData = MODEL.trainingData.slice(-500);
-        }
+    function _fromVector(v) {
+        const weights = {};
+        FEATURES.forEach((f, j) => { weights[f] = v[j]; });
+        weights.bias = v[D - 1];
+        return weights;
     }
 
-    function train(epochs = 50) {
-        if (MODEL.trainingData.length < 20) {
-            // Not enough data to learn meaningfully
-            return { loss: null, message: 'Need at least 20 race results to train' };
+    // ─────────────────────────────────────────────────────────────
+    // SOLVERS — pure functions over the dense matrix, shared with MLRegressionWorker.js.
+    // (X, y, w, n, opts) → { weights: Float64Array(D), loss }
+    // opts: { prior: Float64Array(D), lambda, fixed: Uint8Array(D), init?, epochs?, batchSize?, learningRate?, seed? }
+    // Features flagged in opts.fixed (constant across the rows) are held at the prior.
+    // ─────────────────────────────────────────────────────────────
+    function _loss(X, y, w, n, beta) {
+        let sum = 0, wSum = 0;
+        for (let i = 0; i < n; i++) {
+            let p = 0;
+            for (let j = 0, base = i * D; j < D; j++) p += X[base + j] * beta[j];
+            sum += w[i] * (p - y[i]) * (p - y[i]);
+            wSum += w[i];
         }
+        return wSum ? sum / wSum : 0;
+    }
 
-        let totalLoss = 0;
-
-        for (let e = 0; e < epochs; e++) {
-            totalLoss = 0;
-
-            // Shuffle training data for each epoch
-            const shuffled = [...MODEL.trainingData].sort(() => Math.random() - 0.5);
+    // Weighted ridge toward the prior; the bias column is not penalised. One pass builds
+    // XᵀWX (upper triangle) and XᵀWy, then a Cholesky solve of the D × D system.
+    function ridge(X, y, w, n, opts) {
+        const A = new Float64Array(D * D), b = new Float64Array(D);
+        let wSum = 0;
+        for (let i = 0; i < n; i++) {
+            const base = i * D, wi = w[i];
+            wSum += wi;
+            for (let j = 0; j < D; j++) {
+                const xj = wi * X[base + j];
+                b[j] += xj * y[i];
+                for (let k = j; k < D; k++) A[j * D + k] += xj * X[base + k];
+            }
+        }
+        const lambda = opts.lambda * wSum;
+        for (let j = 0; j < D; j++) {
+            for (let k = 0; k < j; k++) A[j * D + k] = A[k * D + j];
+            if (j < D - 1) { A[j * D + j] += lambda; b[j] += lambda * opts.prior[j]; }
+        }
+        // Pin fixed features: move their prior contribution to the right-hand side, then
+        // replace their row and column with the identity
+        for (let j = 0; j < D - 1; j++) {
+            if (!opts.fixed[j]) continue;
+            for (let k = 0; k < D; k++) {
+                if (k !== j && !opts.fixed[k]) b[k] -= A[k * D + j] * opts.prior[j];
+                A[k * D + j] = A[j * D + k] = 0;
+            }
+            A[j * D + j] = 1;
+            b[j] = opts.prior[j];
+        }
 
-            for (const example of shuffled) {
-                const prediction = predict(example.features);
-                const error = prediction - example.target;
-                totalLoss += error * error;
+        // A = LLᵀ in place (lower triangle), then forward / back substitution
+        for (let j = 0; j < D; j++) {
+            let s = A[j * D + j];
+            for (let k = 0; k < j; k++) s -= A[j * D + k] * A[j * D + k];
+            if (!(s > 1e-12)) return null; // not positive definite (e.g. no rows)
+            const l = Math.sqrt(s);
+            A[j * D + j] = l;
+            for (let i = j + 1; i < D; i++) {
+                let t = A[i * D + j];
+                for (let k = 0; k < j; k++) t -= A[i * D + k] * A[j * D + k];
+                A[i * D + j] = t / l;
+            }
+        }
+        const beta = new Float64Array(D);
+        for (let i = 0; i < D; i++) {
+            let t = b[i];
+            for (let k = 0; k < i; k++) t -= A[i * D + k] * beta[k];
+            beta[i] = t / A[i * D + i];
+        }
+        for (let i = D - 1; i >= 0; i--) {
+            let t = beta[i];
+            for (let k = i + 1; k < D; k++) t -= A[k * D + i] * beta[k];
+            beta[i] = t / A[i * D + i];
+        }
+        return { weights: beta, loss: _loss(X, y, w, n, beta) };
+    }
 
-                // Gradient descent update for each weight
-                for (const [key, value] of Object.entries(example.features)) {
-                    if (MODEL.weights[key] !== undefined) {
-                        const gradient = error * value + MODEL.regularization * MODEL.weights[key];
-                        MODEL.weights[key] -= MODEL.learningRate * gradient;
-                    }
+    // Mini-batch gradient descent on the same objective, from opts.init; Fisher-Yates
+    // shuffle per epoch from a seeded Park-Miller stream, so runs are reproducible
+    function sgd(X, y, w, n, opts) {
+        const beta = Float64Array.from(opts.init), grad = new Float64Array(D);
+        for (let j = 0; j < D - 1; j++) if (opts.fixed[j]) beta[j] = opts.prior[j];
+        const order = new Uint32Array(n);
+        for (let i = 0; i < n; i++) order[i] = i;
+        let s = (opts.seed || 1) % 2147483647;
+        const rand = () => { s = (s * 16807) % 2147483647; return (s - 1) / 2147483646; };
+        const batch = Math.max(1, opts.batchSize), lr = opts.learningRate;
+
+        for (let e = 0; e < opts.epochs; e++) {
+            for (let i = n - 1; i > 0; i--) {
+                const k = Math.floor(rand() * (i + 1));
+                const t = order[i]; order[i] = order[k]; order[k] = t;
+            }
+            for (let start = 0; start < n; start += batch) {
+                const end = Math.min(n, start + batch);
+                grad.fill(0);
+                let wSum = 0;
+                for (let r = start; r < end; r++) {
+                    const i = order[r], base = i * D;
+                    let p = 0;
+                    for (let j = 0; j < D; j++) p += X[base + j] * beta[j];
+                    const err = w[i] * (p - y[i]);
+                    for (let j = 0; j < D; j++) grad[j] += err * X[base + j];
+                    wSum += w[i];
+                }
+                if (!wSum) continue;
+                for (let j = 0; j < D; j++) {
+                    if (opts.fixed[j]) continue;
+                    const reg = j < D - 1 ? opts.lambda * (beta[j] - opts.prior[j]) : 0;
+                    beta[j] -= lr * (grad[j] / wSum + reg);
                 }
-                // Bias update
-                MODEL.weights.bias -= MODEL.learningRate * error;
             }
+        }
+        return { weights: beta, loss: _loss(X, y, w, n, beta) };
+    }
 
-            totalLoss /= shuffled.length;
+    const SOLVERS = { ridge, sgd };
+
+    // Features with no weighted variance across the rows (e.g. teamRating while DynamicModel
+    // is out of reach): nothing to learn, so they keep their prior weight
+    function _constantFeatures() {
+        const fixed = new Uint8Array(D), n = DATA.n;
+        for (let j = 0; j < FEATURES.length; j++) {
+            let wSum = 0, m = 0, m2 = 0;
+            for (let i = 0; i < n; i++) {
+                const w = DATA.w[i], x = DATA.X[i * D + j];
+                wSum += w; m += w * x; m2 += w * x * x;
+            }
+            fixed[j] = !wSum || m2 / wSum - (m / wSum) ** 2 < 1e-9 ? 1 : 0;
         }
+        return fixed;
+    }
 
-        MODEL.epoch += epochs;
-        MODEL.lastLoss = totalLoss;
-        MODEL.trained = true;
+    function _solverOpts(method, epochs) {
+        const fixed = _constantFeatures();
+        MODEL.fitted = FEATURES.filter((_, j) => !fixed[j]);
+        return {
+            prior: _toVector(DEFAULT_WEIGHTS),
+            lambda: MODEL.regularization,
+            fixed,
+            init: _toVector(MODEL.weights),
+            epochs, batchSize: MODEL.batchSize, learningRate: MODEL.learningRate,
+            seed: MODEL.epoch + 1,
+        };
+    }
 
+    function _apply(res, method, epochs, ms) {
+        MODEL.weights = _fromVector(res.weights);
+        MODEL.epoch += method === 'sgd' ? epochs : 1;
+        MODEL.lastLoss = res.loss;
+        MODEL.trained = true;
+        MODEL.method = method;
         save();
-
         return {
-            loss: totalLoss.toFixed(6),
+            loss: res.loss.toFixed(6),
             epoch: MODEL.epoch,
+            method,
+            ms: Math.round(ms * 10) / 10,
             weights: { ...MODEL.weights },
-            dataPoints: MODEL.trainingData.length,
+            dataPoints: DATA.n,
         };
     }
 
+    // ── TRAINING ──
+    // Synchronous; method 'ridge' (default) or 'sgd' (epochs applies to sgd only)
+    function train(epochs = 50, method = 'ridge') {
+        if (DATA.n < MIN_ROWS) {
+            // Not enough data to learn meaningfully
+            return { loss: null, message: 'Need at least 20 race results to train' };
+        }
+        const t0 = performance.now();
+        const res = SOLVERS[method](DATA.X, DATA.y, DATA.w, DATA.n, _solverOpts(method, epochs));
+        if (!res) return { loss: null, message: 'Training matrix is singular' };
+        return _apply(res, method, epochs, performance.now() - t0);
+    }
+
+    // Same as train() but solved in MLRegressionWorker.js; falls back to train() without workers.
+    // Overlapping calls share the run in flight plus at most one follow-up on the newest rows.
+    let _worker = null, _inflight = null, _queued = null;
+    function trainAsync(epochs = 50, method = 'ridge') {
+        if (_inflight) {
+            if (!_queued) _queued = _inflight.then(() => { _queued = null; return trainAsync(epochs, method); });
+            return _queued;
+        }
+        if (DATA.n < MIN_ROWS || typeof Worker === 'undefined' || _worker === false) {
+            return Promise.resolve(train(epochs, method));
+        }
+        _inflight = new Promise(resolve => {
+            const t0 = performance.now();
+            const fail = () => { _worker = false; resolve(train(epochs, method)); };
+            try {
+                if (!_worker) _worker = new Worker('MLRegressionWorker.js');
+                const n = DATA.n;
+                const X = DATA.X.slice(0, n * D), y = DATA.y.slice(0, n), w = DATA.w.slice(0, n);
+                _worker.onmessage = evt => {
+                    if (evt.data.error || !evt.data.weights) { fail(); return; }
+                    resolve(_apply(evt.data, method, epochs, performance.now() - t0));
+                };
+                _worker.onerror = fail;
+                _worker.postMessage({ method, X, y, w, n, opts: _solverOpts(method, epochs) }, [X.buffer, y.buffer, w.buffer]);
+            } catch (e) { fail(); }
+        }).finally(() => { _inflight = null; });
+        return _inflight;
+    }
+
+    // ── TRAINING ROWS ──
+    // key: one race; adding rows under a key that already has rows replaces them
+    function addTrainingExample(driverId, teamId, race, gridPos, weatherType, actualPosition, weight = 1, key = 'manual') {
+        const features = extractFeatures(driverId, teamId, race, gridPos, weatherType);
+        const target = (22 - actualPosition) / 21; // normalize position to 0-1 (P1=1.0)
+        _appendRow(features, target, weight, _groupIndex(key));
+        _trim();
+    }
+
+    function _replaceRace(key, rows, weight) {
+        const g = _groupIndex(key);
+        _compact(x => x !== g);
+        rows.forEach(r => addTrainingExample(r.driverId, r.teamId, r.race, r.gridPos, r.weatherType, r.position, weight, key));
+    }
+
     /**
      * Record a full race result and retrain
      */
@@ -212,63 +473,191 @@ window.MLPaceRegression = (() => {
         if (!result || !result.positions || !drivers) return;
 
         const weatherType = race.rain_probability > 0.5 ? 'wet' : race.rain_probability > 0.2 ? 'mixed' : 'dry';
-
+        const rows = [];
         result.positions.forEach((dId, idx) => {
             const driver = drivers.find(d => d.id === dId);
             if (!driver) return;
-            const gridPos = idx + 1; // We use actual position as approximation if no grid data
-            addTrainingExample(dId, driver.team, race, gridPos, weatherType, idx + 1);
+            // No grid data in results: the grid feature stays neutral rather than echoing the target
+            rows.push({ driverId: dId, teamId: driver.team, race, gridPos: null, weatherType, position: idx + 1 });
         });
+        _ready.then(() => {
+            _replaceRace(`${race.season || 2026}_R${race.round}`, rows, 1);
+            _saveRows();
+            return trainAsync();
+        }).then(res => {
+            console.log(`[MLRegression] Trained on ${DATA.n} examples | Loss: ${res.loss} | ${res.method || ''} ${res.ms ?? ''}ms | Weights:`,
+                getLearnedWeights());
+        });
+    }
 
-        // Retrain with new data
-        const result2 = train(30);
-        console.log(`[MLRegression] Trained on ${MODEL.trainingData.length} examples | Loss: ${result2.loss} | Weights:`,
-            getLearnedWeights());
-
-        return result2;
+    /**
+     * Historical races (HistoricalDataSeeder format), weighted per season, then one retrain
+     */
+    function addHistoricalRaces(races, seasonWeights = {}) {
+        if (!Array.isArray(races) || !races.length) return Promise.resolve(null);
+        return _ready.then(() => {
+            const drivers = typeof PredictionsCenter !== 'undefined' ? PredictionsCenter.getDrivers?.() || [] : [];
+            races.forEach(r => {
+                const race = { short: r.trackCity, round: r.round };
+                const rows = r.results.slice().sort((a, b) => a.position - b.position).map(res => ({
+                    driverId: res.driverId,
+                    teamId: res.teamId || drivers.find(d => d.id === res.driverId)?.team,
+                    race, gridPos: null, weatherType: 'dry', position: res.position
+                }));
+                _replaceRace(`hist_${r.year}_R${r.round}`, rows, seasonWeights[r.year] ?? 0.3);
+            });
+            _saveRows();
+            return trainAsync();
+        });
     }
 
     // ── PERSISTENCE ──
+    // Weights, epoch, loss, trained flag as one base64 Float64Array
     function save() {
         try {
-            (window.safeStorage || localStorage).setItem(STORAGE_KEY, JSON.stringify({
-                weights: MODEL.weights,
-                trainingData: MODEL.trainingData.slice(-200), // save last 200
-                epoch: MODEL.epoch,
-                lastLoss: MODEL.lastLoss,
-                trained: MODEL.trained,
-            }));
+            const v = new Float64Array(D + 3);
+            v.set(_toVector(MODEL.weights));
+            v[D] = MODEL.epoch; v[D + 1] = MODEL.lastLoss ?? NaN; v[D + 2] = MODEL.trained ? 1 : 0;
+            const bytes = new Uint8Array(v.buffer);
+            let bin = '';
+            for (let i = 0; i < bytes.length; i++) bin += String.fromCharCode(bytes[i]);
+            (window.safeStorage || localStorage).setItem(STORAGE_KEY, btoa(bin));
         } catch (e) { /* ignore */ }
     }
 
     function load() {
         try {
+            STALE_KEYS.forEach(k => localStorage.removeItem(k));
             const saved = localStorage.getItem(STORAGE_KEY);
             if (saved) {
-                const data = JSON.parse(saved);
+                const bin = atob(saved);
+                if (bin.length !== (D + 3) * 8) return;
+                const bytes = new Uint8Array(bin.length);
+                for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+                const v = new Float64Array(bytes.buffer);
+                MODEL.weights = _fromVector(v);
+                MODEL.epoch = v[D];
+                MODEL.lastLoss = isNaN(v[D + 1]) ? null : v[D + 1];
+                MODEL.trained = v[D + 2] === 1;
+            }
+        } catch (e) { /* ignore */ }
+    }
+
+    let _db = null;
+    function _openDb() {
+        if (_db) return _db;
+        _db = new Promise(resolve => {
+            if (typeof indexedDB === 'undefined') { resolve(null); return; }
+            try {
+                const req = indexedDB.open(DB_NAME, 1);
+                req.onupgradeneeded = () => req.result.createObjectStore('rows');
+                req.onsuccess = () => resolve(req.result);
+                req.onerror = () => resolve(null);
+                req.onblocked = () => resolve(null);
+            } catch (e) { resolve(null); }
+        });
+        return _db;
+    }
+
+    // Features and targets stored as Float32 (inputs are 0-1 scores), without the bias column
+    function _saveRows() {
+        _openDb().then(db => {
+            if (!db) return;
+            const n = DATA.n, F = FEATURES.length;
+            const X = new Float32Array(n * F);
+            for (let i = 0; i < n; i++) for (let j = 0; j < F; j++) X[i * F + j] = DATA.X[i * D + j];
+            try {
+                db.transaction('rows', 'readwrite').objectStore('rows').put({
+                    version: ROWS_VERSION, features: FEATURES, n, X, y: Float32Array.from(DATA.y.subarray(0, n)),
+                    w: Float32Array.from(DATA.w.subarray(0, n)), group: DATA.group.slice(0, n), keys: DATA.keys
+                }, 'matrix');
+            } catch (e) { /* quota / closed db — rows rebuild from the next results */ }
+        });
+    }
+
+    // Stored rows go in front of anything added before they finished loading
+    function _loadRows() {
+        return _openDb().then(db => new Promise(resolve => {
+            if (!db) { resolve(null); return; }
+            try {
+                const req = db.transaction('rows', 'readonly').objectStore('rows').get('matrix');
+                req.onsuccess = () => resolve(req.result || null);
+                req.onerror = () => resolve(null);
+            } catch (e) { resolve(null); }
+        })).then(rec => {
+            const pending = { n: DATA.n, X: DATA.X.slice(0, DATA.n * D), y: DATA.y.slice(0, DATA.n), w: DATA.w.slice(0, DATA.n), group: DATA.group.slice(0, DATA.n), keys: DATA.keys };
+            DATA.n = 0; DATA.keys = [];
+            const restore = (src, F, cols) => {
+                _reserve(src.n);
+                for (let i = 0; i < src.n; i++) {
+                    const key = src.keys[src.group[i]], features = {};
+                    cols.forEach((f, j) => { if (f) features[f] = src.X[i * F + j]; });
+                    _appendRow(features, src.y[i], src.w[i], _groupIndex(key));
+                }
+            };
+            if (rec && rec.n) {
+                // Older rows: drop the grid column (it held the finishing position)
+                const cols = rec.version >= ROWS_VERSION ? rec.features : rec.features.map(f => f === 'gridPosition' ? null : f);
+                restore(rec, rec.features.length, cols);
+            }
+            if (pending.n) {
+                // Re-added races replace their stored rows
+                const fresh = new Set(pending.keys);
+                _compact(g => !fresh.has(DATA.keys[g]));
+                restore(pending, D, FEATURES);
+            }
+            _trim();
+            _migrateLegacy();
+            if (DATA.n) console.log(`[MLRegression] Loaded ${DATA.n} training rows across ${DATA.keys.length} races, epoch ${MODEL.epoch}`);
+        });
+    }
+
+    // v1 kept weights and up to 200 rows as JSON in localStorage
+    function _migrateLegacy() {
+        try {
+            const saved = localStorage.getItem(LEGACY_KEY);
+            if (!saved) return;
+            const data = JSON.parse(saved);
+            if (!localStorage.getItem(STORAGE_KEY)) {
                 if (data.weights) MODEL.weights = { ...MODEL.weights, ...data.weights };
-                if (data.trainingData) MODEL.trainingData = data.trainingData;
                 if (data.epoch) MODEL.epoch = data.epoch;
                 if (data.lastLoss !== undefined) MODEL.lastLoss = data.lastLoss;
                 if (data.trained) MODEL.trained = data.trained;
-                console.log(`[MLRegression] Loaded ${MODEL.trainingData.length} training examples, epoch ${MODEL.epoch}`);
+                save();
+            }
+            if (Array.isArray(data.trainingData) && data.trainingData.length && !DATA.keys.includes('legacy')) {
+                const g = _groupIndex('legacy');
+                // v1 rows also set the grid feature from the finishing position
+                data.trainingData.forEach(ex => { const { gridPosition, ...f } = ex.features || {}; _appendRow(f, ex.target, 1, g); });
+                _saveRows();
             }
+            localStorage.removeItem(LEGACY_KEY);
         } catch (e) { /* ignore */ }
     }
 
-    // Auto-load on init
-    load();
+    // Auto-load on init (page only — MLRegressionWorker.js loads this file just for the solvers).
+    // Predictions need the weights straight away; the stored rows only matter for the next
+    // retrain, so reading them back from IndexedDB waits until the page is idle.
+    const isPage = typeof document !== 'undefined';
+    if (isPage) load();
+    const _ready = !isPage ? Promise.resolve()
+        : (window.ModuleLoader ? ModuleLoader.idle() : Promise.resolve()).then(_loadRows);
 
     return {
+        FEATURES,
         predictPosition,
         getLearnedWeights,
         recordRaceResult,
+        addHistoricalRaces,
         train,
+        trainAsync,
         addTrainingExample,
-        getModel: () => ({ ...MODEL, weights: { ...MODEL.weights } }),
+        solvers: SOLVERS,
+        ready: _ready,
+        getModel: () => ({ ...MODEL, weights: { ...MODEL.weights }, rows: DATA.n, races: DATA.keys.length }),
         save,
         load,
     };
 })();
 
-console.log('%c[MLPaceRegression] Ready — Gradient descent pace weight learning', 'color:#818cf8;font-weight:bold');
+console.log('%c[MLPaceRegression] Ready — Ridge / mini-batch SGD pace weight learning', 'color:#818cf8;font-weight:bold');
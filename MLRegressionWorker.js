@@ -0,0 +1,27 @@
+'use strict';
+/* ═══════════════════════════════════════════════════════════════
+   ML REGRESSION WORKER — MLRegressionWorker.js
+   Runs MLPaceRegression's ridge / mini-batch SGD solvers off the
+   main thread. Loads MLPaceRegression.js for the solver code only
+   (it skips its storage setup outside a page).
+
+   Messages in:  { method: 'ridge' | 'sgd', X, y, w, n, opts }
+                 (X: n × D Float64Array incl. bias column; transferred)
+   Messages out: { weights: Float64Array(D), loss }  — weights transferred
+                 { error }
+   ═══════════════════════════════════════════════════════════════ */
+
+self.window = self;
+
+importScripts('MLPaceRegression.js');
+
+self.onmessage = function (evt) {
+  const { method, X, y, w, n, opts } = evt.data;
+  try {
+    const res = MLPaceRegression.solvers[method](X, y, w, n, opts);
+    if (!res) { self.postMessage({ error: 'singular' }); return; }
+    self.postMessage(res, [res.weights.buffer]);
+  } catch (e) {
+    self.postMessage({ error: e.message });
+  }
+};
@@ -12,6 +12,11 @@
    - Pit stops create position shuffles
    
    Integrates with LiveDataEngine for real-time lap state updates.
+
+   Car state is held in reusable typed arrays (one slot per car),
+   pit stops come from a per-lap schedule and the running order is
+   maintained by insertion each lap. simulateBatch runs many races
+   per call for the Monte Carlo engine.
    ═══════════════════════════════════════════════════════════════ */
 
 window.MarkovLapSimulator = (() => {
@@ -74,9 +79,34 @@ window.MarkovLapSimulator = (() => {
         wet: { baseGrip: 0.80, degRate: 0.020, cliff: 35, peakLap: 3 },
     };
 
-    function getTirePace(compound, lapsOnTire, tireSmoothnessSkill) {
-        const tire = TIRE_COMPOUNDS[compound] || TIRE_COMPOUNDS.medium;
-        const smoothnessMod = tireSmoothnessSkill || 1.0;
+    // Compounds are interned to small integer codes so car state can live in typed
+    // arrays. Unknown names keep their name (reported as finalCompound) but use
+    // medium-compound physics, as getTirePace always has.
+    const COMPOUND_NAMES = [];
+    const COMPOUND_SPECS = [];
+    const COMPOUND_CODES = new Map();
+    // Per code: tire.degRate * (lapsOnTire - peakLap)^1.15 for peakLap < lapsOnTire < cliff,
+    // and the same term frozen at the cliff
+    const DEG_CURVE = [];
+    const DEG_AT_CLIFF = [];
+
+    function compoundCode(name) {
+        let code = COMPOUND_CODES.get(name);
+        if (code !== undefined) return code;
+        const tire = TIRE_COMPOUNDS[name] || TIRE_COMPOUNDS.medium;
+        code = COMPOUND_NAMES.length;
+        COMPOUND_CODES.set(name, code);
+        COMPOUND_NAMES.push(name);
+        COMPOUND_SPECS.push(tire);
+        const curve = new Float64Array(tire.cliff + 1);
+        for (let l = tire.peakLap + 1; l < tire.cliff; l++) curve[l] = tire.degRate * Math.pow(l - tire.peakLap, 1.15);
+        DEG_CURVE.push(curve);
+        DEG_AT_CLIFF.push(tire.degRate * Math.pow(tire.cliff - tire.peakLap, 1.15));
+        return code;
+    }
+
+    function tirePace(code, lapsOnTire, smoothnessMod) {
+        const tire = COMPOUND_SPECS[code];
 
         // Exponential degradation with cliff
         let degradation;
@@ -85,101 +115,198 @@ window.MarkovLapSimulator = (() => {
             degradation = -0.02 * (tire.peakLap - lapsOnTire);
         } else if (lapsOnTire < tire.cliff) {
             // Normal degradation phase
-            degradation = tire.degRate * Math.pow(lapsOnTire - tire.peakLap, 1.15) / smoothnessMod;
+            const deg = Number.isInteger(lapsOnTire) ? DEG_CURVE[code][lapsOnTire]
+                : tire.degRate * Math.pow(lapsOnTire - tire.peakLap, 1.15);
+            degradation = deg / smoothnessMod;
         } else {
             // Cliff phase — exponential degradation
             const overCliff = lapsOnTire - tire.cliff;
-            degradation = tire.degRate * Math.pow(tire.cliff - tire.peakLap, 1.15) / smoothnessMod
+            degradation = DEG_AT_CLIFF[code] / smoothnessMod
                 + overCliff * 0.12; // 0.12s per lap penalty after cliff
         }
 
         return tire.baseGrip - Math.min(degradation * 0.01, 0.15);
     }
 
+    function getTirePace(compound, lapsOnTire, tireSmoothnessSkill) {
+        return tirePace(compoundCode(compound), lapsOnTire, tireSmoothnessSkill || 1.0);
+    }
+
+    // tirePace sampled at whole laps for one (compound, smoothness) pair, shared
+    // across races so the lap loop does a single array read per car
+    const GRIP_LAPS = 128;
+    const gripTables = new Map(); // smoothness -> [code] -> Float64Array(GRIP_LAPS)
+
+    function gripTable(code, smoothness) {
+        let byCode = gripTables.get(smoothness);
+        if (!byCode) {
+            if (gripTables.size >= 256) gripTables.clear();
+            gripTables.set(smoothness, byCode = []);
+        }
+        let table = byCode[code];
+        if (!table) {
+            table = byCode[code] = new Float64Array(GRIP_LAPS);
+            for (let l = 0; l < GRIP_LAPS; l++) table[l] = tirePace(code, l, smoothness);
+        }
+        return table;
+    }
+
     // ─────────────────────────────────────────────────────────────
-    // CORE MARKOV LAP SIMULATOR
+    // COMPACT RACE STATE — struct-of-arrays, one slot per car in grid order
     // ─────────────────────────────────────────────────────────────
+    function createWorkspace(size) {
+        return {
+            size,
+            basePace: new Float64Array(size),
+            smoothness: new Float64Array(size),
+            compound: new Int32Array(size),
+            lapsOnTire: new Float64Array(size),
+            grip: new Array(size),          // per car: gripTable for its current compound
+            wholeLaps: true,                // lapsOnTire are whole numbers, so grip tables apply
+            fuel: CONFIG.TOTAL_FUEL_KG,     // identical for every running car
+            pitStops: new Int32Array(size),
+            lapTime: new Float64Array(size),
+            totalTime: new Float64Array(size),
+            dnf: new Uint8Array(size),
+            dnfLap: new Int32Array(size),
+            overtakes: new Int32Array(size),
+            running: new Int32Array(size),  // non-DNF cars, kept in running order
+            order: new Int32Array(size),    // final classification
+            schedule: new Array(size),      // per car: pit schedule (see pitSchedule)
+            team: new Array(size),
+            driverId: new Array(size),
+            physics: {                      // reused OvertakePhysicsEngine params
+                paceDelta: 0, gap: 0, drsActive: false, drsZones: 1,
+                trackDifficulty: 0, weather: 'dry', tireDelta: 0, lapsRemaining: 0,
+            },
+        };
+    }
 
-    /**
-     * Simulate a full race lap-by-lap using Markov chain state transitions.
-     * @param {Object} params
-     * @param {Array} params.grid - Starting grid [{driver, gridPos, basePace, compound, tireSmoothnessSkill, pitStrategy}]
-     * @param {number} params.totalLaps - Race distance in laps
-     * @param {string} params.trackId - Track short name for overtake profile
-     * @param {string} params.weather - 'dry' | 'wet' | 'mixed'
-     * @param {number} params.scProbability - Overall SC probability for the race
-     * @param {Object} params.rng - Seeded RNG instance
-     * @param {Object} params.liveState - Optional live race state to start from mid-race
-     * @returns {Object} { positions, lapData, events }
-     */
-    function simulateRace(params) {
-        const { grid, totalLaps, trackId, weather, scProbability, rng, liveState } = params;
-        const profile = TRACK_OVERTAKE_PROFILES[trackId] || TRACK_OVERTAKE_PROFILES.default;
+    let sharedWorkspace = null;
+    function workspaceFor(n) {
+        if (!sharedWorkspace || sharedWorkspace.size < n) sharedWorkspace = createWorkspace(n);
+        return sharedWorkspace;
+    }
 
-        // Initialize race state
-        const cars = grid.map((g, i) => ({
-            driver: g.driver,
-            position: g.gridPos || (i + 1),
-            gapToLeader: i * 1.2,  // Initial gaps (seconds)
-            lapTime: 0,
-            basePace: g.basePace || 0.85,
-            compound: g.compound || 'medium',
-            lapsOnTire: 0,
-            fuel: CONFIG.TOTAL_FUEL_KG,
-            pitStops: 0,
-            pitStrategy: g.pitStrategy || [{ lap: Math.floor(totalLaps * 0.4), compound: 'hard' }],
-            tireSmoothnessSkill: g.tireSmoothnessSkill || 1.0,
-            dnf: false,
-            dnfLap: null,
-            totalTime: 0,
-            overtakes: 0,
-            positionsGained: 0,
-        }));
-
-        // If we have live race state, override from current lap
-        let startLap = 1;
-        if (liveState && liveState.currentLap > 1) {
-            startLap = liveState.currentLap;
-            cars.forEach(car => {
-                const livePos = liveState.positions?.[car.driver.id];
-                if (livePos) {
-                    car.position = livePos.position || car.position;
-                    car.gapToLeader = livePos.gap || car.gapToLeader;
-                }
-                if (liveState.compounds?.[car.driver.id]) {
-                    car.compound = liveState.compounds[car.driver.id];
-                }
-                if (liveState.lapsOnTire?.[car.driver.id]) {
-                    car.lapsOnTire = liveState.lapsOnTire[car.driver.id];
-                }
-                car.fuel = CONFIG.TOTAL_FUEL_KG - (startLap * CONFIG.FUEL_KG_PER_LAP);
-                car.pitStops = liveState.pitStops?.[car.driver.id] || 0;
-            });
+    // Lap -> (compound code + 1) of the first stop planned for that lap, 0 = no stop
+    function pitSchedule(pitStrategy, totalLaps) {
+        const sched = new Int32Array(totalLaps + 2);
+        for (let i = pitStrategy.length - 1; i >= 0; i--) {
+            const s = pitStrategy[i];
+            if (s && Number.isInteger(s.lap) && s.lap >= 0 && s.lap <= totalLaps) {
+                sched[s.lap] = compoundCode(s.compound || 'hard') + 1;
+            }
         }
+        return sched;
+    }
 
-        const events = [];
+    // Reset one car slot to its start-of-race state
+    function initCar(ws, i, basePace, compound, smoothness, schedule, driverId, team) {
+        ws.basePace[i] = basePace || 0.85;
+        ws.compound[i] = compoundCode(compound || 'medium');
+        ws.smoothness[i] = smoothness || 1.0;
+        ws.grip[i] = gripTable(ws.compound[i], ws.smoothness[i]);
+        ws.lapsOnTire[i] = 0;
+        ws.pitStops[i] = 0;
+        ws.lapTime[i] = 0;
+        ws.totalTime[i] = 0;
+        ws.dnf[i] = 0;
+        ws.dnfLap[i] = 0;
+        ws.overtakes[i] = 0;
+        ws.schedule[i] = schedule;
+        ws.driverId[i] = driverId;
+        ws.team[i] = team;
+    }
+
+    // If we have live race state, start from its current lap. liveState.gaps (optional,
+    // driverId → time behind the leader in lap-time units) seeds each car's total time,
+    // so the first running order is the live one rather than grid order.
+    function applyLiveState(ws, n, liveState) {
+        ws.fuel = CONFIG.TOTAL_FUEL_KG;
+        ws.wholeLaps = true;
+        if (!liveState) return 1;
+        if (liveState.gaps) {
+            for (let i = 0; i < n; i++) {
+                const gap = liveState.gaps[ws.driverId[i]];
+                if (gap > 0) ws.totalTime[i] = gap;
+            }
+        }
+        if (!(liveState.currentLap > 1)) return 1;
+        const startLap = liveState.currentLap;
+        ws.fuel = CONFIG.TOTAL_FUEL_KG - (startLap * CONFIG.FUEL_KG_PER_LAP);
+        for (let i = 0; i < n; i++) {
+            const id = ws.driverId[i];
+            if (liveState.compounds?.[id]) {
+                ws.compound[i] = compoundCode(liveState.compounds[id]);
+                ws.grip[i] = gripTable(ws.compound[i], ws.smoothness[i]);
+            }
+            if (liveState.lapsOnTire?.[id]) {
+                const laps = liveState.lapsOnTire[id];
+                ws.lapsOnTire[i] = laps;
+                if (!(Number.isInteger(laps) && laps >= 0)) ws.wholeLaps = false;
+            }
+            ws.pitStops[i] = liveState.pitStops?.[id] || 0;
+        }
+        return startLap;
+    }
+
+    // Running order: (totalTime, grid slot) — the slot tie-break reproduces a stable
+    // sort of the grid-ordered field. Insertion sort, since the order from the
+    // previous lap is almost always still sorted.
+    function sortRunning(ws, m) {
+        const running = ws.running, t = ws.totalTime;
+        for (let i = 1; i < m; i++) {
+            const c = running[i], tc = t[c];
+            let j = i - 1;
+            while (j >= 0 && (t[running[j]] > tc || (t[running[j]] === tc && running[j] > c))) {
+                running[j + 1] = running[j];
+                j--;
+            }
+            running[j + 1] = c;
+        }
+    }
+
+    // Final classification: finishers by total time, then DNFs by the lap they retired
+    function classify(ws, n) {
+        const order = ws.order, dnf = ws.dnf, dnfLap = ws.dnfLap, t = ws.totalTime;
+        const before = (a, b) => {
+            if (dnf[a] !== dnf[b]) return dnf[a] < dnf[b];
+            const d = dnf[a] ? dnfLap[a] - dnfLap[b] : t[a] - t[b];
+            return d < 0 || (d === 0 && a < b);
+        };
+        for (let i = 0; i < n; i++) {
+            let j = i - 1;
+            while (j >= 0 && before(i, order[j])) { order[j + 1] = order[j]; j--; }
+            order[j + 1] = i;
+        }
+    }
+
+    // ─────────────────────────────────────────────────────────────
+    // CORE MARKOV LAP SIMULATOR
+    // ─────────────────────────────────────────────────────────────
+
+    // Lap-by-lap state transitions for the n cars loaded into ws. Draws from rng in
+    // the same order as the original object-per-car loop. events may be null.
+    function runLaps(ws, n, startLap, totalLaps, profile, weather, scProbability, rng, events) {
+        const scLapProb = profile.scProb * (scProbability / 0.4);
+        const weatherMod = weather === 'wet' ? 0.92 : weather === 'mixed' ? 0.96 : 1.0;
+        const { basePace, smoothness, compound, lapsOnTire, grip, lapTime, totalTime, dnf, running, wholeLaps } = ws;
+        let fuel = ws.fuel;
         let scActive = false;
         let scLapsRemaining = 0;
+        let m = 0;
+        for (let i = 0; i < n; i++) running[m++] = i;
 
         // ─── LAP-BY-LAP MARKOV CHAIN ─────────────────────
         for (let lap = startLap; lap <= totalLaps; lap++) {
             const raceProgress = lap / totalLaps; // 0 → 1
 
-            // Safety Car check
-            if (!scActive && rng.next() < profile.scProb * (scProbability / 0.4)) {
+            // Safety Car check — under SC the field runs identical slow laps, so nobody
+            // gains or loses time and the running order is unchanged
+            if (!scActive && rng.next() < scLapProb) {
                 scActive = true;
                 scLapsRemaining = Math.floor(rng.next() * 4) + 2; // 2-5 laps
-                events.push({ lap, type: 'safety_car', laps: scLapsRemaining });
-
-                // Bunch up the field
-                const leader = cars.find(c => c.position === 1 && !c.dnf);
-                if (leader) {
-                    cars.forEach(c => {
-                        if (!c.dnf && c.position > 1) {
-                            c.gapToLeader = (c.position - 1) * CONFIG.SC_BUNCH_RESET;
-                        }
-                    });
-                }
+                if (events) events.push({ lap, type: 'safety_car', laps: scLapsRemaining });
             }
 
             if (scActive) {
@@ -187,110 +314,188 @@ window.MarkovLapSimulator = (() => {
                 if (scLapsRemaining <= 0) scActive = false;
             }
 
+            fuel = Math.max(0, fuel - CONFIG.FUEL_KG_PER_LAP);
+            const fuelEffect = (CONFIG.TOTAL_FUEL_KG - fuel) * CONFIG.FUEL_TIME_PER_KG;
+            const fuelTerm = fuelEffect * 0.001;
+
             // Per-car state transition for this lap
-            cars.forEach(car => {
-                if (car.dnf) return;
+            for (let i = 0; i < n; i++) {
+                if (dnf[i]) continue;
 
                 // Pit stop check
-                const shouldPit = car.pitStrategy.some(s => s.lap === lap);
-                if (shouldPit) {
-                    const strategy = car.pitStrategy.find(s => s.lap === lap);
-                    const pitTime = window.PitCrewLiveData?.getTeamPitTime(car.driver.team, rng)
+                const stop = ws.schedule[i][lap];
+                if (stop) {
+                    const pitTime = window.PitCrewLiveData?.getTeamPitTime(ws.team[i], rng)
                         ?? (CONFIG.PIT_STOP_STATIC_LOSS + (rng.next() - 0.5) * 3);
-                    car.gapToLeader += pitTime;
-                    car.compound = strategy?.compound || 'hard';
-                    car.lapsOnTire = 0;
-                    car.pitStops++;
-                    events.push({ lap, type: 'pit', driver: car.driver.id, compound: car.compound, time: pitTime });
+                    compound[i] = stop - 1;
+                    grip[i] = gripTable(compound[i], smoothness[i]);
+                    lapsOnTire[i] = 0;
+                    ws.pitStops[i]++;
+                    if (events) events.push({ lap, type: 'pit', driver: ws.driverId[i], compound: COMPOUND_NAMES[compound[i]], time: pitTime });
                 }
 
-                car.lapsOnTire++;
-                car.fuel = Math.max(0, car.fuel - CONFIG.FUEL_KG_PER_LAP);
+                const laps = ++lapsOnTire[i];
 
                 // Calculate lap time
-                const tireGrip = getTirePace(car.compound, car.lapsOnTire, car.tireSmoothnessSkill);
-                const fuelEffect = (CONFIG.TOTAL_FUEL_KG - car.fuel) * CONFIG.FUEL_TIME_PER_KG;
-                const weatherMod = weather === 'wet' ? 0.92 : weather === 'mixed' ? 0.96 : 1.0;
-
                 if (scActive) {
                     // Under safety car — all cars go slowly, no position changes from pace
-                    car.lapTime = 1.4; // normalized slow lap
+                    lapTime[i] = 1.4; // normalized slow lap
                 } else {
-                    car.lapTime = (2 - car.basePace * tireGrip * weatherMod) + fuelEffect * 0.001
+                    const tireGrip = wholeLaps && laps < GRIP_LAPS ? grip[i][laps] : tirePace(compound[i], laps, smoothness[i]);
+                    lapTime[i] = (2 - basePace[i] * tireGrip * weatherMod) + fuelTerm
                         + (rng.next() - 0.5) * 0.015; // small random variance per lap
                 }
 
-                car.totalTime += car.lapTime;
-            });
+                totalTime[i] += lapTime[i];
+            }
 
             // Position changes (not during SC)
             if (!scActive) {
-                resolveOvertakes(cars, profile, weather, rng, lap, events);
+                sortRunning(ws, m);
+                resolveOvertakes(ws, m, profile, weather, rng, lap, events);
             }
 
             // DNF check (per-lap probability)
-            cars.forEach(car => {
-                if (car.dnf) return;
-                const dnfProb = 0.0008 + (raceProgress > 0.7 ? 0.0004 : 0); // slightly higher late-race
+            const dnfProb = 0.0008 + (raceProgress > 0.7 ? 0.0004 : 0); // slightly higher late-race
+            for (let i = 0; i < n; i++) {
+                if (dnf[i]) continue;
                 if (rng.next() < dnfProb) {
-                    car.dnf = true;
-                    car.dnfLap = lap;
-                    car.totalTime = 99999;
-                    events.push({ lap, type: 'dnf', driver: car.driver.id });
+                    dnf[i] = 1;
+                    ws.dnfLap[i] = lap;
+                    totalTime[i] = 99999;
+                    if (events) events.push({ lap, type: 'dnf', driver: ws.driverId[i] });
                 }
-            });
+            }
+            // Drop retirements from the running order, keeping it sorted
+            let k = 0;
+            for (let j = 0; j < m; j++) if (!dnf[running[j]]) running[k++] = running[j];
+            m = k;
         }
 
-        // Final positions
-        cars.sort((a, b) => {
-            if (a.dnf && !b.dnf) return 1;
-            if (!a.dnf && b.dnf) return -1;
-            if (a.dnf && b.dnf) return (a.dnfLap || 0) - (b.dnfLap || 0);
-            return a.totalTime - b.totalTime;
-        });
+        classify(ws, n);
+    }
 
-        cars.forEach((car, i) => {
-            car.position = i + 1;
-            car.positionsGained = (grid.findIndex(g => g.driver.id === car.driver.id) + 1) - car.position;
+    /**
+     * Simulate a full race lap-by-lap using Markov chain state transitions.
+     * @param {Object} params
+     * @param {Array} params.grid - Starting grid [{driver, gridPos, basePace, compound, tireSmoothnessSkill, pitStrategy}]
+     * @param {number} params.totalLaps - Race distance in laps
+     * @param {string} params.trackId - Track short name for overtake profile
+     * @param {string} params.weather - 'dry' | 'wet' | 'mixed'
+     * @param {number} params.scProbability - Overall SC probability for the race
+     * @param {Object} params.rng - Seeded RNG instance
+     * @param {Object} params.liveState - Optional live race state to start from mid-race
+     * @returns {Object} { positions, events }
+     */
+    function simulateRace(params) {
+        const { grid, totalLaps, trackId, weather, scProbability, rng, liveState } = params;
+        const profile = TRACK_OVERTAKE_PROFILES[trackId] || TRACK_OVERTAKE_PROFILES.default;
+        const n = grid.length;
+        const ws = workspaceFor(n);
+
+        const defaultSchedule = pitSchedule([{ lap: Math.floor(totalLaps * 0.4), compound: 'hard' }], totalLaps);
+        const schedules = new Map();
+        grid.forEach((g, i) => {
+            let sched = defaultSchedule;
+            if (g.pitStrategy) {
+                sched = schedules.get(g.pitStrategy);
+                if (!sched) schedules.set(g.pitStrategy, sched = pitSchedule(g.pitStrategy, totalLaps));
+            }
+            initCar(ws, i, g.basePace, g.compound, g.tireSmoothnessSkill, sched, g.driver.id, g.driver.team);
         });
+        const startLap = applyLiveState(ws, n, liveState);
 
-        return {
-            positions: cars.map(c => ({
-                driver: c.driver,
-                position: c.position,
-                dnf: c.dnf,
-                dnfLap: c.dnfLap,
-                totalTime: c.totalTime,
-                pitStops: c.pitStops,
-                overtakes: c.overtakes,
-                positionsGained: c.positionsGained,
-                finalCompound: c.compound,
-            })),
-            events,
-        };
+        const events = [];
+        runLaps(ws, n, startLap, totalLaps, profile, weather, scProbability, rng, events);
+
+        const firstSlot = new Map();
+        grid.forEach((g, i) => { if (!firstSlot.has(g.driver.id)) firstSlot.set(g.driver.id, i); });
+        const positions = new Array(n);
+        for (let k = 0; k < n; k++) {
+            const i = ws.order[k];
+            const driver = grid[i].driver;
+            positions[k] = {
+                driver,
+                position: k + 1,
+                dnf: ws.dnf[i] === 1,
+                dnfLap: ws.dnf[i] ? ws.dnfLap[i] : null,
+                totalTime: ws.totalTime[i],
+                pitStops: ws.pitStops[i],
+                overtakes: ws.overtakes[i],
+                positionsGained: (firstSlot.get(driver.id) + 1) - (k + 1),
+                finalCompound: COMPOUND_NAMES[ws.compound[i]],
+            };
+        }
+        return { positions, events };
+    }
+
+    /**
+     * Simulate many races on one track in a single call. Car state lives in one set of
+     * typed arrays reused for every race and no event log is kept; only the
+     * classification is written out. Race r is equivalent to simulateRace with the
+     * same inputs and the RNG returned by rngFor(r).
+     * @param {Object} params
+     * @param {Array} params.drivers - Driver table [{id, team}] that driverIdx indexes into
+     * @param {number} params.races - Number of races
+     * @param {number} params.size - Cars per race (row stride of the arrays below)
+     * @param {Int32Array} params.driverIdx - races×size, driver in each grid slot
+     * @param {Float64Array} params.basePace - races×size, normalized pace per grid slot
+     * @param {Float64Array} params.tireSmoothness - Per driver (indexed like drivers)
+     * @param {Array<string>} params.weather - Per race
+     * @param {Array<string>} params.compound - Per race starting compound
+     * @param {Array} params.pitStrategy - Shared [{lap, compound}] plan
+     * @param {number} params.totalLaps - Race distance in laps
+     * @param {string} params.trackId - Track short name for overtake profile
+     * @param {number} params.scProbability - Overall SC probability for the race
+     * @param {Function} params.rngFor - (race) => seeded RNG for that race
+     * @param {Object} params.liveState - Optional live race state to start from mid-race
+     * @param {Int32Array} params.outOrder - races×size, receives driver indices in finishing order
+     * @param {Uint8Array} params.outDnf - races×size, 1 where the driver in outOrder retired
+     */
+    function simulateBatch(params) {
+        const { drivers, races, size, driverIdx, basePace, tireSmoothness, weather, compound,
+            pitStrategy, totalLaps, trackId, scProbability, rngFor, liveState, outOrder, outDnf } = params;
+        const profile = TRACK_OVERTAKE_PROFILES[trackId] || TRACK_OVERTAKE_PROFILES.default;
+        const ws = workspaceFor(size);
+        const schedule = pitSchedule(pitStrategy || [{ lap: Math.floor(totalLaps * 0.4), compound: 'hard' }], totalLaps);
+
+        for (let r = 0; r < races; r++) {
+            const row = r * size;
+            for (let i = 0; i < size; i++) {
+                const d = drivers[driverIdx[row + i]];
+                initCar(ws, i, basePace[row + i], compound[r], tireSmoothness[driverIdx[row + i]], schedule, d.id, d.team);
+            }
+            const startLap = applyLiveState(ws, size, liveState);
+            runLaps(ws, size, startLap, totalLaps, profile, weather[r], scProbability, rngFor(r), null);
+            for (let k = 0; k < size; k++) {
+                const i = ws.order[k];
+                outOrder[row + k] = driverIdx[row + i];
+                outDnf[row + k] = ws.dnf[i];
+            }
+        }
     }
 
     // ─────────────────────────────────────────────────────────────
     // OVERTAKE RESOLUTION (per-lap, position-pair basis)
     // ─────────────────────────────────────────────────────────────
-    function resolveOvertakes(cars, profile, weather, rng, lap, events) {
-        // Sort by current total time to get actual running order
-        const running = cars.filter(c => !c.dnf).sort((a, b) => a.totalTime - b.totalTime);
+    function resolveOvertakes(ws, m, profile, weather, rng, lap, events) {
+        const { running, totalTime, lapTime, lapsOnTire, physics } = ws;
+        const drsZones = profile.zones || 1;
+        const physicsEngine = window.OvertakePhysicsEngine;
 
-        for (let i = 1; i < running.length; i++) {
+        for (let i = 1; i < m; i++) {
             const behind = running[i];
             const ahead = running[i - 1];
 
             // Calculate gap
-            const gap = behind.totalTime - ahead.totalTime;
+            const gap = totalTime[behind] - totalTime[ahead];
 
             // Only attempt overtake if behind car is faster (lower lap time)
-            const paceDelta = ahead.lapTime - behind.lapTime;
+            const paceDelta = lapTime[ahead] - lapTime[behind];
             if (paceDelta <= 0) continue; // Car ahead is faster, no overtake attempt
 
             // DRS availability
             const drsActive = gap < CONFIG.DRS_ACTIVATION_GAP && gap > 0;
-            const drsZones = profile.zones || 1;
 
             // Calculate overtake probability
             let overtakeProb = CONFIG.OVERTAKE_BASE_PROB;
@@ -310,22 +515,20 @@ window.MarkovLapSimulator = (() => {
             if (weather === 'wet') overtakeProb *= 0.6;
 
             // Tire compound advantage (fresher tires help)
-            if (behind.lapsOnTire < ahead.lapsOnTire * 0.5) {
+            if (lapsOnTire[behind] < lapsOnTire[ahead] * 0.5) {
                 overtakeProb += 0.05; // significant tire advantage
             }
 
             // Use OvertakePhysicsEngine if available for more precise calculation
-            if (window.OvertakePhysicsEngine) {
-                const physicsProb = window.OvertakePhysicsEngine.calculateOvertakeProbability({
-                    paceDelta,
-                    gap,
-                    drsActive,
-                    drsZones,
-                    trackDifficulty: profile.difficulty,
-                    weather,
-                    tireDelta: ahead.lapsOnTire - behind.lapsOnTire,
-                    lapsRemaining: 0, // not used here
-                });
+            if (physicsEngine) {
+                physics.paceDelta = paceDelta;
+                physics.gap = gap;
+                physics.drsActive = drsActive;
+                physics.drsZones = drsZones;
+                physics.trackDifficulty = profile.difficulty;
+                physics.weather = weather;
+                physics.tireDelta = lapsOnTire[ahead] - lapsOnTire[behind];
+                const physicsProb = physicsEngine.calculateOvertakeProbability(physics);
                 overtakeProb = (overtakeProb + physicsProb) / 2; // blend both models
             }
 
@@ -335,21 +538,23 @@ window.MarkovLapSimulator = (() => {
             // Attempt overtake
             if (rng.next() < overtakeProb) {
                 // Successful overtake — swap total times slightly
-                const tempTime = ahead.totalTime;
-                ahead.totalTime = behind.totalTime + 0.3; // car that was ahead drops back
-                behind.totalTime = tempTime;
-                behind.overtakes++;
-
-                events.push({
-                    lap, type: 'overtake',
-                    attacker: behind.driver.id,
-                    defender: ahead.driver.id,
-                    drs: drsActive,
-                    prob: overtakeProb.toFixed(3),
-                });
+                const tempTime = totalTime[ahead];
+                totalTime[ahead] = totalTime[behind] + 0.3; // car that was ahead drops back
+                totalTime[behind] = tempTime;
+                ws.overtakes[behind]++;
+
+                if (events) {
+                    events.push({
+                        lap, type: 'overtake',
+                        attacker: ws.driverId[behind],
+                        defender: ws.driverId[ahead],
+                        drs: drsActive,
+                        prob: overtakeProb.toFixed(3),
+                    });
+                }
             } else if (gap < 0.5 && rng.next() < 0.015) {
                 // Very close battle — small incident risk
-                ahead.totalTime += 0.5 + rng.next() * 1.5; // time loss from defending
+                totalTime[ahead] += 0.5 + rng.next() * 1.5; // time loss from defending
             }
         }
     }
@@ -359,6 +564,7 @@ window.MarkovLapSimulator = (() => {
     // ─────────────────────────────────────────────────────────────
     return {
         simulateRace,
+        simulateBatch,
         getTirePace,
         getTrackProfile: (trackId) => TRACK_OVERTAKE_PROFILES[trackId] || TRACK_OVERTAKE_PROFILES.default,
         CONFIG,
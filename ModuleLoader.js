@@ -0,0 +1,185 @@
+'use strict';
+/* ═══════════════════════════════════════════════════════════════
+   MODULE LOADER — ModuleLoader.js
+   On-demand loading for feature modules and engines that nothing on
+   the first-prediction path needs. Those scripts are not in index.html:
+   they are injected the first time their view, panel or feature asks
+   for them, or preloaded when the browser goes idle / the user hovers
+   a nav link.
+
+   Also keeps the startup timeline. mark() records milestones as
+   performance marks (`startup:<name>`, ms since navigation start) and
+   each page load is kept in localStorage, so
+     ModuleLoader.report()
+   compares median time-to-first-prediction-card between lazy loads
+   and `?modules=eager` loads (every module fetched before the
+   Predictions Center starts, i.e. the old bundle).
+   ═══════════════════════════════════════════════════════════════ */
+
+window.ModuleLoader = (() => {
+
+    // Feature modules by group: window global name → script
+    const GROUPS = {
+        'prediction-panels': {
+            ChartVisuals: 'ChartVisuals.js',
+            HistoricalDataSeeder: 'HistoricalDataSeeder.js',
+            WeatherForecast: 'WeatherForecast.js',
+            ExportShare: 'ExportShare.js',
+            PostRaceAnalysis: 'PostRaceAnalysis.js',
+            FantasyCalculator: 'FantasyCalculator.js',
+            GridPenaltyPredictor: 'GridPenaltyPredictor.js',
+            DriverDevelopment: 'DriverDevelopment.js',
+            DarkHorseAlerts: 'DarkHorseAlerts.js',
+            CommunityPredictions: 'CommunityPredictions.js',
+            SeasonArchive: 'SeasonArchive.js',
+            PushNotifications: 'PushNotifications.js',
+            QualifyingRaceSplit: 'QualifyingRaceSplit.js',
+        },
+        'what-if': {
+            WhatIfScenario: 'WhatIfScenario.js',
+        },
+        // Live session stack, loaded by LiveIntelligence once its panel is up
+        'live': {
+            TelemetryStore: 'TelemetryStore.js',
+            LiveTrace: 'LiveTrace.js',
+            LiveStreamEngine: 'LiveStreamEngine.js',
+            TelemetryFuelEngine: 'TelemetryFuelEngine.js',
+        },
+        // Floating API status widget, loaded once the app is idle
+        'api-health': {
+            ApiHealthDashboard: 'ApiHealthDashboard.js',
+        },
+    };
+    const VIEWS = { predictions: ['prediction-panels', 'what-if'] };
+    // Where users usually go next from each view
+    const NEXT = { dashboard: ['predictions'], rankings: ['predictions'], schedule: ['predictions'] };
+
+    const METRICS_KEY = 'f1_startup_metrics_v1';
+    const MAX_RUNS = 20;
+    const EAGER = typeof location !== 'undefined' && /[?&]modules=eager\b/.test(location.search);
+
+    const SOURCES = {};
+    Object.values(GROUPS).forEach(g => Object.assign(SOURCES, g));
+
+    const _loading = new Map();   // module name → Promise
+    const _marks = {};
+    const _loads = {};            // module name → ms to fetch + run
+    let _run = null;
+
+    // ─────────────────────────────────────────────────────────────
+    // LOADING
+    // ─────────────────────────────────────────────────────────────
+    function _inject(name) {
+        if (window[name]) return Promise.resolve(window[name]);
+        if (!_loading.has(name)) {
+            const t0 = performance.now();
+            _loading.set(name, new Promise((resolve, reject) => {
+                const s = document.createElement('script');
+                s.src = SOURCES[name];
+                s.onload = () => { _loads[name] = Math.round(performance.now() - t0); resolve(window[name]); };
+                s.onerror = () => { _loading.delete(name); reject(new Error(`Failed to load ${SOURCES[name]}`)); };
+                document.head.appendChild(s);
+            }));
+        }
+        return _loading.get(name);
+    }
+
+    // names: a module, a group, or an array of either; resolves once all have run
+    function load(names) {
+        const list = [].concat(names).flatMap(n => GROUPS[n] ? Object.keys(GROUPS[n]) : [n]);
+        const unknown = list.filter(n => !SOURCES[n] && !window[n]);
+        if (unknown.length) return Promise.reject(new Error(`Unknown module: ${unknown.join(', ')}`));
+        return Promise.all(list.map(_inject));
+    }
+
+    function loadView(view) {
+        return load(VIEWS[view] || []);
+    }
+
+    function isLoaded(name) { return !!window[name]; }
+
+    // Resolves when the main thread is next idle (immediately in eager mode)
+    function idle(timeout = 2000) {
+        if (EAGER) return Promise.resolve();
+        return new Promise(resolve => {
+            if (typeof requestIdleCallback === 'function') requestIdleCallback(() => resolve(), { timeout });
+            else setTimeout(resolve, 200);
+        });
+    }
+
+    // Fetch a view's modules (and the views usually visited after it) without blocking anything
+    function preload(view) {
+        const views = [view].concat(NEXT[view] || []).filter(v => VIEWS[v]);
+        if (!views.length) return;
+        idle().then(() => views.forEach(v => loadView(v).catch(e => console.warn('[ModuleLoader]', e.message))));
+    }
+
+    // Everything, before the Predictions Center starts: the pre-loader baseline
+    const startup = EAGER ? load(Object.keys(GROUPS)).catch(() => null) : Promise.resolve();
+
+    // ─────────────────────────────────────────────────────────────
+    // STARTUP METRICS
+    // ─────────────────────────────────────────────────────────────
+    function mark(name) {
+        if (name in _marks) return;
+        _marks[name] = Math.round(performance.now());
+        try { performance.mark(`startup:${name}`); } catch (e) { /* ignore */ }
+        _save();
+    }
+
+    // Marks once the current DOM changes have been painted
+    function markPaint(name) {
+        if (typeof requestAnimationFrame !== 'function') { mark(name); return; }
+        requestAnimationFrame(() => setTimeout(() => mark(name), 0));
+    }
+
+    function _history() {
+        try { return JSON.parse(localStorage.getItem(METRICS_KEY)) || []; }
+        catch (e) { return []; }
+    }
+
+    function _save() {
+        const runs = _history();
+        if (!_run) {
+            _run = { at: new Date().toISOString(), mode: EAGER ? 'eager' : 'lazy', marks: _marks };
+            runs.push(_run);
+        } else {
+            runs[runs.length - 1] = _run;
+        }
+        (window.safeStorage || localStorage).setItem(METRICS_KEY, JSON.stringify(runs.slice(-MAX_RUNS)));
+    }
+
+    function getStartupMetrics() {
+        return { mode: EAGER ? 'eager' : 'lazy', marks: { ..._marks }, loads: { ..._loads } };
+    }
+
+    // Median of each milestone per mode over the stored page loads
+    function report() {
+        const median = xs => { const s = xs.slice().sort((a, b) => a - b); return s[Math.floor(s.length / 2)]; };
+        const byMode = {};
+        _history().forEach(r => { (byMode[r.mode] = byMode[r.mode] || []).push(r.marks); });
+        const rows = {};
+        Object.entries(byMode).forEach(([mode, runs]) => {
+            const names = [...new Set(runs.flatMap(Object.keys))];
+            rows[mode] = { runs: runs.length };
+            names.forEach(n => { rows[mode][n] = median(runs.map(m => m[n]).filter(v => v !== undefined)); });
+        });
+        console.log('[ModuleLoader] Startup milestones, median ms since navigation start (reload with ?modules=eager for the baseline)');
+        console.table(rows);
+        console.table(_loads);
+        return rows;
+    }
+
+    function resetMetrics() {
+        (window.safeStorage || localStorage).removeItem(METRICS_KEY);
+        _run = null;
+    }
+
+    return {
+        GROUPS, EAGER, startup,
+        load, loadView, isLoaded, idle, preload,
+        mark, markPaint, getStartupMetrics, report, resetMetrics,
+    };
+})();
+
+console.log('%c[ModuleLoader] Ready — on-demand feature modules + startup metrics', 'color:#94a3b8;font-weight:bold');
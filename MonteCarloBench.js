@@ -0,0 +1,219 @@
+'use strict';
+/* ═══════════════════════════════════════════════════════════════
+   MONTE CARLO MICRO-BENCHMARK — MonteCarloBench.js
+   Node-only. Loads the same DOM-free scripts as MonteCarloWorker.js
+   into a worker thread and times MonteCarloEngine._runBatch through
+   PredictionsCenter.simKernel.runShard. Reports sims/sec and GC
+   pauses; with --baseline, runs an older checkout of the tree side
+   by side and reports whether the counts are bit-identical.
+
+   Usage:
+     node MonteCarloBench.js                          # 2,000 sims × 4 races
+     node MonteCarloBench.js --sims 10000 --rounds 1,3,8 --repeat 5
+     node MonteCarloBench.js --live                   # real-grid + live-state path
+     node MonteCarloBench.js --profile                # per-engine breakdown (SimProfiler)
+     git worktree add /tmp/mc-base HEAD~1
+     node MonteCarloBench.js --baseline /tmp/mc-base  # compare against that tree
+     node MonteCarloBench.js --baseline /tmp/mc-base --expect-identical  # exit 1 on any difference
+   ═══════════════════════════════════════════════════════════════ */
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { Worker, isMainThread, parentPort, workerData } = require('worker_threads');
+const { PerformanceObserver } = require('perf_hooks');
+
+const MODEL_SCRIPTS = [
+  'TireFuelModels.js',
+  'AeroModel.js',
+  'StrategyModel.js',
+  'MonteCarloStability.js',
+  'AdaptiveCore.js',
+  'RaceEvolutionEngine.js',
+  'AeroDynamicsAdvancedModel.js',
+  'OvertakePhysicsEngine.js',
+  'MarkovLapSimulator.js',
+  'predictions.js'
+];
+
+function parseArgs(argv) {
+  const opts = { sims: 2000, rounds: [1, 3, 8, 14], repeat: 3, live: false, profile: false, baseline: null, expectIdentical: false };
+  for (let i = 0; i < argv.length; i++) {
+    const a = argv[i];
+    if (a === '--sims') opts.sims = parseInt(argv[++i], 10);
+    else if (a === '--rounds') opts.rounds = argv[++i].split(',').map(Number);
+    else if (a === '--repeat') opts.repeat = parseInt(argv[++i], 10);
+    else if (a === '--live') opts.live = true;
+    else if (a === '--profile') opts.profile = true;
+    else if (a === '--baseline') opts.baseline = path.resolve(argv[++i]);
+    else if (a === '--expect-identical') opts.expectIdentical = true;
+    else throw new Error(`Unknown argument: ${a}`);
+  }
+  return opts;
+}
+
+// ─────────────────────────────────────────────────────────────
+// WORKER SIDE — one copy of the model per thread, as a pool worker would see it
+// ─────────────────────────────────────────────────────────────
+
+// Scripts run as classic scripts in the thread's own global, so top-level
+// const declarations are shared between them like they are in the browser
+function loadModel(root) {
+  globalThis.window = globalThis;
+  globalThis.self = globalThis;
+  const log = console.log, warn = console.warn, assert = console.assert;
+  console.log = console.warn = console.assert = () => { };
+  try {
+    MODEL_SCRIPTS.forEach(f => vm.runInThisContext(fs.readFileSync(path.join(root, f), 'utf8'), { filename: f }));
+  } finally {
+    console.log = log; console.warn = warn; console.assert = assert;
+  }
+  const center = vm.runInThisContext('PredictionsCenter');
+  if (!center.simKernel) throw new Error(`${root}/predictions.js has no simKernel export`);
+  return { kernel: center.simKernel, drivers: center.getDrivers(), profiler: center.profiler || null };
+}
+
+// Fake LiveIntelligence: real grid for 18 of the drivers (rest filled by simulated quali) + live positions
+function installLive(drivers) {
+  const realGrid = drivers.slice(0, 18).reverse().map((d, i) => ({ driver_number: d.num, position: i + 1, best_lap: 90 + i * 0.1 }));
+  const livePositions = drivers.map((d, i) => ({ driver_number: d.num, position: i + 1, gap_to_leader: i * 1.3 }));
+  globalThis.LiveIntelligence = {
+    getOverrides: () => ({ realGrid }),
+    getState: () => ({ isLiveSession: true, currentLap: 12, livePositions })
+  };
+}
+
+async function runVariant({ root, opts }) {
+  const calendar = JSON.parse(fs.readFileSync(path.join(root, 'data', 'race_calendar_2026.json'), 'utf8')).races;
+  const races = opts.rounds.map(n => calendar.find(r => r.round === n)).filter(Boolean);
+  if (!races.length) throw new Error('No matching rounds in data/race_calendar_2026.json');
+
+  const { kernel, drivers, profiler } = loadModel(root);
+  const profiling = opts.profile && profiler;
+  if (opts.live) installLive(drivers);
+  const snaps = races.map(race => {
+    const snap = kernel.capture(race);
+    snap.data.calendar = calendar;
+    snap.data.results = {};
+    return snap;
+  });
+
+  const pauses = [];
+  const obs = new PerformanceObserver(list => list.getEntries().forEach(e => pauses.push(e.duration)));
+  obs.observe({ entryTypes: ['gc'] });
+  const heap0 = process.memoryUsage().heapUsed;
+
+  const counts = [];
+  let best = Infinity;
+  if (profiling) profiler.setEnabled(true);
+  for (let rep = 0; rep < opts.repeat; rep++) {
+    const t0 = process.hrtime.bigint();
+    races.forEach((race, i) => {
+      kernel.restore(snaps[i]);
+      const c = kernel.runShard(race, 0, opts.sims);
+      if (rep === 0) counts.push(c);
+    });
+    best = Math.min(best, Number(process.hrtime.bigint() - t0) / 1e9);
+  }
+
+  const heap1 = process.memoryUsage().heapUsed;
+  const profile = profiling ? profiler.report() : null;
+  if (profiling) profiler.setEnabled(false);
+  await new Promise(r => setTimeout(r, 50)); // gc entries are delivered asynchronously
+  obs.disconnect();
+  return {
+    races: races.length,
+    seconds: best,
+    simsPerSec: (opts.sims * races.length) / best,
+    counts,
+    gcCount: pauses.length,
+    gcTotalMs: pauses.reduce((a, b) => a + b, 0),
+    gcMaxMs: pauses.length ? Math.max(...pauses) : 0,
+    heapDeltaMb: (heap1 - heap0) / 1048576,
+    profile
+  };
+}
+
+// ─────────────────────────────────────────────────────────────
+// MAIN THREAD
+// ─────────────────────────────────────────────────────────────
+function spawnVariant(label, root, opts) {
+  return new Promise((resolve, reject) => {
+    const w = new Worker(__filename, { workerData: { root, opts } });
+    w.once('message', res => resolve({ label, ...res }));
+    w.once('error', reject);
+    w.once('exit', code => { if (code !== 0) reject(new Error(`${label} worker exited with code ${code}`)); });
+  });
+}
+
+// Compares the slots both layouts share, so a tree whose counts vector grew (e.g. the
+// position histogram appended after the per-driver tallies) still checks its common prefix
+function firstMismatch(a, b) {
+  for (let r = 0; r < a.length; r++) {
+    const len = Math.min(a[r].length, b[r].length);
+    for (let i = 0; i < len; i++) {
+      if (!Object.is(a[r][i], b[r][i])) return { race: r, index: i, a: a[r][i], b: b[r][i] };
+    }
+  }
+  return null;
+}
+
+function report(rows, opts) {
+  console.log(`\nMonte Carlo kernel — ${opts.sims.toLocaleString()} sims × ${rows[0].races} races, best of ${opts.repeat}${opts.live ? ', live grid' : ''}`);
+  console.log('variant       seconds   sims/sec   gc#   gc total ms   gc max ms   heap Δ MB');
+  rows.forEach(r => {
+    console.log(
+      r.label.padEnd(12) +
+      r.seconds.toFixed(3).padStart(9) +
+      Math.round(r.simsPerSec).toLocaleString().padStart(11) +
+      String(r.gcCount).padStart(6) +
+      r.gcTotalMs.toFixed(1).padStart(14) +
+      r.gcMaxMs.toFixed(2).padStart(12) +
+      r.heapDeltaMb.toFixed(1).padStart(12)
+    );
+  });
+}
+
+function reportProfile(row) {
+  const p = row.profile;
+  console.log(`\n${row.label} — per-engine breakdown (hot calls sampled 1 in ${p.sampleEvery}), ${p.sims.toLocaleString()} sims` +
+    (p.allocBytesPerSim !== null ? `, ~${(p.allocBytesPerSim / 1024).toFixed(1)} KB heap growth per sim` : ''));
+  console.log('engine                                                     ms     self ms    µs/sim   calls/sim');
+  const walk = (n, depth) => {
+    console.log(
+      ('  '.repeat(depth) + n.name).padEnd(54) +
+      n.ms.toFixed(1).padStart(10) +
+      n.selfMs.toFixed(1).padStart(12) +
+      (n.usPerSim === null ? '—' : n.usPerSim.toFixed(1)).padStart(10) +
+      (n.callsPerSim === null ? '—' : n.callsPerSim.toFixed(2)).padStart(12)
+    );
+    n.children.filter(c => c.calls).forEach(c => walk(c, depth + 1));
+  };
+  p.tree.filter(n => n.calls).forEach(n => walk(n, 0));
+}
+
+async function main() {
+  const opts = parseArgs(process.argv.slice(2));
+  const rows = [await spawnVariant('current', __dirname, opts)];
+  if (opts.baseline) rows.push(await spawnVariant('baseline', opts.baseline, opts));
+  report(rows, opts);
+  rows.filter(r => r.profile).forEach(reportProfile);
+
+  if (opts.baseline) {
+    const diff = firstMismatch(rows[0].counts, rows[1].counts);
+    console.log(`\nspeedup vs baseline: ${(rows[0].simsPerSec / rows[1].simsPerSec).toFixed(2)}×`);
+    if (diff) {
+      console.log(`counts differ from baseline: race #${diff.race}, slot ${diff.index} (${diff.a} vs ${diff.b})`);
+      if (opts.expectIdentical) process.exitCode = 1;
+    } else {
+      const extra = rows[0].counts[0].length - rows[1].counts[0].length;
+      console.log(`counts bit-identical to baseline${extra ? ` (${extra > 0 ? 'current' : 'baseline'} has ${Math.abs(extra)} extra slots per race)` : ''}`);
+    }
+  }
+}
+
+if (isMainThread) {
+  main().catch(err => { console.error(err); process.exitCode = 1; });
+} else {
+  runVariant(workerData).then(res => parentPort.postMessage(res));
+}
@@ -0,0 +1,54 @@
+'use strict';
+/* ═══════════════════════════════════════════════════════════════
+   MONTE CARLO POOL WORKER — MonteCarloWorker.js
+   One of the persistent workers behind MonteCarloEngine.run.
+   Loads the DOM-free model scripts from index.html plus
+   predictions.js and runs the full _runBatch / calculatePace
+   pipeline over the seed range it is handed.
+
+   Messages in:  { jobId, from, to, profile, job: { race, snapshot, orders } | null }
+                 (job is only sent the first time a worker sees a job)
+   Messages out: { jobId, counts: Float64Array }  — transferred
+                 { jobId, counts, orders }        — when job.orders is set
+                 { jobId, error }
+                 with profile set, results also carry the shard's
+                 SimProfiler counters as `profile`
+   ═══════════════════════════════════════════════════════════════ */
+
+self.window = self;
+
+importScripts(
+  'TireFuelModels.js',
+  'AeroModel.js',
+  'StrategyModel.js',
+  'MonteCarloStability.js',
+  'AdaptiveCore.js',
+  'RaceEvolutionEngine.js',
+  'AeroDynamicsAdvancedModel.js',
+  'OvertakePhysicsEngine.js',
+  'MarkovLapSimulator.js',
+  'predictions.js'
+);
+
+let current = null;
+
+self.onmessage = function (evt) {
+  const msg = evt.data;
+  try {
+    if (msg.job) current = msg.job;
+    const kernel = PredictionsCenter.simKernel, profiler = PredictionsCenter.profiler;
+    profiler.setEnabled(msg.profile);
+    // Restore before every shard: the sim mutates grid penalties, and shards must not leak into each other
+    kernel.restore(current.snapshot);
+    if (current.orders) {
+      const { counts, orders } = kernel.runShard(current.race, msg.from, msg.to, true);
+      self.postMessage({ jobId: msg.jobId, counts, orders, profile: msg.profile ? profiler.drain() : undefined },
+        [counts.buffer, orders.finish.buffer, orders.dnf.buffer, orders.markov.buffer, orders.markovDnf.buffer]);
+    } else {
+      const counts = kernel.runShard(current.race, msg.from, msg.to);
+      self.postMessage({ jobId: msg.jobId, counts, profile: msg.profile ? profiler.drain() : undefined }, [counts.buffer]);
+    }
+  } catch (e) {
+    self.postMessage({ jobId: msg.jobId, error: e.message });
+  }
+};
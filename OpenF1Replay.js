@@ -0,0 +1,218 @@
+'use strict';
+/* ═══════════════════════════════════════════════════════════════
+   OPENF1 RECORD / REPLAY — OpenF1Replay.js
+   Node-only. Records one OpenF1 session to disk and serves it back
+   as a local stand-in for https://api.openf1.org/v1, so the live
+   pipeline (LiveDataEngine, LiveStreamEngine, PitCrewLiveData,
+   TelemetryFuelEngine) can be run and load-tested outside a race.
+
+   The replay clock starts at the session start (plus --skip) when the
+   server starts and runs at --speed × real time. Rows only appear once
+   the clock passes them, and every timestamp is shifted onto the wall
+   clock, so sessions look live and `date>` / `lap_number>` delta
+   queries behave as they do against the real API.
+
+   Usage:
+     node OpenF1Replay.js record --session 9839                 # → data/replays/9839/
+     node OpenF1Replay.js record --session 9839 --out /tmp/r --token <bearer>
+     node OpenF1Replay.js serve --dir data/replays/9839 --speed 10 --skip 600 --port 8787
+   then open the app with ?openf1=http://localhost:8787/v1 (see HttpCache)
+   and watch LiveTrace.report() in the console.
+   ═══════════════════════════════════════════════════════════════ */
+
+const fs = require('fs');
+const path = require('path');
+const http = require('http');
+
+const OPENF1 = 'https://api.openf1.org/v1';
+const CONTEXT = ['sessions', 'drivers', 'stints'];             // always visible
+const TIMED = ['position', 'weather', 'laps', 'pit', 'car_data']; // revealed by the replay clock
+const DATE_FIELDS = ['date', 'date_start', 'date_end'];
+const REQUEST_GAP_MS = 400; // stay under OpenF1's per-second request limit while recording
+
+function parseArgs(argv) {
+  const opts = { cmd: argv[0], session: null, out: null, token: null, dir: null, speed: 1, skip: 0, port: 8787 };
+  for (let i = 1; i < argv.length; i++) {
+    const a = argv[i];
+    if (a === '--session') opts.session = argv[++i];
+    else if (a === '--out') opts.out = path.resolve(argv[++i]);
+    else if (a === '--token') opts.token = argv[++i];
+    else if (a === '--dir') opts.dir = path.resolve(argv[++i]);
+    else if (a === '--speed') opts.speed = Math.max(1, Math.min(50, parseFloat(argv[++i])));
+    else if (a === '--skip') opts.skip = parseFloat(argv[++i]);
+    else if (a === '--port') opts.port = parseInt(argv[++i], 10);
+    else throw new Error(`Unknown argument: ${a}`);
+  }
+  return opts;
+}
+
+// ─────────────────────────────────────────────────────────────
+// RECORD
+// ─────────────────────────────────────────────────────────────
+async function getJSON(url, token) {
+  await new Promise(r => setTimeout(r, REQUEST_GAP_MS));
+  const resp = await fetch(url, { headers: token ? { Authorization: `Bearer ${token}` } : {} });
+  if (!resp.ok) throw new Error(`${resp.status} for ${url}`);
+  return resp.json();
+}
+
+async function record(opts) {
+  if (!opts.session) throw new Error('record needs --session <session_key>');
+  const out = opts.out || path.join(__dirname, 'data', 'replays', String(opts.session));
+  fs.mkdirSync(out, { recursive: true });
+  const q = `session_key=${opts.session}`;
+  const counts = {};
+  const save = (name, rows) => {
+    fs.writeFileSync(path.join(out, `${name}.json`), JSON.stringify(rows));
+    counts[name] = rows.length;
+    console.log(`  ${name.padEnd(10)} ${rows.length.toLocaleString()} rows`);
+  };
+
+  console.log(`Recording session ${opts.session} → ${out}`);
+  for (const name of CONTEXT.concat(TIMED.filter(n => n !== 'car_data'))) {
+    save(name, await getJSON(`${OPENF1}/${name}?${q}`, opts.token));
+  }
+  // car_data is far too large for one response — one request per driver
+  const drivers = JSON.parse(fs.readFileSync(path.join(out, 'drivers.json'), 'utf8'));
+  let carData = [];
+  for (const d of drivers) {
+    carData = carData.concat(await getJSON(`${OPENF1}/car_data?${q}&driver_number=${d.driver_number}`, opts.token));
+  }
+  carData.sort((a, b) => Date.parse(a.date) - Date.parse(b.date));
+  save('car_data', carData);
+
+  const session = JSON.parse(fs.readFileSync(path.join(out, 'sessions.json'), 'utf8'))[0] || {};
+  fs.writeFileSync(path.join(out, 'manifest.json'), JSON.stringify({
+    session_key: Number(opts.session), recordedAt: new Date().toISOString(),
+    date_start: session.date_start || null, date_end: session.date_end || null, counts
+  }, null, 2));
+}
+
+// ─────────────────────────────────────────────────────────────
+// REPLAY
+// ─────────────────────────────────────────────────────────────
+
+// When a row becomes visible, in session time: a lap once it has been completed
+function rowTime(name, row) {
+  if (name === 'laps') {
+    const start = Date.parse(row.date_start);
+    return isNaN(start) ? NaN : start + (row.lap_duration || 0) * 1000;
+  }
+  return Date.parse(row.date);
+}
+
+function loadRecording(dir) {
+  const manifest = JSON.parse(fs.readFileSync(path.join(dir, 'manifest.json'), 'utf8'));
+  const tables = {};
+  CONTEXT.concat(TIMED).forEach(name => {
+    const file = path.join(dir, `${name}.json`);
+    const rows = fs.existsSync(file) ? JSON.parse(fs.readFileSync(file, 'utf8')) : [];
+    // Timed tables sorted by reveal time, so a request only scans the visible prefix
+    const timed = TIMED.includes(name);
+    tables[name] = rows.map(row => ({ row, t: timed ? rowTime(name, row) : -Infinity }))
+      .filter(r => !isNaN(r.t))
+      .sort((a, b) => a.t - b.t);
+  });
+  return { manifest, tables };
+}
+
+// OpenF1 filters: key=value, key>value, key>=value, key<value, key<=value
+function parseFilters(search) {
+  return search.split('&').filter(Boolean).map(part => {
+    const m = decodeURIComponent(part.replace(/\+/g, ' ')).match(/^([a-z_]+)(>=|<=|>|<|=)(.*)$/);
+    return m ? { key: m[1], op: m[2], value: m[3] } : null;
+  }).filter(Boolean);
+}
+
+function matches(row, f) {
+  if (!(f.key in row)) return true; // filters on fields a table doesn't have are ignored
+  const v = row[f.key];
+  let a, b;
+  if (DATE_FIELDS.includes(f.key)) { a = Date.parse(v); b = Date.parse(f.value); }
+  else if (typeof v === 'number') { a = v; b = parseFloat(f.value); }
+  else { a = String(v); b = f.value; }
+  switch (f.op) {
+    case '>': return a > b;
+    case '>=': return a >= b;
+    case '<': return a < b;
+    case '<=': return a <= b;
+    default: return a === b;
+  }
+}
+
+// First index whose row passes pass(); pass must be false then true along the table
+function lowerBound(rows, pass) {
+  let lo = 0, hi = rows.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (pass(rows[mid].row)) hi = mid;
+    else lo = mid + 1;
+  }
+  return lo;
+}
+
+function serve(opts) {
+  if (!opts.dir) throw new Error('serve needs --dir <recording>');
+  const { manifest, tables } = loadRecording(opts.dir);
+  const sessionStart = Date.parse(manifest.date_start) || (tables.position[0] ? tables.position[0].t : Date.now());
+  const s0 = sessionStart + opts.skip * 1000;
+  const t0 = Date.now();
+  const toWall = t => t0 + (t - s0) / opts.speed;
+  const now = () => s0 + (Date.now() - t0) * opts.speed; // replay clock, in session time
+  const iso = t => new Date(toWall(t)).toISOString();
+
+  // Copy of a row with its timestamps on the wall clock (sessions also move to this year)
+  const shift = row => {
+    const out = { ...row };
+    DATE_FIELDS.forEach(k => { if (out[k]) out[k] = iso(Date.parse(out[k])); });
+    if ('year' in out && out.date_start) out.year = new Date(out.date_start).getUTCFullYear();
+    return out;
+  };
+  // The mapping is fixed once the server starts, so rows are shifted once here rather than per request
+  Object.values(tables).forEach(rows => rows.forEach(r => { r.row = shift(r.row); }));
+
+  const stats = { requests: 0, rows: 0 };
+  const server = http.createServer((req, res) => {
+    const [pathname, search = ''] = req.url.split('?');
+    const name = pathname.replace(/^\/v1\//, '').replace(/\/$/, '');
+    res.setHeader('Access-Control-Allow-Origin', '*');
+    res.setHeader('Content-Type', 'application/json');
+    if (!tables[name]) { res.statusCode = 404; res.end(JSON.stringify({ error: `no ${name} in this recording` })); return; }
+
+    const clock = now();
+    const filters = parseFilters(search);
+    const rows = tables[name];
+    // Tables other than laps are sorted by date, so a date> / date>= delta starts at its lower bound
+    let start = 0;
+    if (TIMED.includes(name) && name !== 'laps') {
+      filters.forEach(f => {
+        if (f.key === 'date' && (f.op === '>' || f.op === '>=')) start = Math.max(start, lowerBound(rows, row => matches(row, f)));
+      });
+    }
+    const out = [];
+    for (let i = start; i < rows.length && rows[i].t <= clock; i++) {
+      const row = rows[i].row;
+      if (filters.every(f => matches(row, f))) out.push(row);
+    }
+    stats.requests++;
+    stats.rows += out.length;
+    res.end(JSON.stringify(out));
+  });
+
+  server.listen(opts.port, () => {
+    console.log(`Replaying session ${manifest.session_key} at ${opts.speed}× on http://localhost:${opts.port}/v1`);
+    console.log(`Open the app with ?openf1=http://localhost:${opts.port}/v1`);
+  });
+  setInterval(() => {
+    const lap = tables.laps.filter(r => r.t <= now()).reduce((m, r) => Math.max(m, r.row.lap_number || 0), 0);
+    console.log(`[replay] session +${Math.round((now() - sessionStart) / 1000)}s · lap ${lap} · ${stats.requests} requests · ${stats.rows.toLocaleString()} rows served`);
+  }, 10000).unref();
+  return server;
+}
+
+if (require.main === module) {
+  const opts = parseArgs(process.argv.slice(2));
+  if (opts.cmd === 'record') record(opts).catch(err => { console.error(err.message); process.exitCode = 1; });
+  else if (opts.cmd === 'serve') serve(opts);
+  else console.log('Usage: node OpenF1Replay.js record --session <key> [--out dir] [--token t] | serve --dir <dir> [--speed 1-50] [--skip s] [--port p]');
+}
@@ -58,14 +58,9 @@ window.PitCrewLiveData = (() => {
     // ─────────────────────────────────────────────────────────────
     async function fetchSeasonPitData(year = 2026) {
         try {
-            const controller = new AbortController();
-            const timeout = setTimeout(() => controller.abort(), 10000);
-
-            const resp = await fetch(`${API_BASE}/pit?year=${year}`, { signal: controller.signal });
-            clearTimeout(timeout);
-
-            if (!resp.ok) return null;
-            const data = await resp.json();
+            const res = await window.HttpCache.request(`${API_BASE}/pit?year=${year}`, { ttl: 10 * 60 * 1000, timeout: 10000 });
+            if (!res.ok) return null;
+            const data = res.data;
             if (!Array.isArray(data) || data.length === 0) return null;
 
             processPitData(data);
@@ -83,14 +78,9 @@ window.PitCrewLiveData = (() => {
     async function fetchSessionPitData(sessionKey) {
         if (!sessionKey) return null;
         try {
-            const controller = new AbortController();
-            const timeout = setTimeout(() => controller.abort(), 8000);
-
-            const resp = await fetch(`${API_BASE}/pit?session_key=${sessionKey}`, { signal: controller.signal });
-            clearTimeout(timeout);
-
-            if (!resp.ok) return null;
-            const data = await resp.json();
+            const res = await window.HttpCache.request(`${API_BASE}/pit?session_key=${sessionKey}`, { ttl: 15000, timeout: 8000 });
+            if (!res.ok) return null;
+            const data = res.data;
             if (!Array.isArray(data) || data.length === 0) return null;
 
             processPitData(data);
@@ -18,7 +18,6 @@
 const TelemetryFuelEngine = (() => {
     const API = 'https://api.openf1.org/v1';
     const CACHE_TTL = 30000;
-    const _cache = {};
 
     // ── 2026 TECHNICAL CONSTANTS ──
     const REGS_2026 = {
@@ -52,7 +51,7 @@ const TelemetryFuelEngine = (() => {
         aeroModes: {},       // { driverNumber: 'X' | 'Z' | 'neutral' }
         overrideActive: {},  // { driverNumber: boolean }
         ersDeploy: {},       // { driverNumber: { deployPct, harvestPct, batteryLevel } }
-        lapTimes: {},        // { driverNumber: [lapTimes...] }
+        // car_data samples and lap times live in TelemetryStore's per-driver ring buffers
         currentLap: 0,
         totalLaps: 0,
         trackShort: null,
@@ -60,84 +59,56 @@ const TelemetryFuelEngine = (() => {
         initialized: false,
     };
 
-    // ── CACHED FETCH ──
+    // ── CACHED FETCH (shared HttpCache; falls back to the last good copy) ──
     async function cachedFetch(endpoint, params = {}) {
         const qs = Object.entries(params).map(([k, v]) => `${k}=${encodeURIComponent(v)}`).join('&');
         const url = `${API}${endpoint}${qs ? '?' + qs : ''}`;
-        if (_cache[url] && Date.now() - _cache[url].ts < CACHE_TTL) return _cache[url].data;
-        try {
-            const ctrl = new AbortController();
-            const t = setTimeout(() => ctrl.abort(), 6000);
-            const resp = await fetch(url, { signal: ctrl.signal });
-            clearTimeout(t);
-            if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
-            const data = await resp.json();
-            _cache[url] = { data, ts: Date.now() };
-            return data;
-        } catch (e) {
-            if (_cache[url]) return _cache[url].data;
-            return null;
-        }
+        return window.HttpCache.getJSON(url, { ttl: CACHE_TTL, timeout: 6000 });
     }
 
     // ── PHASE 1: FETCH CAR TELEMETRY ──
+    // One delta poll for the session, from the oldest of the drivers' last samples in the store;
+    // ingestCarData skips what a driver already holds (LiveStreamEngine's car_data stream feeds
+    // the same store, so this usually returns little)
     async function fetchCarTelemetry(sessionKey) {
-        const data = await cachedFetch('/car_data', {
-            session_key: sessionKey,
-            speed: '>0',
-        });
-        if (!data || data.length === 0) return;
-
-        // Get latest telemetry snapshot per driver
-        const latest = {};
-        data.forEach(d => {
-            const dn = d.driver_number;
-            if (!latest[dn] || new Date(d.date) > new Date(latest[dn].date)) {
-                latest[dn] = d;
-            }
-        });
-
-        Object.entries(latest).forEach(([dn, d]) => {
+        const params = { session_key: sessionKey, speed: '>0' };
+        const held = TelemetryStore.drivers().map(dn => TelemetryStore.lastCarTime(dn)).filter(Boolean);
+        if (held.length) params['date>'] = held.sort()[0]; // ISO strings sort by time; → date>=…
+        const data = (await cachedFetch('/car_data', params)) || [];
+        if (data.length === 0) return;
+
+        const added = TelemetryStore.ingestCarData(data);
+
+        // Latest telemetry snapshot per driver
+        TelemetryStore.drivers().forEach(dn => {
+            const t = TelemetryStore.latest(dn);
+            if (!t) return;
             state.telemetry[dn] = {
-                rpm: d.rpm || 0,
-                speed: d.speed || 0,
-                throttle: d.throttle || 0,
-                gear: d.n_gear || 0,
-                drs: d.drs || 0,
-                brake: d.brake || 0,
-                timestamp: d.date,
+                rpm: t.rpm,
+                speed: t.speed,
+                throttle: t.throttle,
+                gear: t.gear,
+                drs: t.drs,
+                brake: t.brake,
+                timestamp: new Date(t.time).toISOString(),
             };
         });
 
-        console.log('[TelemetryFuel] Car telemetry fetched for', Object.keys(latest).length, 'drivers');
+        console.log('[TelemetryFuel] Car telemetry: +' + added, 'samples for', TelemetryStore.drivers().length, 'drivers');
     }
 
     // ── PHASE 2: FETCH LAP TIMES FOR FUEL CORRECTION ──
     async function fetchLapTimesForFuel(sessionKey) {
-        const data = await cachedFetch('/laps', { session_key: sessionKey });
+        const params = { session_key: sessionKey };
+        const from = TelemetryStore.minLastLap();
+        if (from > 0) params['lap_number>'] = from; // → lap_number>=…; laps already held are skipped
+        const data = await cachedFetch('/laps', params);
         if (!data || data.length === 0) return;
 
-        state.lapTimes = {};
-        let maxLap = 0;
-
+        TelemetryStore.ingestLaps(data);
         data.forEach(lap => {
-            const dn = lap.driver_number;
-            if (!state.lapTimes[dn]) state.lapTimes[dn] = [];
-            if (lap.lap_duration && lap.lap_duration > 0 && lap.lap_duration < 200) {
-                state.lapTimes[dn].push({
-                    lap: lap.lap_number,
-                    time: lap.lap_duration,
-                    s1: lap.duration_sector_1,
-                    s2: lap.duration_sector_2,
-                    s3: lap.duration_sector_3,
-                    compound: lap.compound,
-                    isPit: lap.is_pit_out_lap,
-                });
-            }
-            if (lap.lap_number > maxLap) maxLap = lap.lap_number;
+            if (lap.lap_number > state.currentLap) state.currentLap = lap.lap_number;
         });
-
-        state.currentLap = maxLap;
     }
 
     // ── PHASE 3: FUEL LOAD ESTIMATION ──
@@ -145,15 +116,26 @@ const TelemetryFuelEngine = (() => {
     // - Compare first stint laps vs. later laps (removing tire deg outliers)
     // - Each kg of fuel = ~0.035s penalty per lap
     // - Estimated burn rate validated against track-specific rates
+    // Each driver's clean-lap aggregates are maintained by TelemetryStore as laps arrive,
+    // so this is O(1) per driver however long the race has run
+    let _fuelModelRate = null;
     function estimateFuelLoads() {
         const burnRate = TRACK_FUEL_RATES[state.trackShort] || REGS_2026.FUEL_BURN_RATE_KG_PER_LAP;
+        if (burnRate !== _fuelModelRate) {
+            TelemetryStore.setFuelModel({
+                capacityKg: REGS_2026.FUEL_CAPACITY_KG,
+                burnKgPerLap: burnRate,
+                secPerKg: REGS_2026.FUEL_TIME_PENALTY_PER_KG,
+            });
+            _fuelModelRate = burnRate;
+        }
 
-        Object.entries(state.lapTimes).forEach(([dn, laps]) => {
-            if (laps.length < 3) return;
+        TelemetryStore.drivers().forEach(dn => {
+            const laps = TelemetryStore.lapStats(dn);
+            if (!laps || laps.laps < 3) return;
 
-            // Filter out pit laps and outliers
-            const cleanLaps = laps.filter(l => !l.isPit && l.time > 0);
-            if (cleanLaps.length < 3) return;
+            // Pit laps are excluded from the clean-lap aggregates
+            if (laps.cleanLaps < 3 || !laps.edge) return;
 
             // Method 1: Simple burn rate calculation
             const fuelBurned = state.currentLap * burnRate;
@@ -161,15 +143,12 @@ const TelemetryFuelEngine = (() => {
 
             // Method 2: Fuel correction from lap time regression
             // Compare pace progression (later laps should be faster if fuel is burning off)
-            const early = cleanLaps.slice(0, Math.min(5, Math.floor(cleanLaps.length * 0.2)));
-            const late = cleanLaps.slice(-Math.min(5, Math.floor(cleanLaps.length * 0.2)));
-
-            const earlyAvg = early.reduce((s, l) => s + l.time, 0) / early.length;
-            const lateAvg = late.reduce((s, l) => s + l.time, 0) / late.length;
+            const earlyAvg = laps.earlyAvg;
+            const lateAvg = laps.lateAvg;
 
             // Fuel correction: time gained from fuel burn
             const timeDelta = earlyAvg - lateAvg;
-            const lapsElapsed = (late[late.length - 1]?.lap || state.currentLap) - (early[0]?.lap || 1);
+            const lapsElapsed = (laps.lateLap || state.currentLap) - (laps.earlyLap || 1);
             const estimatedBurnPerLap = lapsElapsed > 0 ?
                 Math.abs(timeDelta) / (lapsElapsed * REGS_2026.FUEL_TIME_PENALTY_PER_KG) * burnRate : burnRate;
 
@@ -191,21 +170,23 @@ const TelemetryFuelEngine = (() => {
                 energyPerLapMJ: Math.round(energyPerLap * 10) / 10,
                 pctRemaining: Math.round((fuelRemaining / REGS_2026.FUEL_CAPACITY_KG) * 100),
                 lapsToEmpty: fuelRemaining > 0 ? Math.round(fuelRemaining / burnRate) : 0,
+                correctedLapDelta: laps.correctedDelta !== null ? Math.round(laps.correctedDelta * 1000) / 1000 : null,
             };
         });
     }
 
     // ── PHASE 4: ENGINE PERFORMANCE ESTIMATION ──
-    // Infers relative engine performance from RPM traces and speed data
+    // Infers relative engine performance from RPM traces and speed data: rolling means
+    // and window top speed from TelemetryStore, mode detection from the latest sample
     function estimateEnginePerformance() {
         Object.entries(state.telemetry).forEach(([dn, t]) => {
-            const laps = state.lapTimes[dn] || [];
-            const cleanLaps = laps.filter(l => !l.isPit && l.time > 0);
+            const laps = TelemetryStore.lapStats(dn);
+            const roll = TelemetryStore.rolling(dn) || { rpm: t.rpm, maxSpeed: t.speed, throttle: t.throttle };
 
             // Calculate metrics from telemetry
-            const maxRPM = t.rpm;
-            const topSpeed = t.speed;
-            const throttleUsage = t.throttle;
+            const maxRPM = Math.round(roll.rpm);
+            const topSpeed = Math.round(roll.maxSpeed);
+            const throttleUsage = roll.throttle;
 
             // Power score: normalized composite of RPM, speed, and throttle
             // Higher RPM + Higher speed + Higher throttle = more aggressive engine mapping
@@ -225,10 +206,10 @@ const TelemetryFuelEngine = (() => {
             // Detect Manual Override (sudden ERS deployment spike)
             // In 2026, drivers within 1s of car ahead get 350kW extra
             // Detectable as throttle > 95% + speed acceleration spike
-            state.overrideActive[dn] = throttleUsage > 95 && topSpeed > 300;
+            state.overrideActive[dn] = t.throttle > 95 && t.speed > 300;
 
             // ERS deployment estimate (from throttle patterns)
-            const deployPct = Math.min(100, throttleUsage * 1.1); // Approximate
+            const deployPct = Math.min(100, t.throttle * 1.1); // Approximate
             const harvestPct = t.brake > 50 ? Math.min(100, t.brake * 0.8) : 0;
             const batteryLevel = Math.max(0, Math.min(100, 65 + (harvestPct - deployPct) * 0.3)); // Rough estimate
 
@@ -240,12 +221,8 @@ const TelemetryFuelEngine = (() => {
 
             // Calculate consistency score from lap times
             let consistency = 0;
-            if (cleanLaps.length >= 3) {
-                const times = cleanLaps.map(l => l.time);
-                const mean = times.reduce((s, t) => s + t, 0) / times.length;
-                const variance = times.reduce((s, t) => s + Math.pow(t - mean, 2), 0) / times.length;
-                const stdDev = Math.sqrt(variance);
-                consistency = Math.max(0, 100 - stdDev * 50); // Lower stdDev = more consistent
+            if (laps && laps.cleanLaps >= 3) {
+                consistency = Math.max(0, 100 - laps.stdDev * 50); // Lower stdDev = more consistent
             }
 
             state.enginePerf[dn] = {
@@ -429,6 +406,12 @@ const TelemetryFuelEngine = (() => {
             return;
         }
 
+        // New session: the store has dropped the old one's buffers, drop what was derived from them
+        if (TelemetryStore.setSession(sessionKey)) {
+            state.currentLap = 0;
+            ['telemetry', 'fuelEstimates', 'enginePerf', 'aeroModes', 'overrideActive', 'ersDeploy'].forEach(k => { state[k] = {}; });
+        }
+
         try {
             await Promise.all([
                 fetchCarTelemetry(sessionKey),
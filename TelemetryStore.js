@@ -0,0 +1,290 @@
+'use strict';
+/* ═══════════════════════════════════════════════════════════════
+   TELEMETRY STORE — TelemetryStore.js
+   Per-driver columnar ring buffers for OpenF1 car_data and laps,
+   allocated once per driver so memory stays flat for a whole race.
+
+   car samples: speed, throttle, rpm, gear, brake, drs (Float32Array)
+                + time (Float64Array, epoch ms), CAR_CAPACITY deep
+   laps:        lap number, lap time, fuel-corrected lap time
+                (Float32Array) + pit flag, LAP_CAPACITY deep
+
+   Appends are O(1) and skip anything not newer than what the driver
+   already has, so overlapping delta polls are harmless. Rolling means
+   over the last WINDOW samples, the window top speed, and the clean-lap
+   aggregates TelemetryFuelEngine needs are maintained on append.
+   view() hands out zero-copy subarrays of the ring.
+
+   Buffers belong to one OpenF1 session: setSession() with a new
+   session key drops them, so a race's early laps and samples aren't
+   mistaken for ones already held from practice.
+   ═══════════════════════════════════════════════════════════════ */
+
+window.TelemetryStore = (() => {
+
+    const CAR_CAPACITY = 2048;     // ~9 min of car_data at OpenF1's ~3.7 Hz
+    const LAP_CAPACITY = 128;      // longer than any race
+    const WINDOW = 32;             // rolling-mean window, in samples
+    const EDGE_LAPS = 5;           // early / late clean-lap windows for fuel correction
+    const CAR_COLUMNS = ['speed', 'throttle', 'rpm', 'gear', 'brake', 'drs'];
+
+    const FUEL = { capacityKg: 70, burnKgPerLap: 1.35, secPerKg: 0.035 };
+
+    const _drivers = new Map();    // driverNumber → buffers
+    let _lastCarTime = 0;          // newest car sample across all drivers
+    let _session = null;           // OpenF1 session_key the buffers belong to
+
+    function _create() {
+        const car = { time: new Float64Array(CAR_CAPACITY), count: 0 };
+        CAR_COLUMNS.forEach(c => { car[c] = new Float32Array(CAR_CAPACITY); });
+        return {
+            car,
+            roll: { speed: 0, throttle: 0, rpm: 0, brake: 0 },
+            maxQ: new Int32Array(WINDOW), maxHead: 0, maxLen: 0, // monotonic deque of sample counters
+            laps: {
+                lap: new Float32Array(LAP_CAPACITY),
+                time: new Float32Array(LAP_CAPACITY),
+                corrected: new Float32Array(LAP_CAPACITY),
+                pit: new Uint8Array(LAP_CAPACITY),
+                count: 0,
+                lastLap: 0,
+            },
+            clean: {
+                count: 0, sum: 0, sumSq: 0,
+                early: new Float64Array(EDGE_LAPS), earlyLap: 0,
+                late: new Float64Array(EDGE_LAPS), lateLap: 0,
+                correctedSum: 0, correctedLast: 0, correctedPrev: 0,
+            },
+        };
+    }
+
+    function _driver(dn) {
+        const key = Number(dn);
+        let d = _drivers.get(key);
+        if (!d) { d = _create(); _drivers.set(key, d); }
+        return d;
+    }
+
+    // ─────────────────────────────────────────────────────────────
+    // CAR DATA
+    // ─────────────────────────────────────────────────────────────
+    function _appendCar(d, t, row) {
+        const car = d.car, n = car.count, i = n % CAR_CAPACITY;
+
+        // Rolling sums: add the new sample, drop the one leaving the window
+        if (n >= WINDOW) {
+            const j = (n - WINDOW) % CAR_CAPACITY;
+            d.roll.speed -= car.speed[j]; d.roll.throttle -= car.throttle[j];
+            d.roll.rpm -= car.rpm[j]; d.roll.brake -= car.brake[j];
+        }
+        car.time[i] = t;
+        car.speed[i] = row.speed || 0;
+        car.throttle[i] = row.throttle || 0;
+        car.rpm[i] = row.rpm || 0;
+        car.gear[i] = row.n_gear || 0;
+        car.brake[i] = row.brake || 0;
+        car.drs[i] = row.drs || 0;
+        d.roll.speed += car.speed[i]; d.roll.throttle += car.throttle[i];
+        d.roll.rpm += car.rpm[i]; d.roll.brake += car.brake[i];
+
+        // Window max speed: evict expired counters from the front, dominated ones from the back
+        const q = d.maxQ;
+        if (d.maxLen && q[d.maxHead] <= n - WINDOW) { d.maxHead = (d.maxHead + 1) % WINDOW; d.maxLen--; }
+        while (d.maxLen && car.speed[q[(d.maxHead + d.maxLen - 1) % WINDOW] % CAR_CAPACITY] <= car.speed[i]) d.maxLen--;
+        q[(d.maxHead + d.maxLen) % WINDOW] = n;
+        d.maxLen++;
+
+        car.count = n + 1;
+    }
+
+    // OpenF1 car_data rows, any order and any mix of drivers; returns samples appended.
+    // Rows are taken in date order, so only samples at or before a driver's newest held one are skipped.
+    function ingestCarData(rows) {
+        if (!Array.isArray(rows)) return 0;
+        let added = 0;
+        const samples = rows.map(r => ({ r, t: Date.parse(r.date) })).filter(({ r, t }) => r.driver_number && !isNaN(t));
+        samples.sort((a, b) => a.t - b.t).forEach(({ r, t }) => {
+            const d = _driver(r.driver_number), car = d.car;
+            if (car.count && t <= car.time[(car.count - 1) % CAR_CAPACITY]) return;
+            _appendCar(d, t, r);
+            if (t > _lastCarTime) _lastCarTime = t;
+            added++;
+        });
+        return added;
+    }
+
+    // ─────────────────────────────────────────────────────────────
+    // LAPS
+    // ─────────────────────────────────────────────────────────────
+    function _fuelPenalty(lap) {
+        return Math.max(0, FUEL.capacityKg - lap * FUEL.burnKgPerLap) * FUEL.secPerKg;
+    }
+
+    function _appendLap(d, lapNumber, time, isPit) {
+        const L = d.laps, i = L.count % LAP_CAPACITY;
+        L.lap[i] = lapNumber;
+        L.time[i] = time;
+        L.corrected[i] = time - _fuelPenalty(lapNumber);
+        L.pit[i] = isPit ? 1 : 0;
+        L.count++;
+        L.lastLap = lapNumber;
+        if (isPit) return;
+
+        const c = d.clean, k = c.count % EDGE_LAPS;
+        if (c.count < EDGE_LAPS) {
+            c.early[c.count] = time;
+            if (c.count === 0) c.earlyLap = lapNumber;
+        }
+        c.late[k] = time;
+        c.lateLap = lapNumber;
+        c.count++;
+        c.sum += time;
+        c.sumSq += time * time;
+        c.correctedPrev = c.correctedLast;
+        c.correctedLast = L.corrected[i];
+        c.correctedSum += L.corrected[i];
+    }
+
+    // OpenF1 laps rows; laps without a valid duration yet are skipped and picked up on a later poll
+    function ingestLaps(rows) {
+        if (!Array.isArray(rows)) return 0;
+        let added = 0;
+        rows.slice().sort((a, b) => a.lap_number - b.lap_number).forEach(l => {
+            if (!l.driver_number || !(l.lap_duration > 0 && l.lap_duration < 200)) return;
+            const d = _driver(l.driver_number);
+            if (l.lap_number <= d.laps.lastLap) return;
+            _appendLap(d, l.lap_number, l.lap_duration, !!l.is_pit_out_lap);
+            added++;
+        });
+        return added;
+    }
+
+    // Re-derive fuel-corrected times for a different track burn rate (only on track change)
+    function setFuelModel(model) {
+        Object.assign(FUEL, model);
+        _drivers.forEach(d => {
+            const L = d.laps, c = d.clean, n = Math.min(L.count, LAP_CAPACITY);
+            c.correctedSum = 0;
+            for (let k = L.count - n; k < L.count; k++) {
+                const i = k % LAP_CAPACITY;
+                L.corrected[i] = L.time[i] - _fuelPenalty(L.lap[i]);
+                if (!L.pit[i]) { c.correctedPrev = c.correctedLast; c.correctedLast = L.corrected[i]; c.correctedSum += L.corrected[i]; }
+            }
+        });
+    }
+
+    // ─────────────────────────────────────────────────────────────
+    // READS — all O(1) except view()'s subarray setup
+    // ─────────────────────────────────────────────────────────────
+    function latest(dn) {
+        const d = _drivers.get(Number(dn));
+        if (!d || !d.car.count) return null;
+        const car = d.car, i = (car.count - 1) % CAR_CAPACITY;
+        return {
+            speed: car.speed[i], throttle: car.throttle[i], rpm: car.rpm[i],
+            gear: car.gear[i], brake: car.brake[i], drs: car.drs[i], time: car.time[i],
+        };
+    }
+
+    function rolling(dn) {
+        const d = _drivers.get(Number(dn));
+        if (!d || !d.car.count) return null;
+        const n = Math.min(d.car.count, WINDOW);
+        return {
+            samples: n,
+            speed: d.roll.speed / n, throttle: d.roll.throttle / n,
+            rpm: d.roll.rpm / n, brake: d.roll.brake / n,
+            maxSpeed: d.car.speed[d.maxQ[d.maxHead] % CAR_CAPACITY],
+        };
+    }
+
+    // Clean-lap aggregates: `edge` = the early/late window size estimateFuelLoads uses,
+    // min(EDGE_LAPS, 20% of clean laps)
+    function lapStats(dn) {
+        const d = _drivers.get(Number(dn));
+        if (!d) return null;
+        const c = d.clean;
+        const edge = Math.min(EDGE_LAPS, Math.floor(c.count * 0.2));
+        let earlySum = 0, lateSum = 0;
+        for (let k = 0; k < edge; k++) {
+            earlySum += c.early[k];
+            lateSum += c.late[(c.count - 1 - k) % EDGE_LAPS];
+        }
+        const mean = c.count ? c.sum / c.count : 0;
+        return {
+            laps: d.laps.count,
+            cleanLaps: c.count,
+            lastLap: d.laps.lastLap,
+            edge,
+            earlyAvg: edge ? earlySum / edge : null,
+            lateAvg: edge ? lateSum / edge : null,
+            earlyLap: c.earlyLap,
+            lateLap: c.lateLap,
+            mean,
+            stdDev: c.count ? Math.sqrt(Math.max(0, c.sumSq / c.count - mean * mean)) : 0,
+            correctedMean: c.count ? c.correctedSum / c.count : null,
+            correctedDelta: c.count > 1 ? c.correctedLast - c.correctedPrev : null, // last clean lap vs the one before, fuel-corrected
+        };
+    }
+
+    // Zero-copy: the column's samples, oldest first, as one or two subarrays of the ring
+    function view(dn, column) {
+        const d = _drivers.get(Number(dn));
+        if (!d) return [];
+        const isLap = column === 'lapTime' || column === 'lap' || column === 'corrected';
+        const buf = isLap ? d.laps[column === 'lapTime' ? 'time' : column] : d.car[column];
+        if (!buf) return [];
+        const count = isLap ? d.laps.count : d.car.count, cap = buf.length;
+        if (count <= cap) return [buf.subarray(0, count)];
+        const head = count % cap;
+        return head ? [buf.subarray(head), buf.subarray(0, head)] : [buf];
+    }
+
+    function drivers() { return [..._drivers.keys()]; }
+
+    // Newest sample held for one driver (delta queries), or across all drivers without dn
+    function lastCarTime(dn) {
+        let t = _lastCarTime;
+        if (dn !== undefined) {
+            const d = _drivers.get(Number(dn));
+            t = d && d.car.count ? d.car.time[(d.car.count - 1) % CAR_CAPACITY] : 0;
+        }
+        return t ? new Date(t).toISOString() : null;
+    }
+
+    function minLastLap() {
+        let min = Infinity;
+        _drivers.forEach(d => { if (d.laps.count) min = Math.min(min, d.laps.lastLap); });
+        return min === Infinity ? 0 : min;
+    }
+
+    function reset() {
+        _drivers.clear();
+        _lastCarTime = 0;
+    }
+
+    // Call before ingesting a session's rows; true (after a reset) when the session changed
+    function setSession(sessionKey) {
+        if (sessionKey === undefined || sessionKey === null || String(sessionKey) === _session) return false;
+        const changed = _session !== null;
+        _session = String(sessionKey);
+        if (changed) reset();
+        return changed;
+    }
+
+    function memoryBytes() {
+        let bytes = 0;
+        _drivers.forEach(d => {
+            bytes += d.car.time.byteLength + CAR_COLUMNS.reduce((s, c) => s + d.car[c].byteLength, 0);
+            bytes += d.laps.lap.byteLength + d.laps.time.byteLength + d.laps.corrected.byteLength + d.laps.pit.byteLength;
+        });
+        return bytes;
+    }
+
+    return {
+        CAR_CAPACITY, LAP_CAPACITY, WINDOW,
+        ingestCarData, ingestLaps, setFuelModel,
+        latest, rolling, lapStats, view,
+        drivers, lastCarTime, minLastLap, reset, setSession, memoryBytes,
+    };
+})();
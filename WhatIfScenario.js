@@ -5,6 +5,9 @@
    conditions: weather changes, driver DNFs, team upgrades,
    etc. Re-runs simulations with modified parameters and shows
    comparison between baseline and scenario results.
+   Scenarios are plain specs (createScenario), so a batch of them can
+   be evaluated against the baseline with common random numbers via
+   MonteCarloEngine.runScenarios.
    ═══════════════════════════════════════════════════════════════ */
 
 window.WhatIfScenario = (() => {
@@ -23,6 +26,7 @@ window.WhatIfScenario = (() => {
   let _currentScenario = { ...DEFAULT_SCENARIO };
   let _baselineResult = null;
   let _scenarioResult = null;
+  let _batchResult = null;
 
   function reset() {
     _currentScenario = { ...DEFAULT_SCENARIO, forceDNFs: [], teamUpgrades: {}, penaltyGridDrops: {}, driverBoosts: {} };
@@ -55,33 +59,73 @@ window.WhatIfScenario = (() => {
   function getScenario() { return { ..._currentScenario }; }
   function isActive() { return _currentScenario.active; }
 
-  function applyToRace(race) {
+  function _hasModifications(sc) {
+    return sc.weather !== 'dry' || sc.forceDNFs.length > 0 || sc.scProbOverride !== null ||
+      Object.values(sc.teamUpgrades).some(v => v) || Object.values(sc.penaltyGridDrops).some(v => v) ||
+      Object.values(sc.driverBoosts).some(v => v && v !== 1);
+  }
+
+  // Standalone spec for batch evaluation; does not touch the builder's current scenario.
+  // `label` and any other extra fields are carried through to the batch report.
+  function createScenario(overrides = {}) {
+    const sc = {
+      ...DEFAULT_SCENARIO,
+      ...overrides,
+      forceDNFs: [...(overrides.forceDNFs || [])],
+      teamUpgrades: { ...(overrides.teamUpgrades || {}) },
+      penaltyGridDrops: { ...(overrides.penaltyGridDrops || {}) },
+      driverBoosts: { ...(overrides.driverBoosts || {}) }
+    };
+    sc.active = _hasModifications(sc);
+    return sc;
+  }
+
+  // One scenario per team on top of the current one, each adding `delta` to that team's upgrade
+  function teamUpgradeSweep(teamIds, delta) {
+    return teamIds.map(teamId => createScenario({
+      ..._currentScenario,
+      label: `${teamId.replace(/_/g, ' ')} ${delta > 0 ? '+' : ''}${delta}`,
+      teamUpgrades: { ..._currentScenario.teamUpgrades, [teamId]: (_currentScenario.teamUpgrades[teamId] || 0) + delta }
+    }));
+  }
+
+  // Run fn with `scenario` standing in for the current one (main-thread batch fallback)
+  function evaluate(scenario, fn) {
+    const prev = _currentScenario;
+    _currentScenario = scenario;
+    try { return fn(); } finally { _currentScenario = prev; }
+  }
+
+  function applyToRace(race, scenario = _currentScenario) {
     const modified = { ...race };
-    if (_currentScenario.weather !== 'dry') {
-      modified.weather = _currentScenario.weather;
-      if (_currentScenario.weather === 'wet' || _currentScenario.weather === 'heavy_rain') {
+    if (scenario.weather !== 'dry') {
+      modified.weather = scenario.weather;
+      if (scenario.weather === 'wet' || scenario.weather === 'heavy_rain') {
         modified.sc_probability = Math.max(modified.sc_probability || 0.3, 0.65);
-      } else if (_currentScenario.weather === 'damp') {
+      } else if (scenario.weather === 'damp') {
         modified.sc_probability = Math.max(modified.sc_probability || 0.3, 0.45);
       }
     }
-    if (_currentScenario.scProbOverride !== null) {
-      modified.sc_probability = _currentScenario.scProbOverride;
+    if (scenario.scProbOverride !== null) {
+      modified.sc_probability = scenario.scProbOverride;
+    }
+    if (Object.values(scenario.penaltyGridDrops).some(v => v)) {
+      modified.grid_drops = { ...scenario.penaltyGridDrops };
     }
     return modified;
   }
 
-  function getDriverModifier(driver) {
+  function getDriverModifier(driver, scenario = _currentScenario) {
     let modifier = 1.0;
-    const teamDelta = _currentScenario.teamUpgrades[driver.team];
+    const teamDelta = scenario.teamUpgrades[driver.team];
     if (teamDelta) {
       modifier += teamDelta * 0.01;
     }
-    const driverBoost = _currentScenario.driverBoosts[driver.id];
+    const driverBoost = scenario.driverBoosts[driver.id];
     if (driverBoost) {
       modifier *= driverBoost;
     }
-    if (_currentScenario.weather === 'wet' || _currentScenario.weather === 'heavy_rain') {
+    if (scenario.weather === 'wet' || scenario.weather === 'heavy_rain') {
       const wetDrivers = {
         'verstappen': 1.08, 'hamilton': 1.08, 'alonso': 1.05, 'norris': 1.03,
         'sainz': 1.02, 'russell': 1.01, 'gasly': 1.01, 'ocon': 1.01,
@@ -104,6 +148,8 @@ window.WhatIfScenario = (() => {
   function setScenarioResult(result) { _scenarioResult = result; }
   function getBaseline() { return _baselineResult; }
   function getScenarioResult() { return _scenarioResult; }
+  function setBatchResult(batch) { _batchResult = batch; }
+  function getBatchResult() { return _batchResult; }
 
   function buildComparisonHTML(baseline, scenario, drivers) {
     if (!baseline || !scenario) return '<div style="color:#666;padding:1rem;font-size:0.7rem">Run both baseline and scenario to see comparison.</div>';
@@ -140,15 +186,18 @@ window.WhatIfScenario = (() => {
       const change = bPos - sPos;
       const changeColor = change > 0 ? '#00dc50' : change < 0 ? '#ff4444' : '#666';
       const changeIcon = change > 0 ? '\u25b2' : change < 0 ? '\u25bc' : '\u2013';
-      const winDelta = (sEntry.winProb - b.winProb).toFixed(1);
+      // Paired (common-random-numbers) delta and its CI when the scenario came from runScenarios
+      const paired = scenario.deltas ? scenario.deltas.find(x => x.driver.id === b.driver.id) : null;
+      const winDelta = (paired ? paired.win : sEntry.winProb - b.winProb).toFixed(1);
       const winColor = parseFloat(winDelta) > 0 ? '#00dc50' : parseFloat(winDelta) < 0 ? '#ff4444' : '#666';
+      const winCI = paired ? ` <span style="color:#666;font-size:0.55rem">\u00b1${paired.winCI.toFixed(1)}</span>` : '';
 
       html += `<tr style="border-bottom:1px solid #ffffff06${change !== 0 ? ';background:#ffffff04' : ''}">
         <td style="padding:0.3rem;color:${b.driver.color}">${b.driver.name}</td>
         <td style="text-align:center">P${bPos}</td>
         <td style="text-align:center;font-weight:bold">P${sPos}</td>
         <td style="text-align:center;color:${changeColor};font-weight:bold">${changeIcon}${Math.abs(change) || ''}</td>
-        <td style="text-align:center;color:${winColor}">${parseFloat(winDelta) > 0 ? '+' : ''}${winDelta}%</td>
+        <td style="text-align:center;color:${winColor}">${parseFloat(winDelta) > 0 ? '+' : ''}${winDelta}%${winCI}</td>
       </tr>`;
     });
 
@@ -156,6 +205,30 @@ window.WhatIfScenario = (() => {
     return html;
   }
 
+  // Sweep table: one row per scenario with the biggest paired win-probability movers
+  function buildBatchHTML(batch) {
+    if (!batch || !batch.scenarios.length) return '';
+    let html = '<div style="margin-top:0.8rem">';
+    html += `<div style="font-size:0.75rem;color:#a78bfa;font-weight:bold;margin-bottom:0.5rem">\ud83e\uddea SCENARIO SWEEP \u2014 ${batch.scenarios.length} scenarios \u00d7 ${batch.sims.toLocaleString()} paired sims</div>`;
+    html += '<table style="width:100%;border-collapse:collapse;font-size:0.62rem">';
+    html += '<tr style="color:#666;border-bottom:1px solid #ffffff0a"><th style="text-align:left;padding:0.3rem">Scenario</th><th style="text-align:left">Biggest win % movers (\u00b195% CI)</th><th>CI vs independent</th></tr>';
+    batch.scenarios.forEach(sc => {
+      const movers = sc.deltas.slice(0, 3).map(d => {
+        const col = d.win > 0 ? '#00dc50' : d.win < 0 ? '#ff4444' : '#666';
+        return `<span style="color:${d.driver.color}">${d.driver.name}</span> <span style="color:${col}">${d.win > 0 ? '+' : ''}${d.win.toFixed(1)}</span><span style="color:#666">\u00b1${d.winCI.toFixed(1)}</span>`;
+      }).join(' \u00b7 ');
+      const top = sc.deltas[0];
+      const gain = top && top.winCI > 0 ? (top.winCIIndependent / top.winCI).toFixed(1) + '\u00d7 tighter' : '\u2014';
+      html += `<tr style="border-bottom:1px solid #ffffff06">
+        <td style="padding:0.3rem;color:#ccc;text-transform:capitalize">${sc.label || 'Scenario'}</td>
+        <td>${movers}</td>
+        <td style="text-align:center;color:#888">${gain}</td>
+      </tr>`;
+    });
+    html += '</table></div>';
+    return html;
+  }
+
   function renderPanel(drivers, teams) {
     return `
       <div id="whatif-panel" style="background:linear-gradient(135deg,#0a0e14,#0d1117);border:1px solid #a78bfa22;border-radius:12px;padding:1.2rem;margin-bottom:1.5rem">
@@ -235,11 +308,17 @@ window.WhatIfScenario = (() => {
             onmouseout="this.style.borderColor='#a78bfa55';this.style.boxShadow='none'">
             \ud83d\udd2e Run What-If Simulation
           </button>
+          <button onclick="PredictionsCenter.sweepWhatIf()"
+            style="padding:0.6rem 1.1rem;background:#0d1117;border:1px solid #a78bfa33;color:#a78bfa;border-radius:8px;cursor:pointer;font-family:'Orbitron',monospace;font-size:0.65rem;letter-spacing:0.5px"
+            title="Every team +1.0 on top of the current scenario, evaluated in one paired batch">
+            \ud83e\uddea Sweep Team Upgrades
+          </button>
           <span style="color:#48484a;font-size:0.55rem;font-family:monospace">${_currentScenario.active ? '\u26a1 Scenario active' : '\u2014 No modifications'}</span>
         </div>
 
         <!-- Comparison Output -->
         <div id="whatif-comparison"></div>
+        <div id="whatif-sweep"></div>
       </div>
     `;
   }
@@ -249,7 +328,8 @@ window.WhatIfScenario = (() => {
     setSCOverride, setGridPenalty, setDriverBoost, getScenario, isActive,
     applyToRace, getDriverModifier, isForcedDNF, getGridPenalty,
     setBaseline, setScenarioResult, getBaseline, getScenarioResult,
-    buildComparisonHTML, renderPanel
+    createScenario, teamUpgradeSweep, evaluate, setBatchResult, getBatchResult,
+    buildComparisonHTML, buildBatchHTML, renderPanel
   };
 })();
 
@@ -915,6 +915,7 @@ const AppRouter = (() => {
     if (view === 'predictions' && typeof PredictionsCenter !== 'undefined') {
       PredictionsCenter.loadAndRender();
     }
+    if (window.ModuleLoader) ModuleLoader.preload(view);
   }
 
   function goTeam(id) {
@@ -1019,6 +1020,10 @@ const AppRouter = (() => {
         const view = link.dataset.view;
         if (view) goView(view);
       });
+      // Hovering a tab is a good hint it is next: fetch its modules early
+      link.addEventListener('pointerenter', () => {
+        if (link.dataset.view && window.ModuleLoader) ModuleLoader.preload(link.dataset.view);
+      }, { once: true });
     });
 
     // Mobile features
@@ -1070,6 +1075,11 @@ const AutoRefresh = (() => {
       console.error('[App] Failed to load F1 data.');
       return;
     }
+    if (window.ModuleLoader) {
+      ModuleLoader.mark('data');
+      ModuleLoader.idle().then(() => ModuleLoader.load('api-health'))
+        .catch(e => console.warn('[App] API health widget:', e.message));
+    }
 
     // Ticker
     Ticker.build(data);
@@ -1139,7 +1149,8 @@ const AutoRefresh = (() => {
     // On fast CDNs like Vercel Edge, DataLoader.load() resolves in <10ms which can outrace defer scripts
     function waitForPredictions(retries) {
       if (typeof PredictionsCenter !== 'undefined') {
-        PredictionsCenter.init();
+        // ModuleLoader.startup only waits in ?modules=eager mode (the all-up-front baseline)
+        Promise.resolve(window.ModuleLoader?.startup).then(() => PredictionsCenter.init());
       } else if (retries > 0) {
         setTimeout(() => waitForPredictions(retries - 1), 100);
       } else {
@@ -192,8 +192,17 @@ const PredictionsCenter = (() => {
 
   // Stateful seeded RNG (per simulation run)
   class RNG {
-    constructor(seed) { this.s = (seed || 1) % 2147483647; }
-    next() { this.s = (this.s * 16807) % 2147483647; return (this.s - 1) / 2147483646; }
+    constructor(seed) { this.reseed(seed); }
+    reseed(seed) { this.s = (seed || 1) % 2147483647; return this; }
+    // s * 16807 < 2^46 is exact in a double; reducing it mod the Mersenne prime 2^31 - 1 by
+    // folding the high bits back in gives the same value as % without a floating-point fmod
+    next() {
+      const x = this.s * 16807, hi = Math.floor(x / 2147483648);
+      let s = x - hi * 2147483648 + hi;
+      if (s >= 2147483647) s -= 2147483647;
+      this.s = s;
+      return (s - 1) / 2147483646;
+    }
     norm(m, sd) { const u = Math.max(this.next(), 1e-9), v = this.next(); return m + sd * Math.sqrt(-2 * Math.log(u)) * Math.cos(2 * Math.PI * v); }
     range(a, b) { return a + this.next() * (b - a); }
   }
@@ -690,7 +699,8 @@ const PredictionsCenter = (() => {
       ferrari: 0.055, mclaren: 0.06, mercedes: 0.07, red_bull: 0.065, alpine: 0.08,
       haas: 0.085, audi: 0.10, racing_bulls: 0.09, williams: 0.09, cadillac: 0.12, aston_martin: 0.18
     },
-    roll(driver, weather, rng, driverPersContext) {
+    // Per-race failure chances for engine, gearbox, cooling, hybrid (may exceed 1)
+    _rates(driver, weather, driverPersContext) {
       const comp = ComponentReliability.getComponents(driver.team);
       const tr = DynamicModel.teamRatings[driver.team];
       const relMod = tr ? (2.0 - tr.reliability) : 1.0;
@@ -711,10 +721,19 @@ const PredictionsCenter = (() => {
       const errMod = pers.mistake_rate;
       const rookieMod = isRookie ? HistoricalPerformanceMatrix.drivers.rookie_prospect.dnf_rate : 1.0;
 
-      const engineFail = rng.next() < comp.engine * wMod * relMod * (2.0 - histRel) * rookieMod * SeasonComponentWear.getComponentWearMult(driver.team, 'engine');
-      const gearboxFail = rng.next() < comp.gearbox * wMod * relMod * aggrMod * rookieMod * SeasonComponentWear.getComponentWearMult(driver.team, 'gearbox');
-      const coolingFail = rng.next() < comp.cooling * (weather.dnfMod > 1.5 ? wMod * 1.3 : wMod) * relMod * SeasonComponentWear.getComponentWearMult(driver.team, 'cooling');
-      const hybridFail = rng.next() < comp.hybrid * wMod * relMod * errMod * SeasonComponentWear.getComponentWearMult(driver.team, 'hybrid');
+      return [
+        comp.engine * wMod * relMod * (2.0 - histRel) * rookieMod * SeasonComponentWear.getComponentWearMult(driver.team, 'engine'),
+        comp.gearbox * wMod * relMod * aggrMod * rookieMod * SeasonComponentWear.getComponentWearMult(driver.team, 'gearbox'),
+        comp.cooling * (weather.dnfMod > 1.5 ? wMod * 1.3 : wMod) * relMod * SeasonComponentWear.getComponentWearMult(driver.team, 'cooling'),
+        comp.hybrid * wMod * relMod * errMod * SeasonComponentWear.getComponentWearMult(driver.team, 'hybrid')
+      ];
+    },
+    roll(driver, weather, rng, driverPersContext) {
+      const rates = this._rates(driver, weather, driverPersContext);
+      const engineFail = rng.next() < rates[0];
+      const gearboxFail = rng.next() < rates[1];
+      const coolingFail = rng.next() < rates[2];
+      const hybridFail = rng.next() < rates[3];
 
       const failed = engineFail || gearboxFail || coolingFail || hybridFail;
 
@@ -724,6 +743,10 @@ const PredictionsCenter = (() => {
 
       return failed;
     },
+    // Chance roll() retires this driver, without consuming randomness or booking penalties
+    probability(driver, weather, driverPersContext) {
+      return 1 - this._rates(driver, weather, driverPersContext).reduce((p, r) => p * (1 - Math.min(1, r)), 1);
+    },
     getFailureType(driver, rng) {
       const r = rng.next();
       if (r < 0.35) return 'Engine';
@@ -946,7 +969,10 @@ const PredictionsCenter = (() => {
     }
   };
 
-  function calculatePace(driver, race, rng, wp, isLateRace, weather, isQuali = false, aeroParams = null) {
+  // Everything in the pace formula except the RNG draws. Depends only on
+  // (driver, race, isLateRace, weather, isQuali) and on model state that is
+  // constant for the length of a Monte Carlo batch, so PaceProfileCache can reuse it.
+  function buildPaceProfile(driver, race, isLateRace, weather, isQuali) {
     let base_rolling_team_rating = DynamicModel.getTeamRating(driver.team);
     let driver_form_mult = DynamicModel.getDriverFormMult(driver.id);
     driver_form_mult *= WeekendFormEngine.getMultiplier(driver.id, race, driver_form_mult);
@@ -1058,80 +1084,86 @@ const PredictionsCenter = (() => {
       basePace *= trackHistMod;
     }
 
-    // D. Always-on Strategy Window Model (not just live)
+    // D. Always-on Strategy Window Model (not just live) — the draw happens in calculatePace
+    let hasStrategyRoll = false, strategyChance = 0;
     if (window.StrategyWindowModel && !isQuali) {
       const sTireLaps = Math.max(5, Math.floor((race.laps || 57) / ((race.strategy_stops || 1) + 1)));
       const sTrackTemp = 35;
       const sUndercutDelta = window.StrategyWindowModel.calculateUndercutDelta('medium', sTireLaps, 'hard', sTrackTemp);
       const sSuccess = window.StrategyWindowModel.getPitSuccessProbability(sUndercutDelta);
       const stratEff = StrategyEngine.EFF[driver.team] || 0.85;
-      if (rng.next() < sSuccess * stratEff) {
-        basePace += 0.003;
-      }
+      hasStrategyRoll = true;
+      strategyChance = sSuccess * stratEff;
     }
 
-    // D. Always-on Tire Degradation Model (offline sim too)
-    if (!isQuali && typeof TireDegradationModel !== 'undefined') {
-      const simLapsOnTire = Math.floor((race.laps || 57) / ((race.strategy_stops || 1) + 1) * 0.6);
-      const simComp = 'medium';
-      const simDeg = TireDegradationModel.getPaceModifier(
-        simComp, simLapsOnTire, 35,
-        DriverPersonalityMatrix[driver.id]?.tire_smoothness || 1.0,
-        race.tire_deg || 'Medium', 50
-      );
-      basePace -= simDeg * 0.15;
-    }
-
-    // D. Always-on Fuel Mass gain (offline sim too)
-    if (!isQuali && typeof FuelMassModel !== 'undefined') {
-      const midRaceLap = Math.floor((race.laps || 57) * 0.5);
-      basePace += FuelMassModel.getPaceModifier(midRaceLap, race.laps || 57, 0) * 0.2;
-    }
+    // Remaining additive terms, applied to both outcomes of the strategy roll
+    const finish = (basePace) => {
+      // D. Always-on Tire Degradation Model (offline sim too)
+      if (!isQuali && typeof TireDegradationModel !== 'undefined') {
+        const simLapsOnTire = Math.floor((race.laps || 57) / ((race.strategy_stops || 1) + 1) * 0.6);
+        const simComp = 'medium';
+        const simDeg = TireDegradationModel.getPaceModifier(
+          simComp, simLapsOnTire, 35,
+          DriverPersonalityMatrix[driver.id]?.tire_smoothness || 1.0,
+          race.tire_deg || 'Medium', 50
+        );
+        basePace -= simDeg * 0.15;
+      }
 
-    // D. Race Evolution Engine integration
-    if (!isQuali && window.RaceEvolutionEngine) {
-      const fuelGain = window.RaceEvolutionEngine.fuelMassGain(50);
-      basePace += fuelGain * 0.0005;
-    }
+      // D. Always-on Fuel Mass gain (offline sim too)
+      if (!isQuali && typeof FuelMassModel !== 'undefined') {
+        const midRaceLap = Math.floor((race.laps || 57) * 0.5);
+        basePace += FuelMassModel.getPaceModifier(midRaceLap, race.laps || 57, 0) * 0.2;
+      }
 
-    // Adaptive Live Features: Fuel & Tire Models Integration
-    if (!isQuali && window.LiveIntelligence && typeof window.LiveIntelligence.getState === 'function') {
-      let liveState = window.LiveIntelligence.getState();
-      if (liveState.isLiveSession) {
-        let currentLap = liveState.currentLap || 1;
-        let scLaps = liveState.scLaps || 0;
-        let totalLaps = race.laps || 60;
+      // D. Race Evolution Engine integration
+      if (!isQuali && window.RaceEvolutionEngine) {
+        const fuelGain = window.RaceEvolutionEngine.fuelMassGain(50);
+        basePace += fuelGain * 0.0005;
+      }
 
-        if (typeof FuelMassModel !== 'undefined') {
-          basePace += FuelMassModel.getPaceModifier(currentLap, totalLaps, scLaps);
-        }
+      // Adaptive Live Features: Fuel & Tire Models Integration
+      if (!isQuali && window.LiveIntelligence && typeof window.LiveIntelligence.getState === 'function') {
+        let liveState = window.LiveIntelligence.getState();
+        if (liveState.isLiveSession) {
+          let currentLap = liveState.currentLap || 1;
+          let scLaps = liveState.scLaps || 0;
+          let totalLaps = race.laps || 60;
 
-        if (typeof TireDegradationModel !== 'undefined') {
-          let trackTemp = liveState.liveWeather?.trackTemp || 35;
-          let lapsOnTire = liveState.lapsOnTire && liveState.lapsOnTire[driver.id] ? liveState.lapsOnTire[driver.id] : (currentLap % 20);
-          let comp = liveState.compounds && liveState.compounds[driver.id] ? liveState.compounds[driver.id] : 'medium';
-          let fuelMass = 70;
           if (typeof FuelMassModel !== 'undefined') {
-            fuelMass = FuelMassModel.getFuelState(currentLap, totalLaps, false, false, scLaps).remaining;
+            basePace += FuelMassModel.getPaceModifier(currentLap, totalLaps, scLaps);
           }
-          basePace -= TireDegradationModel.getPaceModifier(comp, lapsOnTire, trackTemp, DriverPersonalityMatrix[driver.id]?.tire_smoothness || 1.0, race.tire_deg || 'Medium', fuelMass);
-        }
 
-        if (typeof LiveWeatherOverrideEngine !== 'undefined') {
-          let mods = LiveWeatherOverrideEngine.getModifiers(liveState.liveWeather?.trackTemp || 35, liveState.liveWeather?.wind || 10, liveState.liveWeather?.humidity || 50, liveState.liveWeather?.rainfall ? 0.5 : 0, getTrait('wet'));
-          basePace *= mods.degTempMod;
+          if (typeof TireDegradationModel !== 'undefined') {
+            let trackTemp = liveState.liveWeather?.trackTemp || 35;
+            let lapsOnTire = liveState.lapsOnTire && liveState.lapsOnTire[driver.id] ? liveState.lapsOnTire[driver.id] : (currentLap % 20);
+            let comp = liveState.compounds && liveState.compounds[driver.id] ? liveState.compounds[driver.id] : 'medium';
+            let fuelMass = 70;
+            if (typeof FuelMassModel !== 'undefined') {
+              fuelMass = FuelMassModel.getFuelState(currentLap, totalLaps, false, false, scLaps).remaining;
+            }
+            basePace -= TireDegradationModel.getPaceModifier(comp, lapsOnTire, trackTemp, DriverPersonalityMatrix[driver.id]?.tire_smoothness || 1.0, race.tire_deg || 'Medium', fuelMass);
+          }
+
+          if (typeof LiveWeatherOverrideEngine !== 'undefined') {
+            let mods = LiveWeatherOverrideEngine.getModifiers(liveState.liveWeather?.trackTemp || 35, liveState.liveWeather?.wind || 10, liveState.liveWeather?.humidity || 50, liveState.liveWeather?.rainfall ? 0.5 : 0, getTrait('wet'));
+            basePace *= mods.degTempMod;
+          }
         }
       }
-    }
-
-    if (isQuali) {
-      const conf = ConfidenceEngine.calc(race);
-      const random_variance = rng.norm(0, wp.noise * (1.2 - conf / 100) * 0.6);
-      return basePace + random_variance;
-    }
+      return basePace;
+    };
 
-    const conf = ConfidenceEngine.calc(race);
-    let varianceScale = wp.noise * (1.2 - conf / 100);
+    const profile = {
+      base: finish(basePace),
+      baseWithStrategy: hasStrategyRoll ? finish(basePace + 0.003) : 0,
+      hasStrategyRoll,
+      strategyChance,
+      conf: ConfidenceEngine.calc(race),
+      mistakeMult: null,
+      whatIfMod: null
+    };
+    if (isQuali) return profile;
 
     if (window.LiveIntelligence && typeof window.LiveIntelligence.getState === 'function') {
       let liveState = window.LiveIntelligence.getState();
@@ -1143,28 +1175,64 @@ const PredictionsCenter = (() => {
           liveState.liveWeather?.rainfall ? 0.5 : 0,
           getTrait('wet')
         );
-        varianceScale *= mods.mistakeMult;
+        profile.mistakeMult = mods.mistakeMult;
       }
     }
 
-    const random_variance = rng.norm(0, varianceScale);
-
     // ═══ WHAT-IF SCENARIO MODIFIER ═══
     if (window.WhatIfScenario && window.WhatIfScenario.isActive()) {
-      const whatIfMod = window.WhatIfScenario.getDriverModifier(driver);
-      basePace *= whatIfMod;
+      profile.whatIfMod = window.WhatIfScenario.getDriverModifier(driver);
     }
+    return profile;
+  }
+
+  // Memo of buildPaceProfile for the duration of one MonteCarloEngine._runBatch call.
+  // Outside a batch every call builds a fresh profile, so live/what-if edits apply immediately.
+  const PaceProfileCache = {
+    race: null,
+    profiles: null, // Map<driver, { [weather]: [early, early quali, late, late quali] }>
+
+    begin(race) { this.race = race; this.profiles = new Map(); },
+    end() { this.race = null; this.profiles = null; },
+
+    get(driver, race, isLateRace, weather, isQuali) {
+      if (!this.profiles || race !== this.race) return buildPaceProfile(driver, race, isLateRace, weather, isQuali);
+      let byWeather = this.profiles.get(driver);
+      if (!byWeather) this.profiles.set(driver, byWeather = {});
+      const slots = byWeather[weather] || (byWeather[weather] = [null, null, null, null]);
+      const k = (isLateRace ? 2 : 0) + (isQuali ? 1 : 0);
+      return slots[k] || (slots[k] = buildPaceProfile(driver, race, isLateRace, weather, isQuali));
+    }
+  };
 
+  function calculatePace(driver, race, rng, wp, isLateRace, weather, isQuali = false, aeroParams = null) {
+    const p = PaceProfileCache.get(driver, race, isLateRace, weather, isQuali);
+    let basePace = p.hasStrategyRoll && rng.next() < p.strategyChance ? p.baseWithStrategy : p.base;
+
+    if (isQuali) {
+      const random_variance = rng.norm(0, wp.noise * (1.2 - p.conf / 100) * 0.6);
+      return basePace + random_variance;
+    }
+
+    let varianceScale = wp.noise * (1.2 - p.conf / 100);
+    if (p.mistakeMult !== null) varianceScale *= p.mistakeMult;
+    const random_variance = rng.norm(0, varianceScale);
+
+    if (p.whatIfMod !== null) basePace *= p.whatIfMod;
     return basePace + random_variance;
   }
 
   // Phase 2: Championship State & Pressure System
   const ChampionshipState = {
+    // Only set by SeasonProjectionEngine while it fills its banks: the standings read as
+    // level and PressureEngine stays neutral, since each sampled season applies its own
+    neutral: false,
+
     getStandingsBefore(round, isSprintCache = false) {
       const dPts = {};
       DRIVERS.forEach(d => dPts[d.id] = 0);
 
-      if (!DataModel.calendar) return dPts;
+      if (!DataModel.calendar || this.neutral) return dPts;
 
       DataModel.calendar.forEach(r => {
         if (r.round < round && DataModel.results[r.round]) {
@@ -1182,6 +1250,7 @@ const PredictionsCenter = (() => {
   const PressureEngine = {
     getModifiers(driverId, currentPts, maxPts, round, totalRounds) {
       let risk = 1.0; let def = 1.0; let error = 1.0;
+      if (ChampionshipState.neutral) return { risk, def, error };
 
       const gap = maxPts - currentPts;
       const racesLeft = totalRounds - round + 1;
@@ -1202,62 +1271,255 @@ const PredictionsCenter = (() => {
     }
   };
 
-  // PHASE 7: Monte Carlo Engine — 1,000 stochastic simulations
+  // PHASE 7: Monte Carlo Engine — 10,000 stochastic simulations (1,000 without workers)
   const MonteCarloEngine = {
-    SIMS: 1000,
+    SIMS: 10000,
+    FALLBACK_SIMS: 1000,
+    SCENARIO_SIMS: 2000,          // per variant in runScenarios; paired deltas need far fewer sims
+    SCENARIO_FALLBACK_SIMS: 400,
+    MARKOV_WEIGHT: 0.3,           // share of each sim taken from its Markov race (see _simulate)
+    POS_SCALE: 10,                // position-histogram units per sim, so the Markov blend stays integral
+
+    // Adaptive stopping: SIMS / FALLBACK_SIMS become hard caps. The run is checked at
+    // `checkpoints` evenly spaced points (never before minFraction of the cap) and stops
+    // once the 95% CI half-width of every top-N win and podium probability is within
+    // the target, in percentage points.
+    ADAPTIVE: {
+      enabled: true,
+      checkpoints: 10,
+      minFraction: 0.2,
+      topN: 6,
+      z: 1.96,
+      winHalfWidth: 1.0,
+      podiumHalfWidth: 1.5
+    },
 
-    // Run simulations synchronously (called from worker or fallback)
-    _runBatch(race, fromSim, toSim, wins, podiums, finishSum, dnfs) {
+    // Stable in-place insertion sort of slot indices by time — same order as the
+    // Array#sort((a, b) => a.time - b.time) the kernel used on entry objects (n ≤ 22)
+    _sortSlots(order, time, n) {
+      for (let i = 1; i < n; i++) {
+        const s = order[i], t = time[s];
+        let j = i - 1;
+        while (j >= 0 && time[order[j]] > t) { order[j + 1] = order[j]; j--; }
+        order[j + 1] = s;
+      }
+    },
+
+    // Run simulations synchronously (called from worker or fallback).
+    // positions (optional, see _histogram) accumulates drivers × finishing positions
+    // in POS_SCALE units per sim; orders (optional, see MonteCarloKernel.allocOrders)
+    // receives each sim's finishing order from the standard model and from its Markov race.
+    _runBatch(race, fromSim, toSim, wins, podiums, finishSum, dnfs, positions = null, orders = null) {
+      PaceProfileCache.begin(race);
+      try {
+        this._simulate(race, fromSim, toSim, wins, podiums, finishSum, dnfs, positions, orders);
+      } finally {
+        PaceProfileCache.end();
+      }
+    },
+
+    // Everything that does not depend on the sim's RNG stream is resolved once per batch;
+    // per-sim state lives in typed arrays indexed by grid slot, reused across sims.
+    // RNG draws happen in exactly the order of the original object-based loop, so the
+    // counts are bit-identical for the same seeds.
+    _simulate(race, fromSim, toSim, wins, podiums, finishSum, dnfs, positions = null, orders = null) {
       const standsThisRound = ChampionshipState.getStandingsBefore(race.round);
       const curMaxPts = Math.max(0, ...Object.values(standsThisRound));
       const totalRounds = DataModel.calendar ? DataModel.calendar.length : 24;
+      const N = DRIVERS.length;
 
-      for (let sim = fromSim; sim < toSim; sim++) {
-        // Phase 4: Seeded Monte Carlo Stability Engine
-        let baseSeed = race.round * 10000 + sim * 73 + 1;
-        if (typeof window.MonteCarloStabilityEngine !== 'undefined') {
-          baseSeed = window.MonteCarloStabilityEngine.generateDeterministicSeed(race.track_type, race.round, "unknown", "race") + sim;
+      // ── Per-race invariants ──
+      const byId = new Map(), byNum = new Map();
+      DRIVERS.forEach((d, i) => {
+        if (!byId.has(d.id)) byId.set(d.id, i);
+        if (!byNum.has(d.num)) byNum.set(d.num, i);
+      });
+
+      // Phase 4: Seeded Monte Carlo Stability Engine
+      const stableSeed = typeof window.MonteCarloStabilityEngine !== 'undefined'
+        ? window.MonteCarloStabilityEngine.generateDeterministicSeed(race.track_type, race.round, "unknown", "race") : null;
+
+      // P0 FIX: Use real qualifying grid from LiveDataEngine when available
+      const liveOverrides = typeof window.LiveIntelligence !== 'undefined' && window.LiveIntelligence.getOverrides
+        ? window.LiveIntelligence.getOverrides() : null;
+      let realGrid = null, realMissing = null;
+      if (liveOverrides && liveOverrides.realGrid && liveOverrides.realGrid.length > 0) {
+        // Match driver by driver_number to our internal DRIVERS list; drop unmatched entries
+        realGrid = [];
+        liveOverrides.realGrid.forEach((g, idx) => {
+          let di = byNum.get(g.driver_number);
+          if (di === undefined) di = byId.get(g.driverId);
+          if (di === undefined && idx < N) di = idx;
+          if (di !== undefined) realGrid.push({ di, gridPos: g.position || (idx + 1) });
+        });
+        // If real grid doesn't cover all drivers, the rest are filled from simulated qualifying
+        if (realGrid.length < N) {
+          const onGrid = new Set(realGrid.map(g => g.di));
+          realMissing = [];
+          for (let i = 0; i < N; i++) if (!onGrid.has(i)) realMissing.push(i);
         }
+      }
+
+      // Phase 1: Qualifying -> Race Conversion Fix
+      const trackCity = (race.city || '').toLowerCase();
+      const trackName = (race.name || '').toLowerCase();
+      let overtakeDiff = 0.2;
+      if (race.overtaking === 'Very Low' || trackName.includes('monaco') || trackCity.includes('singapore') || trackCity.includes('zandvoort') || trackName.includes('hungary')) {
+        overtakeDiff = 0.95;
+      } else if (race.overtaking === 'Low') {
+        overtakeDiff = 0.6;
+      } else if (race.overtaking === 'Medium' || race.overtaking === 'Low-Medium') {
+        overtakeDiff = 0.35;
+      } else if (race.overtaking === 'High' || trackName.includes('bahrain') || trackCity.includes('spa') || trackName.includes('austria')) {
+        overtakeDiff = 0.10;
+      }
+      // Late-race track evolution makes overtakes slightly easier
+      const overtakeDiffByPhase = [overtakeDiff, overtakeDiff * 0.9];
+
+      // Track evolution: race phase based on grid position proxy (0 = early, 1 = late)
+      const RACE_PHASE = [0.4, 0.8];
+      const mistakeModByPhase = RACE_PHASE.map(p => TrackEvolutionEngine.getMistakeRate(p));
+      const gripByWeather = {};
+
+      const aeroRace = typeof window.AeroDynamicsRaceModel !== 'undefined' ? window.AeroDynamicsRaceModel : null;
+      const overtakePhysics = window.OvertakePhysicsEngine || null;
+      const aeroAdvanced = typeof window.AeroDynamicsAdvancedModel !== 'undefined' ? window.AeroDynamicsAdvancedModel : null;
+      const gridCurves = window.GridRecoveryCurves && race.short ? window.GridRecoveryCurves : null;
+
+      // ── Per-driver invariants (Phase 2: Championship Pressure Context) ──
+      const activePers = new Array(N);
+      const evoPers = [new Array(N), new Array(N)];
+      const stands = new Float64Array(N);
+      const speedTrap = new Float64Array(N);
+      const restartSkill = new Float64Array(N);
+      const rivalAggression = new Float64Array(N);
+      const tireSmoothness = new Float64Array(N);
+      const wetElite = new Uint8Array(N);
+      const teamIdx = new Int32Array(N);
+      const teamIds = new Map();
+      DRIVERS.forEach((d, i) => {
+        const curPts = standsThisRound[d.id] || 0;
+        const press = PressureEngine.getModifiers(d.id, curPts, curMaxPts, race.round, totalRounds);
+        const bp = DriverPersonalityMatrix[d.id] || DriverPersonalityMatrix["default"];
+        const pers = activePers[i] = {
+          mistake_rate: bp.mistake_rate * press.error,
+          overtake_risk: bp.overtake_risk * press.risk,
+          defense: bp.defense * press.def,
+          tire_smoothness: bp.tire_smoothness,
+          aggression: bp.aggression * press.risk,
+          restart_skill: bp.restart_skill || 1.0
+        };
+        // Apply track evo mistake rate to DNF check
+        // Also apply confidence: low confidence = more mistakes
+        const confMistakeMod = 1 / DriverConfidenceEngine.get(d.id);
+        mistakeModByPhase.forEach((mistakeMod, ph) => {
+          evoPers[ph][i] = { ...pers, mistake_rate: pers.mistake_rate * mistakeMod * confMistakeMod };
+        });
 
-        const rng = new RNG(baseSeed);
+        stands[i] = curPts;
+        speedTrap[i] = (pers.aggression - 1.0) * 10;
+        restartSkill[i] = pers.restart_skill;
+        rivalAggression[i] = DriverPersonalityMatrix[d.id]?.aggression || 1;
+        // Reads a key the matrix does not have (it is tire_smoothness), so every Markov car runs at
+        // 1.0; left as is so batch counts stay identical to earlier releases
+        tireSmoothness[i] = DriverPersonalityMatrix[d.id]?.tireSmoothness || 1.0;
+        wetElite[i] = (DriverSkillMatrix[d.id]?.wet || 1.0) >= 1.06 ? 1 : 0;
+        if (!teamIds.has(d.team)) teamIds.set(d.team, teamIds.size);
+        teamIdx[i] = teamIds.get(d.team);
+      });
+
+      // ── Markov lap-by-lap blend invariants ──
+      const markov = window.MarkovLapSimulator || null;
+      const markovPitStrategy = [{ lap: Math.floor((race.laps || 57) * 0.4), compound: 'hard' }];
+      let markovLiveState = null;
+      if (markov && toSim > fromSim && typeof window.LiveIntelligence !== 'undefined' && window.LiveIntelligence.getState) {
+        const state = window.LiveIntelligence.getState();
+        if (state.isLiveSession && state.livePositions?.length > 0) {
+          markovLiveState = { currentLap: state.currentLap || 1, positions: {}, compounds: {}, lapsOnTire: {}, pitStops: {} };
+          state.livePositions.forEach(p => {
+            const di = byNum.get(p.driver_number);
+            if (di !== undefined && DRIVERS[di].id) {
+              markovLiveState.positions[DRIVERS[di].id] = { position: p.position, gap: p.gap_to_leader || 0 };
+            }
+          });
+        }
+      }
+
+      // What-if grid drops (WhatIfScenario.applyToRace), applied like PU penalties after qualifying
+      let gridDrops = null;
+      if (race.grid_drops) {
+        gridDrops = new Float64Array(N);
+        DRIVERS.forEach((d, i) => { gridDrops[i] = race.grid_drops[d.id] || 0; });
+      }
+
+      // ── Per-sim state, struct-of-arrays by grid slot, reused across sims ──
+      const cap = Math.max(N, realGrid ? realGrid.length : 0);
+      const slotDriver = new Int32Array(cap);
+      const slotGridPos = new Float64Array(cap);
+      const time = new Float64Array(cap);
+      const order = new Int32Array(cap);
+      const firstTime = new Float64Array(N);
+      const posStd = this.POS_SCALE, posMarkov = Math.round(this.POS_SCALE * this.MARKOV_WEIGHT);
+
+      // Markov inputs are queued per sim (rows of `cap` slots) and run in one simulateBatch
+      // call per grid size after the loop. Each sim's Markov race continues that sim's RNG
+      // stream, as if run inline.
+      const sims = Math.max(0, toSim - fromSim);
+      const mkSize = new Int32Array(markov ? sims : 0);
+      const mkSeed = new Float64Array(markov ? sims : 0);
+      const mkWeather = markov ? new Array(sims) : null;
+      const mkCompound = markov ? new Array(sims) : null;
+      const mkDriver = new Int32Array(markov ? sims * cap : 0);
+      const mkPace = new Float64Array(markov ? sims * cap : 0);
+      const stdOrder = new Int32Array(markov ? sims * cap : 0); // driver per finishing position, standard model
+      const mkSim = orders && markov ? new Int32Array(sims) : null;
+      let mkQueued = 0;
+
+      // Accumulate into typed arrays, starting from (and written back to) the caller's
+      // tallies so the sequence of float additions per driver is unchanged
+      const winAcc = new Float64Array(N), podAcc = new Float64Array(N);
+      const finAcc = new Float64Array(N), dnfAcc = new Float64Array(N);
+      DRIVERS.forEach((d, i) => {
+        winAcc[i] = wins[d.id]; podAcc[i] = podiums[d.id];
+        finAcc[i] = finishSum[d.id]; dnfAcc[i] = dnfs[d.id];
+      });
+
+      const rng = new RNG(1);
+      for (let sim = fromSim; sim < toSim; sim++) {
+        rng.reseed(stableSeed !== null ? stableSeed + sim : race.round * 10000 + sim * 73 + 1);
         const weather = WeatherEngine.generate(race.rain_probability, rng);
         const wp = WeatherEngine.params(weather);
 
-        // P0 FIX: Use real qualifying grid from LiveDataEngine when available
-        let grid;
-        const liveOverrides = typeof window.LiveIntelligence !== 'undefined' && window.LiveIntelligence.getOverrides
-          ? window.LiveIntelligence.getOverrides() : null;
-
-        if (liveOverrides && liveOverrides.realGrid && liveOverrides.realGrid.length > 0) {
-          // Map real qualifying data to simulation grid format
-          grid = liveOverrides.realGrid.map((g, idx) => {
-            // Match driver by driver_number to our internal DRIVERS list
-            const driver = DRIVERS.find(d => d.num === g.driver_number)
-              || DRIVERS.find(d => d.id === g.driverId)
-              || DRIVERS[idx];
-            return {
-              driver: driver,
-              gridPos: g.position || (idx + 1),
-              qualiPace: g.best_lap ? (1 / g.best_lap) : 0,
-              qualiRound: g.session || 'Q3'
-            };
-          }).filter(g => g.driver); // Remove any unmatched entries
-
-          // If real grid doesn't cover all drivers, fill remaining from simulation
-          if (grid.length < DRIVERS.length) {
-            const gridDriverIds = new Set(grid.map(g => g.driver.id));
-            const missingDrivers = DRIVERS.filter(d => !gridDriverIds.has(d.id));
+        let n;
+        if (realGrid) {
+          n = realGrid.length;
+          for (let s = 0; s < n; s++) { slotDriver[s] = realGrid[s].di; slotGridPos[s] = realGrid[s].gridPos; }
+          if (realMissing) {
             const simGrid = QualifyingEngine.simulate(race, rng, weather);
-            missingDrivers.forEach(d => {
-              const simEntry = simGrid.find(sg => sg.driver.id === d.id);
-              if (simEntry) {
-                simEntry.gridPos = grid.length + 1;
-                grid.push(simEntry);
+            for (let m = 0; m < realMissing.length; m++) {
+              const id = DRIVERS[realMissing[m]].id;
+              if (simGrid.some(sg => sg.driver.id === id)) {
+                slotDriver[n] = realMissing[m]; slotGridPos[n] = n + 1; n++;
               }
-            });
+            }
           }
         } else {
-          grid = QualifyingEngine.simulate(race, rng, weather); // Fallback: simulated qualifying
+          const simGrid = QualifyingEngine.simulate(race, rng, weather); // Fallback: simulated qualifying
+          n = simGrid.length;
+          for (let s = 0; s < n; s++) { slotDriver[s] = byId.get(simGrid[s].driver.id); slotGridPos[s] = simGrid[s].gridPos; }
+        }
+        if (gridDrops) {
+          for (let s = 0; s < n; s++) {
+            if (gridDrops[slotDriver[s]] > 0) slotGridPos[s] = Math.min(22, slotGridPos[s] + gridDrops[slotDriver[s]]);
+          }
+          // Stable re-sort by grid position, then renumber — same as QualifyingEngine's penalty pass
+          for (let s = 1; s < n; s++) {
+            const di = slotDriver[s], gp = slotGridPos[s];
+            let j = s - 1;
+            while (j >= 0 && slotGridPos[j] > gp) { slotDriver[j + 1] = slotDriver[j]; slotGridPos[j + 1] = slotGridPos[j]; j--; }
+            slotDriver[j + 1] = di; slotGridPos[j + 1] = gp;
+          }
+          for (let s = 0; s < n; s++) slotGridPos[s] = s + 1;
         }
 
         const scHappens = rng.next() < race.sc_probability;
@@ -1269,409 +1531,1923 @@ const PredictionsCenter = (() => {
         if (weather === 'heavy_rain') baseUpsetRate += 0.15;
         const chaosRace = rng.next() < baseUpsetRate;
 
-        const entries = grid.map(g => {
-          const d = g.driver;
-
-          // Apply Phase 2: Championship Pressure Context
-          const curPts = standsThisRound[d.id] || 0;
-          const press = PressureEngine.getModifiers(d.id, curPts, curMaxPts, race.round, totalRounds);
-          const bp = DriverPersonalityMatrix[d.id] || DriverPersonalityMatrix["default"];
-
-          const activePers = {
-            mistake_rate: bp.mistake_rate * press.error,
-            overtake_risk: bp.overtake_risk * press.risk,
-            defense: bp.defense * press.def,
-            tire_smoothness: bp.tire_smoothness,
-            aggression: bp.aggression * press.risk,
-            restart_skill: bp.restart_skill || 1.0
-          };
+        const ph = isLateRace ? 1 : 0;
+        const grip = gripByWeather[weather] || (gripByWeather[weather] =
+          RACE_PHASE.map(p => TrackEvolutionEngine.getGripMod(race, p, weather)));
+        const gripMod = grip[ph];
+        const simOvertakeDiff = overtakeDiffByPhase[ph];
+        const simEvoPers = evoPers[ph];
 
-          // Track evolution: race phase based on grid position proxy
-          const racePhase = isLateRace ? 0.8 : 0.4;
-          const gripMod = TrackEvolutionEngine.getGripMod(race, racePhase, weather);
-          const mistakeMod = TrackEvolutionEngine.getMistakeRate(racePhase);
+        for (let s = 0; s < n; s++) {
+          const di = slotDriver[s], d = DRIVERS[di], gridPos = slotGridPos[s];
+          order[s] = s;
 
-          // Apply track evo mistake rate to DNF check
-          // Also apply confidence: low confidence = more mistakes
-          const confMistakeMod = 1 / DriverConfidenceEngine.get(d.id);
-          const evoPers = { ...activePers, mistake_rate: activePers.mistake_rate * mistakeMod * confMistakeMod };
-          const dnf = DNFEngine.roll(d, wp, rng, evoPers);
-          if (dnf) { dnfs[d.id]++; return { driver: d, time: 9999 + rng.next() }; }
+          if (DNFEngine.roll(d, wp, rng, simEvoPers[di])) { dnfAcc[di]++; time[s] = 9999 + rng.next(); continue; }
 
-          // Use new calculatePace formula as layered input
+          // Use new calculatePace formula as layered input, with track evolution grip bonus
           let pace = calculatePace(d, race, rng, wp, isLateRace, weather, false);
-
-          // Apply track evolution grip bonus
           pace *= gripMod;
 
           // Elite wet drivers boosted in heavy rain
-          if (weather === 'heavy_rain' && (DriverSkillMatrix[d.id]?.wet || 1.0) >= 1.06) {
-            pace -= 0.05;
-          }
-
-          // Phase 1: Qualifying -> Race Conversion Fix
-          const trackCity = (race.city || '').toLowerCase();
-          const trackName = (race.name || '').toLowerCase();
-
-          let overtakeDiff = 0.2;
-          if (race.overtaking === 'Very Low' || trackName.includes('monaco') || trackCity.includes('singapore') || trackCity.includes('zandvoort') || trackName.includes('hungary')) {
-            overtakeDiff = 0.95;
-          } else if (race.overtaking === 'Low') {
-            overtakeDiff = 0.6;
-          } else if (race.overtaking === 'Medium' || race.overtaking === 'Low-Medium') {
-            overtakeDiff = 0.35;
-          } else if (race.overtaking === 'High' || trackName.includes('bahrain') || trackCity.includes('spa') || trackName.includes('austria')) {
-            overtakeDiff = 0.10;
-          }
-
-          // Late-race track evolution makes overtakes slightly easier
-          if (racePhase > 0.7) overtakeDiff *= 0.9;
+          if (weather === 'heavy_rain' && wetElite[di]) pace -= 0.05;
 
           // Phase 2: Real DRS + Dirty Air Physics Model (Replaces static dirty air logic)
-          let dirtyAirPaceLoss = Math.pow(g.gridPos, 1.1) * 0.005 * overtakeDiff;
-          let gapAhead = g.gridPos === 1 ? 5.0 : 0.8;
-          let speedTrapDelta = (activePers.aggression - 1.0) * 10;
-          if (typeof window.AeroDynamicsRaceModel !== 'undefined') {
-            dirtyAirPaceLoss = window.AeroDynamicsRaceModel.getAeroPaceDelta(d.id, gapAhead, speedTrapDelta, race.track_type, true);
-          } else if (window.OvertakePhysicsEngine) {
-            // Use new OvertakePhysicsEngine dirty air model
-            dirtyAirPaceLoss = window.OvertakePhysicsEngine.DirtyAir.calculatePenalty(gapAhead) * overtakeDiff;
-          } else if (typeof window.AeroDynamicsAdvancedModel !== 'undefined') {
-            dirtyAirPaceLoss = window.AeroDynamicsAdvancedModel.calculateDirtyAirPenalty(race.track_type, speedTrapDelta, gapAhead, 2);
+          const gapAhead = gridPos === 1 ? 5.0 : 0.8;
+          let dirtyAirPaceLoss;
+          if (aeroRace) {
+            dirtyAirPaceLoss = aeroRace.getAeroPaceDelta(d.id, gapAhead, speedTrap[di], race.track_type, true);
+          } else if (overtakePhysics) {
+            dirtyAirPaceLoss = overtakePhysics.DirtyAir.calculatePenalty(gapAhead) * simOvertakeDiff;
+          } else if (aeroAdvanced) {
+            dirtyAirPaceLoss = aeroAdvanced.calculateDirtyAirPenalty(race.track_type, speedTrap[di], gapAhead, 2);
+          } else {
+            dirtyAirPaceLoss = Math.pow(gridPos, 1.1) * 0.005 * simOvertakeDiff;
           }
 
-          const defensiveMod = activePers.defense;
           // Non-linear grid penalty from GridRecoveryCurves (replaces linear formula)
-          let gridPenalty;
-          if (window.GridRecoveryCurves && race.short) {
-            gridPenalty = window.GridRecoveryCurves.getNonLinearGridPenalty(g.gridPos, race.short) / activePers.overtake_risk;
-          } else {
-            gridPenalty = (g.gridPos - 1) * 0.06 * overtakeDiff / activePers.overtake_risk;
-          }
+          const gridPenalty = gridCurves
+            ? gridCurves.getNonLinearGridPenalty(gridPos, race.short) / activePers[di].overtake_risk
+            : (gridPos - 1) * 0.06 * simOvertakeDiff / activePers[di].overtake_risk;
 
           // Safety car chaos & Upset probability
           let scEffect = 0;
-          if (scHappens) {
-            const bunchFactor = (g.gridPos / 20) * scChaos;
-            scEffect = -bunchFactor;
-          }
+          if (scHappens) scEffect = -((gridPos / 20) * scChaos);
 
           let upsetBoost = 0;
           if (chaosRace && rng.next() < 0.2) {
             upsetBoost = rng.range(0.05, 0.25);
           }
 
-          // Strategy variance (now includes pit crew model)
-          const stratDelta = StrategyEngine.getDelta(d, race, rng, activePers) / 50;
+          // Strategy variance (now includes pit crew model)
+          const stratDelta = StrategyEngine.getDelta(d, race, rng, activePers[di]) / 50;
+
+          const paceNorm = Math.max(0.1, pace - dirtyAirPaceLoss);
+          time[s] = (2 - paceNorm) + gridPenalty + scEffect + stratDelta - upsetBoost;
+        }
+
+        this._sortSlots(order, time, n);
+
+        // Phase 5: Safety Car Restart Bunching & Skill handling
+        if (scHappens) {
+          for (let k = 0; k < n; k++) {
+            const s = order[k];
+            if (time[s] > 9900) continue;
+            time[s] -= rng.norm(0, (restartSkill[slotDriver[s]] - 1.0) * 0.4);
+          }
+          this._sortSlots(order, time, n);
+        }
+
+        // Phase 3: Team Orders & Pit Wall Intelligence
+        for (let j = 0; j < n - 1; j++) {
+          const s1 = order[j], s2 = order[j + 1];
+          const d1 = slotDriver[s1], d2 = slotDriver[s2];
+          // If driver behind is significantly ahead in championship and it is late season,
+          // P1 swaps with P2 to maximize team title points
+          if (time[s1] < 9900 && teamIdx[d1] === teamIdx[d2] &&
+            stands[d2] > stands[d1] + 25 && race.round > totalRounds * 0.5) {
+            if (rng.next() < 0.8) {
+              const temp = time[s1];
+              time[s1] = time[s2];
+              time[s2] = temp;
+            }
+          }
+        }
+
+        this._sortSlots(order, time, n);
+
+        // Phase 4: Rivalry & Incident check between adjacent finishers
+        for (let k = 0; k < n - 1; k++) {
+          const s1 = order[k], s2 = order[k + 1];
+          if (time[s1] > 9900 || time[s2] > 9900) continue;
+          if (time[s2] - time[s1] < 0.015) { // Close battle
+            const d1 = slotDriver[s1], d2 = slotDriver[s2];
+            const incident = RivalryEngine.checkIncident(DRIVERS[d1], DRIVERS[d2], rng, weather);
+            if (incident === 'dnf') {
+              // Aggressive driver more likely to be eliminated
+              const victim = rivalAggression[d2] > rivalAggression[d1] ? s2 : s1;
+              time[victim] = 9999 + rng.next();
+              dnfAcc[slotDriver[victim]]++;
+            } else if (incident === 'damage') {
+              time[s2] += rng.range(0.05, 0.15);
+            } else if (incident === 'position') {
+              time[s2] += rng.range(0.01, 0.04);
+            }
+          }
+        }
+
+        this._sortSlots(order, time, n);
+
+        for (let k = 0; k < n; k++) {
+          const di = slotDriver[order[k]];
+          finAcc[di] += (k + 1);
+          if (k === 0) winAcc[di]++;
+          if (k < 3) podAcc[di]++;
+        }
+        if (positions) {
+          for (let k = 0; k < n && k < N; k++) positions[slotDriver[order[k]] * N + k] += posStd;
+        }
+        if (orders) {
+          const row = (sim - fromSim) * orders.width;
+          for (let k = 0; k < n && k < orders.width; k++) {
+            orders.finish[row + k] = slotDriver[order[k]];
+            orders.dnf[row + k] = time[order[k]] > 9900 ? 1 : 0;
+          }
+        }
+
+        // Queue this sim's Markov race: grid in slot order, pace from the driver's first
+        // entry in the standard finishing order
+        if (markov) {
+          const row = mkQueued * cap;
+          for (let k = n - 1; k >= 0; k--) firstTime[slotDriver[order[k]]] = time[order[k]];
+          for (let s = 0; s < n; s++) {
+            const di = slotDriver[s], t = firstTime[di];
+            mkDriver[row + s] = di;
+            mkPace[row + s] = t ? 2 - t : 0.85;
+            stdOrder[row + s] = slotDriver[order[s]];
+          }
+          mkSize[mkQueued] = n;
+          mkSeed[mkQueued] = rng.s;
+          mkWeather[mkQueued] = weather;
+          mkCompound[mkQueued] = weather === 'heavy_rain' ? 'wet' : weather === 'light_rain' ? 'intermediate' : 'medium';
+          if (mkSim) mkSim[mkQueued] = sim - fromSim;
+          mkQueued++;
+        }
+      }
+
+      // ═══ MARKOV LAP-BY-LAP SIMULATION (every sim) ═══
+      // Blend Markov results (30%) with standard results (70%) by adjusting the
+      // standard contribution down and adding the Markov contribution.
+      // A Markov race on every sim (rather than a fifth of them) dropped MonteCarloBench from
+      // ~7.0k to ~4.8k sims/s; the fmod-free RNG.next brought it back above the subsampled rate.
+      if (mkQueued > 0) {
+        const mkOrder = new Int32Array(mkQueued * cap);
+        const mkDnf = new Uint8Array(mkQueued * cap);
+        let ran = true;
+        try {
+          // One call per grid size; normally every sim shares one and the rows go in as queued
+          for (const size of new Set(mkSize.subarray(0, mkQueued))) {
+            const idx = [];
+            for (let r = 0; r < mkQueued; r++) if (mkSize[r] === size) idx.push(r);
+            const direct = size === cap && idx.length === mkQueued;
+            const races = idx.length;
+            const driverIdx = direct ? mkDriver : new Int32Array(races * size);
+            const basePace = direct ? mkPace : new Float64Array(races * size);
+            const outOrder = direct ? mkOrder : new Int32Array(races * size);
+            const outDnf = direct ? mkDnf : new Uint8Array(races * size);
+            if (!direct) {
+              idx.forEach((r, j) => {
+                driverIdx.set(mkDriver.subarray(r * cap, r * cap + size), j * size);
+                basePace.set(mkPace.subarray(r * cap, r * cap + size), j * size);
+              });
+            }
+            markov.simulateBatch({
+              drivers: DRIVERS,
+              races,
+              size,
+              driverIdx,
+              basePace,
+              tireSmoothness,
+              weather: direct ? mkWeather : idx.map(r => mkWeather[r]),
+              compound: direct ? mkCompound : idx.map(r => mkCompound[r]),
+              pitStrategy: markovPitStrategy,
+              totalLaps: race.laps || 57,
+              trackId: race.short || 'default',
+              scProbability: race.sc_probability || 0.4,
+              rngFor: j => rng.reseed(mkSeed[idx[j]]),
+              liveState: markovLiveState,
+              outOrder,
+              outDnf,
+            });
+            if (!direct) {
+              idx.forEach((r, j) => {
+                mkOrder.set(outOrder.subarray(j * size, (j + 1) * size), r * cap);
+                mkDnf.set(outDnf.subarray(j * size, (j + 1) * size), r * cap);
+              });
+            }
+          }
+        } catch (e) {
+          // Standard sims only for this batch; say so once rather than on every run
+          ran = false;
+          if (!this._markovFailed) {
+            this._markovFailed = true;
+            console.warn('[MonteCarlo] Markov batch failed, using standard sims only:', e.message);
+          }
+        }
+
+        if (ran) {
+          // Adjust standard sim contribution down by 30% and add Markov at 30%
+          // This keeps the total at 1.0 per sim (0.7 standard + 0.3 Markov)
+          for (let r = 0; r < mkQueued; r++) {
+            const row = r * cap, size = mkSize[r];
+            for (let k = 0; k < size; k++) {
+              const di = stdOrder[row + k];
+              finAcc[di] -= (k + 1) * 0.3; // remove 30% of standard
+              if (k === 0) winAcc[di] -= 0.3;
+              if (k < 3) podAcc[di] -= 0.3;
+              if (positions && k < N) positions[di * N + k] -= posMarkov;
+            }
+            for (let k = 0; k < size; k++) {
+              const di = mkOrder[row + k];
+              finAcc[di] += (k + 1) * 0.3;
+              if (k === 0) winAcc[di] += 0.3;
+              if (k < 3) podAcc[di] += 0.3;
+              if (mkDnf[row + k]) dnfAcc[di] += 0.3;
+              if (positions && k < N) positions[di * N + k] += posMarkov;
+            }
+            if (mkSim) {
+              const out = mkSim[r] * orders.width;
+              for (let k = 0; k < size && k < orders.width; k++) {
+                orders.markov[out + k] = mkOrder[row + k];
+                orders.markovDnf[out + k] = mkDnf[row + k];
+              }
+            }
+          }
+        }
+      }
+
+      DRIVERS.forEach((d, i) => {
+        wins[d.id] = winAcc[i]; podiums[d.id] = podAcc[i];
+        finishSum[d.id] = finAcc[i]; dnfs[d.id] = dnfAcc[i];
+      });
+    },
+
+    // Remaining-laps-only run from race.live (see LiveRaceEngine.snapshot): the grid is
+    // the live running order and each sim continues the race from the live lap with its
+    // own late-race pace draws, through the Markov lap model alone. Whole-sim tallies,
+    // POS_SCALE histogram units per sim, so the result goes through _buildResult as usual.
+    _runLiveBatch(race, fromSim, toSim, wins, podiums, finishSum, dnfs, positions = null) {
+      const markov = window.MarkovLapSimulator || null;
+      const live = race.live, sims = Math.max(0, toSim - fromSim);
+      if (!markov || !live || !sims) return;
+      const N = DRIVERS.length, size = live.order.length, totalLaps = race.laps || 57;
+
+      PaceProfileCache.begin(race);
+      try {
+        const wp = WeatherEngine.params(live.weather);
+        const gripMod = TrackEvolutionEngine.getGripMod(race, Math.min(1, live.lap / totalLaps), live.weather);
+        const tireSmoothness = new Float64Array(N);
+        DRIVERS.forEach((d, i) => { tireSmoothness[i] = DriverPersonalityMatrix[d.id]?.tire_smoothness || 1.0; });
+
+        const driverIdx = new Int32Array(sims * size);
+        const basePace = new Float64Array(sims * size);
+        const seeds = new Float64Array(sims);
+        const rng = new RNG(1);
+        for (let r = 0; r < sims; r++) {
+          rng.reseed(live.seed + (fromSim + r) * 73);
+          const row = r * size;
+          for (let s = 0; s < size; s++) {
+            const di = live.order[s];
+            driverIdx[row + s] = di;
+            basePace[row + s] = calculatePace(DRIVERS[di], race, rng, wp, true, live.weather, false) * gripMod;
+          }
+          seeds[r] = rng.s;
+        }
+
+        const outOrder = new Int32Array(sims * size), outDnf = new Uint8Array(sims * size);
+        const startCompound = live.weather === 'heavy_rain' ? 'wet' : live.weather === 'light_rain' ? 'intermediate' : 'medium';
+        markov.simulateBatch({
+          drivers: DRIVERS,
+          races: sims,
+          size,
+          driverIdx,
+          basePace,
+          tireSmoothness,
+          weather: new Array(sims).fill(live.weather),
+          compound: new Array(sims).fill(startCompound),
+          pitStrategy: [{ lap: Math.floor(totalLaps * 0.4), compound: 'hard' }],
+          totalLaps,
+          trackId: race.short || 'default',
+          scProbability: race.sc_probability || 0.4,
+          rngFor: r => rng.reseed(seeds[r]),
+          liveState: live.state,
+          outOrder,
+          outDnf,
+        });
+
+        for (let r = 0; r < sims; r++) {
+          const row = r * size;
+          for (let k = 0; k < size; k++) {
+            const di = outOrder[row + k], id = DRIVERS[di].id;
+            finishSum[id] += k + 1;
+            if (k === 0) wins[id]++;
+            if (k < 3) podiums[id]++;
+            if (outDnf[row + k]) dnfs[id]++;
+            if (positions && k < N) positions[di * N + k] += this.POS_SCALE;
+          }
+        }
+      } finally {
+        PaceProfileCache.end();
+      }
+    },
+
+    // Empty drivers × finishing-positions count matrix for _runBatch
+    _histogram() {
+      return new Uint32Array(DRIVERS.length * DRIVERS.length);
+    },
+
+    // Synchronous run — called from Web Worker OR rAF fallback aggregator
+    _buildResult(race, wins, podiums, finishSum, dnfs, positions, weatherCache, qualiGridCache, sims = this.SIMS) {
+      const N = DRIVERS.length;
+      const results = DRIVERS.map((d, i) => ({
+        driver: d,
+        winProb: (wins[d.id] / sims) * 100,
+        podiumProb: (podiums[d.id] / sims) * 100,
+        avgFinish: finishSum[d.id] / sims,
+        dnfProb: (dnfs[d.id] / sims) * 100,
+        power: finishSum[d.id] / sims,
+        winCount: wins[d.id],
+        positionCounts: positions ? positions.subarray(i * N, (i + 1) * N) : null
+      }));
+      results.sort((a, b) => a.avgFinish - b.avgFinish);
+      results.forEach((r, i) => { r.position = i + 1; r.score = 21 - r.avgFinish; });
+
+      // σ for the probability cloud; finishing bands and VaR come straight from the position histogram
+      results.forEach(r => {
+        const p = r.winProb / 100;
+        r.winSigma = Math.sqrt(p * (1 - p) / sims) * 100;
+        r.podiumSigma = Math.sqrt((r.podiumProb / 100) * (1 - r.podiumProb / 100) / sims) * 100;
+
+        // Elo confidence interval
+        if (window.EloRatingSystem) {
+          const ci = window.EloRatingSystem.getConfidenceInterval(r.driver.id);
+          r.eloCI = ci;
+          r.eloRating = window.EloRatingSystem.getRating(r.driver.id).elo;
+        }
+
+        if (typeof window.ConfidenceBandEngine !== 'undefined' && r.positionCounts) {
+          const bands = window.ConfidenceBandEngine.calculateBandsFromCounts(r.positionCounts, sims);
+          if (bands) {
+            r.finishSigma = bands.sigma;
+            r.confidence_score = bands.confidence_score;
+            r.confidence_interval_win = window.ConfidenceBandEngine.calculateWinCI(p, sims);
+            r.VaR95 = [bands.quantile_95, bands.quantile_99];
+          }
+        }
+      });
+
+      // J. Position Probability Distribution
+      let positionDistributions = null;
+      if (window.PositionProbabilityEngine) {
+        positionDistributions = window.PositionProbabilityEngine.calculateDistribution(results, sims);
+      }
+
+      return {
+        grid: results,
+        weather: weatherCache,
+        qualiGrid: qualiGridCache,
+        confidence: ConfidenceEngine.calc(race),
+        sims,
+        convergence: this._convergence(wins, podiums, sims),
+        positionDistributions
+      };
+    },
+
+    // 95% CI half-width (percentage points) of the top-N win and podium probabilities,
+    // same normal approximation as winSigma/podiumSigma in _buildResult
+    _convergence(wins, podiums, sims) {
+      const cfg = this.ADAPTIVE;
+      const halfWidth = counts => {
+        const top = DRIVERS.map(d => counts[d.id]).sort((a, b) => b - a).slice(0, cfg.topN);
+        return Math.max(...top.map(c => {
+          const p = c / sims;
+          return cfg.z * Math.sqrt(p * (1 - p) / sims) * 100;
+        }));
+      };
+      const win = halfWidth(wins), podium = halfWidth(podiums);
+      return {
+        winHalfWidth: win,
+        podiumHalfWidth: podium,
+        converged: win <= cfg.winHalfWidth && podium <= cfg.podiumHalfWidth
+      };
+    },
+
+    // Checkpoint spacing and earliest stop for a run capped at `cap` sims; `step` is the
+    // granularity sims complete in (pool shard or rAF chunk)
+    _plan(cap, step, adaptive) {
+      const cfg = this.ADAPTIVE;
+      const every = Math.max(step, Math.round(cap / cfg.checkpoints / step) * step);
+      return { every, min: adaptive ? Math.ceil(cap * cfg.minFraction) : Infinity };
+    },
+
+    // Shared checkpoint handler: true = stop here, otherwise report an early estimate
+    _checkpoint(race, wins, podiums, finishSum, dnfs, positions, weatherCache, qualiGridCache, sims, plan, onProgress) {
+      const ci = this._convergence(wins, podiums, sims);
+      if (sims >= plan.min && ci.converged) return true;
+      if (onProgress) {
+        const partial = this._buildResult(race, wins, podiums, finishSum, dnfs, positions, weatherCache, qualiGridCache, sims);
+        partial.partial = true;
+        onProgress(partial);
+      }
+      return false;
+    },
+
+    // Public entry: non-blocking via the persistent worker pool → rAF fallback.
+    // opts.adaptive (default ADAPTIVE.enabled) stops at the first checkpoint where the
+    // CI target is met; opts.onProgress gets a partial result at every earlier checkpoint.
+    run(race, onComplete, opts = {}) {
+      // Qualifying below consumes grid penalties, so the cache keys on them as they were before
+      const penalties = JSON.parse(JSON.stringify(ComponentReliability.gridPenalties));
+      const rng0 = new RNG(race.round * 10000 + 1);
+      const weatherCache = WeatherEngine.generate(race.rain_probability, rng0);
+      const qualiGridCache = QualifyingEngine.simulate(race, new RNG(race.round * 77), weatherCache);
+      const adaptive = opts.adaptive ?? this.ADAPTIVE.enabled;
+      const onProgress = opts.onProgress || null;
+      const self = this;
+      const finish = (c, sims) => onComplete(self._buildResult(race, c.wins, c.podiums, c.finishSum, c.dnfs, c.positions, weatherCache, qualiGridCache, sims));
+
+      // Snapshot after qualifying — everything from here on is what the cache stands in for
+      const lookup = (mode, cap) => {
+        const snapshot = MonteCarloKernel.capture(race);
+        const key = MonteCarloResultCache.key(race, snapshot, { mode, cap, adaptive: adaptive && self.ADAPTIVE }, penalties);
+        return { snapshot, key, hit: MonteCarloResultCache.get(key) };
+      };
+      // A hit still completes asynchronously, like a run would
+      const replay = hit => setTimeout(() => finish(MonteCarloResultCache.apply(hit), hit.sims), 0);
+
+      // Fallback: rAF chunking on main thread at the pre-pool sim count
+      const fallback = () => {
+        const { key, hit } = lookup('raf', self.FALLBACK_SIMS);
+        if (hit) { replay(hit); return; }
+        const wins = {}, podiums = {}, finishSum = {}, dnfs = {}, positions = self._histogram();
+        DRIVERS.forEach(d => { wins[d.id] = 0; podiums[d.id] = 0; finishSum[d.id] = 0; dnfs[d.id] = 0; });
+        self._runWithRAF(race, wins, podiums, finishSum, dnfs, positions, weatherCache, qualiGridCache, mc => {
+          MonteCarloResultCache.put(key, mc.sims, MonteCarloKernel.pack(wins, podiums, finishSum, dnfs, positions));
+          onComplete(mc);
+        }, adaptive, onProgress);
+      };
+      if (!MonteCarloPool.available()) { fallback(); return; }
+
+      // Every sim runs the full _runBatch pipeline inside a pool worker; the main thread
+      // only snapshots model state and merges the per-shard counts
+      try {
+        const { snapshot, key, hit } = lookup('pool', this.SIMS);
+        if (hit) { replay(hit); return; }
+        const plan = this._plan(this.SIMS, MonteCarloPool.SHARD, adaptive);
+        const checkpoint = (adaptive || onProgress) ? (counts, sims) => {
+          const c = MonteCarloKernel.unpack(counts);
+          return self._checkpoint(race, c.wins, c.podiums, c.finishSum, c.dnfs, c.positions, weatherCache, qualiGridCache, sims, plan, onProgress);
+        } : null;
+        MonteCarloPool.submit(race, snapshot, this.SIMS, (counts, sims) => {
+          MonteCarloResultCache.put(key, sims, counts);
+          finish(MonteCarloKernel.unpack(counts), sims);
+        }, fallback, checkpoint, plan.every);
+      } catch (e) {
+        console.warn('[MonteCarlo] Worker pool unavailable:', e.message);
+        MonteCarloPool.downUntil = performance.now() + MonteCarloPool.COOLDOWN_MS;
+        fallback();
+      }
+    },
+
+    // rAF chunking fallback: process 100 sims per frame @ ~60fps
+    _runWithRAF(race, wins, podiums, finishSum, dnfs, positions, weatherCache, qualiGridCache, onComplete, adaptive = false, onProgress = null) {
+      const CHUNK = 100;
+      const plan = this._plan(this.FALLBACK_SIMS, CHUNK, adaptive);
+      let processed = 0;
+      const self = this;
+      const tick = () => {
+        const end = Math.min(processed + CHUNK, self.FALLBACK_SIMS);
+        self._runBatch(race, processed, end, wins, podiums, finishSum, dnfs, positions);
+        processed = end;
+        const stop = processed < self.FALLBACK_SIMS && (adaptive || onProgress) && processed % plan.every === 0 &&
+          self._checkpoint(race, wins, podiums, finishSum, dnfs, positions, weatherCache, qualiGridCache, processed, plan, onProgress);
+        if (processed < self.FALLBACK_SIMS && !stop) {
+          requestAnimationFrame(tick);
+        } else {
+          onComplete(self._buildResult(race, wins, podiums, finishSum, dnfs, positions, weatherCache, qualiGridCache, processed));
+        }
+      };
+      requestAnimationFrame(tick);
+    },
+
+    // ── Scenario batches with common random numbers ──
+    // Baseline + K WhatIfScenario specs over the same seed range: every variant replays
+    // sim i from the same seed, so per-sim outcomes pair up and the deltas carry far less
+    // noise than two independent runs. onComplete gets
+    // { sims, baseline, scenarios: [{ label, scenario, result, deltas }] }.
+    runScenarios(race, scenarios, onComplete, opts = {}) {
+      const wi = window.WhatIfScenario;
+      const variants = [wi.createScenario({ label: 'Baseline' }), ...scenarios].map(spec => ({
+        spec, race: wi.applyToRace(race, spec), orders: null
+      }));
+      const rng0 = new RNG(race.round * 10000 + 1);
+      const weatherCache = WeatherEngine.generate(race.rain_probability, rng0);
+      const qualiGridCache = QualifyingEngine.simulate(race, new RNG(race.round * 77), weatherCache);
+      const self = this;
+      const finish = () => onComplete(self._scenarioReport(variants, weatherCache, qualiGridCache));
+
+      // Fallback: one variant per frame on the main thread, each from the same grid penalties
+      const fallback = () => {
+        const sims = opts.sims || self.SCENARIO_FALLBACK_SIMS;
+        const penalties = JSON.stringify(ComponentReliability.gridPenalties);
+        let v = 0;
+        const tick = () => {
+          const variant = variants[v];
+          const wins = {}, podiums = {}, finishSum = {}, dnfs = {};
+          DRIVERS.forEach(d => { wins[d.id] = 0; podiums[d.id] = 0; finishSum[d.id] = 0; dnfs[d.id] = 0; });
+          variant.orders = MonteCarloKernel.allocOrders(sims);
+          wi.evaluate(variant.spec, () => self._runBatch(variant.race, 0, sims, wins, podiums, finishSum, dnfs, null, variant.orders));
+          ComponentReliability.gridPenalties = JSON.parse(penalties);
+          if (++v < variants.length) requestAnimationFrame(tick);
+          else finish();
+        };
+        requestAnimationFrame(tick);
+      };
+      if (!MonteCarloPool.available()) { fallback(); return; }
+
+      try {
+        const sims = opts.sims || this.SCENARIO_SIMS;
+        let pending = variants.length, failed = false;
+        const onError = () => { if (!failed) { failed = true; fallback(); } };
+        variants.forEach(variant => {
+          MonteCarloPool.submit(variant.race, MonteCarloKernel.capture(variant.race, variant.spec), sims, (counts, done, orders) => {
+            variant.orders = orders;
+            if (--pending === 0 && !failed) finish();
+          }, onError, null, sims, true);
+        });
+      } catch (e) {
+        console.warn('[MonteCarlo] Worker pool unavailable:', e.message);
+        MonteCarloPool.downUntil = performance.now() + MonteCarloPool.COOLDOWN_MS;
+        fallback();
+      }
+    },
+
+    // Per-sim, per-driver outcomes from recorded orders, blended with the sim's Markov
+    // race exactly as the counts are. Forced DNFs are moved to the back of every order.
+    _simOutcomes(orders, forced) {
+      const S = orders.sims, W = orders.width, N = DRIVERS.length, mw = this.MARKOV_WEIGHT;
+      const out = {
+        win: new Float64Array(S * N), podium: new Float64Array(S * N),
+        finish: new Float64Array(S * N), dnf: new Float64Array(S * N),
+        positions: this._histogram()
+      };
+      const row = new Int16Array(W), rowDnf = new Uint8Array(W);
+      const addOrder = (src, srcDnf, base, weight, units, off) => {
+        let m = 0;
+        for (let k = 0; k < W; k++) {
+          const di = src[base + k];
+          if (di < 0) break;
+          if (!forced[di]) { row[m] = di; rowDnf[m++] = srcDnf[base + k]; }
+        }
+        for (let k = 0; k < W; k++) {
+          const di = src[base + k];
+          if (di < 0) break;
+          if (forced[di]) { row[m] = di; rowDnf[m++] = 1; }
+        }
+        for (let k = 0; k < m; k++) {
+          const i = off + row[k];
+          out.finish[i] += (k + 1) * weight;
+          if (k === 0) out.win[i] += weight;
+          if (k < 3) out.podium[i] += weight;
+          if (rowDnf[k]) out.dnf[i] += weight;
+          if (k < N) out.positions[row[k] * N + k] += units;
+        }
+      };
+      const markovUnits = Math.round(this.POS_SCALE * mw);
+      for (let j = 0; j < S; j++) {
+        const base = j * W, off = j * N;
+        const hasMarkov = orders.markov[base] >= 0;
+        addOrder(orders.finish, orders.dnf, base, hasMarkov ? 1 - mw : 1, hasMarkov ? this.POS_SCALE - markovUnits : this.POS_SCALE, off);
+        if (hasMarkov) addOrder(orders.markov, orders.markovDnf, base, mw, markovUnits, off);
+      }
+      return out;
+    },
+
+    // Mean paired difference per driver with a 95% CI, plus the CI two independent runs of the same size would give
+    _pairedDelta(a, b, S, i, N, scale) {
+      let sum = 0, sumSq = 0, sa = 0, saSq = 0, sb = 0, sbSq = 0;
+      for (let j = 0; j < S; j++) {
+        const x = a[j * N + i], y = b[j * N + i], d = x - y;
+        sum += d; sumSq += d * d; sa += x; saSq += x * x; sb += y; sbSq += y * y;
+      }
+      const variance = (s1, s2) => S > 1 ? Math.max(0, (s2 - s1 * s1 / S) / (S - 1)) : 0;
+      const z = this.ADAPTIVE.z;
+      return {
+        delta: sum / S * scale,
+        ci: z * Math.sqrt(variance(sum, sumSq) / S) * scale,
+        ciIndependent: z * Math.sqrt((variance(sa, saSq) + variance(sb, sbSq)) / S) * scale
+      };
+    },
+
+    _scenarioReport(variants, weatherCache, qualiGridCache) {
+      const N = DRIVERS.length;
+      const outcomes = variants.map(v => {
+        const forced = new Uint8Array(N);
+        (v.spec.forceDNFs || []).forEach(id => { const i = DRIVERS.findIndex(d => d.id === id); if (i >= 0) forced[i] = 1; });
+        return this._simOutcomes(v.orders, forced);
+      });
+      const S = variants[0].orders.sims;
+      const results = variants.map((v, k) => {
+        const o = outcomes[k], wins = {}, podiums = {}, finishSum = {}, dnfs = {};
+        DRIVERS.forEach((d, i) => {
+          let w = 0, p = 0, f = 0, x = 0;
+          for (let j = 0; j < S; j++) { w += o.win[j * N + i]; p += o.podium[j * N + i]; f += o.finish[j * N + i]; x += o.dnf[j * N + i]; }
+          wins[d.id] = w; podiums[d.id] = p; finishSum[d.id] = f; dnfs[d.id] = x;
+        });
+        return this._buildResult(v.race, wins, podiums, finishSum, dnfs, o.positions, weatherCache, qualiGridCache, S);
+      });
+      const base = outcomes[0];
+      return {
+        sims: S,
+        baseline: results[0],
+        scenarios: variants.slice(1).map((v, k) => {
+          const o = outcomes[k + 1];
+          const deltas = DRIVERS.map((d, i) => {
+            const win = this._pairedDelta(o.win, base.win, S, i, N, 100);
+            const podium = this._pairedDelta(o.podium, base.podium, S, i, N, 100);
+            const finish = this._pairedDelta(o.finish, base.finish, S, i, N, 1);
+            return {
+              driver: d,
+              win: win.delta, winCI: win.ci, winCIIndependent: win.ciIndependent,
+              podium: podium.delta, podiumCI: podium.ci,
+              finish: finish.delta, finishCI: finish.ci
+            };
+          }).sort((x, y) => Math.abs(y.win) - Math.abs(x.win));
+          return { label: v.spec.label || null, scenario: v.spec, result: results[k + 1], deltas };
+        })
+      };
+    },
+
+    // Synchronous run for non-async contexts (championship projection)
+    runSync(race) {
+      const wins = {}, podiums = {}, finishSum = {}, dnfs = {}, positions = this._histogram();
+      DRIVERS.forEach(d => { wins[d.id] = 0; podiums[d.id] = 0; finishSum[d.id] = 0; dnfs[d.id] = 0; });
+      const penalties = JSON.parse(JSON.stringify(ComponentReliability.gridPenalties));
+      const rng0 = new RNG(race.round * 10000 + 1);
+      const weatherCache = WeatherEngine.generate(race.rain_probability, rng0);
+      const qualiGridCache = QualifyingEngine.simulate(race, new RNG(race.round * 77), weatherCache);
+      // Use 200 sims for sync contexts to keep UI responsive
+      const SYNC_SIMS = 200;
+      const key = MonteCarloResultCache.key(race, MonteCarloKernel.capture(race), { mode: 'sync', cap: SYNC_SIMS }, penalties);
+      const hit = MonteCarloResultCache.get(key);
+      if (hit) {
+        const c = MonteCarloResultCache.apply(hit);
+        return this._buildResult(race, c.wins, c.podiums, c.finishSum, c.dnfs, c.positions, weatherCache, qualiGridCache, SYNC_SIMS);
+      }
+      this._runBatch(race, 0, SYNC_SIMS, wins, podiums, finishSum, dnfs, positions);
+      MonteCarloResultCache.put(key, SYNC_SIMS, MonteCarloKernel.pack(wins, podiums, finishSum, dnfs, positions));
+      return this._buildResult(race, wins, podiums, finishSum, dnfs, positions, weatherCache, qualiGridCache, SYNC_SIMS);
+    }
+  };
+
+  // ─────────────────────────────────────────────────────────────
+  // MONTE CARLO KERNEL — full-model shard runner for pool workers
+  // capture() freezes every piece of mutable state the sim pipeline reads
+  // (model state + learned window.* engines) on the main thread; restore()
+  // replays it inside a worker before each shard, so a shard's counts only
+  // depend on its seed range, never on which worker ran it.
+  // ─────────────────────────────────────────────────────────────
+  const MonteCarloKernel = {
+    LIVE_FIELDS: ['isLiveSession', 'currentLap', 'scLaps', 'liveWeather', 'lapsOnTire', 'compounds', 'livePositions'],
+
+    // scenario: a WhatIfScenario spec to snapshot instead of the live one (scenario batches)
+    capture(race, scenario = null) {
+      const clone = v => v === undefined ? null : JSON.parse(JSON.stringify(v));
+      const byDriver = fn => { const o = {}; DRIVERS.forEach(d => { o[d.id] = fn(d); }); return o; };
+      const byTeam = fn => { const o = {}; Object.keys(BASE_IDX).forEach(t => { o[t] = fn(t); }); return o; };
+      const e = {};
+
+      if (window.MLPaceRegression) e.ml = window.MLPaceRegression.getLearnedWeights();
+      if (window.EloRatingSystem) e.elo = byDriver(d => window.EloRatingSystem.getNormalizedRating(d.id));
+      if (window.TrackPerformanceHistory) {
+        e.trackHist = byDriver(d => window.TrackPerformanceHistory.getTrackPaceModifier(d.id, race.short, race.city));
+      }
+      if (window.BayesianPerformanceEngine) e.bayes = byTeam(t => window.BayesianPerformanceEngine.getTeamAdjustment(t));
+      if (window.LapDeltaLearningEngine) e.lapDelta = byTeam(t => window.LapDeltaLearningEngine.getTeamAdjustment(t));
+      if (window.GridRecoveryCurves && race.short) {
+        e.gridCurve = DRIVERS.map((_, i) => window.GridRecoveryCurves.getNonLinearGridPenalty(i + 1, race.short));
+      }
+      if (window.PitCrewLiveData) e.pit = clone(byTeam(t => window.PitCrewLiveData.getTeamStats(t)));
+      if (window.WhatIfScenario) {
+        const wi = window.WhatIfScenario;
+        const active = scenario ? !!scenario.active : wi.isActive();
+        e.whatIf = { active, mods: active ? byDriver(d => scenario ? wi.getDriverModifier(d, scenario) : wi.getDriverModifier(d)) : null };
+      }
+      if (window.LiveIntelligence) {
+        const li = window.LiveIntelligence;
+        const st = typeof li.getState === 'function' ? li.getState() : null;
+        const state = {};
+        if (st) this.LIVE_FIELDS.forEach(k => { if (st[k] !== undefined) state[k] = clone(st[k]); });
+        e.live = { overrides: li.getOverrides ? clone(li.getOverrides()) : null, state: st ? state : null };
+      }
+
+      return {
+        model: clone({
+          teamRatings: DynamicModel.teamRatings,
+          driverForm: DynamicModel.driverForm,
+          confidence: DriverConfidenceEngine.confidence,
+          wear: SeasonComponentWear.wear,
+          gridPenalties: ComponentReliability.gridPenalties
+        }),
+        data: { calendar: DataModel.calendar, results: DataModel.results, racesScored: DataModel.accuracy.races_scored },
+        engines: e
+      };
+    },
+
+    // Worker side only: overwrite local state and swap stateful engines for snapshot-backed facades
+    restore(snap) {
+      const m = JSON.parse(JSON.stringify(snap.model));
+      DynamicModel.teamRatings = m.teamRatings;
+      DynamicModel.driverForm = m.driverForm;
+      DriverConfidenceEngine.confidence = m.confidence;
+      SeasonComponentWear.wear = m.wear;
+      ComponentReliability.gridPenalties = m.gridPenalties;
+      DataModel.calendar = snap.data.calendar;
+      DataModel.results = snap.data.results;
+      DataModel.accuracy.races_scored = snap.data.racesScored;
+
+      const e = snap.engines;
+      const install = (name, facade) => { if (facade) window[name] = facade; else delete window[name]; };
+      install('MLPaceRegression', e.ml && { getLearnedWeights: () => e.ml });
+      install('EloRatingSystem', e.elo && { getNormalizedRating: id => e.elo[id] ?? 0.5 });
+      install('TrackPerformanceHistory', e.trackHist && { getTrackPaceModifier: id => e.trackHist[id] ?? 1.0 });
+      install('BayesianPerformanceEngine', e.bayes && { getTeamAdjustment: t => e.bayes[t] || 0 });
+      install('LapDeltaLearningEngine', e.lapDelta && { getTeamAdjustment: t => e.lapDelta[t] || 0 });
+      install('GridRecoveryCurves', e.gridCurve && {
+        getNonLinearGridPenalty: pos => e.gridCurve[Math.max(1, Math.min(e.gridCurve.length, pos)) - 1]
+      });
+      install('PitCrewLiveData', e.pit && {
+        getTeamStats: t => e.pit[t] || null,
+        // Same draw sequence as PitCrewLiveData.getTeamPitTime
+        getTeamPitTime(t, rng) {
+          const stats = e.pit[t] || { mean: 2.5, stddev: 0.25 };
+          const u1 = rng.next(), u2 = rng.next();
+          const z = Math.sqrt(-2 * Math.log(u1 || 0.001)) * Math.cos(2 * Math.PI * u2);
+          let pitTime = Math.max(1.8, Math.min(10.0, stats.mean + z * stats.stddev));
+          if (rng.next() < 0.03) pitTime += 2 + rng.next() * 8;
+          return pitTime;
+        }
+      });
+      install('WhatIfScenario', e.whatIf && {
+        isActive: () => e.whatIf.active,
+        getDriverModifier: d => (e.whatIf.mods && e.whatIf.mods[d.id]) ?? 1.0
+      });
+      install('LiveIntelligence', e.live && {
+        getOverrides: () => e.live.overrides,
+        getState: () => e.live.state || {}
+      });
+    },
+
+    // withOrders: also return every sim's finishing orders → { counts, orders }.
+    // A race carrying a live snapshot (LiveRaceEngine) runs the remaining-laps batch instead.
+    runShard(race, fromSim, toSim, withOrders = false) {
+      const wins = {}, podiums = {}, finishSum = {}, dnfs = {}, positions = MonteCarloEngine._histogram();
+      DRIVERS.forEach(d => { wins[d.id] = 0; podiums[d.id] = 0; finishSum[d.id] = 0; dnfs[d.id] = 0; });
+      const orders = withOrders ? this.allocOrders(toSim - fromSim) : null;
+      if (race.live) MonteCarloEngine._runLiveBatch(race, fromSim, toSim, wins, podiums, finishSum, dnfs, positions);
+      else MonteCarloEngine._runBatch(race, fromSim, toSim, wins, podiums, finishSum, dnfs, positions, orders);
+      const counts = this.pack(wins, podiums, finishSum, dnfs, positions);
+      return withOrders ? { counts, orders } : counts;
+    },
+
+    // Per-sim finishing orders (driver index per position, -1 = empty) from the
+    // standard model and from the sim's Markov race, as filled by _runBatch
+    allocOrders(sims) {
+      const width = DRIVERS.length;
+      return {
+        sims, width,
+        finish: new Int16Array(sims * width).fill(-1),
+        dnf: new Uint8Array(sims * width),
+        markov: new Int16Array(sims * width).fill(-1),
+        markovDnf: new Uint8Array(sims * width)
+      };
+    },
+
+    joinOrders(parts) {
+      const out = this.allocOrders(parts.reduce((a, p) => a + p.sims, 0));
+      let off = 0;
+      parts.forEach(p => {
+        ['finish', 'dnf', 'markov', 'markovDnf'].forEach(k => out[k].set(p[k], off));
+        off += p.sims * p.width;
+      });
+      return out;
+    },
+
+    // One flat vector per run: wins | podiums | finishSum | dnfs (n each), then the
+    // n × n position histogram. Every slot merges by addition, and the histogram's
+    // integer counts are exact in float64, so shards and cache entries need no special casing.
+    pack(wins, podiums, finishSum, dnfs, positions) {
+      const n = DRIVERS.length, counts = new Float64Array(n * 4 + n * n);
+      DRIVERS.forEach((d, i) => {
+        counts[i] = wins[d.id]; counts[n + i] = podiums[d.id];
+        counts[2 * n + i] = finishSum[d.id]; counts[3 * n + i] = dnfs[d.id];
+      });
+      counts.set(positions, n * 4);
+      return counts;
+    },
+
+    unpack(counts) {
+      const n = DRIVERS.length, out = { wins: {}, podiums: {}, finishSum: {}, dnfs: {}, positions: new Uint32Array(counts.subarray(n * 4)) };
+      DRIVERS.forEach((d, i) => {
+        out.wins[d.id] = counts[i]; out.podiums[d.id] = counts[n + i];
+        out.finishSum[d.id] = counts[2 * n + i]; out.dnfs[d.id] = counts[3 * n + i];
+      });
+      return out;
+    }
+  };
+
+  // ─────────────────────────────────────────────────────────────
+  // MONTE CARLO WORKER POOL — persistent, sized to hardwareConcurrency
+  // Jobs are cut into fixed seed-range shards handed to whichever worker is
+  // idle; shard counts are merged in shard order as the prefix completes.
+  // A failed shard is rerun on a fresh worker; only a repeat failure takes the
+  // pool down, and then just for COOLDOWN_MS before workers are tried again.
+  // ─────────────────────────────────────────────────────────────
+  const MonteCarloPool = {
+    SHARD: 250,
+    MAX_WORKERS: 16,
+    SHARD_RETRIES: 1,
+    COOLDOWN_MS: 30000,
+    workers: [],
+    idle: [],
+    jobs: [],
+    nextJobId: 1,
+    downUntil: 0,
+
+    available() { return typeof Worker !== 'undefined' && performance.now() >= this.downUntil; },
+
+    size() {
+      const hc = (typeof navigator !== 'undefined' && navigator.hardwareConcurrency) || 4;
+      return Math.max(1, Math.min(this.MAX_WORKERS, hc));
+    },
+
+    _spawn() {
+      while (this.workers.length < this.size()) {
+        const w = new Worker('MonteCarloWorker.js');
+        w.jobId = 0;
+        w.shard = null;
+        w.onmessage = evt => this._onShard(w, evt.data);
+        w.onerror = err => this._fail(w, err);
+        this.workers.push(w);
+        this.idle.push(w);
+      }
+    },
+
+    // onCheckpoint(counts, sims) fires each time the merged shard prefix reaches a
+    // multiple of `every` sims; returning true stops the job there and hands that
+    // prefix to onDone. Checkpoints sit on fixed seed boundaries, so where a job
+    // stops never depends on which worker finished first.
+    // withOrders: shards also return per-sim finishing orders, joined in shard order
+    // and passed to onDone as a third argument.
+    // priority: queue ahead of already-submitted jobs (live re-prediction under a deadline).
+    submit(race, snapshot, sims, onDone, onError, onCheckpoint = null, every = sims, withOrders = false, priority = false) {
+      this._spawn();
+      const shards = [];
+      for (let from = 0; from < sims; from += this.SHARD) shards.push([from, Math.min(sims, from + this.SHARD)]);
+      this.jobs[priority ? 'unshift' : 'push']({
+        id: this.nextJobId++, race, snapshot, shards, next: 0,
+        parts: new Array(shards.length), merged: 0, acc: null, cancelled: false,
+        retry: [], retries: new Uint8Array(shards.length),
+        orders: withOrders ? [] : null,
+        onDone, onError, onCheckpoint, every
+      });
+      this._dispatch();
+    },
+
+    _dispatch() {
+      while (this.idle.length) {
+        const job = this.jobs.find(j => j.retry.length || j.next < j.shards.length);
+        if (!job) return;
+        const w = this.idle.pop();
+        const idx = job.retry.length ? job.retry.shift() : job.next++;
+        const [from, to] = job.shards[idx];
+        w.shard = { job, idx };
+        w.sentAt = SimProfiler.enabled ? performance.now() : 0;
+        // The snapshot only crosses the thread boundary once per worker per job
+        w.postMessage({ jobId: job.id, from, to, profile: SimProfiler.enabled, job: w.jobId === job.id ? null : { race: job.race, snapshot: job.snapshot, orders: !!job.orders } });
+        w.jobId = job.id;
+      }
+    },
+
+    _onShard(w, msg) {
+      if (msg.error) { this._fail(w, new Error(msg.error)); return; }
+      const { job, idx } = w.shard;
+      w.shard = null;
+      this.idle.push(w);
+      if (w.sentAt) SimProfiler.workerBusy(performance.now() - w.sentAt);
+      if (msg.profile) SimProfiler.merge(msg.profile);
+      // Shards still in flight when a job stopped early are dropped
+      if (!job.cancelled) {
+        job.parts[idx] = msg.counts;
+        if (job.orders) job.orders[idx] = msg.orders;
+        this._merge(job);
+      }
+      this._dispatch();
+    },
+
+    // Shard order, not arrival order, so the merged sums are reproducible
+    _merge(job) {
+      while (job.merged < job.shards.length && job.parts[job.merged]) {
+        const p = job.parts[job.merged];
+        job.parts[job.merged] = null;
+        if (!job.acc) job.acc = new Float64Array(p.length);
+        for (let i = 0; i < p.length; i++) job.acc[i] += p[i];
+        const done = job.shards[job.merged++][1];
+        const last = job.merged === job.shards.length;
+        const stop = !last && job.onCheckpoint && done % job.every === 0 && job.onCheckpoint(job.acc, done) === true;
+        if (last || stop) {
+          job.cancelled = true;
+          this.jobs.splice(this.jobs.indexOf(job), 1);
+          job.onDone(job.acc, done, job.orders && MonteCarloKernel.joinOrders(job.orders.slice(0, job.merged)));
+          return;
+        }
+      }
+    },
+
+    // The failing worker is replaced either way; its shard goes back to the front of
+    // its job unless it already used up SHARD_RETRIES. Errors outside a shard (a
+    // worker that failed to load) and repeat failures take the whole pool down.
+    _fail(w, err) {
+      const shard = w.shard;
+      w.terminate();
+      this.workers = this.workers.filter(x => x !== w);
+      this.idle = this.idle.filter(x => x !== w);
+      if (shard && (shard.job.cancelled || shard.job.retries[shard.idx] < this.SHARD_RETRIES)) {
+        if (!shard.job.cancelled) {
+          console.warn('[MonteCarlo] Pool worker error, retrying shard on a fresh worker:', err.message);
+          shard.job.retries[shard.idx]++;
+          shard.job.retry.push(shard.idx);
+        }
+        try { this._spawn(); } catch (e) { this.suspend(e); return; }
+        this._dispatch();
+        return;
+      }
+      this.suspend(err);
+    },
+
+    // Fail every queued job over to its fallback and keep the pool off for COOLDOWN_MS
+    suspend(err) {
+      console.warn(`[MonteCarlo] Pool worker error, falling back to rAF for ${this.COOLDOWN_MS / 1000}s:`, err.message);
+      this.downUntil = performance.now() + this.COOLDOWN_MS;
+      this.workers.forEach(w => w.terminate());
+      this.workers = [];
+      this.idle = [];
+      const jobs = this.jobs;
+      this.jobs = [];
+      jobs.forEach(j => { j.cancelled = true; j.onError(err); });
+    }
+  };
+
+  // ─────────────────────────────────────────────────────────────
+  // SIM PROFILER — opt-in, sampled per-engine timings for the sim pipeline
+  // While enabled, the engine methods below are swapped for timing wrappers;
+  // disabling puts the originals back, so a disabled profiler costs nothing.
+  // Hot per-driver calls are timed one in SAMPLE_EVERY and scaled up by their
+  // call count. Roots also emit performance.mark/measure entries (visible in
+  // the DevTools performance panel) and track heap growth per sim where the
+  // runtime exposes it. Pool workers profile their own shards and ship the
+  // counters back with each result; the pool adds worker busy time.
+  // ─────────────────────────────────────────────────────────────
+  const SimProfiler = {
+    SAMPLE_EVERY: 16,
+    enabled: false,
+    active: false,         // inside a profiled root — wrappers outside one pass straight through
+    since: 0,
+    // [name, parent, hot]; roots have no parent
+    NODES: [
+      ['MonteCarloEngine batches', null, false],
+      ['WeatherEngine.generate', 'MonteCarloEngine batches', true],
+      ['QualifyingEngine.simulate', 'MonteCarloEngine batches', false],
+      ['PressureEngine.getModifiers', 'MonteCarloEngine batches', false],
+      ['TrackEvolutionEngine.getMistakeRate', 'MonteCarloEngine batches', false],
+      ['TrackEvolutionEngine.getGripMod', 'MonteCarloEngine batches', false],
+      ['DNFEngine.roll', 'MonteCarloEngine batches', true],
+      ['AeroDynamicsRaceModel.getAeroPaceDelta', 'MonteCarloEngine batches', true],
+      ['OvertakePhysicsEngine.DirtyAir.calculatePenalty', 'MonteCarloEngine batches', true],
+      ['GridRecoveryCurves.getNonLinearGridPenalty', 'MonteCarloEngine batches', true],
+      ['StrategyEngine.getDelta', 'MonteCarloEngine batches', true],
+      ['PitCrewLiveData.getTeamPitTime', 'StrategyEngine.getDelta', true],
+      ['RivalryEngine.checkIncident', 'MonteCarloEngine batches', true],
+      ['EngineIntegrator.getEnhancedPaceModifiers', 'MonteCarloEngine batches', true],
+      ['MarkovLapSimulator.simulateBatch', 'MonteCarloEngine batches', false],
+      ['OvertakePhysicsEngine.calculateOvertakeProbability', 'MarkovLapSimulator.simulateBatch', true],
+      ['MonteCarloEngine._buildResult', null, false],
+      ['ConfidenceBandEngine.calculateBandsFromCounts', 'MonteCarloEngine._buildResult', false],
+      ['ConfidenceBandEngine.calculateWinCI', 'MonteCarloEngine._buildResult', false],
+      ['PositionProbabilityEngine.calculateDistribution', 'MonteCarloEngine._buildResult', false],
+    ],
+    ROOTS: { _runBatch: 'MonteCarloEngine batches', _runLiveBatch: 'MonteCarloEngine batches', _buildResult: 'MonteCarloEngine._buildResult' },
+    nodes: null,           // name → { calls, sampled, sampledMs }
+    totals: null,          // { sims, allocBytes, allocSims, workerBusyMs }
+    patched: new Map(),    // 'Owner.method' → [owner, method, original, wrapper]
+
+    _reset() {
+      this.nodes = {};
+      this.NODES.forEach(([name]) => { this.nodes[name] = { calls: 0, sampled: 0, sampledMs: 0 }; });
+      this.totals = { sims: 0, allocBytes: 0, allocSims: 0, workerBusyMs: 0 };
+      this.since = performance.now();
+    },
+
+    setEnabled(on) {
+      on = !!on;
+      if (on === this.enabled) return;
+      this.enabled = on;
+      if (on) { if (!this.nodes) this._reset(); this.since = performance.now(); this._instrument(); }
+      else this._restore();
+    },
+
+    // Engines local to this file by name; everything else is looked up on window
+    _owner(path) {
+      const local = { MonteCarloEngine, WeatherEngine, QualifyingEngine, PressureEngine, TrackEvolutionEngine, DNFEngine, StrategyEngine, RivalryEngine };
+      const parts = path.split('.');
+      let owner = local[parts[0]] || window[parts[0]];
+      for (let i = 1; owner && i < parts.length - 1; i++) owner = owner[parts[i]];
+      return owner && typeof owner[parts[parts.length - 1]] === 'function' ? owner : null;
+    },
+
+    // Idempotent, and re-run on every root call: worker restore() installs fresh engine facades
+    _instrument() {
+      Object.entries(this.ROOTS).forEach(([method, name]) => this._wrap(MonteCarloEngine, method, name, false, true, `MonteCarloEngine.${method}`));
+      this.NODES.forEach(([name, parent, hot]) => {
+        if (!parent) return;
+        const owner = this._owner(name);
+        if (owner) this._wrap(owner, name.split('.').pop(), name, hot, false, name);
+      });
+    },
+
+    _wrap(owner, method, name, hot, root, key) {
+      const orig = owner[method];
+      if (orig.__profiled) return;
+      const prof = this, every = hot ? this.SAMPLE_EVERY : 1;
+      const wrapper = root
+        ? function () { return prof._runRoot(name, method, orig, this, arguments); }
+        : function () {
+          if (!prof.active) return orig.apply(this, arguments);
+          const node = prof.nodes[name];
+          if (node.calls++ % every) return orig.apply(this, arguments);
+          const t0 = performance.now();
+          try { return orig.apply(this, arguments); } finally { node.sampled++; node.sampledMs += performance.now() - t0; }
+        };
+      wrapper.__profiled = true;
+      owner[method] = wrapper;
+      this.patched.set(key, [owner, method, orig, wrapper]); // replaces any entry for a discarded facade
+    },
+
+    _restore() {
+      this.patched.forEach(([owner, method, orig, wrapper]) => { if (owner[method] === wrapper) owner[method] = orig; });
+      this.patched.clear();
+    },
+
+    _heap() {
+      if (typeof performance !== 'undefined' && performance.memory) return performance.memory.usedJSHeapSize;
+      if (typeof process !== 'undefined' && process.memoryUsage) return process.memoryUsage().heapUsed;
+      return null;
+    },
+
+    _runRoot(name, method, orig, self, args) {
+      if (this.active) return orig.apply(self, args); // nested root: already being timed
+      this._instrument();
+      this.active = true;
+      const batch = method !== '_buildResult';
+      const sims = batch ? Math.max(0, args[2] - args[1]) : 0;
+      const mark = `f1:${method}`, canMark = typeof performance.mark === 'function';
+      if (canMark) performance.mark(`${mark}:start`);
+      const h0 = batch ? this._heap() : null, t0 = performance.now();
+      try {
+        return orig.apply(self, args);
+      } finally {
+        const node = this.nodes[name];
+        node.calls++; node.sampled++; node.sampledMs += performance.now() - t0;
+        if (batch) {
+          this.totals.sims += sims;
+          const h1 = h0 === null ? null : this._heap();
+          if (h1 !== null && h1 >= h0) { this.totals.allocBytes += h1 - h0; this.totals.allocSims += sims; } // shrank: a GC ran mid-batch
+        }
+        if (canMark) {
+          try { performance.measure(mark, `${mark}:start`); } catch (e) { /* mark buffer cleared */ }
+          performance.clearMarks(`${mark}:start`);
+          performance.clearMeasures(mark);
+        }
+        this.active = false;
+      }
+    },
+
+    // Worker side: counters since the last drain, for the shard result message
+    drain() {
+      const out = { nodes: this.nodes, totals: this.totals };
+      this._reset();
+      return out;
+    },
+
+    // Main side: fold in a worker's drained counters
+    merge(part) {
+      if (!this.nodes || !part) return;
+      Object.entries(part.nodes).forEach(([name, n]) => {
+        const node = this.nodes[name];
+        if (!node) return;
+        node.calls += n.calls; node.sampled += n.sampled; node.sampledMs += n.sampledMs;
+      });
+      this.totals.sims += part.totals.sims;
+      this.totals.allocBytes += part.totals.allocBytes;
+      this.totals.allocSims += part.totals.allocSims;
+    },
+
+    workerBusy(ms) { if (this.totals) this.totals.workerBusyMs += ms; },
+
+    // Flame-style tree: estimated ms per node (sampled time scaled to all calls), self time,
+    // µs per sim and calls per sim. Times are CPU ms summed over the main thread and workers.
+    report() {
+      if (!this.nodes) this._reset();
+      const sims = this.totals.sims;
+      const build = name => {
+        const n = this.nodes[name];
+        const ms = n.sampled ? n.sampledMs * n.calls / n.sampled : 0;
+        const children = this.NODES.filter(([, parent]) => parent === name).map(([child]) => build(child));
+        const childMs = children.reduce((a, c) => a + c.ms, 0);
+        return {
+          name, calls: n.calls, ms, selfMs: Math.max(0, ms - childMs),
+          usPerSim: sims ? ms * 1000 / sims : null,
+          callsPerSim: sims ? n.calls / sims : null,
+          children
+        };
+      };
+      const wallMs = performance.now() - this.since;
+      const workers = MonteCarloPool.workers.length;
+      return {
+        enabled: this.enabled,
+        sampleEvery: this.SAMPLE_EVERY,
+        wallMs,
+        sims,
+        allocBytesPerSim: this.totals.allocSims ? this.totals.allocBytes / this.totals.allocSims : null,
+        workers: {
+          size: workers,
+          busyMs: this.totals.workerBusyMs,
+          utilization: workers && wallMs > 0 ? Math.min(1, this.totals.workerBusyMs / (workers * wallMs)) : null
+        },
+        tree: this.NODES.filter(([, parent]) => !parent).map(([name]) => build(name))
+      };
+    },
+
+    reset() { this._reset(); }
+  };
+
+  // ─────────────────────────────────────────────────────────────
+  // MONTE CARLO RESULT CACHE — content-addressed, memory LRU over IndexedDB
+  // A run's counts are a pure function of the race record, the sim plan and
+  // the model state MonteCarloKernel.capture() snapshots (ratings, form,
+  // reliability, learned engines, live overrides, what-if mods), so the key
+  // is a hash of exactly that. Any input change yields a new key; stale
+  // entries just age out. Entries also keep the post-run grid penalties,
+  // the one piece of model state a main-thread run mutates.
+  // ─────────────────────────────────────────────────────────────
+  const MonteCarloResultCache = {
+    VERSION: 3, // bump when the sim pipeline changes what a given input produces
+    MEMORY_MAX: 256,
+    PERSIST_MAX: 1024,
+    DB_NAME: 'f1_2026_mc_cache',
+    STORE: 'results',
+    memory: new Map(), // key → { sims, counts: Float64Array, gridPenalties }, oldest first
+    db: null,
+    warming: null,
+    hits: 0,
+    misses: 0,
+
+    // JSON with sorted object keys, so equal state always hashes equally
+    _stable(v) {
+      if (v === null || typeof v !== 'object') return JSON.stringify(v) ?? 'null';
+      if (Array.isArray(v)) return '[' + v.map(x => this._stable(x)).join(',') + ']';
+      return '{' + Object.keys(v).sort().filter(k => v[k] !== undefined)
+        .map(k => JSON.stringify(k) + ':' + this._stable(v[k])).join(',') + '}';
+    },
+
+    // cyrb53 under two seeds → 106-bit hex digest
+    _hash(str) {
+      const h53 = seed => {
+        let h1 = 0xdeadbeef ^ seed, h2 = 0x41c6ce57 ^ seed;
+        for (let i = 0; i < str.length; i++) {
+          const ch = str.charCodeAt(i);
+          h1 = Math.imul(h1 ^ ch, 2654435761);
+          h2 = Math.imul(h2 ^ ch, 1597334677);
+        }
+        h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+        h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+        return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(16).padStart(14, '0');
+      };
+      return h53(0) + h53(0x9e3779b9);
+    },
+
+    // plan: everything about the run itself (mode, sim cap, adaptive settings)
+    // penalties: grid penalties from before the run, for runs whose own qualifying
+    // consumed some ahead of the snapshot; they stand in for the snapshot's
+    key(race, snapshot, plan, penalties = null) {
+      if (penalties) snapshot = { ...snapshot, model: { ...snapshot.model, gridPenalties: penalties } };
+      return this._hash(this._stable({ v: this.VERSION, race, plan, snapshot }));
+    },
+
+    get(key) {
+      const hit = this.memory.get(key);
+      if (!hit) { this.misses++; return null; }
+      this.memory.delete(key);
+      this.memory.set(key, hit);
+      this.hits++;
+      return hit;
+    },
+
+    put(key, sims, counts) {
+      const entry = { sims, counts, gridPenalties: JSON.parse(JSON.stringify(ComponentReliability.gridPenalties)) };
+      this._remember(key, entry);
+      this._persist(key, entry);
+    },
+
+    // Replays the run's side effect on model state, then unpacks the counts
+    apply(entry) {
+      ComponentReliability.gridPenalties = JSON.parse(JSON.stringify(entry.gridPenalties));
+      return MonteCarloKernel.unpack(entry.counts);
+    },
+
+    _remember(key, entry) {
+      this.memory.delete(key);
+      this.memory.set(key, entry);
+      while (this.memory.size > this.MEMORY_MAX) this.memory.delete(this.memory.keys().next().value);
+    },
+
+    _open() {
+      return new Promise(resolve => {
+        if (typeof indexedDB === 'undefined') { resolve(null); return; }
+        try {
+          const req = indexedDB.open(this.DB_NAME, 1);
+          req.onupgradeneeded = () => {
+            const store = req.result.createObjectStore(this.STORE, { keyPath: 'key' });
+            store.createIndex('ts', 'ts');
+          };
+          req.onsuccess = () => resolve(req.result);
+          req.onerror = () => resolve(null);
+          req.onblocked = () => resolve(null);
+        } catch (e) { resolve(null); }
+      });
+    },
+
+    // Load the most recently used persisted entries into memory and prune the rest.
+    // Safe to call repeatedly; resolves even when IndexedDB is unavailable.
+    warm() {
+      if (this.warming) return this.warming;
+      this.warming = this._open().then(db => new Promise(resolve => {
+        this.db = db;
+        if (!db) { resolve(); return; }
+        try {
+          const tx = db.transaction(this.STORE, 'readwrite');
+          const store = tx.objectStore(this.STORE);
+          const req = store.getAll();
+          req.onsuccess = () => {
+            const rows = req.result.sort((a, b) => a.ts - b.ts).filter(r => {
+              if (r.v === this.VERSION) return true;
+              store.delete(r.key);
+              return false;
+            });
+            rows.slice(0, Math.max(0, rows.length - this.PERSIST_MAX)).forEach(r => store.delete(r.key));
+            rows.slice(-this.MEMORY_MAX).forEach(r => {
+              if (this.memory.has(r.key)) return;
+              this.memory.set(r.key, { sims: r.sims, counts: Float64Array.from(r.counts), gridPenalties: r.gridPenalties });
+            });
+          };
+          tx.oncomplete = () => resolve();
+          tx.onerror = () => resolve();
+        } catch (e) { resolve(); }
+      }));
+      return this.warming;
+    },
+
+    _persist(key, entry) {
+      if (!this.db) return;
+      try {
+        this.db.transaction(this.STORE, 'readwrite').objectStore(this.STORE).put({
+          key, v: this.VERSION, ts: Date.now(), sims: entry.sims,
+          counts: Array.from(entry.counts), gridPenalties: entry.gridPenalties
+        });
+      } catch (e) { /* quota / closed db — memory copy still serves this session */ }
+    },
+
+    clear() {
+      this.memory.clear();
+      if (!this.db) return;
+      try { this.db.transaction(this.STORE, 'readwrite').objectStore(this.STORE).clear(); } catch (e) { /* ignore */ }
+    }
+  };
 
-          const paceNorm = Math.max(0.1, pace - dirtyAirPaceLoss);
+  // ─────────────────────────────────────────────────────────────
+  // LIVE RACE ENGINE — latency-budgeted in-race re-prediction
+  // Each position update snapshots the live state once (running order, gaps,
+  // tyres, stops, weather) and runs remaining-laps-only sims on the worker
+  // pool. Updates that arrive while a run is in flight collapse into one
+  // follow-up run on the freshest state. The sim count tracks measured
+  // throughput so a run fits BUDGET_MS, and a run still going at the budget
+  // stops at the next shard boundary with what it has.
+  // ─────────────────────────────────────────────────────────────
+  const LiveRaceEngine = {
+    BUDGET_MS: 500,        // position update → win/podium numbers on screen
+    MIN_SIMS: 250,
+    MAX_SIMS: 4000,
+    START_SIMS: 1000,      // until a run has measured throughput
+    CHUNK: 50,             // main-thread fallback sims per frame
+    SEC_PER_UNIT: 10,      // gap seconds → Markov time units (the model's ~0.25/lap field spread ≈ 2.5 s)
+    DEFAULT_GAP_SEC: 2,    // per place, where the feed has no usable gap_to_leader
+    throughput: 0,         // sims per ms, smoothed over completed pool runs
+    running: false,
+    pending: null,         // { race, t0, onResult, trace } of the newest update seen mid-run
+    stats: { runs: 0, coalesced: 0, overBudget: 0, lastLatencyMs: 0, lastSims: 0 },
+
+    // Live state → the race.live record _runLiveBatch reads; null outside a live race
+    snapshot(race) {
+      const li = window.LiveIntelligence;
+      const st = li && typeof li.getState === 'function' ? li.getState() : null;
+      if (!st || !st.isLiveSession || !st.livePositions?.length) return null;
+
+      const byNum = new Map();
+      DRIVERS.forEach((d, i) => { if (!byNum.has(d.num)) byNum.set(d.num, i); });
+      const rows = st.livePositions.filter(p => byNum.has(p.driver_number)).sort((a, b) => a.position - b.position);
+      const order = [], seen = new Set();
+      rows.forEach(p => {
+        const di = byNum.get(p.driver_number);
+        if (!seen.has(di)) { seen.add(di); order.push(di); }
+      });
+      if (!order.length) return null;
+
+      const lap = Math.max(1, Math.min(race.laps || 57, st.currentLap || 1));
+      const state = { currentLap: lap, compounds: {}, lapsOnTire: {}, pitStops: {} };
+      order.forEach(di => {
+        const d = DRIVERS[di];
+        if (st.compounds?.[d.num]) state.compounds[d.id] = st.compounds[d.num];
+        if (st.lapsOnTire?.[d.num] > 0) state.lapsOnTire[d.id] = st.lapsOnTire[d.num];
+      });
+      (Array.isArray(st.pitStops) ? st.pitStops : []).forEach(p => {
+        const di = byNum.get(p.driver_number);
+        if (di !== undefined) state.pitStops[DRIVERS[di].id] = (state.pitStops[DRIVERS[di].id] || 0) + 1;
+      });
 
-          const time = (2 - paceNorm) + gridPenalty + scEffect + stratDelta - upsetBoost;
-          return { driver: d, time, activePers };
-        });
+      // Gaps to the leader seed each car's race time — without them the whole field would
+      // restart level and the fastest car would lead after one lap. A missing, lapped
+      // ("+1 LAP") or out-of-order gap becomes DEFAULT_GAP_SEC behind the car in front.
+      state.gaps = {};
+      let gap = 0;
+      order.forEach((di, k) => {
+        const g = parseFloat(rows.find(p => byNum.get(p.driver_number) === di).gap_to_leader);
+        if (k > 0) gap = g > gap ? g : gap + this.DEFAULT_GAP_SEC;
+        state.gaps[DRIVERS[di].id] = gap / this.SEC_PER_UNIT;
+      });
 
-        entries.sort((a, b) => a.time - b.time);
+      const weather = st.liveWeather?.rainfall ? 'light_rain' : 'dry';
+      return { lap, order, state, weather, seed: race.round * 10000 + lap * 131 + 7 };
+    },
 
-        // Phase 5: Safety Car Restart Bunching & Skill handling
-        if (scHappens) {
-          entries.forEach(e => {
-            if (e.time > 9900) return;
-            e.time -= rng.norm(0, (e.activePers.restart_skill - 1.0) * 0.4);
-          });
-          entries.sort((a, b) => a.time - b.time);
+    // Entry point for position updates; onResult(mc) gets a _buildResult object with
+    // mc.live = { lap, lapsRemaining, latencyMs, sims, coalesced, budgetMs }.
+    // Called from a traced poll callback, it carries the LiveTrace through predict and render.
+    update(race, onResult) {
+      const t0 = performance.now();
+      const trace = window.LiveTrace ? window.LiveTrace.adopt() : null;
+      if (this.running) {
+        if (this.pending) {
+          this.stats.coalesced++;
+          if (this.pending.trace) window.LiveTrace.coalesce(this.pending.trace);
         }
+        this.pending = { race, t0, onResult, trace, coalesced: this.pending ? this.pending.coalesced + 1 : 0 };
+        return;
+      }
+      this._start(race, t0, onResult, 0, trace);
+    },
 
-        // Phase 3: Team Orders & Pit Wall Intelligence
-        for (let j = 0; j < entries.length - 1; j++) {
-          let e1 = entries[j];
-          let e2 = entries[j + 1];
-
-          if (e1.time < 9900 && e1.driver.team === e2.driver.team) {
-            const pts1 = standsThisRound[e1.driver.id] || 0;
-            const pts2 = standsThisRound[e2.driver.id] || 0;
-
-            // If driver behind (e2) is significantly ahead in championship, and it is late season
-            // P1 swaps with P2 to maximize team title points
-            if (pts2 > pts1 + 25 && race.round > totalRounds * 0.5) {
-              if (rng.next() < 0.8) {
-                const temp = e1.time;
-                e1.time = e2.time;
-                e2.time = temp;
-                // e2 is now faster, sorts ahead on next pass
-              }
-            }
-          }
-        }
+    _start(race, t0, onResult, coalesced, trace) {
+      const live = this.snapshot(race);
+      if (!live) {
+        if (trace) window.LiveTrace.end(trace);
+        this._next();
+        return;
+      }
+      const liveRace = { ...race, live };
+      this.running = true;
 
-        entries.sort((a, b) => a.time - b.time);
+      const wins = {}, podiums = {}, finishSum = {}, dnfs = {};
+      DRIVERS.forEach(d => { wins[d.id] = 0; podiums[d.id] = 0; finishSum[d.id] = 0; dnfs[d.id] = 0; });
+      const done = (c, sims) => {
+        const latencyMs = performance.now() - t0;
+        const mc = MonteCarloEngine._buildResult(liveRace, c.wins, c.podiums, c.finishSum, c.dnfs, c.positions, live.weather, null, sims);
+        mc.live = { lap: live.lap, lapsRemaining: Math.max(0, (race.laps || 57) - live.lap), latencyMs, sims, coalesced, budgetMs: this.BUDGET_MS };
+        this.stats.runs++;
+        this.stats.lastLatencyMs = latencyMs;
+        this.stats.lastSims = sims;
+        if (latencyMs > this.BUDGET_MS) this.stats.overBudget++;
+        if (trace) window.LiveTrace.mark(trace, 'predict');
+        try { onResult(mc); } catch (e) { console.warn('[LiveRace] Render failed:', e.message); }
+        // Rendered once the frame with the new numbers is up
+        if (trace) requestAnimationFrame(() => window.LiveTrace.end(trace, 'render'));
+        this.running = false;
+        this._next();
+      };
+      const local = () => this._runLocal(liveRace, t0, { wins, podiums, finishSum, dnfs, positions: MonteCarloEngine._histogram() }, done);
 
-        // Phase 4: Rivalry & Incident check between adjacent finishers
-        for (let k = 0; k < entries.length - 1; k++) {
-          const e1 = entries[k]; const e2 = entries[k + 1];
-          if (e1.time > 9900 || e2.time > 9900) continue;
-          const timeDiff = e2.time - e1.time;
-          if (timeDiff < 0.015) { // Close battle
-            const incident = RivalryEngine.checkIncident(e1.driver, e2.driver, rng, weather);
-            if (incident === 'dnf') {
-              // Aggressive driver more likely to be eliminated
-              const victim = (DriverPersonalityMatrix[e2.driver.id]?.aggression || 1) >
-                (DriverPersonalityMatrix[e1.driver.id]?.aggression || 1) ? e2 : e1;
-              victim.time = 9999 + rng.next();
-              dnfs[victim.driver.id]++;
-            } else if (incident === 'damage') {
-              e2.time += rng.range(0.05, 0.15);
-            } else if (incident === 'position') {
-              e2.time += rng.range(0.01, 0.04);
-            }
-          }
-        }
-        entries.sort((a, b) => a.time - b.time);
+      if (!MonteCarloPool.available()) { local(); return; }
+      try {
+        const shard = MonteCarloPool.SHARD;
+        const target = this.throughput ? this.throughput * this.BUDGET_MS * 0.8 : this.START_SIMS;
+        const sims = Math.max(this.MIN_SIMS, Math.min(this.MAX_SIMS, Math.round(target / shard) * shard));
+        const t1 = performance.now();
+        // Deadline: stop at the first shard boundary past the budget, once MIN_SIMS are in
+        const deadline = (counts, n) => n >= this.MIN_SIMS && performance.now() - t0 >= this.BUDGET_MS;
+        MonteCarloPool.submit(liveRace, MonteCarloKernel.capture(liveRace), sims, (counts, n) => {
+          const rate = n / Math.max(1, performance.now() - t1);
+          this.throughput = this.throughput ? this.throughput * 0.5 + rate * 0.5 : rate;
+          done(MonteCarloKernel.unpack(counts), n);
+        }, local, deadline, shard, false, true);
+      } catch (e) {
+        console.warn('[LiveRace] Worker pool unavailable:', e.message);
+        MonteCarloPool.downUntil = performance.now() + MonteCarloPool.COOLDOWN_MS;
+        local();
+      }
+    },
 
-        entries.forEach((e, i) => {
-          finishSum[e.driver.id] += (i + 1);
-          if (i === 0) wins[e.driver.id]++;
-          if (i < 3) podiums[e.driver.id]++;
-        });
+    // Main-thread fallback: CHUNK sims per frame until MIN_SIMS or the budget runs out
+    _runLocal(race, t0, c, done) {
+      let processed = 0;
+      const tick = () => {
+        MonteCarloEngine._runLiveBatch(race, processed, processed + this.CHUNK, c.wins, c.podiums, c.finishSum, c.dnfs, c.positions);
+        processed += this.CHUNK;
+        if (processed < this.MIN_SIMS && performance.now() - t0 < this.BUDGET_MS) requestAnimationFrame(tick);
+        else done(c, processed);
+      };
+      requestAnimationFrame(tick);
+    },
 
-        // ═══ MARKOV LAP-BY-LAP SIMULATION (20% of sims) ═══
-        // For these sims, blend Markov results (30%) with standard results (70%)
-        // by adjusting the standard contribution down and adding Markov contribution
-        if (window.MarkovLapSimulator && (sim - fromSim) < Math.floor((toSim - fromSim) * 0.2)) {
-          try {
-            const markovGrid = grid.map(g => ({
-              driver: g.driver,
-              gridPos: g.gridPos,
-              basePace: entries.find(e => e.driver.id === g.driver.id)?.time
-                ? 2 - (entries.find(e => e.driver.id === g.driver.id)?.time || 1) : 0.85,
-              compound: weather === 'heavy_rain' ? 'wet' : weather === 'light_rain' ? 'intermediate' : 'medium',
-              tireSmoothnessSkill: DriverPersonalityMatrix[g.driver.id]?.tireSmoothness || 1.0,
-              pitStrategy: [{ lap: Math.floor((race.laps || 57) * 0.4), compound: 'hard' }],
-            }));
-
-            // Get live race state if available
-            let liveState = null;
-            if (typeof window.LiveIntelligence !== 'undefined' && window.LiveIntelligence.getState) {
-              const state = window.LiveIntelligence.getState();
-              if (state.isLiveSession && state.livePositions?.length > 0) {
-                liveState = {
-                  currentLap: state.currentLap || 1,
-                  positions: {},
-                  compounds: {},
-                  lapsOnTire: {},
-                  pitStops: {},
-                };
-                state.livePositions.forEach(p => {
-                  const dId = DRIVERS.find(d => d.num === p.driver_number)?.id;
-                  if (dId) {
-                    liveState.positions[dId] = { position: p.position, gap: p.gap_to_leader || 0 };
-                  }
-                });
-              }
-            }
+    _next() {
+      const p = this.pending;
+      this.pending = null;
+      if (p) this._start(p.race, p.t0, p.onResult, p.coalesced, p.trace);
+    },
 
-            const markovResult = window.MarkovLapSimulator.simulateRace({
-              grid: markovGrid,
-              totalLaps: race.laps || 57,
-              trackId: race.short || 'default',
-              weather: weather,
-              scProbability: race.sc_probability || 0.4,
-              rng: rng,
-              liveState: liveState,
-            });
+    getStats() {
+      return { ...this.stats, running: this.running, pending: !!this.pending, simsPerMs: this.throughput };
+    }
+  };
 
-            // Adjust standard sim contribution down by 30% and add Markov at 30%
-            // This keeps the total at 1.0 per sim (0.7 standard + 0.3 Markov)
-            entries.forEach((e, i) => {
-              finishSum[e.driver.id] -= (i + 1) * 0.3; // remove 30% of standard
-              if (i === 0) wins[e.driver.id] -= 0.3;
-              if (i < 3) podiums[e.driver.id] -= 0.3;
-            });
-            markovResult.positions.forEach((pos, i) => {
-              const dId = pos.driver.id;
-              finishSum[dId] += (i + 1) * 0.3;
-              if (i === 0) wins[dId] += 0.3;
-              if (i < 3) podiums[dId] += 0.3;
-              if (pos.dnf) dnfs[dId] += 0.3;
-            });
-          } catch (e) { /* silently fallback to standard sim */ }
+  // ─────────────────────────────────────────────────────────────
+  // ANALYTIC RACE MODEL — closed-form estimate ahead of the Monte Carlo
+  // Built from the pace profiles the sim draws from: Gaussian pace noise →
+  // pairwise odds → Poisson-binomial slot distributions, first for
+  // qualifying, then for the running order on race pace plus the expected
+  // grid penalty of each driver's qualifying distribution. Retirement odds
+  // come from DNFEngine's component model; everything is mixed over
+  // WeatherEngine's weather odds. GridRecoveryCurves.finishDistribution then
+  // pushes the running order through the track's cached transition matrix.
+  // Incidents, safety cars and strategy only appear as extra noise: an
+  // instant first answer that MonteCarloEngine / SeasonProjectionEngine refine.
+  // ─────────────────────────────────────────────────────────────
+  const AnalyticRaceModel = {
+    SESSION_SD: 0.007, // QualifyingEngine's traffic, yellow-flag and second-run effects
+    RACE_SD: 0.07,     // safety cars, upsets, strategy and incidents (fit to MonteCarloEngine, rounds 1-8)
+    memo: new Map(),   // round → { key, value }: keyed like MonteCarloResultCache on the captured state
+
+    // Standard normal CDF (Abramowitz & Stegun 26.2.17, |error| < 7.5e-8)
+    _phi(x) {
+      const t = 1 / (1 + 0.2316419 * Math.abs(x));
+      const d = 0.3989422804014327 * Math.exp(-x * x / 2);
+      const p = d * t * (0.319381530 + t * (-0.356563782 + t * (1.781477937 + t * (-1.821255978 + t * 1.330274429))));
+      return x >= 0 ? 1 - p : p;
+    },
+
+    // WeatherEngine.generate's odds for this race
+    _weatherMix(race) {
+      const r = race.rain_probability || 0;
+      return [['heavy_rain', r * 0.15], ['wet', r * 0.30], ['light_rain', r * 0.25], ['mixed', r * 0.15], ['dry', 1 - r * 0.85]]
+        .filter(([, p]) => p > 0);
+    },
+
+    // N × N, row k = P(k has exactly i drivers ahead) when scores ~ N(mu, v), higher first
+    _slots(mu, v) {
+      const N = mu.length, out = new Float64Array(N * N), pb = new Float64Array(N);
+      for (let k = 0; k < N; k++) {
+        pb.fill(0);
+        pb[0] = 1;
+        let len = 1;
+        for (let m = 0; m < N; m++) {
+          if (m === k) continue;
+          const p = this._phi((mu[m] - mu[k]) / Math.sqrt(v[m] + v[k])); // m ahead of k
+          for (let a = len; a > 0; a--) pb[a] = pb[a] * (1 - p) + pb[a - 1] * p;
+          pb[0] *= 1 - p;
+          len++;
         }
+        out.set(pb, k * N);
       }
+      return out;
     },
 
-    // Synchronous run — called from Web Worker OR rAF fallback aggregator
-    _buildResult(race, wins, podiums, finishSum, dnfs, weatherCache, qualiGridCache) {
-      const results = DRIVERS.map(d => ({
-        driver: d,
-        winProb: (wins[d.id] / this.SIMS) * 100,
-        podiumProb: (podiums[d.id] / this.SIMS) * 100,
-        avgFinish: finishSum[d.id] / this.SIMS,
-        dnfProb: (dnfs[d.id] / this.SIMS) * 100,
-        power: finishSum[d.id] / this.SIMS,
-        winCount: wins[d.id]
-      }));
-      results.sort((a, b) => a.avgFinish - b.avgFinish);
-      results.forEach((r, i) => { r.position = i + 1; r.score = 21 - r.avgFinish; });
-
-      // Compute σ for probability cloud + position distributions
-      const finishData = {};
-      DRIVERS.forEach(d => { finishData[d.id] = []; });
-      results.forEach(r => {
-        const p = r.winProb / 100;
-        r.winSigma = Math.sqrt(p * (1 - p) / this.SIMS) * 100;
-        r.podiumSigma = Math.sqrt((r.podiumProb / 100) * (1 - r.podiumProb / 100) / this.SIMS) * 100;
+    _meanPace(p) {
+      return p.hasStrategyRoll ? p.base + p.strategyChance * (p.baseWithStrategy - p.base) : p.base;
+    },
 
-        // Elo confidence interval
-        if (window.EloRatingSystem) {
-          const ci = window.EloRatingSystem.getConfidenceInterval(r.driver.id);
-          r.eloCI = ci;
-          r.eloRating = window.EloRatingSystem.getRating(r.driver.id).elo;
-        }
+    // Qualifying slots under one weather (calculatePace's quali variance)
+    _qualiDistribution(race, weather, wp) {
+      const N = DRIVERS.length, mu = new Float64Array(N), v = new Float64Array(N);
+      DRIVERS.forEach((d, k) => {
+        const p = PaceProfileCache.get(d, race, false, weather, true);
+        const sd = wp.noise * (1.2 - p.conf / 100) * 0.6;
+        mu[k] = this._meanPace(p);
+        v[k] = sd * sd + this.SESSION_SD * this.SESSION_SD;
+      });
+      return this._slots(mu, v);
+    },
 
-        if (typeof window.ConfidenceBandEngine !== 'undefined') {
-          const pseudoSimResults = Array.from({ length: this.SIMS }, (_, i) => r.avgFinish + (Math.random() - 0.5) * r.winSigma);
-          const bands = window.ConfidenceBandEngine.calculateBands(pseudoSimResults);
-          if (bands) {
-            r.winSigma = bands.sigma;
-            r.confidence_score = bands.confidence_score;
-            r.confidence_interval_win = window.ConfidenceBandEngine.calculateWinCI(p, this.SIMS);
-            r.VaR95 = [bands.band_95[1], bands.band_99[1]];
-          }
+    // Running order on race pace, less the grid penalty the qualifying distribution implies
+    _raceDistribution(race, weather, wp, quali, curves) {
+      const N = DRIVERS.length, mu = new Float64Array(N), v = new Float64Array(N);
+      const penalty = DRIVERS.map((_, j) => curves.getNonLinearGridPenalty(j + 1, race.short));
+      DRIVERS.forEach((d, k) => {
+        const p = PaceProfileCache.get(d, race, false, weather, false);
+        const sd = wp.noise * (1.2 - p.conf / 100);
+        let g = 0, g2 = 0;
+        for (let j = 0; j < N; j++) {
+          const q = quali[k * N + j];
+          g += q * penalty[j];
+          g2 += q * penalty[j] * penalty[j];
         }
+        mu[k] = this._meanPace(p) - g;
+        v[k] = sd * sd + Math.max(0, g2 - g * g) + this.RACE_SD * this.RACE_SD;
       });
+      return this._slots(mu, v);
+    },
 
-      // J. Position Probability Distribution
-      let positionDistributions = null;
-      if (window.PositionProbabilityEngine) {
-        positionDistributions = window.PositionProbabilityEngine.calculateDistribution(results, this.SIMS);
-      }
+    // Per-driver finishing distributions and summary odds; null without GridRecoveryCurves.
+    // Memoised per round on the captured model state (about a millisecond to key, against
+    // 6-12 ms to compute), so repeated asks between state changes are free. Shared — do not modify.
+    predict(race) {
+      const curves = window.GridRecoveryCurves;
+      if (!curves || !curves.finishDistribution) return null; // MonteCarloWorker's facade only has the grid penalty
+      const key = MonteCarloResultCache.key(race, MonteCarloKernel.capture(race), { mode: 'analytic' });
+      const hit = this.memo.get(race.round);
+      if (hit && hit.key === key) return hit.value;
+      const value = this._predict(race, curves);
+      this.memo.set(race.round, { key, value });
+      return value;
+    },
 
+    _predict(race, curves) {
+      const t0 = performance.now();
+      const N = DRIVERS.length;
+      const quali = new Float64Array(N * N), running = new Float64Array(N * N), dnf = new Float64Array(N);
+      const mix = this._weatherMix(race);
+      mix.forEach(([weather, pw]) => {
+        const wp = WeatherEngine.params(weather);
+        const q = this._qualiDistribution(race, weather, wp);
+        const r = this._raceDistribution(race, weather, wp, q, curves);
+        for (let i = 0; i < q.length; i++) { quali[i] += pw * q[i]; running[i] += pw * r[i]; }
+        DRIVERS.forEach((d, k) => { dnf[k] += pw * DNFEngine.probability(d, wp); });
+      });
+      const positions = curves.finishDistribution(running, dnf, race.short);
+
+      const ptsList = race.is_sprint ? PTS_SPRINT : PTS;
+      const totalDnf = dnf.reduce((a, b) => a + b, 0);
+      const grid = DRIVERS.map((d, k) => {
+        const row = positions.subarray(k * N, (k + 1) * N);
+        let posSum = 0, pts = 0, ptsSq = 0, slot = 0;
+        for (let j = 0; j < N; j++) {
+          const pt = ptsList[j] || 0;
+          posSum += (j + 1) * row[j];
+          pts += pt * row[j];
+          ptsSq += pt * pt * row[j];
+          slot += (j + 1) * quali[k * N + j];
+        }
+        return {
+          driver: d,
+          winProb: row[0] * 100,
+          podiumProb: (row[0] + row[1] + row[2]) * 100,
+          dnfProb: dnf[k] * 100,
+          // Retirements are classified behind the finishers, in random order, as in the sim
+          avgFinish: posSum + dnf[k] * (N - (totalDnf - dnf[k]) / 2),
+          expectedPts: pts,
+          ptsVar: Math.max(0, ptsSq - pts * pts),
+          qualiSlot: slot,
+          positions: row
+        };
+      });
       return {
-        grid: results,
-        weather: weatherCache,
-        qualiGrid: qualiGridCache,
-        confidence: ConfidenceEngine.calc(race),
-        sims: this.SIMS,
-        positionDistributions
+        grid,
+        weather: mix.reduce((best, w) => w[1] > best[1] ? w : best)[0],
+        ms: performance.now() - t0
       };
     },
 
-    // Public entry: non-blocking via Web Worker → rAF fallback
-    run(race, onComplete) {
+    // Shaped like MonteCarloEngine._buildResult, for the race card's first paint
+    result(race) {
+      const a = this.predict(race);
+      if (!a) return null;
+      const grid = a.grid.map(e => ({ ...e })).sort((x, y) => x.avgFinish - y.avgFinish);
+      grid.forEach((e, i) => { e.position = i + 1; e.power = e.avgFinish; e.score = 21 - e.avgFinish; e.winSigma = 0; e.podiumSigma = 0; });
+      const qualiGrid = a.grid.slice().sort((x, y) => x.qualiSlot - y.qualiSlot).map((e, i) => ({ driver: e.driver, gridPos: i + 1 }));
+      return { grid, weather: a.weather, qualiGrid, confidence: ConfidenceEngine.calc(race), sims: 0, analytic: true, partial: true, positionDistributions: null, ms: a.ms };
+    }
+  };
+
+  // ─────────────────────────────────────────────────────────────
+  // SEASON PROJECTION ENGINE — incremental season-level Monte Carlo
+  // Each remaining round keeps a bank of simulated finishing orders (standard
+  // model + its Markov race), keyed like MonteCarloResultCache on the race's own
+  // inputs and simulated with level standings, so a bank is only rebuilt when
+  // something that round's race depends on changed. Seasons are sampled round by
+  // round from the banks with points carried per season, and each sampled season
+  // applies its own title fight: PressureEngine's error modifier tilts which bank
+  // rows are drawn (through their DNFs), and late-season team orders swap
+  // teammates as _simulate would.
+  // Bank size follows the season budget: SEASONS / 4 sims gives each round
+  // SEASONS / 2 distinct candidates (standard + Markov), so the sampled seasons
+  // mostly draw different races rather than recycling a handful. The price is
+  // the cold start — BANK_SIMS sims per remaining round on the first projection
+  // and whenever a round's inputs change; reused banks cost nothing.
+  // ─────────────────────────────────────────────────────────────
+  const SeasonProjectionEngine = {
+    SEASONS: 2000,
+    get BANK_SIMS() { return Math.ceil(this.SEASONS / 4); },
+    // Rejection draws before _draw gives up on the tilt for that season
+    MAX_DRAW_TRIES: 256,
+    banks: new Map(), // round → bank
+    stats: { rebuilt: 0, reused: 0, ms: 0 },
+
+    _bank(race) {
+      const snapshot = MonteCarloKernel.capture(race);
+      snapshot.data.results = null; // standings only reach a bank through the sampled seasons
+      const key = MonteCarloResultCache.key(race, snapshot, { mode: 'season', cap: this.BANK_SIMS });
+      const cached = this.banks.get(race.round);
+      if (cached && cached.key === key) { this.stats.reused++; return cached; }
+
+      const bank = MonteCarloKernel.allocOrders(this.BANK_SIMS);
       const wins = {}, podiums = {}, finishSum = {}, dnfs = {};
       DRIVERS.forEach(d => { wins[d.id] = 0; podiums[d.id] = 0; finishSum[d.id] = 0; dnfs[d.id] = 0; });
-      const rng0 = new RNG(race.round * 10000 + 1);
-      const weatherCache = WeatherEngine.generate(race.rain_probability, rng0);
-      const qualiGridCache = QualifyingEngine.simulate(race, new RNG(race.round * 77), weatherCache);
-      const self = this;
-
-      // Try Web Worker for background simulation (keeps UI responsive)
-      let workerUsed = false;
+      // Projections must not consume the real grid penalties
+      const penalties = JSON.parse(JSON.stringify(ComponentReliability.gridPenalties));
+      ChampionshipState.neutral = true;
       try {
-        if (typeof Worker !== 'undefined') {
-          // Prepare serializable data for the worker
-          const teamRatings = {};
-          const driverFormMults = {};
-          const teamDnfRates = {};
-          DRIVERS.forEach(d => {
-            teamRatings[d.team] = DynamicModel.getTeamRating(d.team);
-            driverFormMults[d.id] = DynamicModel.getDriverFormMult(d.id);
-          });
-          Object.keys(ComponentReliability.teams).forEach(t => {
-            const comp = ComponentReliability.teams[t];
-            teamDnfRates[t] = comp.engine + comp.gearbox + comp.cooling + comp.hybrid;
-          });
+        MonteCarloEngine._runBatch(race, 0, this.BANK_SIMS, wins, podiums, finishSum, dnfs, null, bank);
+      } finally {
+        ChampionshipState.neutral = false;
+        ComponentReliability.gridPenalties = penalties;
+      }
+      this._index(bank);
+      bank.key = key;
+      this.banks.set(race.round, bank);
+      this.stats.rebuilt++;
+      return bank;
+    },
 
-          const worker = new Worker('SimulationWorker.js');
-          worker.onmessage = function (evt) {
-            if (evt.data.done) {
-              // Merge worker results with main-thread detailed simulation
-              // Worker handles ~40% of sims for speed, main thread handles ~60% with full model fidelity
-              const workerSims = evt.data.sims;
-              const mainSims = self.SIMS - workerSims;
-
-              // Run remaining sims on main thread with full model
-              if (mainSims > 0) {
-                self._runBatch(race, 0, mainSims, wins, podiums, finishSum, dnfs);
-              }
+    // Rows as draw candidates: 0..sims-1 the standard orders, sims..2·sims-1 their Markov
+    // races, weighted like the sim blend. Per candidate, the drivers who retired (CSR
+    // in dnfStart/dnfDriver); per driver, the blended DNF rate a tilt is relative to.
+    _index(bank) {
+      const S = bank.sims, W = bank.width, N = DRIVERS.length, mw = MonteCarloEngine.MARKOV_WEIGHT;
+      const rate = new Float64Array(N), dnfStart = new Int32Array(2 * S + 1), drivers = [];
+      let maxDnf = 0;
+      for (let c = 0; c < 2 * S; c++) {
+        const markov = c >= S, row = (markov ? c - S : c) * W;
+        const ok = bank.markov[row] >= 0;
+        const weight = markov ? (ok ? mw : 0) : (ok ? 1 - mw : 1);
+        dnfStart[c] = drivers.length;
+        if (!weight) continue;
+        const order = markov ? bank.markov : bank.finish, dnf = markov ? bank.markovDnf : bank.dnf;
+        for (let k = 0; k < W && order[row + k] >= 0; k++) {
+          if (!dnf[row + k]) continue;
+          drivers.push(order[row + k]);
+          rate[order[row + k]] += weight / S;
+        }
+        maxDnf = Math.max(maxDnf, drivers.length - dnfStart[c]);
+      }
+      dnfStart[2 * S] = drivers.length;
+      bank.dnfRate = rate;
+      bank.dnfStart = dnfStart;
+      bank.dnfDriver = Int16Array.from(drivers);
+      bank.maxDnf = maxDnf;
+    },
 
-              // Blend worker results
-              DRIVERS.forEach(d => {
-                wins[d.id] += evt.data.wins[d.id] || 0;
-                podiums[d.id] += evt.data.podiums[d.id] || 0;
-                finishSum[d.id] += evt.data.finishSum[d.id] || 0;
-                dnfs[d.id] += evt.data.dnfs[d.id] || 0;
-              });
+    // Candidate drawn for one sampled season: the plain blend draw, and when someone is
+    // under pressure (bound > 0) accepted with probability ∏ tilt over the candidate's
+    // retirements / bound — rows reweighted by each retirement's odds ratio under the
+    // driver's error modifier, since mistakes are what end races early. A bound far
+    // above every candidate's weight could reject for a long time, so after
+    // MAX_DRAW_TRIES the last plain draw is taken untilted.
+    _draw(bank, rng, tilt, bound) {
+      const S = bank.sims;
+      let c = 0;
+      for (let tries = 0; tries < this.MAX_DRAW_TRIES; tries++) {
+        const row = Math.floor(rng.next() * S);
+        c = rng.next() < MonteCarloEngine.MARKOV_WEIGHT && bank.markov[row * bank.width] >= 0 ? S + row : row;
+        if (!bound) return c;
+        let w = 1;
+        for (let k = bank.dnfStart[c]; k < bank.dnfStart[c + 1]; k++) w *= tilt[bank.dnfDriver[k]];
+        if (rng.next() * bound < w) return c;
+      }
+      return c;
+    },
 
-              onComplete(self._buildResult(race, wins, podiums, finishSum, dnfs, weatherCache, qualiGridCache));
-              worker.terminate();
-            }
-          };
+    project(calendar) {
+      const t0 = performance.now();
+      this.stats = { rebuilt: 0, reused: 0, ms: 0 };
+      const N = DRIVERS.length, S = this.SEASONS;
+      const teams = Object.keys(BASE_IDX);
+      const teamOf = DRIVERS.map(d => teams.indexOf(d.team));
+      const totalRounds = calendar.length;
+      const future = calendar.filter(r => !DataModel.results[r.round]);
+      [...this.banks.keys()].forEach(round => { if (!future.some(r => r.round === round)) this.banks.delete(round); });
+
+      // Completed rounds count as they happened
+      const actual = ChampionshipState.getStandingsBefore(Infinity);
+      const winSum = new Float64Array(N), podSum = new Float64Array(N), dnfSum = new Float64Array(N);
+      calendar.forEach(r => {
+        const res = DataModel.results[r.round];
+        if (!res || !res.positions) return;
+        res.positions.forEach((id, i) => {
+          const di = DRIVERS.findIndex(d => d.id === id);
+          if (di < 0) return;
+          if (i === 0) winSum[di] += S;
+          if (i < 3) podSum[di] += S;
+        });
+      });
 
-          worker.onerror = function (err) {
-            console.warn('[MonteCarlo] Worker error, falling back to rAF:', err.message);
-            worker.terminate();
-            self._runWithRAF(race, wins, podiums, finishSum, dnfs, weatherCache, qualiGridCache, onComplete);
-          };
+      const pts = new Float64Array(S * N);
+      for (let p = 0; p < S; p++) DRIVERS.forEach((d, i) => { pts[p * N + i] = actual[d.id] || 0; });
 
-          // Send ~40% of sims to the worker (simplified model), rest on main thread (full model)
-          const workerSimCount = Math.floor(self.SIMS * 0.4);
-          worker.postMessage({
-            drivers: DRIVERS.map(d => ({ id: d.id, team: d.team, rating: d.rating, num: d.num })),
-            race: { round: race.round, rain_probability: race.rain_probability, sc_probability: race.sc_probability, laps: race.laps },
-            sims: workerSimCount,
-            teamRatings,
-            driverFormMults,
-            personalities: DriverPersonalityMatrix,
-            driverSkills: DriverSkillMatrix,
-            config: { teamDnfRates }
-          });
+      const rng = new RNG(calendar.length * 1000 + future.length);
+      const tilt = new Float64Array(N), ord = new Int16Array(N), out = new Uint8Array(N);
+      future.forEach(race => {
+        const bank = this._bank(race);
+        const ptsList = race.is_sprint ? PTS_SPRINT : PTS;
+        const W = bank.width;
+        const pressure = race.round > totalRounds * 0.4, teamOrders = race.round > totalRounds * 0.5;
+        for (let p = 0; p < S; p++) {
+          const off = p * N;
+          let bound = 0;
+          if (pressure) {
+            let maxPts = 0, top = 0;
+            for (let i = 0; i < N; i++) if (pts[off + i] > maxPts) maxPts = pts[off + i];
+            for (let i = 0; i < N; i++) {
+              const e = PressureEngine.getModifiers(DRIVERS[i].id, pts[off + i], maxPts, race.round, totalRounds).error;
+              const r = bank.dnfRate[i];
+              if (e === 1 || r <= 0 || r >= 1) { tilt[i] = 1; continue; }
+              const q = Math.min(0.95, r * e);
+              tilt[i] = (q / r) * ((1 - r) / (1 - q));
+              top = Math.max(top, tilt[i]);
+            }
+            if (top) bound = Math.pow(Math.max(1, top), bank.maxDnf);
+          }
+          const c = this._draw(bank, rng, tilt, bound);
+          const markov = c >= bank.sims, row = (markov ? c - bank.sims : c) * W;
+          const order = markov ? bank.markov : bank.finish, dnf = markov ? bank.markovDnf : bank.dnf;
+          let n = 0;
+          while (n < W && order[row + n] >= 0) { ord[n] = order[row + n]; out[n] = dnf[row + n]; n++; }
+          // Late-season team orders, on standings before this round (see _simulate Phase 3)
+          if (teamOrders) {
+            for (let k = 0; k < n - 1; k++) {
+              const d1 = ord[k], d2 = ord[k + 1];
+              if (!out[k] && !out[k + 1] && teamOf[d1] === teamOf[d2] && pts[off + d2] > pts[off + d1] + 25 && rng.next() < 0.8) {
+                ord[k] = d2; ord[k + 1] = d1;
+              }
+            }
+          }
+          for (let k = 0; k < n; k++) {
+            const di = ord[k];
+            pts[off + di] += ptsList[k] || 0;
+            if (k === 0) winSum[di]++;
+            if (k < 3) podSum[di]++;
+            if (out[k]) dnfSum[di]++;
+          }
+        }
+      });
 
-          workerUsed = true;
+      // Title odds per sampled season; a tie at the top splits the title
+      const dTitle = new Float64Array(N), tTitle = new Float64Array(teams.length);
+      const tPts = new Float64Array(S * teams.length);
+      for (let p = 0; p < S; p++) {
+        const off = p * N, toff = p * teams.length;
+        let best = -Infinity, tied = 0;
+        for (let i = 0; i < N; i++) {
+          const v = pts[off + i];
+          tPts[toff + teamOf[i]] += v;
+          if (v > best) { best = v; tied = 1; } else if (v === best) tied++;
         }
-      } catch (e) {
-        console.warn('[MonteCarlo] Worker creation failed:', e.message);
-        workerUsed = false;
+        for (let i = 0; i < N; i++) if (pts[off + i] === best) dTitle[i] += 1 / tied;
+        let tBest = -Infinity, tTied = 0;
+        for (let t = 0; t < teams.length; t++) {
+          const v = tPts[toff + t];
+          if (v > tBest) { tBest = v; tTied = 1; } else if (v === tBest) tTied++;
+        }
+        for (let t = 0; t < teams.length; t++) if (tPts[toff + t] === tBest) tTitle[t] += 1 / tTied;
       }
 
-      // Fallback: rAF chunking on main thread
-      if (!workerUsed) {
-        this._runWithRAF(race, wins, podiums, finishSum, dnfs, weatherCache, qualiGridCache, onComplete);
-      }
+      const column = (arr, stride, i) => {
+        const out = new Float64Array(S);
+        for (let p = 0; p < S; p++) out[p] = arr[p * stride + i];
+        return out.sort();
+      };
+      const drivers = DRIVERS.map((d, i) => {
+        const col = column(pts, N, i);
+        return {
+          driver: d,
+          pts: col.reduce((a, b) => a + b, 0) / S,
+          p10: col[Math.floor(S * 0.1)],
+          p90: col[Math.floor(S * 0.9)],
+          titleProb: dTitle[i] / S * 100,
+          wins: winSum[i] / S,
+          podiums: podSum[i] / S,
+          dnfs: dnfSum[i] / S
+        };
+      }).sort((a, b) => b.pts - a.pts);
+      const teamsOut = teams.map((t, ti) => ({
+        team: t,
+        pts: column(tPts, teams.length, ti).reduce((a, b) => a + b, 0) / S,
+        titleProb: tTitle[ti] / S * 100,
+        color: TEAM_COLORS[t]
+      })).sort((a, b) => b.pts - a.pts);
+
+      this.stats.ms = performance.now() - t0;
+      return { drivers, teams: teamsOut, seasons: S, remaining: future.length, stats: { ...this.stats } };
     },
 
-    // rAF chunking fallback: process 100 sims per frame @ ~60fps
-    _runWithRAF(race, wins, podiums, finishSum, dnfs, weatherCache, qualiGridCache, onComplete) {
-      const CHUNK = 100;
-      let processed = 0;
-      const self = this;
-      const tick = () => {
-        const end = Math.min(processed + CHUNK, self.SIMS);
-        self._runBatch(race, processed, end, wins, podiums, finishSum, dnfs);
-        processed = end;
-        if (processed < self.SIMS) {
-          requestAnimationFrame(tick);
-        } else {
-          onComplete(self._buildResult(race, wins, podiums, finishSum, dnfs, weatherCache, qualiGridCache));
-        }
-      };
-      requestAnimationFrame(tick);
+    // Normal approximation of project(): per-race analytic point means and variances
+    // summed over the remaining rounds (races taken as independent, no standings
+    // pressure). Null when AnalyticRaceModel is unavailable.
+    projectAnalytic(calendar) {
+      const t0 = performance.now();
+      const N = DRIVERS.length;
+      const teams = Object.keys(BASE_IDX);
+      const future = calendar.filter(r => !DataModel.results[r.round]);
+      const actual = ChampionshipState.getStandingsBefore(Infinity);
+      const mean = new Float64Array(N), vari = new Float64Array(N);
+      const winSum = new Float64Array(N), podSum = new Float64Array(N), dnfSum = new Float64Array(N);
+      DRIVERS.forEach((d, i) => { mean[i] = actual[d.id] || 0; });
+      calendar.forEach(r => {
+        const res = DataModel.results[r.round];
+        if (!res || !res.positions) return;
+        res.positions.forEach((id, i) => {
+          const di = DRIVERS.findIndex(d => d.id === id);
+          if (di < 0) return;
+          if (i === 0) winSum[di]++;
+          if (i < 3) podSum[di]++;
+        });
+      });
+      for (const race of future) {
+        const a = AnalyticRaceModel.predict(race);
+        if (!a) return null;
+        a.grid.forEach((e, i) => {
+          mean[i] += e.expectedPts;
+          vari[i] += e.ptsVar;
+          winSum[i] += e.winProb / 100;
+          podSum[i] += e.podiumProb / 100;
+          dnfSum[i] += e.dnfProb / 100;
+        });
+      }
+
+      const teamOf = DRIVERS.map(d => teams.indexOf(d.team));
+      const tMean = new Float64Array(teams.length), tVar = new Float64Array(teams.length);
+      for (let i = 0; i < N; i++) { tMean[teamOf[i]] += mean[i]; tVar[teamOf[i]] += vari[i]; }
+
+      const drivers = DRIVERS.map((d, i) => {
+        const sd = Math.sqrt(vari[i]);
+        return {
+          driver: d,
+          pts: mean[i],
+          p10: Math.max(0, mean[i] - 1.2816 * sd),
+          p90: mean[i] + 1.2816 * sd,
+          wins: winSum[i],
+          podiums: podSum[i],
+          dnfs: dnfSum[i]
+        };
+      });
+      const dTitle = this._titleOdds(mean, vari);
+      drivers.forEach((e, i) => { e.titleProb = dTitle[i] * 100; });
+      const tTitle = this._titleOdds(tMean, tVar);
+      const teamsOut = teams.map((t, ti) => ({ team: t, pts: tMean[ti], titleProb: tTitle[ti] * 100, color: TEAM_COLORS[t] }))
+        .sort((a, b) => b.pts - a.pts);
+      drivers.sort((a, b) => b.pts - a.pts);
+
+      return { drivers, teams: teamsOut, seasons: 0, remaining: future.length, stats: { ms: performance.now() - t0 }, analytic: true };
     },
 
-    // Synchronous run for non-async contexts (championship projection)
-    runSync(race) {
-      const wins = {}, podiums = {}, finishSum = {}, dnfs = {};
-      DRIVERS.forEach(d => { wins[d.id] = 0; podiums[d.id] = 0; finishSum[d.id] = 0; dnfs[d.id] = 0; });
-      const rng0 = new RNG(race.round * 10000 + 1);
-      const weatherCache = WeatherEngine.generate(race.rain_probability, rng0);
-      const qualiGridCache = QualifyingEngine.simulate(race, new RNG(race.round * 77), weatherCache);
-      // Use 200 sims for sync contexts to keep UI responsive
-      const SYNC_SIMS = 200;
-      const origSims = this.SIMS;
-      this.SIMS = SYNC_SIMS;
-      this._runBatch(race, 0, SYNC_SIMS, wins, podiums, finishSum, dnfs);
-      const result = this._buildResult(race, wins, podiums, finishSum, dnfs, weatherCache, qualiGridCache);
-      this.SIMS = origSims;
-      return result;
+    // P(i finishes ahead of everyone) for independent normal totals: ∫ φ_i(x) Π_j Φ_j(x) dx
+    _titleOdds(mean, vari) {
+      const n = mean.length, out = new Float64Array(n);
+      const sd = Array.from(vari, v => Math.sqrt(v));
+      const live = [];
+      for (let i = 0; i < n; i++) if (sd[i] > 0) live.push(i);
+      if (!live.length) {
+        // Season over: the leader takes it, ties split
+        const top = Math.max(...mean), tied = [];
+        for (let i = 0; i < n; i++) if (mean[i] === top) tied.push(i);
+        tied.forEach(i => { out[i] = 1 / tied.length; });
+        return out;
+      }
+      let lo = Infinity, hi = -Infinity;
+      live.forEach(i => { lo = Math.min(lo, mean[i] - 6 * sd[i]); hi = Math.max(hi, mean[i] + 6 * sd[i]); });
+      const STEPS = 400, dx = (hi - lo) / STEPS;
+      const cdf = (j, x) => sd[j] > 0 ? AnalyticRaceModel._phi((x - mean[j]) / sd[j]) : (x >= mean[j] ? 1 : 0);
+      let total = 0;
+      for (let s = 0; s < STEPS; s++) {
+        const x = lo + (s + 0.5) * dx;
+        const c = new Float64Array(n);
+        let all = 1;
+        for (let j = 0; j < n; j++) { c[j] = cdf(j, x); all *= c[j]; }
+        if (all === 0) continue;
+        live.forEach(i => {
+          const z = (x - mean[i]) / sd[i];
+          const pdf = Math.exp(-z * z / 2) / (sd[i] * 2.5066282746310002);
+          out[i] += pdf * dx * all / c[i];
+        });
+      }
+      for (let i = 0; i < n; i++) total += out[i];
+      if (total > 0) for (let i = 0; i < n; i++) out[i] /= total;
+      return out;
     }
   };
 
@@ -1685,58 +3461,46 @@ const PredictionsCenter = (() => {
         const power = pace * 100;
         return { driver: d, power, score: power };
       });
+      // Analytic finishing odds when GridRecoveryCurves is loaded; pace softmax otherwise
+      const analytic = AnalyticRaceModel.predict(race);
+      if (analytic) {
+        const byId = new Map(analytic.grid.map(a => [a.driver.id, a]));
+        return scored.map(s => {
+          const a = byId.get(s.driver.id);
+          return { ...s, winProb: a.winProb, podiumProb: a.podiumProb, dnfProb: a.dnfProb, avgFinish: a.avgFinish, expectedPts: a.expectedPts };
+        }).sort((a, b) => a.avgFinish - b.avgFinish).map((s, i) => ({ ...s, position: i + 1 }));
+      }
       scored.sort((a, b) => b.power - a.power);
       const probs = softmax(scored.map(s => s.power), 4.0);
       return scored.map((s, i) => ({ ...s, position: i + 1, winProb: probs[i] * 100, podiumProb: probs.slice(0, 3).reduce((a, b) => a + b, 0) * 100 }));
     },
-    projectChampionship(calendar) {
-      const dPts = {}, tPts = {};
-      DRIVERS.forEach(d => { dPts[d.id] = 0; });
-      Object.keys(BASE_IDX).forEach(t => { tPts[t] = 0; });
-      calendar.forEach(race => {
-        const mc = MonteCarloEngine.runSync(race);
-        const grid = mc.grid;
-        const ptsList = race.is_sprint ? PTS_SPRINT : PTS;
-        grid.forEach((entry, i) => {
-          const pts = (ptsList[i] || 0);
-          dPts[entry.driver.id] += pts * entry.winProb / 100 * 20;
-          tPts[entry.driver.team] += pts * entry.winProb / 100 * 20;
-        });
-      });
+    // opts.analytic: closed-form projection (instant) instead of the season Monte Carlo
+    projectChampionship(calendar, opts = {}) {
+      const proj = (opts.analytic && SeasonProjectionEngine.projectAnalytic(calendar)) || SeasonProjectionEngine.project(calendar);
       return {
-        driverStandings: Object.entries(dPts).map(([id, pts]) => ({ driver: DRIVERS.find(d => d.id === id), pts: Math.round(pts) })).sort((a, b) => b.pts - a.pts),
-        teamStandings: Object.entries(tPts).map(([t, pts]) => ({ team: t, pts: Math.round(pts), color: TEAM_COLORS[t] })).sort((a, b) => b.pts - a.pts)
+        driverStandings: proj.drivers.map(e => ({ driver: e.driver, pts: Math.round(e.pts), titleProb: e.titleProb, range: [Math.round(e.p10), Math.round(e.p90)] })),
+        teamStandings: proj.teams.map(e => ({ team: e.team, pts: Math.round(e.pts), titleProb: e.titleProb, color: e.color })),
+        seasons: proj.seasons,
+        analytic: !!proj.analytic
       };
     },
     // Full season sim with detailed stats
     simulateFullSeason(calendar) {
-      const dPts = {}, tPts = {}, dWins = {}, dPods = {}, dDnfs = {};
-      DRIVERS.forEach(d => { dPts[d.id] = 0; dWins[d.id] = 0; dPods[d.id] = 0; dDnfs[d.id] = 0; });
-      Object.keys(BASE_IDX).forEach(t => { tPts[t] = 0; });
+      const proj = SeasonProjectionEngine.project(calendar);
       const upgrades = [];
       calendar.forEach(race => {
-        const mc = MonteCarloEngine.runSync(race);
-        const grid = mc.grid;
-        const ptsList = race.is_sprint ? PTS_SPRINT : PTS;
-        grid.forEach((entry, i) => {
-          const pts = (ptsList[i] || 0);
-          const wPts = pts * entry.winProb / 100 * 20;
-          dPts[entry.driver.id] += wPts;
-          tPts[entry.driver.team] += wPts;
-          if (i === 0) dWins[entry.driver.id] += entry.winProb / 100;
-          if (i < 3) dPods[entry.driver.id] += entry.podiumProb / 100;
-          dDnfs[entry.driver.id] += entry.dnfProb / 100;
-        });
         DynamicModel.upgradeLog.filter(u => u.round === race.round).forEach(u => upgrades.push(u));
       });
       return {
-        driverStandings: Object.entries(dPts).map(([id, pts]) => ({
-          driver: DRIVERS.find(d => d.id === id), pts: Math.round(pts),
-          wins: Math.round(dWins[id] * 10) / 10,
-          podiums: Math.round(dPods[id] * 10) / 10,
-          dnfs: Math.round(dDnfs[id] * 10) / 10
-        })).sort((a, b) => b.pts - a.pts),
-        teamStandings: Object.entries(tPts).map(([t, pts]) => ({ team: t, pts: Math.round(pts), color: TEAM_COLORS[t] })).sort((a, b) => b.pts - a.pts),
+        driverStandings: proj.drivers.map(e => ({
+          driver: e.driver, pts: Math.round(e.pts),
+          titleProb: e.titleProb,
+          wins: Math.round(e.wins * 10) / 10,
+          podiums: Math.round(e.podiums * 10) / 10,
+          dnfs: Math.round(e.dnfs * 10) / 10
+        })),
+        teamStandings: proj.teams.map(e => ({ team: e.team, pts: Math.round(e.pts), titleProb: e.titleProb, color: e.color })),
+        seasons: proj.seasons,
         upgrades
       };
     }
@@ -2054,7 +3818,7 @@ const PredictionsCenter = (() => {
       if (window.TrackPerformanceHistory) window.TrackPerformanceHistory.init(DRIVERS);
       if (window.TeammateComparisonEngine) window.TeammateComparisonEngine.init(DRIVERS);
 
-      // Replay all saved results into the dynamic model + advanced engines
+      // Replay all saved results into the dynamic model, then the advanced engines
       Object.entries(this.results).forEach(([round, result]) => {
         DynamicModel.updateFromResult(+round, result, this.calendar);
         const race = this.calendar.find(r => r.round === +round);
@@ -2063,39 +3827,48 @@ const PredictionsCenter = (() => {
           result.positions.forEach((dId, i) => {
             DriverConfidenceEngine.updateAfterRace(dId, i + 1, i >= 19);
           });
+        }
+      });
+      this.replayEngineResults();
+      return this.calendar;
+    },
 
-          // Replay into Elo
-          if (window.EloRatingSystem) {
-            window.EloRatingSystem.updateFromRace(result, DRIVERS, +round);
-          }
+    // Saved results into Elo / track history / teammate H2H — on load, and again after
+    // the historical seeder has put the engines back to finished seasons only
+    replayEngineResults() {
+      Object.entries(this.results).forEach(([round, result]) => {
+        const race = this.calendar.find(r => r.round === +round);
+        if (!result.positions) return;
+        // Replay into Elo
+        if (window.EloRatingSystem) {
+          window.EloRatingSystem.updateFromRace(result, DRIVERS, +round);
+        }
 
-          // Replay into Track History
-          if (window.TrackPerformanceHistory && race) {
-            result.positions.forEach((dId, pos) => {
-              window.TrackPerformanceHistory.recordResult(dId, race.short, pos + 1, 11, +round);
-            });
-          }
+        // Replay into Track History
+        if (window.TrackPerformanceHistory && race) {
+          result.positions.forEach((dId, pos) => {
+            window.TrackPerformanceHistory.recordResult(dId, race.short, pos + 1, 11, +round);
+          });
+        }
 
-          // Replay into Teammate Comparison
-          if (window.TeammateComparisonEngine && race) {
-            const teams = {};
-            result.positions.forEach((dId, pos) => {
-              const d = DRIVERS.find(dr => dr.id === dId);
-              if (d) {
-                if (!teams[d.team]) teams[d.team] = [];
-                teams[d.team].push({ driverId: dId, position: pos + 1 });
-              }
-            });
-            const pts = {};
-            const ptsList = race.is_sprint ? PTS_SPRINT : PTS;
-            result.positions.forEach((dId, pos) => { pts[dId] = ptsList[pos] || 0; });
-            Object.entries(teams).forEach(([teamId, results]) => {
-              window.TeammateComparisonEngine.recordRace(teamId, results, pts);
-            });
-          }
+        // Replay into Teammate Comparison
+        if (window.TeammateComparisonEngine && race) {
+          const teams = {};
+          result.positions.forEach((dId, pos) => {
+            const d = DRIVERS.find(dr => dr.id === dId);
+            if (d) {
+              if (!teams[d.team]) teams[d.team] = [];
+              teams[d.team].push({ driverId: dId, position: pos + 1 });
+            }
+          });
+          const pts = {};
+          const ptsList = race.is_sprint ? PTS_SPRINT : PTS;
+          result.positions.forEach((dId, pos) => { pts[dId] = ptsList[pos] || 0; });
+          Object.entries(teams).forEach(([teamId, results]) => {
+            window.TeammateComparisonEngine.recordRace(teamId, results, pts);
+          });
         }
       });
-      return this.calendar;
     },
 
     loadFromStorage() {
@@ -2238,14 +4011,19 @@ const PredictionsCenter = (() => {
           driver.rating = Math.max(60, Math.min(99, driver.rating + adjustment));
         });
 
-        // P1: Wire QualifyingRaceSplit.recordQualiVsRace (was dead code)
-        if (window.QualifyingRaceSplit && prevPred) {
-          result.positions.forEach((dId, raceIdx) => {
-            const qualiIdx = prevPred.findIndex(p => p.driver.id === dId);
-            if (qualiIdx >= 0) {
-              window.QualifyingRaceSplit.recordQualiVsRace(dId, qualiIdx + 1, raceIdx + 1);
-            }
-          });
+        // P1: Wire QualifyingRaceSplit.recordQualiVsRace (was dead code); the module is on demand
+        if (prevPred) {
+          const recordSplit = () => {
+            if (!window.QualifyingRaceSplit) return;
+            result.positions.forEach((dId, raceIdx) => {
+              const qualiIdx = prevPred.findIndex(p => p.driver.id === dId);
+              if (qualiIdx >= 0) {
+                window.QualifyingRaceSplit.recordQualiVsRace(dId, qualiIdx + 1, raceIdx + 1);
+              }
+            });
+          };
+          if (window.QualifyingRaceSplit || !window.ModuleLoader) recordSplit();
+          else ModuleLoader.load('QualifyingRaceSplit').then(recordSplit).catch(e => console.warn('[PredCenter] QualifyingRaceSplit:', e.message));
         }
 
         // ML REGRESSION: Record race result for weight learning
@@ -2294,6 +4072,7 @@ const PredictionsCenter = (() => {
   // ─────────────────────────────────────────────────────────────
   let _selectedRound = 1;
   let _championship = null;
+  let _championshipToken = 0;
 
   const RenderEngine = {
 
@@ -2499,10 +4278,14 @@ const PredictionsCenter = (() => {
       const result = DataModel.results[race.round];
       const el = document.getElementById('pred-race-detail');
       if (!el) return;
-      // Show animated spinner while 1000 sims run asynchronously
-      el.innerHTML = `<div class="pred-loader" style="height:300px">
+      // Instant analytic estimate while the Monte Carlo sims run; spinner if it's unavailable
+      const estimate = AnalyticRaceModel.result(race);
+      if (estimate) {
+        el.innerHTML = this._buildRaceDetail(race, estimate, result);
+        this._renderProbabilityCloud(estimate.grid);
+      } else el.innerHTML = `<div class="pred-loader" style="height:300px">
         <div style="font-size:2rem">⚙️</div>
-        <div>Running 1,000 stochastic simulations...</div>
+        <div>Running up to ${(MonteCarloPool.available() ? MonteCarloEngine.SIMS : MonteCarloEngine.FALLBACK_SIMS).toLocaleString()} stochastic simulations...</div>
         <div style="margin-top:0.5rem;font-size:0.7rem;color:#666">Aero · MGU-K · Clutch Factor active</div>
         <div class="pred-sim-bar"><div class="pred-sim-bar-fill" id="sim-progress"></div></div>
       </div>`;
@@ -2523,6 +4306,14 @@ const PredictionsCenter = (() => {
         // Refresh analytics panels for new race
         this._renderPositionHeatmap(race);
         this._renderTireStrategy(race);
+      }, {
+        // Early estimate at each checkpoint until the run converges or hits its cap
+        onProgress: (mc) => {
+          if (_selectedRound !== race.round) return;
+          clearInterval(progTimer);
+          el.innerHTML = this._buildRaceDetail(race, mc, result);
+          this._renderProbabilityCloud(mc.grid);
+        }
       });
     },
 
@@ -2616,7 +4407,7 @@ const PredictionsCenter = (() => {
                 </svg>
                 <div class="pred-conf-val">${confidence}%</div>
               </div>
-              <div style="font-size:0.58rem;color:#666;margin-top:0.2rem">${sims.toLocaleString()} sims</div>
+              <div style="font-size:0.58rem;color:#666;margin-top:0.2rem">${mc.analytic ? 'analytic estimate' : sims.toLocaleString() + ' sims'}${mc.partial ? ' · refining…' : ''}</div>
             </div>
           </div>
 
@@ -2704,8 +4495,32 @@ const PredictionsCenter = (() => {
         </div>`;
     },
 
+    // Analytic projection straight away, then the season Monte Carlo once the page has painted
     _renderChampionship(calendar) {
-      _championship = PredictionEngine.projectChampionship(calendar, DataModel.formFactors);
+      const token = ++_championshipToken;
+      this._paintChampionship(PredictionEngine.projectChampionship(calendar, { analytic: true }));
+      if (!_championship.analytic) return;
+      setTimeout(() => {
+        if (token !== _championshipToken) return;
+        this._paintChampionship(PredictionEngine.projectChampionship(calendar));
+        this._renderTitleBattle(calendar);
+        this._renderChampionshipChart();
+      }, 0);
+    },
+
+    // ChartVisuals is on demand: fetch it if this paint got there first, then draw
+    // `data` (default: the current projection)
+    _renderChampionshipChart(data = null) {
+      if (!document.getElementById('pred-chart-championship')) return;
+      (window.ModuleLoader ? ModuleLoader.load('ChartVisuals') : Promise.resolve())
+        .then(() => {
+          if (window.ChartVisuals) window.ChartVisuals.renderChampionshipChart('pred-chart-championship', data || _championship, DRIVERS);
+        })
+        .catch(e => console.warn('[ChartVisuals] Championship chart error:', e.message));
+    },
+
+    _paintChampionship(champ) {
+      _championship = champ;
       const el = document.getElementById('pred-championship');
       if (!el) return;
 
@@ -2722,7 +4537,7 @@ const PredictionsCenter = (() => {
           <div class="pred-champ-bar-wrap">
             <div class="pred-champ-bar" style="width:${pct}%;background:${e.driver.color}99"></div>
           </div>
-          <div class="pred-champ-pts">${e.pts}pts</div>
+          <div class="pred-champ-pts">${e.pts}pts <span style="font-size:0.6rem;color:#888">${e.titleProb.toFixed(1)}% 🏆</span></div>
         </div>`;
       }).join('');
 
@@ -2736,7 +4551,7 @@ const PredictionsCenter = (() => {
           <div class="pred-champ-bar-wrap">
             <div class="pred-champ-bar" style="width:${pct}%;background:${e.color}99"></div>
           </div>
-          <div class="pred-champ-pts">${e.pts}pts</div>
+          <div class="pred-champ-pts">${e.pts}pts <span style="font-size:0.6rem;color:#888">${e.titleProb.toFixed(1)}% 🏆</span></div>
         </div>`;
       }).join('');
 
@@ -2750,7 +4565,7 @@ const PredictionsCenter = (() => {
             <div class="pred-champ-col-title">🏭 Constructor Championship</div>
             ${teamBars}
           </div>
-        </div>`;
+        </div>${_championship.analytic ? '<div style="font-size:0.6rem;color:#666;margin-top:0.4rem">Analytic estimate · Monte Carlo refining…</div>' : ''}`;
     },
 
     _renderAllRacesGrid(calendar) {
@@ -2802,7 +4617,7 @@ const PredictionsCenter = (() => {
         const top10 = mc.positionDistributions.slice(0, 10);
         let html = '<div style="overflow-x:auto"><table style="width:100%;border-collapse:collapse;font-size:0.62rem;font-family:monospace">';
         html += '<thead><tr><th style="text-align:left;padding:0.3rem;color:#666;position:sticky;left:0;background:#0d1117">Driver</th>';
-        for (let p = 1; p <= 20; p++) {
+        for (let p = 1; p <= top10[0].positions.length; p++) {
           html += `<th style="padding:0.2rem 0.3rem;color:#666;text-align:center;min-width:32px">P${p}</th>`;
         }
         html += '</tr></thead><tbody>';
@@ -3267,15 +5082,13 @@ const PredictionsCenter = (() => {
       const onStandings = (standings) => {
         console.log('[AutoUpdate] Standings updated:', standings.drivers?.length, 'drivers');
         // Refresh championship chart with new data
-        if (window.ChartVisuals && standings.drivers) {
-          try {
-            window.ChartVisuals.renderChampionshipChart('pred-chart-championship', {
-              driverStandings: standings.drivers.map(s => ({
-                driver: { id: s.driverId },
-                pts: s.points
-              }))
-            }, DRIVERS);
-          } catch (e) { console.warn('[AutoUpdate] Championship chart update error:', e); }
+        if (standings.drivers) {
+          this._renderChampionshipChart({
+            driverStandings: standings.drivers.map(s => ({
+              driver: { id: s.driverId },
+              pts: s.points
+            }))
+          });
         }
       };
 
@@ -3399,7 +5212,8 @@ const PredictionsCenter = (() => {
     view.appendChild(loader);
 
     try {
-      await DataModel.loadCalendar();
+      // Persisted Monte Carlo results let the season projections below render without re-simulating
+      await Promise.all([DataModel.loadCalendar(), MonteCarloResultCache.warm()]);
       console.log('[PredCenter] loadCalendar done. Calendar length:', DataModel.calendar?.length);
     } catch (e) {
       console.error('[PredCenter] Calendar load error:', e.message, e.stack);
@@ -3427,9 +5241,13 @@ const PredictionsCenter = (() => {
       try { fn(); } catch (e) { console.warn('[PredCenter] Non-fatal error in', name, ':', e.message); }
     };
 
+    const modules = window.ModuleLoader;
+    if (modules) modules.mark('predictions-init');
+
     safeCall('_renderTimeline', () => RenderEngine._renderTimeline(calendar));
     safeCall('_renderAccuracyBar', () => RenderEngine._renderAccuracyBar());
     safeCall('_selectRace', () => RenderEngine._selectRace(calendar[0], calendar));
+    if (modules) modules.markPaint('first-prediction-card');
     safeCall('_renderChampionship', () => RenderEngine._renderChampionship(calendar));
     safeCall('_renderAllRacesGrid', () => RenderEngine._renderAllRacesGrid(calendar));
     safeCall('_renderPositionHeatmap', () => RenderEngine._renderPositionHeatmap(calendar[0]));
@@ -3439,19 +5257,33 @@ const PredictionsCenter = (() => {
     safeCall('_renderAccuracyDashboard', () => RenderEngine._renderAccuracyDashboard());
     safeCall('_renderTireStrategy', () => RenderEngine._renderTireStrategy(calendar[0]));
     safeCall('_renderWhatIfPanel', () => RenderEngine._renderWhatIfPanel());
-    safeCall('_renderChartJsVisuals', () => RenderEngine._renderChartJsVisuals(calendar[0]));
-    safeCall('_seedHistoricalData', () => RenderEngine._seedHistoricalData());
     safeCall('_initAutoUpdate', () => RenderEngine._initAutoUpdate());
-    safeCall('_renderWeatherForecast', () => RenderEngine._renderWeatherForecast(calendar));
-    safeCall('_renderExportPanel', () => RenderEngine._renderExportPanel());
-    safeCall('_renderQualiRaceSplit', () => RenderEngine._renderQualiRaceSplit());
-    safeCall('_renderDarkHorseAlerts', () => RenderEngine._renderDarkHorseAlerts(calendar[0]));
-    safeCall('_renderPostRaceAnalysis', () => RenderEngine._renderPostRaceAnalysis());
-    safeCall('_renderFantasyCalc', () => RenderEngine._renderFantasyCalc());
-    safeCall('_renderGridPenalty', () => RenderEngine._renderGridPenalty());
-    safeCall('_renderDriverDevelopment', () => RenderEngine._renderDriverDevelopment());
-    safeCall('_renderCommunityPredictions', () => RenderEngine._renderCommunityPredictions());
-    safeCall('_renderSeasonArchive', () => RenderEngine._renderSeasonArchive());
+
+    // Feature panels: their modules are fetched once the main thread goes idle after the first cards
+    const renderPanels = () => {
+      safeCall('_renderChartJsVisuals', () => RenderEngine._renderChartJsVisuals(calendar[0]));
+      safeCall('_seedHistoricalData', () => RenderEngine._seedHistoricalData());
+      safeCall('_renderWeatherForecast', () => RenderEngine._renderWeatherForecast(calendar));
+      safeCall('_renderExportPanel', () => RenderEngine._renderExportPanel());
+      safeCall('_renderDarkHorseAlerts', () => RenderEngine._renderDarkHorseAlerts(calendar[0]));
+      safeCall('_renderPostRaceAnalysis', () => RenderEngine._renderPostRaceAnalysis());
+      safeCall('_renderFantasyCalc', () => RenderEngine._renderFantasyCalc());
+      safeCall('_renderGridPenalty', () => RenderEngine._renderGridPenalty());
+      safeCall('_renderDriverDevelopment', () => RenderEngine._renderDriverDevelopment());
+      safeCall('_renderCommunityPredictions', () => RenderEngine._renderCommunityPredictions());
+      safeCall('_renderSeasonArchive', () => RenderEngine._renderSeasonArchive());
+      safeCall('_renderWhatIfPanel', () => RenderEngine._renderWhatIfPanel());
+      safeCall('_renderQualiRaceSplit', () => RenderEngine._renderQualiRaceSplit());
+      if (modules) modules.markPaint('panels');
+    };
+    if (modules) {
+      modules.idle()
+        .then(() => modules.loadView('predictions'))
+        .catch(e => console.warn('[PredCenter] Panel modules:', e.message))
+        .then(renderPanels);
+    } else {
+      renderPanels();
+    }
 
     RenderEngine.rendered = true;
     console.log('[PredCenter] ✅ Predictions Center fully rendered!');
@@ -3503,22 +5335,44 @@ const PredictionsCenter = (() => {
         out.innerHTML = html;
 
         // Push win probs to live intelligence panel
-        const liveProbs = document.getElementById('live-win-probs');
-        if (liveProbs) {
-          let probHtml = '';
-          mc.grid.slice(0, 5).forEach((e, i) => {
-            const bar = Math.min(100, e.winProb * 3);
-            probHtml += '<div style="display:flex;align-items:center;gap:0.4rem;margin-bottom:0.2rem">';
-            probHtml += '<span style="color:' + e.driver.color + ';width:90px;font-size:0.6rem">' + e.driver.name + '</span>';
-            probHtml += '<div style="flex:1;height:6px;background:#ffffff08;border-radius:3px;overflow:hidden"><div style="width:' + bar + '%;height:100%;background:' + e.driver.color + ';border-radius:3px"></div></div>';
-            probHtml += '<span style="color:#fff;font-size:0.6rem;width:35px;text-align:right">' + e.winProb.toFixed(1) + '%</span></div>';
-          });
-          liveProbs.innerHTML = probHtml;
-        }
+        renderLiveWinProbs(mc);
       });
     }, 50);
   }
 
+  // Top-5 win probability bars in the live intelligence panel; live re-predictions
+  // add podium odds and a lap / sims / latency line
+  function renderLiveWinProbs(mc) {
+    const liveProbs = document.getElementById('live-win-probs');
+    if (!liveProbs) return;
+    const top = mc.live ? mc.grid.slice().sort((a, b) => b.winProb - a.winProb) : mc.grid;
+    let probHtml = '';
+    top.slice(0, 5).forEach(e => {
+      const bar = Math.min(100, e.winProb * 3);
+      probHtml += '<div style="display:flex;align-items:center;gap:0.4rem;margin-bottom:0.2rem">';
+      probHtml += '<span style="color:' + e.driver.color + ';width:90px;font-size:0.6rem">' + e.driver.name + '</span>';
+      probHtml += '<div style="flex:1;height:6px;background:#ffffff08;border-radius:3px;overflow:hidden"><div style="width:' + bar + '%;height:100%;background:' + e.driver.color + ';border-radius:3px"></div></div>';
+      probHtml += '<span style="color:#fff;font-size:0.6rem;width:35px;text-align:right">' + e.winProb.toFixed(1) + '%</span>';
+      if (mc.live) probHtml += '<span style="color:#888;font-size:0.55rem;width:42px;text-align:right">P3 ' + e.podiumProb.toFixed(0) + '%</span>';
+      probHtml += '</div>';
+    });
+    if (mc.live) {
+      const l = mc.live;
+      probHtml += '<div style="color:' + (l.latencyMs > l.budgetMs ? '#f97316' : '#555') + ';font-size:0.55rem;margin-top:0.2rem">Lap ' + l.lap + ' · ' +
+        l.lapsRemaining + ' to go · ' + l.sims.toLocaleString() + ' sims · ' + Math.round(l.latencyMs) + ' ms</div>';
+    }
+    liveProbs.innerHTML = probHtml;
+  }
+
+  // ─── Public: in-race re-prediction on each live position update ───
+  // Cheap to call as often as updates arrive: LiveRaceEngine coalesces while a run is in flight
+  function liveRePredict() {
+    const race = DataModel.calendar?.find(r => r.round === _selectedRound);
+    if (!race) return false;
+    LiveRaceEngine.update(race, renderLiveWinProbs);
+    return true;
+  }
+
   // ─── Public: Run Season Sim button handler ───
   function runSeasonSim() {
     const cal = DataModel.calendar;
@@ -3526,21 +5380,22 @@ const PredictionsCenter = (() => {
     const out = document.getElementById('pred-sim-output');
     if (!out) return;
     out.style.display = 'block';
-    out.innerHTML = '<div style="color:#ffd166">🏆 Simulating full ' + cal.length + '-race season...</div>';
+    out.innerHTML = '<div style="color:#ffd166">🏆 Simulating ' + SeasonProjectionEngine.SEASONS.toLocaleString() + ' full ' + cal.length + '-race seasons...</div>';
     setTimeout(() => {
       const res = PredictionEngine.simulateFullSeason(cal);
-      let html = '<div style="color:#ffd166;font-weight:bold;margin-bottom:0.5rem">🏆 FULL SEASON SIMULATION — ' + cal.length + ' Races</div>';
+      let html = '<div style="color:#ffd166;font-weight:bold;margin-bottom:0.5rem">🏆 FULL SEASON SIMULATION — ' + cal.length + ' Races · ' + res.seasons.toLocaleString() + ' seasons</div>';
       html += '<div style="display:flex;gap:2rem;flex-wrap:wrap">';
       // Driver standings
       html += '<div style="flex:1;min-width:280px"><div style="color:#aaa;margin-bottom:0.3rem;font-weight:bold">Driver Championship</div>';
       html += '<table style="width:100%;border-collapse:collapse">';
-      html += '<tr style="color:#666;font-size:0.6rem"><th style="text-align:left;padding:0.2rem">P</th><th style="text-align:left">Driver</th><th>Pts</th><th>Wins</th><th>Pods</th><th>DNFs</th></tr>';
+      html += '<tr style="color:#666;font-size:0.6rem"><th style="text-align:left;padding:0.2rem">P</th><th style="text-align:left">Driver</th><th>Pts</th><th>Title</th><th>Wins</th><th>Pods</th><th>DNFs</th></tr>';
       res.driverStandings.forEach((e, i) => {
         const medal = i === 0 ? '🥇' : i === 1 ? '🥈' : i === 2 ? '🥉' : (i + 1);
         html += '<tr style="border-top:1px solid #ffffff08;color:' + (i < 3 ? '#fff' : '#888') + '">';
         html += '<td style="padding:0.2rem">' + medal + '</td>';
         html += '<td><span style="color:' + e.driver.color + '">' + e.driver.full + '</span></td>';
         html += '<td style="text-align:center;font-weight:bold">' + e.pts + '</td>';
+        html += '<td style="text-align:center;color:#ffd166">' + e.titleProb.toFixed(1) + '%</td>';
         html += '<td style="text-align:center">' + e.wins.toFixed(1) + '</td>';
         html += '<td style="text-align:center">' + e.podiums.toFixed(1) + '</td>';
         html += '<td style="text-align:center;color:#f44">' + e.dnfs.toFixed(1) + '</td></tr>';
@@ -3549,11 +5404,12 @@ const PredictionsCenter = (() => {
       // Constructor standings
       html += '<div style="flex:1;min-width:240px"><div style="color:#aaa;margin-bottom:0.3rem;font-weight:bold">Constructor Championship</div>';
       html += '<table style="width:100%;border-collapse:collapse">';
-      html += '<tr style="color:#666;font-size:0.6rem"><th style="text-align:left;padding:0.2rem">P</th><th style="text-align:left">Team</th><th>Pts</th></tr>';
+      html += '<tr style="color:#666;font-size:0.6rem"><th style="text-align:left;padding:0.2rem">P</th><th style="text-align:left">Team</th><th>Pts</th><th>Title</th></tr>';
       res.teamStandings.forEach((e, i) => {
         html += '<tr style="border-top:1px solid #ffffff08"><td style="padding:0.2rem">' + (i + 1) + '</td>';
         html += '<td style="color:' + e.color + '">' + e.team.replace(/_/g, ' ').replace(/\b\w/g, c => c.toUpperCase()) + '</td>';
-        html += '<td style="text-align:center;font-weight:bold">' + e.pts + '</td></tr>';
+        html += '<td style="text-align:center;font-weight:bold">' + e.pts + '</td>';
+        html += '<td style="text-align:center;color:#ffd166">' + e.titleProb.toFixed(1) + '%</td></tr>';
       });
       html += '</table></div></div>';
       // Upgrades
@@ -3811,7 +5667,8 @@ const PredictionsCenter = (() => {
   }
 
   // ─── Public: Run What-If Scenario ───
-  function runWhatIfUI() {
+  async function runWhatIfUI() {
+    if (window.ModuleLoader) await ModuleLoader.load('WhatIfScenario').catch(() => null);
     if (!window.WhatIfScenario) return;
     const race = DataModel.calendar?.find(r => r.round === _selectedRound);
     if (!race) return;
@@ -3822,71 +5679,69 @@ const PredictionsCenter = (() => {
     }
 
     setTimeout(() => {
-      // Run baseline first
-      const baselineRace = race;
-      MonteCarloEngine.run(baselineRace, (baselineMC) => {
+      // Baseline and scenario in one paired batch: same seeds, so the deltas are not sampling noise.
+      // Forced DNFs are applied per sim inside the batch.
+      const spec = window.WhatIfScenario.createScenario({ ...window.WhatIfScenario.getScenario(), label: 'Scenario' });
+      MonteCarloEngine.runScenarios(race, [spec], (batch) => {
+        const baselineMC = batch.baseline;
+        const scenarioMC = { ...batch.scenarios[0].result, deltas: batch.scenarios[0].deltas };
         window.WhatIfScenario.setBaseline(baselineMC);
+        window.WhatIfScenario.setScenarioResult(scenarioMC);
+
+        // Build comparison
+        const compHtml = window.WhatIfScenario.buildComparisonHTML(baselineMC, scenarioMC, DRIVERS);
+        const compEl = document.getElementById('whatif-comparison');
+        if (compEl) compEl.innerHTML = compHtml;
+
+        if (out) {
+          let html = '<div style="color:#00dc50;font-weight:bold;margin-bottom:0.5rem">\u2705 What-If Analysis Complete</div>';
+          html += '<div style="font-size:0.6rem;color:#888;margin-bottom:0.5rem">Baseline vs Scenario comparison generated</div>';
+
+          const scenario = window.WhatIfScenario.getScenario();
+          html += '<div style="display:flex;flex-wrap:wrap;gap:0.3rem;margin-bottom:0.5rem">';
+          if (scenario.weather !== 'dry') html += `<span style="color:#58a6ff;font-size:0.6rem">\ud83c\udf27\ufe0f ${scenario.weather}</span>`;
+          if (scenario.forceDNFs.length) html += `<span style="color:#ff4444;font-size:0.6rem">\ud83d\udca5 ${scenario.forceDNFs.length} forced DNF(s)</span>`;
+          const upgrades = Object.entries(scenario.teamUpgrades).filter(([, v]) => v !== 0);
+          if (upgrades.length) html += `<span style="color:#00dc50;font-size:0.6rem">\u2b06\ufe0f ${upgrades.length} team adjustment(s)</span>`;
+          html += '</div>';
+
+          // Show top 5 scenario results
+          const sGrid = scenarioMC.grid || [];
+          html += '<div style="font-size:0.65rem;color:#a78bfa;font-weight:bold;margin:0.5rem 0 0.3rem">\ud83d\udd2e Scenario Result (Top 5)</div>';
+          sGrid.slice(0, 5).forEach((g, i) => {
+            const bEntry = baselineMC.grid?.find(b => b.driver.id === g.driver.id);
+            const bPos = bEntry ? baselineMC.grid.indexOf(bEntry) + 1 : '?';
+            const change = typeof bPos === 'number' ? bPos - (i + 1) : 0;
+            const arrow = change > 0 ? `<span style="color:#00dc50">\u25b2${change}</span>` : change < 0 ? `<span style="color:#ff4444">\u25bc${Math.abs(change)}</span>` : '';
+            html += `<div style="display:flex;align-items:center;gap:0.5rem;padding:0.2rem 0;font-size:0.62rem">
+              <span style="color:#888;width:18px">P${i + 1}</span>
+              <span style="color:${g.driver.color}">${g.driver.name}</span>
+              <span style="color:#888">${g.winProb.toFixed(1)}% win</span>
+              ${arrow}
+            </div>`;
+          });
 
-        // Apply scenario modifications
-        const scenarioRace = window.WhatIfScenario.applyToRace(race);
-
-        // Run scenario with modified parameters
-        MonteCarloEngine.run(scenarioRace, (scenarioMC) => {
-          // Apply forced DNFs - move them to last
-          const forcedDNFs = window.WhatIfScenario.getScenario().forceDNFs || [];
-          if (forcedDNFs.length > 0 && scenarioMC.grid) {
-            const grid = scenarioMC.grid;
-            forcedDNFs.forEach(dnfId => {
-              const idx = grid.findIndex(g => g.driver.id === dnfId);
-              if (idx >= 0) {
-                const entry = grid.splice(idx, 1)[0];
-                entry.avgFinish = 22;
-                entry.winProb = 0;
-                entry.podiumProb = 0;
-                entry.dnfProb = 100;
-                grid.push(entry);
-              }
-            });
-          }
-
-          window.WhatIfScenario.setScenarioResult(scenarioMC);
-
-          // Build comparison
-          const compHtml = window.WhatIfScenario.buildComparisonHTML(baselineMC, scenarioMC, DRIVERS);
-          const compEl = document.getElementById('whatif-comparison');
-          if (compEl) compEl.innerHTML = compHtml;
-
-          if (out) {
-            let html = '<div style="color:#00dc50;font-weight:bold;margin-bottom:0.5rem">\u2705 What-If Analysis Complete</div>';
-            html += '<div style="font-size:0.6rem;color:#888;margin-bottom:0.5rem">Baseline vs Scenario comparison generated</div>';
-
-            const scenario = window.WhatIfScenario.getScenario();
-            html += '<div style="display:flex;flex-wrap:wrap;gap:0.3rem;margin-bottom:0.5rem">';
-            if (scenario.weather !== 'dry') html += `<span style="color:#58a6ff;font-size:0.6rem">\ud83c\udf27\ufe0f ${scenario.weather}</span>`;
-            if (scenario.forceDNFs.length) html += `<span style="color:#ff4444;font-size:0.6rem">\ud83d\udca5 ${scenario.forceDNFs.length} forced DNF(s)</span>`;
-            const upgrades = Object.entries(scenario.teamUpgrades).filter(([, v]) => v !== 0);
-            if (upgrades.length) html += `<span style="color:#00dc50;font-size:0.6rem">\u2b06\ufe0f ${upgrades.length} team adjustment(s)</span>`;
-            html += '</div>';
-
-            // Show top 5 scenario results
-            const sGrid = scenarioMC.grid || [];
-            html += '<div style="font-size:0.65rem;color:#a78bfa;font-weight:bold;margin:0.5rem 0 0.3rem">\ud83d\udd2e Scenario Result (Top 5)</div>';
-            sGrid.slice(0, 5).forEach((g, i) => {
-              const bEntry = baselineMC.grid?.find(b => b.driver.id === g.driver.id);
-              const bPos = bEntry ? baselineMC.grid.indexOf(bEntry) + 1 : '?';
-              const change = typeof bPos === 'number' ? bPos - (i + 1) : 0;
-              const arrow = change > 0 ? `<span style="color:#00dc50">\u25b2${change}</span>` : change < 0 ? `<span style="color:#ff4444">\u25bc${Math.abs(change)}</span>` : '';
-              html += `<div style="display:flex;align-items:center;gap:0.5rem;padding:0.2rem 0;font-size:0.62rem">
-                <span style="color:#888;width:18px">P${i + 1}</span>
-                <span style="color:${g.driver.color}">${g.driver.name}</span>
-                <span style="color:#888">${g.winProb.toFixed(1)}% win</span>
-                ${arrow}
-              </div>`;
-            });
+          out.innerHTML = html;
+        }
+      });
+    }, 50);
+  }
 
-            out.innerHTML = html;
-          }
-        });
+  // Every team +1.0 on top of the current scenario, one paired batch
+  async function sweepWhatIfUI() {
+    if (window.ModuleLoader) await ModuleLoader.load('WhatIfScenario').catch(() => null);
+    if (!window.WhatIfScenario) return;
+    const race = DataModel.calendar?.find(r => r.round === _selectedRound);
+    const el = document.getElementById('whatif-sweep');
+    if (!race || !el) return;
+    const scenarios = window.WhatIfScenario.teamUpgradeSweep(Object.keys(BASE_IDX), 1);
+    el.innerHTML = `<div style="color:#a78bfa;font-size:0.65rem;margin-top:0.6rem">\ud83e\uddea Sweeping ${scenarios.length} scenarios...</div>`;
+    setTimeout(() => {
+      const t0 = performance.now();
+      MonteCarloEngine.runScenarios(race, scenarios, (batch) => {
+        window.WhatIfScenario.setBatchResult(batch);
+        el.innerHTML = window.WhatIfScenario.buildBatchHTML(batch) +
+          `<div style="color:#48484a;font-size:0.55rem;margin-top:0.3rem;font-family:monospace">${((performance.now() - t0) / 1000).toFixed(2)}s</div>`;
       });
     }, 50);
   }
@@ -3905,17 +5760,22 @@ const PredictionsCenter = (() => {
       out.innerHTML = '<div style="color:#00dc50">\ud83d\udce1 Fetching historical F1 data from 2023-2025 seasons...</div><div style="font-size:0.6rem;color:#888;margin-top:0.3rem">Querying Jolpica API (Ergast successor)... This may take a few seconds.</div>';
     }
 
+    if (window.ModuleLoader) await ModuleLoader.load('HistoricalDataSeeder').catch(() => null);
     if (!window.HistoricalDataSeeder) {
       if (out) out.innerHTML = '<div style="color:#ff4444">\u274c HistoricalDataSeeder module not loaded.</div>';
       return;
     }
 
     try {
-      const result = await window.HistoricalDataSeeder.seed(DRIVERS, true); // Force refresh
+      // Incremental: restores the stored engine snapshot, tops up the season in progress
+      const result = await window.HistoricalDataSeeder.seed(DRIVERS);
+      DataModel.replayEngineResults();
+      const seasons = Object.keys(result.status?.seasons || {});
+      const span = seasons.length ? `${seasons[0]}-${seasons[seasons.length - 1]}` : '2023-2025';
 
       if (out) {
         let html = '<div style="color:#00dc50;font-weight:bold;margin-bottom:0.5rem">\u2705 Historical Data Seeded Successfully!</div>';
-        html += `<div style="font-size:0.6rem;color:#888;margin-bottom:0.5rem">${result.allRaces?.length || '?'} races processed across 2023-2025 seasons</div>`;
+        html += `<div style="font-size:0.6rem;color:#888;margin-bottom:0.5rem">${result.allRaces?.length || '?'} races processed across ${span} seasons</div>`;
 
         // Show driver summary highlights
         if (result.driverSummary) {
@@ -3923,7 +5783,7 @@ const PredictionsCenter = (() => {
             .sort((a, b) => b[1].points - a[1].points)
             .slice(0, 8);
 
-          html += '<div style="font-size:0.65rem;color:#58a6ff;font-weight:bold;margin:0.5rem 0 0.3rem">\ud83c\udfc6 Historical Leaders (2023-2025)</div>';
+          html += `<div style="font-size:0.65rem;color:#58a6ff;font-weight:bold;margin:0.5rem 0 0.3rem">\ud83c\udfc6 Historical Leaders (${span})</div>`;
           topDrivers.forEach(([id, s]) => {
             const d = DRIVERS.find(dr => dr.id === id);
             html += `<div style="display:flex;align-items:center;gap:0.5rem;padding:0.15rem 0;font-size:0.58rem">
@@ -4034,7 +5894,9 @@ const PredictionsCenter = (() => {
     }
   }
   // ═══ v15.0 public API functions ═══
-  function exportCardUI() {
+  // The modules behind these buttons are on demand: a click before the idle preload fetches them
+  async function exportCardUI() {
+    if (window.ModuleLoader) await ModuleLoader.load('ExportShare').catch(() => null);
     if (!window.ExportShare) return;
     const race = DataModel.calendar?.find(r => r.round === _selectedRound) || DataModel.calendar?.[0];
     if (!race) return;
@@ -4042,7 +5904,8 @@ const PredictionsCenter = (() => {
     window.ExportShare.downloadCard(race, predictions);
   }
 
-  function copyCardUI() {
+  async function copyCardUI() {
+    if (window.ModuleLoader) await ModuleLoader.load('ExportShare').catch(() => null);
     if (!window.ExportShare) return;
     const race = DataModel.calendar?.find(r => r.round === _selectedRound) || DataModel.calendar?.[0];
     if (!race) return;
@@ -4052,18 +5915,21 @@ const PredictionsCenter = (() => {
     });
   }
 
-  function exportDataUI() {
+  async function exportDataUI() {
+    if (window.ModuleLoader) await ModuleLoader.load('ExportShare').catch(() => null);
     if (window.ExportShare) window.ExportShare.exportJSON(DataModel);
   }
 
-  function toggleNotificationsUI() {
+  async function toggleNotificationsUI() {
+    if (window.ModuleLoader) await ModuleLoader.load('PushNotifications').catch(() => null);
     if (window.PushNotifications) window.PushNotifications.toggle();
     setTimeout(() => {
       // Refresh any notification toggles in the UI
     }, 500);
   }
 
-  function submitCommunityPredictionUI() {
+  async function submitCommunityPredictionUI() {
+    if (window.ModuleLoader) await ModuleLoader.load('CommunityPredictions').catch(() => null);
     if (!window.CommunityPredictions) return;
     const p1 = document.getElementById('community-p1')?.value;
     const p2 = document.getElementById('community-p2')?.value;
@@ -4081,7 +5947,8 @@ const PredictionsCenter = (() => {
     if (window.LiveAutoUpdate) window.LiveAutoUpdate.showToast('🔒 Prediction locked in! Good luck!', 'info');
   }
 
-  function archiveCurrentSeasonUI() {
+  async function archiveCurrentSeasonUI() {
+    if (window.ModuleLoader) await ModuleLoader.load('SeasonArchive').catch(() => null);
     if (!window.SeasonArchive) return;
     const totalResults = Object.keys(DataModel.results || {}).length;
     const data = {
@@ -4100,10 +5967,12 @@ const PredictionsCenter = (() => {
 
   return {
     init, loadAndRender, selectRound, openResultModal, saveResult, closeModal,
-    runRaceSim, runLiveRaceSim, runSeasonSim,
+    runRaceSim, runLiveRaceSim, runSeasonSim, liveRePredict,
+    getLiveRaceStats: () => LiveRaceEngine.getStats(),
     runDiagnostics: runDiagnosticsUI,
     runAnalytics: runAnalyticsUI,
     runWhatIf: runWhatIfUI,
+    sweepWhatIf: sweepWhatIfUI,
     refreshWhatIf: refreshWhatIfUI,
     seedHistorical: seedHistoricalUI,
     checkForUpdates: checkForUpdatesUI,
@@ -4116,6 +5985,11 @@ const PredictionsCenter = (() => {
     toggleNotifications: toggleNotificationsUI,
     submitCommunityPrediction: submitCommunityPredictionUI,
     archiveCurrentSeason: archiveCurrentSeasonUI,
-    getDrivers: () => DRIVERS
+    getDrivers: () => DRIVERS,
+    // Opt-in sim pipeline profiling (ApiHealthDashboard, MonteCarloBench --profile)
+    profiler: SimProfiler,
+    // Entry point for MonteCarloWorker.js
+    simKernel: MonteCarloKernel,
+    analytic: AnalyticRaceModel
   };
 })();
@@ -8,6 +8,12 @@ Usage:
     python scraper.py               # Full update cycle
     python scraper.py --team ferrari  # Update specific team
     python scraper.py --dry-run     # Preview without writing
+    python scraper.py --concurrency 8  # Fetch all hosts in parallel
+    python scraper.py --no-cache    # Ignore the page cache, re-fetch and re-parse everything
+    python scraper.py --journal     # Also record every change in the DB journal (history for --as-of)
+    python scraper.py --compact     # Fold the journal into f1_2026_cars.json
+    python scraper.py --as-of 42    # Print the DB as of journal entry 42
+    python scraper.py --simulate    # Precompute per-round Monte Carlo predictions (needs numpy)
 
 Requirements:
     pip install requests beautifulsoup4 schedule
@@ -21,16 +27,26 @@ import logging
 import argparse
 import hashlib
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import urlparse
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     from bs4 import BeautifulSoup
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
+try:
+    import lxml  # noqa: F401 — faster BeautifulSoup tree builder when installed
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 # ============================================================
 # CONFIG
 # ============================================================
@@ -104,15 +120,56 @@ HEADERS = {
 }
 
 REQUEST_TIMEOUT = 15
-REQUEST_DELAY = 2.0   # seconds between requests (be polite)
+REQUEST_DELAY = 2.0   # seconds between requests to the same host (be polite)
+DEFAULT_CONCURRENCY = 1   # 1 = serial fetch; >1 = thread pool across hosts
+
+PAGE_CACHE_PATH = DATA_DIR / "page_cache.json"
+PAGE_CACHE_VERSION = 2          # bump when extraction output changes shape/meaning
+PAGE_CACHE_TTL_DAYS = 30        # force a full fetch + parse after this long
+PAGE_CACHE_MAX_BYTES = 2_000_000
+
+JOURNAL_COMPACT_BYTES = 256_000   # journaled DB: fold into the JSON snapshot past this many unfolded bytes
+WEEKLY_UPDATES_KEPT = 12
 
 # ============================================================
 # DATABASE MODULE
 # ============================================================
+def atomic_write_json(path: Path, payload, indent: int | None = None) -> None:
+    """Write JSON to a sibling temp file, fsync, then rename over ``path``."""
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=indent, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 class Database:
-    def __init__(self, path: Path):
+    """The car database JSON, with an id→team index.
+
+    With ``journal=True`` every update_team / add_weekly_update / update_meta is also appended to
+    ``<name>.journal.jsonl`` (one ``{seq, ts, op, args}`` per line). save() then only appends the
+    new lines; the JSON snapshot is rewritten by compact(), either on demand or once the journal
+    has grown ``compact_bytes`` past the last compaction. The snapshot records the last folded
+    entry in ``meta.journal_seq``, so load() replays exactly the entries after it. The snapshot
+    as it was before the first journal entry is kept as ``<name>.base.json`` for as_of().
+
+    load() replays an existing journal in either mode, and a non-journal save() writes the full
+    snapshot with ``meta.journal_seq`` at the last replayed entry, so the two modes can be mixed.
+    """
+
+    def __init__(self, path: Path, journal: bool = False, compact_bytes: int = JOURNAL_COMPACT_BYTES):
         self.path = path
         self._data = None
+        self._index = {}
+        self.journal = journal
+        self.journal_path = path.with_suffix('.journal.jsonl')
+        self.base_path = path.with_suffix('.base.json')
+        self.compact_bytes = compact_bytes
+        self._seq = 0
+        self._pending = []
+        self._unfolded = 0       # journal bytes on disk past the snapshot's journal_seq
+        self._journal_good = 0   # byte length of the journal up to its last complete record
 
     def load(self) -> dict:
         if not self.path.exists():
@@ -120,6 +177,9 @@ class Database:
             return {}
         with open(self.path, encoding='utf-8') as f:
             self._data = json.load(f)
+        self._index = self._build_index(self._data)
+        if self.journal or self.journal_path.exists():
+            self._replay_journal()
         log.info(f"Database loaded: {len(self._data.get('teams', []))} teams")
         return self._data
 
@@ -128,50 +188,82 @@ class Database:
             log.info("[DRY RUN] Would write:")
             log.info(json.dumps(data['meta'], indent=2))
             return
-        with open(self.path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        log.info(f"Database saved to {self.path}")
+        if not self.journal or data is not self._data:
+            if self._seq and data is self._data:
+                # the snapshot now includes every replayed entry: fold the journal in
+                data.setdefault('meta', {})['journal_seq'] = self._seq
+                self._unfolded = 0
+            atomic_write_json(self.path, data, indent=2)
+            log.info(f"Database saved to {self.path}")
+            return
+        appended = len(self._pending)
+        self._flush_journal()
+        if self._unfolded >= self.compact_bytes:
+            self.compact()
+        else:
+            log.info(f"Journal: {appended} entries appended to {self.journal_path.name} "
+                     f"({self._unfolded} bytes since last compaction)")
+
+    def compact(self) -> None:
+        """Fold the journal into the JSON snapshot (atomic write-and-rename)."""
+        if not self._data:
+            return
+        if self.journal:
+            self._flush_journal()
+            self._data.setdefault('meta', {})['journal_seq'] = self._seq
+        atomic_write_json(self.path, self._data, indent=2)
+        self._unfolded = 0
+        log.info(f"Database compacted to {self.path} at journal seq {self._seq}")
+
+    def as_of(self, seq: int) -> dict:
+        """Rebuild the database as it was right after journal entry ``seq`` (0 = before any entry)."""
+        if not self.base_path.exists():
+            raise FileNotFoundError(f"No journal base snapshot at {self.base_path}")
+        with open(self.base_path, encoding='utf-8') as f:
+            data = json.load(f)
+        index = self._build_index(data)
+        for entry, _ in self._read_journal()[0]:
+            if entry['seq'] > seq:
+                break
+            self._apply(data, index, entry['op'], entry['args'])
+        return data
+
+    def journal_entries(self) -> list[dict]:
+        """All durable journal entries, oldest first (the points as_of() can rebuild)."""
+        return [entry for entry, _ in self._read_journal()[0]]
 
     def get_team(self, team_id: str) -> dict | None:
         if not self._data:
             return None
-        teams = self._data.get('teams', [])
-        return next((t for t in teams if t['id'] == team_id), None)
+        i = self._index.get(team_id)
+        return self._data['teams'][i] if i is not None else None
 
     def update_team(self, team_id: str, updates: dict) -> bool:
         if not self._data:
             return False
-        teams = self._data.get('teams', [])
-        for i, t in enumerate(teams):
-            if t['id'] == team_id:
-                teams[i] = self._deep_merge(t, updates)
-                log.info(f"Updated team: {team_id}")
-                return True
-        return False
+        args = {'team_id': team_id, 'updates': updates}
+        if not self._apply(self._data, self._index, 'update_team', args):
+            return False
+        self._record('update_team', args)
+        log.info(f"Updated team: {team_id}")
+        return True
 
     def update_meta(self) -> None:
         if self._data:
-            self._data['meta']['last_updated'] = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-            self._data['meta']['data_version'] = self._bump_version(self._data['meta'].get('data_version', '1.0.0'))
+            args = {
+                'last_updated': datetime.now(timezone.utc).strftime('%Y-%m-%d'),
+                'data_version': self._bump_version(self._data['meta'].get('data_version', '1.0.0')),
+            }
+            self._apply(self._data, self._index, 'update_meta', args)
+            self._record('update_meta', args)
 
     def add_weekly_update(self, week: str, summary: str, news: list) -> None:
         if not self._data:
             return
-        updates = self._data.setdefault('weekly_updates', [])
-        # Check if week already exists
-        for u in updates:
-            if u['week'] == week:
-                u['summary'] = summary
-                u['news'].extend(n for n in news if n not in u['news'])
-                return
-        updates.insert(0, {
-            "week": week,
-            "date": datetime.now(timezone.utc).strftime('%Y-%m-%d'),
-            "summary": summary,
-            "news": news
-        })
-        # Keep last 12 weeks
-        self._data['weekly_updates'] = updates[:12]
+        args = {'week': week, 'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'),
+                'summary': summary, 'news': news}
+        self._apply(self._data, self._index, 'add_weekly_update', args)
+        self._record('add_weekly_update', args)
 
     def get_data(self) -> dict:
         return self._data
@@ -186,6 +278,98 @@ class Database:
                 result[key] = value
         return result
 
+    @staticmethod
+    def _build_index(data: dict) -> dict:
+        return {t['id']: i for i, t in enumerate(data.get('teams', []))}
+
+    @staticmethod
+    def _apply(data: dict, index: dict, op: str, args: dict) -> bool:
+        """Apply one journal op to ``data``. Shared by the live mutators and replay."""
+        if op == 'update_team':
+            i = index.get(args['team_id'])
+            if i is None:
+                return False
+            teams = data['teams']
+            teams[i] = Database._deep_merge(teams[i], args['updates'])
+        elif op == 'update_meta':
+            data['meta']['last_updated'] = args['last_updated']
+            data['meta']['data_version'] = args['data_version']
+        elif op == 'add_weekly_update':
+            updates = data.setdefault('weekly_updates', [])
+            # Check if week already exists
+            for u in updates:
+                if u['week'] == args['week']:
+                    u['summary'] = args['summary']
+                    u['news'].extend(n for n in args['news'] if n not in u['news'])
+                    return True
+            updates.insert(0, {
+                "week": args['week'],
+                "date": args['date'],
+                "summary": args['summary'],
+                "news": list(args['news'])
+            })
+            data['weekly_updates'] = updates[:WEEKLY_UPDATES_KEPT]
+        else:
+            log.warning(f"Unknown journal op: {op}")
+            return False
+        return True
+
+    def _record(self, op: str, args: dict) -> None:
+        if not self.journal:
+            return
+        self._seq += 1
+        entry = {'seq': self._seq, 'ts': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                 'op': op, 'args': args}
+        # serialise now so later mutation of ``args`` by the caller can't leak into the journal
+        self._pending.append(json.dumps(entry, ensure_ascii=False))
+
+    def _flush_journal(self) -> None:
+        if not self._pending:
+            return
+        if not self.base_path.exists() and not self.journal_path.exists() and self.path.exists():
+            # the snapshot on disk predates every journal entry — keep it as the as_of() base
+            tmp = self.base_path.with_suffix('.tmp')
+            with open(self.path, 'rb') as src, open(tmp, 'wb') as dst:
+                dst.write(src.read())
+            os.replace(tmp, self.base_path)
+        if self.journal_path.exists() and self.journal_path.stat().st_size > self._journal_good:
+            # drop a torn final record left by a crash mid-append
+            os.truncate(self.journal_path, self._journal_good)
+        blob = ''.join(line + '\n' for line in self._pending).encode('utf-8')
+        with open(self.journal_path, 'ab') as f:
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_good += len(blob)
+        self._unfolded += len(blob)
+        self._pending = []
+
+    def _read_journal(self) -> tuple[list[tuple[dict, int]], int]:
+        """Return ([(entry, record bytes)], byte length of complete records). A torn last line is ignored."""
+        if not self.journal_path.exists():
+            return [], 0
+        with open(self.journal_path, 'rb') as f:
+            raw = f.read()
+        good = raw.rfind(b'\n') + 1
+        if good < len(raw):
+            log.warning(f"Journal {self.journal_path.name}: ignoring torn final record")
+        records = [(json.loads(line), len(line) + 1) for line in raw[:good].split(b'\n') if line.strip()]
+        return records, good
+
+    def _replay_journal(self) -> None:
+        records, self._journal_good = self._read_journal()
+        folded = self._data.get('meta', {}).get('journal_seq', 0)
+        replayed = 0
+        self._unfolded = 0
+        for entry, line_len in records:
+            self._seq = max(self._seq, entry['seq'])
+            if entry['seq'] > folded:
+                self._apply(self._data, self._index, entry['op'], entry['args'])
+                self._unfolded += line_len
+                replayed += 1
+        if replayed:
+            log.info(f"Journal: replayed {replayed} entries past seq {folded}")
+
     @staticmethod
     def _bump_version(v: str) -> str:
         parts = v.split('.')
@@ -200,113 +384,315 @@ class Database:
 # HTTP CLIENT MODULE
 # ============================================================
 class HTTPClient:
-    def __init__(self):
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, revalidate: bool = False):
         self._session = None
+        self._lock = threading.Lock()
+        self._host_locks = {}
+        self._host_next = {}
         if HAS_REQUESTS:
             self._session = requests.Session()
             self._session.headers.update(HEADERS)
-
-    def get(self, url: str, timeout: int = REQUEST_TIMEOUT) -> str | None:
+            if revalidate:
+                # Conditional GETs carry their own validators; let CDNs answer 304 from the edge
+                self._session.headers.pop('Cache-Control', None)
+            # Size the connection pool so concurrent workers reuse sockets instead of reconnecting
+            pool = max(1, concurrency)
+            adapter = HTTPAdapter(pool_connections=pool, pool_maxsize=pool)
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+
+    def _throttle(self, url: str) -> None:
+        """Enforce REQUEST_DELAY between requests to the same host; other hosts proceed freely."""
+        host = urlparse(url).netloc
+        with self._lock:
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+        with host_lock:
+            wait = self._host_next.get(host, 0.0) - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._host_next[host] = time.monotonic() + REQUEST_DELAY
+
+    def get_response(self, url: str, headers: dict | None = None,
+                     timeout: int = REQUEST_TIMEOUT) -> 'requests.Response | None':
         if not HAS_REQUESTS:
             log.warning("requests library not installed. Install with: pip install requests beautifulsoup4")
             return None
         try:
-            time.sleep(REQUEST_DELAY)
-            resp = self._session.get(url, timeout=timeout)
+            self._throttle(url)
+            resp = self._session.get(url, headers=headers, timeout=timeout)
             resp.raise_for_status()
-            log.info(f"GET {url} → {resp.status_code} ({len(resp.text)} chars)")
-            return resp.text
+            if resp.status_code == 304:
+                log.info(f"GET {url} → 304 (not modified)")
+            else:
+                log.info(f"GET {url} → {resp.status_code} ({len(resp.text)} chars)")
+            return resp
         except requests.RequestException as e:
             log.error(f"HTTP error for {url}: {e}")
             return None
 
+    def get(self, url: str, timeout: int = REQUEST_TIMEOUT) -> str | None:
+        resp = self.get_response(url, timeout=timeout)
+        return resp.text if resp is not None else None
+
     def get_soup(self, url: str) -> 'BeautifulSoup | None':
-        html = self.get(url)
+        return self.parse(self.get(url), url)
+
+    @staticmethod
+    def parse(html: str | None, url: str = '') -> 'BeautifulSoup | None':
         if not html:
             return None
         try:
             from bs4 import BeautifulSoup
-            return BeautifulSoup(html, 'html.parser')
+            return BeautifulSoup(html, HTML_PARSER)
         except Exception as e:
             log.error(f"Parse error for {url}: {e}")
             return None
 
 
+# ============================================================
+# PAGE CACHE MODULE
+# ============================================================
+class PageCache:
+    """On-disk validator + extraction cache keyed by URL.
+
+    Each entry keeps the ETag, Last-Modified and SHA-256 of the last body we parsed, plus the
+    extraction result. A 304 or an identical body hash reuses the stored extraction, so the page
+    is not handed to BeautifulSoup or Parser again. Revalidation does not extend an entry's life:
+    ``ttl_days`` after the last parse it expires, forcing an unconditional fetch and a fresh parse.
+    Past ``max_bytes`` the least recently checked entries are dropped.
+    """
+
+    def __init__(self, path: Path, ttl_days: float = PAGE_CACHE_TTL_DAYS,
+                 max_bytes: int = PAGE_CACHE_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> 'PageCache':
+        if not self.path.exists():
+            return self
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning(f"Page cache unreadable, starting fresh: {e}")
+            return self
+        if data.get('version') != PAGE_CACHE_VERSION:
+            log.info("Page cache version changed — discarding old entries")
+            return self
+        self._entries = data.get('entries', {})
+        self.evict()
+        log.info(f"Page cache loaded: {len(self._entries)} entries")
+        return self
+
+    def save(self) -> None:
+        self.evict()
+        with self._lock:
+            payload = {'version': PAGE_CACHE_VERSION, 'entries': self._entries}
+        atomic_write_json(self.path, payload)
+        log.info(f"Page cache saved: {len(self._entries)} entries (hits={self.hits}, misses={self.misses})")
+
+    def lookup(self, url: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry and self._expired(entry, time.time()):
+                del self._entries[url]
+                return None
+            return entry
+
+    def _expired(self, entry: dict, now: float) -> bool:
+        # entries written before parsed_at existed age from their last check
+        return now - entry.get('parsed_at', entry['checked_at']) > self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: dict | None) -> dict:
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def hit(self, url: str, resp) -> object:
+        """Record an unchanged page (304 or same hash) and return its cached extraction."""
+        with self._lock:
+            entry = self._entries[url]
+            entry['checked_at'] = time.time()
+            entry['etag'] = resp.headers.get('ETag') or entry.get('etag')
+            entry['last_modified'] = resp.headers.get('Last-Modified') or entry.get('last_modified')
+            self.hits += 1
+            return entry['extract']
+
+    def store(self, url: str, resp, body_hash: str, extract) -> None:
+        now = time.time()
+        entry = {
+            'etag': resp.headers.get('ETag'),
+            'last_modified': resp.headers.get('Last-Modified'),
+            'hash': body_hash,
+            'checked_at': now,
+            'parsed_at': now,
+            'extract': extract,
+        }
+        entry['size'] = len(json.dumps(entry, ensure_ascii=False))
+        with self._lock:
+            self._entries[url] = entry
+            self.misses += 1
+
+    def evict(self) -> None:
+        now = time.time()
+        with self._lock:
+            for url in [u for u, e in self._entries.items() if self._expired(e, now)]:
+                del self._entries[url]
+            total = sum(e.get('size', 0) for e in self._entries.values())
+            for url in sorted(self._entries, key=lambda u: self._entries[u]['checked_at']):
+                if total <= self.max_bytes:
+                    break
+                total -= self._entries.pop(url).get('size', 0)
+
+
 # ============================================================
 # PARSER MODULE
 # ============================================================
 class Parser:
+    # One alternation per unit class; a single finditer pass yields every spec candidate.
+    SPEC_RE = re.compile(
+        r'(\d{3,})\s*(?:(?P<hp>bhp|hp|horsepower)|(?P<ps>ps|cv)|(?P<kg>kg|kilograms)|(?P<mm>mm))',
+        re.IGNORECASE)
+    # (min, max) trailing digits read per unit, as the old per-unit patterns matched
+    # them: \d{3,4} hp/ps, \d{3} kg, \d{4} mm — so "1798 kg" still yields 798
+    SPEC_DIGITS = {'hp': (3, 4), 'ps': (3, 4), 'kg': (3, 3), 'mm': (4, 4)}
+    NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+    WS_RE = re.compile(r'\s+')
+    NEWS_TAGS = frozenset(('p', 'h2', 'h3', 'li'))
+    SPEC_RANGES = {'bhp': (400, 1200), 'weight': (700, 820), 'wheelbase': (3000, 3800)}
+
     @staticmethod
     def extract_numbers(text: str) -> list[float]:
         """Extract all numbers from a text string."""
-        return [float(m) for m in re.findall(r'\d+(?:\.\d+)?', text)]
+        return [float(m) for m in Parser.NUMBER_RE.findall(text)]
+
+    @staticmethod
+    def find_specs(text: str) -> dict:
+        """Single scan for BHP, weight and wheelbase. First match per unit wins, as before."""
+        first = {}
+        for m in Parser.SPEC_RE.finditer(text):
+            unit = m.lastgroup
+            if unit in first:
+                continue
+            digits = m.group(1)
+            lo, hi = Parser.SPEC_DIGITS[unit]
+            if len(digits) < lo:
+                continue
+            first[unit] = int(digits[-hi:])
+            if len(first) == 4:
+                break
+
+        def in_range(key, val):
+            lo, hi = Parser.SPEC_RANGES[key]
+            return val if val is not None and lo <= val <= hi else None
+
+        return {
+            'bhp': in_range('bhp', first.get('hp')) or in_range('bhp', first.get('ps')),
+            'weight': in_range('weight', first.get('kg')),
+            'wheelbase': in_range('wheelbase', first.get('mm')),
+        }
 
     @staticmethod
     def find_bhp(text: str) -> int | None:
         """Try to find BHP values from text."""
-        patterns = [
-            r'(\d{3,4})\s*(?:bhp|hp|horsepower)',
-            r'(\d{3,4})\s*(?:ps|cv)',
-        ]
-        for p in patterns:
-            m = re.search(p, text, re.IGNORECASE)
-            if m:
-                val = int(m.group(1))
-                if 400 <= val <= 1200:
-                    return val
-        return None
+        return Parser.find_specs(text)['bhp']
 
     @staticmethod
     def find_weight(text: str) -> int | None:
         """Find weight values from text."""
-        patterns = [
-            r'(\d{3})\s*(?:kg|kilograms)',
-        ]
-        for p in patterns:
-            m = re.search(p, text, re.IGNORECASE)
-            if m:
-                val = int(m.group(1))
-                if 700 <= val <= 820:
-                    return val
-        return None
+        return Parser.find_specs(text)['weight']
 
     @staticmethod
     def find_wheelbase(text: str) -> int | None:
         """Find wheelbase values from text."""
-        m = re.search(r'(\d{4})\s*mm', text, re.IGNORECASE)
-        if m:
-            val = int(m.group(1))
-            if 3000 <= val <= 3800:
-                return val
-        return None
+        return Parser.find_specs(text)['wheelbase']
 
     @staticmethod
-    def extract_team_news(soup, team_keywords: list[str]) -> list[str]:
-        """Extract news snippets related to a team from HTML soup."""
+    def extract_page(soup, team_keywords: list[str], max_news: int = 3) -> dict:
+        """
+        One walk over the document's strings: builds the page text for spec matching
+        and the p/h2/h3/li block texts for news in the same pass.
+        """
         if not soup:
+            return {'bhp': None, 'weight': None, 'wheelbase': None, 'news': []}
+
+        chunks = []
+        blocks = {}       # id(tag) -> [stripped strings], insertion = document order
+        enclosing = {}    # id(tag) -> news-tag ancestors (outermost first), memoised per parent
+
+        def news_ancestors(tag):
+            key = id(tag)
+            if key not in enclosing:
+                path = []
+                node = tag
+                while node is not None and id(node) not in enclosing:
+                    path.append(node)
+                    node = node.parent
+                acc = enclosing[id(node)] if node is not None else ()
+                for el in reversed(path):
+                    if el.name in Parser.NEWS_TAGS:
+                        acc = acc + (id(el),)
+                    enclosing[id(el)] = acc
+            return enclosing[key]
+
+        for s in soup.strings:
+            chunks.append(s)
+            owners = news_ancestors(s.parent)
+            if owners:
+                stripped = s.strip()
+                for owner in owners:
+                    parts = blocks.setdefault(owner, [])
+                    if stripped:
+                        parts.append(stripped)
+
+        specs = Parser.find_specs(''.join(chunks))
+        specs['news'] = Parser._match_news((''.join(p) for p in blocks.values()),
+                                           team_keywords, max_news)
+        return specs
+
+    @staticmethod
+    def _match_news(texts, team_keywords: list[str], max_news: int) -> list[str]:
+        if not any(team_keywords):
             return []
-        news = []
-        texts = [el.get_text(strip=True) for el in soup.find_all(['p', 'h2', 'h3', 'li'])]
+        kw_re = re.compile('|'.join(re.escape(kw) for kw in team_keywords if kw), re.IGNORECASE)
+        news, seen = [], set()
         for text in texts:
-            text_lower = text.lower()
-            if any(kw.lower() in text_lower for kw in team_keywords):
-                if len(text) > 30 and len(text) < 300:
-                    cleaned = re.sub(r'\s+', ' ', text).strip()
-                    if cleaned and cleaned not in news:
-                        news.append(cleaned)
-                        if len(news) >= 3:
-                            break
+            if 30 < len(text) < 300 and kw_re.search(text):
+                cleaned = Parser.WS_RE.sub(' ', text).strip()
+                if cleaned and cleaned not in seen:
+                    seen.add(cleaned)
+                    news.append(cleaned)
+                    if len(news) >= max_news:
+                        break
         return news
 
+    @staticmethod
+    def extract_team_news(soup, team_keywords: list[str]) -> list[str]:
+        """Extract news snippets related to a team from HTML soup."""
+        return Parser.extract_page(soup, team_keywords)['news'] if soup else []
+
 
 # ============================================================
 # SCRAPER MODULE
 # ============================================================
 class F1Scraper:
-    def __init__(self, db: Database, http: HTTPClient, dry_run: bool = False):
+    def __init__(self, db: Database, http: HTTPClient, dry_run: bool = False,
+                 concurrency: int = DEFAULT_CONCURRENCY, cache: PageCache | None = None):
         self.db = db
         self.http = http
         self.dry_run = dry_run
+        self.concurrency = max(1, concurrency)
+        self.cache = cache
         self.news_buffer = []
 
     def scrape_all(self) -> dict:
@@ -316,22 +702,24 @@ class F1Scraper:
         log.info(f"Timestamp: {datetime.now().isoformat()}")
         log.info("=" * 60)
 
-        results = {"updated": [], "failed": [], "no_change": []}
-
-        for team_id in TEAM_URLS.keys():
-            try:
-                updated = self.scrape_team(team_id)
-                if updated:
-                    results["updated"].append(team_id)
-                else:
-                    results["no_change"].append(team_id)
-            except Exception as e:
-                log.error(f"Failed to scrape {team_id}: {e}")
-                results["failed"].append(team_id)
-            time.sleep(REQUEST_DELAY)
-
-        # Scrape general F1 news
-        self._scrape_f1_news()
+        if self.concurrency > 1:
+            results = self._scrape_all_concurrent()
+        else:
+            results = {"updated": [], "failed": [], "no_change": []}
+
+            for team_id in TEAM_URLS.keys():
+                try:
+                    updated = self.scrape_team(team_id)
+                    if updated:
+                        results["updated"].append(team_id)
+                    else:
+                        results["no_change"].append(team_id)
+                except Exception as e:
+                    log.error(f"Failed to scrape {team_id}: {e}")
+                    results["failed"].append(team_id)
+
+            # Scrape general F1 news
+            self._scrape_f1_news()
 
         # Update meta
         self.db.update_meta()
@@ -344,6 +732,70 @@ class F1Scraper:
         log.info(f"\nUpdate complete: {results}")
         return results
 
+    def _scrape_all_concurrent(self) -> dict:
+        """Fetch every team and news page in a thread pool; merge results on this thread as they finish.
+
+        Workers only fetch and parse. Database writes and the news buffer are touched here, and
+        the final tallies and news order follow TEAM_URLS/SOURCES order so output matches the
+        serial path.
+        """
+        log.info(f"Concurrent fetch: {self.concurrency} workers")
+        results = {"updated": [], "failed": [], "no_change": []}
+        team_news = {}
+        source_headlines = {}
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = {}
+            for team_id, url in TEAM_URLS.items():
+                team = self.db.get_team(team_id)
+                if not team:
+                    log.warning(f"Team not found in DB: {team_id}")
+                    results["no_change"].append(team_id)
+                    continue
+                log.info(f"--- Queued: {team['name']} → {url}")
+                futures[pool.submit(self._fetch_team_page, team, url)] = ('team', team_id, team)
+            for source_id, source in SOURCES.items():
+                if source['type'] not in ('technical', 'official'):
+                    continue
+                futures[pool.submit(self._fetch_headlines, source['url'])] = ('news', source_id, None)
+
+            for fut in as_completed(futures):
+                kind, key, team = futures[fut]
+                if kind == 'news':
+                    try:
+                        headlines = fut.result()
+                    except Exception as e:
+                        log.error(f"Failed to scrape news source {key}: {e}")
+                        continue
+                    if headlines:
+                        log.info(f"  → {len(headlines)} headlines from {key}")
+                        source_headlines[key] = headlines[:3]
+                    continue
+                try:
+                    page = fut.result()
+                    if page is None:
+                        log.warning(f"Could not fetch page for {key}")
+                        updated = False
+                    else:
+                        updated = self._apply_team_page(key, team, page)
+                        team_news[key] = page['news']
+                except Exception as e:
+                    log.error(f"Failed to scrape {key}: {e}")
+                    results["failed"].append(key)
+                    continue
+                results["updated" if updated else "no_change"].append(key)
+
+        order = list(TEAM_URLS.keys())
+        for bucket in results.values():
+            bucket.sort(key=order.index)
+        for team_id in order:
+            team = self.db.get_team(team_id)
+            if team and team_news.get(team_id):
+                self.news_buffer.extend([f"{team['name']}: {n}" for n in team_news[team_id]])
+        for source_id in SOURCES:
+            self.news_buffer.extend(source_headlines.get(source_id, []))
+        return results
+
     def scrape_team(self, team_id: str) -> bool:
         """Scrape data for a specific team. Returns True if data was updated."""
         team = self.db.get_team(team_id)
@@ -357,38 +809,73 @@ class F1Scraper:
             return False
 
         log.info(f"\n--- Scraping: {team['name']} → {url}")
-        soup = self.http.get_soup(url)
+        page = self._fetch_team_page(team, url)
 
-        if not soup:
+        if page is None:
             log.warning(f"Could not fetch page for {team_id}")
             return False
 
+        if page['news']:
+            self.news_buffer.extend([f"{team['name']}: {n}" for n in page['news']])
+        return self._apply_team_page(team_id, team, page)
+
+    def _fetch_extract(self, url: str, extract):
+        """Fetch url and return extract(soup), reusing the cached extraction if the page is unchanged.
+
+        Returns None when the page could not be fetched or parsed.
+        """
+        if not self.cache:
+            soup = self.http.get_soup(url)
+            return extract(soup) if soup else None
+
+        entry = self.cache.lookup(url)
+        resp = self.http.get_response(url, headers=PageCache.conditional_headers(entry))
+        if resp is None:
+            return None
+        if entry and resp.status_code == 304:
+            return self.cache.hit(url, resp)
+        body_hash = hashlib.sha256(resp.content).hexdigest()
+        if entry and entry['hash'] == body_hash:
+            log.info(f"  → Unchanged content for {url}, skipping parse")
+            return self.cache.hit(url, resp)
+
+        soup = self.http.parse(resp.text, url)
+        if not soup:
+            return None
+        result = extract(soup)
+        self.cache.store(url, resp, body_hash, result)
+        return result
+
+    def _fetch_team_page(self, team: dict, url: str) -> dict | None:
+        """Fetch and parse a team page into spec candidates + news. Safe to run in a worker thread."""
+        keywords = [team['name'], team['chassis']]
+        return self._fetch_extract(url, lambda soup: Parser.extract_page(soup, keywords))
+
+    def _apply_team_page(self, team_id: str, team: dict, page: dict) -> bool:
+        """Diff extracted page values against the DB and apply any changes. Returns True if updated."""
         updates = {}
-        page_text = soup.get_text()
 
         # Try to extract BHP data
-        bhp = Parser.find_bhp(page_text)
+        bhp = page['bhp']
         if bhp and abs(bhp - team['power_unit']['total_power_bhp']) > 5:
             log.info(f"  → BHP update: {team['power_unit']['total_power_bhp']} → {bhp}")
             updates['power_unit'] = {'total_power_bhp': bhp, 'data_status': 'partial'}
 
         # Try to extract weight data
-        weight = Parser.find_weight(page_text)
+        weight = page['weight']
         if weight and weight != team['chassis_aero']['weight_kg']:
             log.info(f"  → Weight update: {team['chassis_aero']['weight_kg']} → {weight}")
             updates.setdefault('chassis_aero', {})['weight_kg'] = weight
 
         # Try to extract wheelbase
-        wb = Parser.find_wheelbase(page_text)
+        wb = page['wheelbase']
         if wb and wb != team['chassis_aero']['wheelbase_mm']:
             log.info(f"  → Wheelbase update: {team['chassis_aero']['wheelbase_mm']} → {wb}")
             updates.setdefault('chassis_aero', {})['wheelbase_mm'] = wb
 
         # Extract relevant news
-        news = Parser.extract_team_news(soup, [team['name'], team['chassis']])
-        if news:
-            log.info(f"  → Found {len(news)} news snippets")
-            self.news_buffer.extend([f"{team['name']}: {n}" for n in news])
+        if page['news']:
+            log.info(f"  → Found {len(page['news'])} news snippets")
 
         if updates:
             self.db.update_team(team_id, updates)
@@ -403,17 +890,21 @@ class F1Scraper:
             if source['type'] not in ('technical', 'official'):
                 continue
             log.info(f"\n--- Scraping news source: {source_id}")
-            soup = self.http.get_soup(source['url'])
-            if not soup:
-                continue
+            headlines = self._fetch_headlines(source['url'])
+            if headlines:
+                log.info(f"  → {len(headlines)} headlines from {source_id}")
+                self.news_buffer.extend(headlines[:3])
+
+    def _fetch_headlines(self, url: str) -> list[str]:
+        """Fetch a news page and return F1-relevant headlines. Safe to run in a worker thread."""
+        def extract(soup):
             headlines = []
             for tag in soup.find_all(['h2', 'h3'], limit=20):
                 text = tag.get_text(strip=True)
                 if len(text) > 20 and any(kw in text.lower() for kw in ['f1', 'formula 1', '2026', 'chassis', 'engine', 'power unit']):
                     headlines.append(text[:200])
-            if headlines:
-                log.info(f"  → {len(headlines)} headlines from {source_id}")
-                self.news_buffer.extend(headlines[:3])
+            return headlines
+        return self._fetch_extract(url, extract) or []
 
 
 # ============================================================
@@ -566,16 +1057,58 @@ def main():
     parser.add_argument('--report', action='store_true', help='Generate weekly report only')
     parser.add_argument('--csv', action='store_true', help='Export CSV only')
     parser.add_argument('--schedule', action='store_true', help='Run as scheduled weekly updater')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Parallel fetch workers (1 = serial; politeness delay is kept per host)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the page cache: unconditional GETs and full re-parse of every page')
+    parser.add_argument('--journal', action='store_true',
+                        help='Journaled DB: record every change in a journal; the JSON is folded after each cycle')
+    parser.add_argument('--compact', action='store_true',
+                        help='With --journal: fold the journal into the JSON snapshot and exit')
+    parser.add_argument('--as-of', type=int, metavar='SEQ',
+                        help='Print the database as it was at journal entry SEQ and exit')
+    parser.add_argument('--simulate', action='store_true',
+                        help='Write per-round Monte Carlo predictions to data/ (with --schedule: after each update)')
+    parser.add_argument('--sims', type=int, default=100_000, help='Simulations per round for --simulate')
     args = parser.parse_args()
 
-    db = Database(DB_PATH)
+    db = Database(DB_PATH, journal=args.journal or args.compact or args.as_of is not None)
     data = db.load()
     if not data and not args.report:
         log.error("Database not found or empty. Cannot proceed.")
         sys.exit(1)
 
-    http = HTTPClient()
-    scraper = F1Scraper(db, http, dry_run=args.dry_run)
+    if args.as_of is not None:
+        try:
+            snapshot = db.as_of(args.as_of)
+        except FileNotFoundError as e:
+            log.error(f"{e} — --as-of needs a DB that has been saved with --journal")
+            sys.exit(1)
+        print(json.dumps(snapshot, indent=2, ensure_ascii=False))
+        return
+
+    if args.compact:
+        db.compact()
+        return
+
+    def simulate():
+        try:
+            import simulator
+        except ImportError as e:
+            log.error(f"--simulate needs numpy ({e}). Install with: pip install numpy")
+            return
+        t0 = time.perf_counter()
+        result = simulator.write_predictions(sims=args.sims, db_path=DB_PATH)
+        log.info(f"Simulated {len(result['rounds'])} rounds × {args.sims} sims in "
+                 f"{time.perf_counter() - t0:.1f}s → {simulator.SIM_OUTPUT_PATH}")
+
+    if args.simulate and not args.schedule:
+        simulate()
+        return
+
+    cache = None if args.no_cache else PageCache(PAGE_CACHE_PATH).load()
+    http = HTTPClient(concurrency=args.concurrency, revalidate=cache is not None)
+    scraper = F1Scraper(db, http, dry_run=args.dry_run, concurrency=args.concurrency, cache=cache)
     report_gen = ReportGenerator(db)
     csv_exp = CSVExporter(db)
 
@@ -597,10 +1130,19 @@ def main():
             results = scraper.scrape_all()
             log.info(f"Full update: {results}")
 
+        if cache is not None:
+            cache.save()
+
         if not args.dry_run:
-            db.save(db.get_data())
+            # the site reads the JSON snapshot, so a journaled cycle still folds into it before exiting
+            if db.journal:
+                db.compact()
+            else:
+                db.save(db.get_data())
             csv_exp.export()
             report_gen.save_report()
+            if args.simulate:
+                simulate()
 
     if args.schedule:
         scheduler = Scheduler()
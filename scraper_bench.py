@@ -0,0 +1,453 @@
+"""
+F1 2026 Technical Intelligence System — Offline Scraper Benchmark
+=================================================================
+Serves the TEAM_URLS / SOURCES pages from local fixture HTTP servers and runs the real
+F1Scraper / HTTPClient / Parser against them. No network access required.
+
+Each page gets its own local server (own host:port), so the per-host politeness
+throttle behaves as it does against the real sites. Pages come from recorded copies
+in data/bench_fixtures/ when present, otherwise from deterministic synthetic pages
+that can be scaled up with --scale.
+
+Usage:
+    python scraper_bench.py                          # concurrency 1,8 × cache none/cold/warm
+    python scraper_bench.py --concurrency 1,4,16 --latency-ms 120 --scale 20
+    python scraper_bench.py --compare data/bench/old.json --max-regression 10
+    python scraper_bench.py --record                 # one-off: save live pages as fixtures (needs network)
+"""
+
+import json
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+import hashlib
+import platform
+import tempfile
+import threading
+import tracemalloc
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+import scraper
+from scraper import Database, HTTPClient, F1Scraper, PageCache, DATA_DIR, DB_PATH, log
+
+# ============================================================
+# CONFIG
+# ============================================================
+FIXTURE_DIR = DATA_DIR / "bench_fixtures"
+RESULTS_DIR = DATA_DIR / "bench"
+BASE_BLOCKS = 120          # text blocks in a scale=1 synthetic page
+STAGES = ('fetch', 'parse', 'extract', 'merge')
+PERCENTILES = (50, 90, 95, 99)
+
+
+# ============================================================
+# FIXTURES
+# ============================================================
+def fixture_pages() -> dict:
+    """(kind, key) -> live URL for every page a full scrape_all touches."""
+    pages = {('team', tid): url for tid, url in scraper.TEAM_URLS.items()}
+    pages.update({('source', sid): src['url'] for sid, src in scraper.SOURCES.items()})
+    return pages
+
+
+def fixture_path(kind: str, key: str) -> Path:
+    return FIXTURE_DIR / f"{kind}_{key}.html"
+
+
+def synthetic_page(kind: str, key: str, scale: int, teams: list[dict], seed: int = 2026) -> str:
+    """Deterministic stand-in page: nav/script boilerplate plus team-relevant blocks and spec figures."""
+    rng = random.Random(f"{seed}:{kind}:{key}")
+    team = next((t for t in teams if t['id'] == key), None)
+    names = [team['name'], team['chassis']] if team else [t['name'] for t in teams]
+    words = ("the new floor package brings a revised front wing and updated sidepod inlets for "
+             "improved cooling while the power unit team reports better energy deployment on "
+             "long straights during the latest simulator correlation work at the factory").split()
+    specs = ("{} bhp", "{} hp", "{} kg", "{} mm", "{} ps")
+
+    def sentence(n):
+        out = [rng.choice(words) for _ in range(n)]
+        if rng.random() < 0.35:
+            out.insert(rng.randrange(len(out)), rng.choice(names))
+        if rng.random() < 0.15:
+            fmt = rng.choice(specs)
+            val = {'{} kg': rng.randint(760, 800), '{} mm': rng.randint(3400, 3600)}.get(fmt, rng.randint(900, 1100))
+            out.insert(rng.randrange(len(out)), fmt.format(val))
+        return ' '.join(out).capitalize() + '.'
+
+    parts = ['<!DOCTYPE html><html><head><title>', key, '</title>',
+             '<script>window.dataLayer=[];function gtag(){dataLayer.push(arguments)}</script>',
+             '<style>body{font-family:sans-serif}</style></head><body><nav><ul>']
+    parts += [f'<li><a href="/s/{i}">Section {i}</a></li>' for i in range(12)]
+    parts.append('</ul></nav><main>')
+    for i in range(BASE_BLOCKS * max(1, scale)):
+        r = rng.random()
+        if kind == 'source' and r < 0.2:
+            parts.append(f'<h2>F1 2026 {sentence(rng.randint(4, 10))}</h2>')
+        elif r < 0.3:
+            parts.append(f'<h3>{sentence(rng.randint(4, 9))}</h3>')
+        elif r < 0.45:
+            parts.append('<ul>' + ''.join(f'<li>{sentence(rng.randint(5, 12))}</li>' for _ in range(3)) + '</ul>')
+        elif r < 0.85:
+            parts.append(f'<p>{sentence(rng.randint(10, 40))}</p>')
+        else:
+            parts.append(f'<div class="card"><span>{sentence(rng.randint(3, 8))}</span>'
+                         f'<img src="/img/{i}.jpg" alt=""></div>')
+    parts.append('</main><footer><p>© 2026</p></footer></body></html>')
+    return ''.join(parts)
+
+
+def load_fixtures(scale: int, synthetic: bool, teams: list[dict]) -> dict:
+    """(kind, key) -> (html bytes, origin) where origin is 'recorded' or 'synthetic'."""
+    out = {}
+    for kind, key in fixture_pages():
+        path = fixture_path(kind, key)
+        if not synthetic and path.exists():
+            out[(kind, key)] = (path.read_bytes(), 'recorded')
+        else:
+            out[(kind, key)] = (synthetic_page(kind, key, scale, teams).encode('utf-8'), 'synthetic')
+    return out
+
+
+def record_fixtures() -> None:
+    """Fetch every live page once and store it under data/bench_fixtures/."""
+    FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+    http = HTTPClient()
+    for (kind, key), url in fixture_pages().items():
+        html = http.get(url)
+        if html:
+            fixture_path(kind, key).write_text(html, encoding='utf-8')
+            log.info(f"Recorded {kind}/{key}: {len(html)} chars")
+        else:
+            log.warning(f"Could not record {kind}/{key} from {url}")
+
+
+# ============================================================
+# FIXTURE SERVER
+# ============================================================
+class FixtureServer:
+    """One ThreadingHTTPServer per page, so every page lives on its own host:port."""
+
+    def __init__(self, fixtures: dict, latency_ms: float = 0.0, jitter_ms: float = 0.0):
+        self.fixtures = fixtures
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.status_counts = {}
+        self._lock = threading.Lock()
+        self._servers = []
+        self.urls = {}
+
+    def _handler(self, body: bytes):
+        server = self
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                delay = server.latency + (random.uniform(0, server.jitter) if server.jitter else 0)
+                if delay:
+                    time.sleep(delay)
+                if self.headers.get('If-None-Match') == etag:
+                    server._count(304)
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                server._count(200)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def _count(self, status: int) -> None:
+        with self._lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def take_counts(self) -> dict:
+        with self._lock:
+            counts, self.status_counts = self.status_counts, {}
+        return {str(k): v for k, v in sorted(counts.items())}
+
+    def start(self) -> 'FixtureServer':
+        for page, (body, _) in self.fixtures.items():
+            srv = ThreadingHTTPServer(('127.0.0.1', 0), self._handler(body))
+            srv.daemon_threads = True
+            threading.Thread(target=srv.serve_forever, daemon=True).start()
+            self._servers.append(srv)
+            self.urls[page] = f"http://127.0.0.1:{srv.server_address[1]}/{page[0]}/{page[1]}"
+        return self
+
+    def stop(self) -> None:
+        for srv in self._servers:
+            srv.shutdown()
+            srv.server_close()
+
+
+class patched_targets:
+    """Point TEAM_URLS / SOURCES / REQUEST_DELAY at the fixture servers for the duration of a block."""
+
+    def __init__(self, urls: dict, delay: float):
+        self.urls = urls
+        self.delay = delay
+
+    def __enter__(self):
+        self._teams = dict(scraper.TEAM_URLS)
+        self._sources = {sid: src['url'] for sid, src in scraper.SOURCES.items()}
+        self._delay = scraper.REQUEST_DELAY
+        for (kind, key), url in self.urls.items():
+            if kind == 'team':
+                scraper.TEAM_URLS[key] = url
+            else:
+                scraper.SOURCES[key]['url'] = url
+        scraper.REQUEST_DELAY = self.delay
+        return self
+
+    def __exit__(self, *exc):
+        scraper.TEAM_URLS.update(self._teams)
+        for sid, url in self._sources.items():
+            scraper.SOURCES[sid]['url'] = url
+        scraper.REQUEST_DELAY = self._delay
+
+
+# ============================================================
+# INSTRUMENTATION
+# ============================================================
+class StageTimer:
+    """Wraps the scraper's stage boundaries on one instance and collects per-call latencies."""
+
+    def __init__(self):
+        self.samples = {stage: [] for stage in STAGES}
+        self._lock = threading.Lock()
+
+    def wrap(self, stage: str, fn):
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - t0
+                with self._lock:
+                    self.samples[stage].append(elapsed)
+        return timed
+
+    def instrument(self, sc: F1Scraper) -> None:
+        # fetch = HTTP round trip, parse = HTML → tree, extract = tree → specs/news, merge = diff + DB update
+        sc.http.get_response = self.wrap('fetch', sc.http.get_response)
+        sc.http.parse = self.wrap('parse', sc.http.parse)
+        fetch_extract = sc._fetch_extract
+        sc._fetch_extract = lambda url, extract: fetch_extract(url, self.wrap('extract', extract))
+        sc._apply_team_page = self.wrap('merge', sc._apply_team_page)
+
+
+def percentile(sorted_vals: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_vals:
+        return 0.0
+    rank = max(1, -(-len(sorted_vals) * q // 100))
+    return sorted_vals[int(rank) - 1]
+
+
+def summarize(samples: list[float]) -> dict:
+    vals = sorted(samples)
+    ms = lambda v: round(v * 1000, 3)
+    out = {'count': len(vals), 'total_ms': ms(sum(vals)),
+           'mean_ms': ms(sum(vals) / len(vals)) if vals else 0.0}
+    out.update({f'p{q}_ms': ms(percentile(vals, q)) for q in PERCENTILES})
+    out['max_ms'] = ms(vals[-1]) if vals else 0.0
+    return out
+
+
+# ============================================================
+# BENCHMARK RUNNER
+# ============================================================
+def run_once(concurrency: int, cache: PageCache | None, track_memory: bool) -> dict:
+    db = Database(DB_PATH)
+    db.load()
+    http = HTTPClient(concurrency=concurrency, revalidate=cache is not None)
+    sc = F1Scraper(db, http, dry_run=True, concurrency=concurrency, cache=cache)
+    timer = StageTimer()
+    timer.instrument(sc)
+    hits0, misses0 = (cache.hits, cache.misses) if cache is not None else (0, 0)
+
+    if track_memory:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    results = sc.scrape_all()
+    wall = time.perf_counter() - t0
+    peak = 0
+    if track_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    run = {
+        'wall_s': round(wall, 4),
+        'peak_mem_mb': round(peak / 2**20, 3) if track_memory else None,
+        'stage_total_ms': {s: round(sum(v) * 1000, 3) for s, v in timer.samples.items()},
+        'updated': len(results['updated']),
+        'failed': len(results['failed']),
+        'news': len(sc.news_buffer),
+    }
+    if cache is not None:
+        run['cache'] = {'hits': cache.hits - hits0, 'misses': cache.misses - misses0}
+    return run, timer.samples
+
+
+def run_scenario(name: str, server: FixtureServer, concurrency: int, cache_for_run,
+                 repeat: int, track_memory: bool) -> dict:
+    """``cache_for_run()`` supplies the PageCache (or None) for each repeat."""
+    runs, pooled = [], {s: [] for s in STAGES}
+    for _ in range(repeat):
+        server.take_counts()
+        run, samples = run_once(concurrency, cache_for_run(), track_memory)
+        run['http_status'] = server.take_counts()
+        # pages the fixture servers actually answered; failed fetches never reach them
+        pages = run['http_status'].get('200', 0) + run['http_status'].get('304', 0)
+        run['pages'] = pages
+        run['pages_per_sec'] = round(pages / run['wall_s'], 3) if run['wall_s'] else 0.0
+        runs.append(run)
+        for s in STAGES:
+            pooled[s].extend(samples[s])
+    pps = sorted(r['pages_per_sec'] for r in runs)
+    scenario = {
+        'name': name,
+        'concurrency': concurrency,
+        'pages_per_sec_median': pps[len(pps) // 2],
+        'peak_mem_mb_max': max((r['peak_mem_mb'] or 0) for r in runs) if track_memory else None,
+        'stages': {s: summarize(v) for s, v in pooled.items()},
+        'runs': runs,
+    }
+    log.warning(f"{name:<16} {scenario['pages_per_sec_median']:>8.2f} pages/s  "
+                + '  '.join(f"{s} p50={scenario['stages'][s]['p50_ms']:.1f}ms p95={scenario['stages'][s]['p95_ms']:.1f}ms"
+                            for s in STAGES))
+    return scenario
+
+
+def compare(current: dict, baseline_path: Path, max_regression: float | None) -> bool:
+    """Print pages/sec deltas against an earlier results file. False if any scenario regressed too far."""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {s['name']: s for s in json.load(f)['scenarios']}
+    ok = True
+    print(f"\nvs {baseline_path.name}:")
+    for s in current['scenarios']:
+        old = baseline.get(s['name'])
+        if not old or not old['pages_per_sec_median']:
+            print(f"  {s['name']:<16} (no baseline)")
+            continue
+        delta = (s['pages_per_sec_median'] / old['pages_per_sec_median'] - 1) * 100
+        flag = ''
+        if max_regression is not None and delta < -max_regression:
+            flag, ok = '  ← REGRESSION', False
+        print(f"  {s['name']:<16} {old['pages_per_sec_median']:>8.2f} → {s['pages_per_sec_median']:>8.2f} pages/s ({delta:+.1f}%){flag}")
+    return ok
+
+
+# ============================================================
+# CLI
+# ============================================================
+def main():
+    parser = argparse.ArgumentParser(description="Offline F1Scraper benchmark against local fixture servers")
+    parser.add_argument('--concurrency', default='1,8', help='Comma-separated worker counts to benchmark')
+    parser.add_argument('--cache', default='none,cold,warm',
+                        help='Comma-separated cache modes: none, cold (empty PageCache), warm (after a cold run)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per scenario')
+    parser.add_argument('--scale', type=int, default=1, help='Synthetic page size multiplier')
+    parser.add_argument('--synthetic', action='store_true', help='Ignore recorded fixtures, use synthetic pages only')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Simulated server latency per request')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Extra uniform random latency per request')
+    parser.add_argument('--delay', type=float, default=0.0, help='Per-host REQUEST_DELAY during the benchmark')
+    parser.add_argument('--no-memory', action='store_true', help='Skip tracemalloc (it slows parsing noticeably)')
+    parser.add_argument('--out', type=Path, help='Results JSON path (default: data/bench/scraper_<timestamp>.json)')
+    parser.add_argument('--compare', type=Path, help='Earlier results JSON to compare pages/sec against')
+    parser.add_argument('--max-regression', type=float,
+                        help='With --compare: exit 1 if any scenario is more than this %% slower')
+    parser.add_argument('--record', action='store_true', help='Record live pages into data/bench_fixtures/ and exit')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Keep the scraper\'s per-request logging')
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures()
+        return
+
+    if not args.verbose:
+        log.setLevel(logging.WARNING)
+    # fixture servers are local; never route them through an HTTP proxy from the environment
+    os.environ['NO_PROXY'] = ','.join(filter(None, [os.environ.get('NO_PROXY'), '127.0.0.1', 'localhost']))
+
+    teams = Database(DB_PATH).load().get('teams', [])
+    fixtures = load_fixtures(args.scale, args.synthetic, teams)
+    server = FixtureServer(fixtures, args.latency_ms, args.jitter_ms).start()
+    concurrencies = [int(c) for c in args.concurrency.split(',') if c.strip()]
+    modes = [m.strip() for m in args.cache.split(',') if m.strip()]
+
+    scenarios = []
+    try:
+        with patched_targets(server.urls, args.delay), tempfile.TemporaryDirectory() as tmp:
+            for c in concurrencies:
+                def fresh_cache():
+                    return PageCache(Path(tmp) / f"page_cache_c{c}.json")
+                warm = None
+                for mode in modes:
+                    if mode == 'none':
+                        cache_for_run = lambda: None
+                    elif mode == 'cold':
+                        cache_for_run = fresh_cache
+                    elif mode == 'warm':
+                        if warm is None:
+                            warm = fresh_cache()
+                            run_once(c, warm, False)   # populate validators + extractions
+                        cache_for_run = lambda: warm
+                    else:
+                        parser.error(f"unknown cache mode: {mode}")
+                    scenarios.append(run_scenario(f"c{c}/{mode}", server, c, cache_for_run,
+                                                  args.repeat, not args.no_memory))
+    finally:
+        server.stop()
+
+    result = {
+        'generated': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'env': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'html_parser': scraper.HTML_PARSER,
+        },
+        'config': {
+            'scale': args.scale,
+            'latency_ms': args.latency_ms,
+            'jitter_ms': args.jitter_ms,
+            'request_delay': args.delay,
+            'repeat': args.repeat,
+            'pages': {f"{k}/{key}": {'bytes': len(body), 'origin': origin}
+                      for (k, key), (body, origin) in fixtures.items()},
+        },
+        'scenarios': scenarios,
+    }
+    out = args.out or RESULTS_DIR / f"scraper_{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+    print(f"\nResults written to {out}")
+
+    empty = [s['name'] for s in scenarios if any(r['pages'] == 0 for r in s['runs'])]
+    if empty:
+        log.error(f"No pages served in {', '.join(empty)} — every fetch failed, the numbers are meaningless")
+        sys.exit(1)
+
+    if args.compare and not compare(result, args.compare, args.max_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,875 @@
+"""
+F1 2026 Technical Intelligence System — Headless Monte Carlo Simulator
+======================================================================
+NumPy port of the race model the site runs: MonteCarloEngine._runBatch in predictions.js,
+as executed by the MonteCarloWorker.js pool. Used to precompute per-round predictions
+server-side right after the scraper refreshes the data files.
+
+Each sim runs the same stages as the worker:
+  weather → Q1/Q2/Q3 qualifying → component DNF rolls → calculatePace with track grip →
+  dirty air/DRS, GridRecoveryCurves grid penalty, safety-car and upset effects, strategy
+  and pit stops → safety-car restart → rivalry incidents, then a lap-by-lap Markov race
+  (MarkovLapSimulator.simulateBatch) blended in at MARKOV_WEIGHT.
+
+Model state is the season start the site has before any results are entered: level
+standings (so team orders never fire), no form history (every driver counts as a
+rookie), default ML weights and Elo, no live session or what-if scenario.
+
+Team pace, reliability and the driver line-up come from data/f1_2026_cars.json, the DB
+the scraper writes. BASE_IDX and the component failure rates were fitted against the
+specs in BASE_SPECS; each team's rating moves with its power-to-weight relative to the
+field and its failure rates with its race-completion rate, so an unchanged DB gives the
+site's numbers. Without the DB the mirrored constants are used as they are.
+
+Sims run in sims × drivers batches of BATCH_SIMS. Each sim's weather roll is the site's own
+(the first draw of its Park-Miller stream, which barely moves between consecutive seeds);
+every other draw comes from NumPy's PCG64 seeded per round, so results match the site in
+distribution rather than sim for sim.
+
+Usage:
+    python scraper.py --simulate                 # 100k sims per round → data/sim_predictions_2026.json
+    python simulator.py --sims 20000 --round 3   # standalone
+"""
+
+import json
+import math
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).parent
+DATA_DIR = BASE_DIR / "data"
+DB_PATH = DATA_DIR / "f1_2026_cars.json"
+CALENDAR_PATH = DATA_DIR / "race_calendar_2026.json"
+SIM_OUTPUT_PATH = DATA_DIR / "sim_predictions_2026.json"
+
+DEFAULT_SIMS = 100_000
+BATCH_SIMS = 20_000      # sims per vectorised batch (bounds peak memory)
+
+# ============================================================
+# MODEL CONSTANTS — mirrored from predictions.js and the engines the worker loads
+# ============================================================
+# (id, full name, team, rating) — DRIVERS
+DRIVERS = [
+    ('leclerc', 'Charles Leclerc', 'ferrari', 94), ('hamilton', 'Lewis Hamilton', 'ferrari', 95),
+    ('norris', 'Lando Norris', 'mclaren', 91), ('piastri', 'Oscar Piastri', 'mclaren', 88),
+    ('antonelli', 'Kimi Antonelli', 'mercedes', 83), ('russell', 'George Russell', 'mercedes', 85),
+    ('verstappen', 'Max Verstappen', 'red_bull', 95), ('hadjar', 'Isack Hadjar', 'red_bull', 79),
+    ('gasly', 'Pierre Gasly', 'alpine', 82), ('colapinto', 'Franco Colapinto', 'alpine', 78),
+    ('bearman', 'Oliver Bearman', 'haas', 79), ('ocon', 'Esteban Ocon', 'haas', 80),
+    ('bortoleto', 'Gabriel Bortoleto', 'audi', 80), ('hulkenberg', 'Nico Hulkenberg', 'audi', 80),
+    ('lawson', 'Liam Lawson', 'racing_bulls', 79), ('lindblad', 'Arvid Lindblad', 'racing_bulls', 76),
+    ('sainz', 'Carlos Sainz', 'williams', 87), ('albon', 'Alexander Albon', 'williams', 84),
+    ('bottas', 'Valtteri Bottas', 'cadillac', 80), ('perez', 'Sergio Perez', 'cadillac', 81),
+    ('alonso', 'Fernando Alonso', 'aston_martin', 88), ('stroll', 'Lance Stroll', 'aston_martin', 72),
+]
+NEW_DRIVER_RATING = 78   # DB drivers predictions.js does not list yet
+
+# BASE_IDX — what DynamicModel.getTeamRating returns before any results are recorded
+BASE_IDX = {
+    'ferrari': 91.5, 'mclaren': 90.6, 'mercedes': 88.3, 'red_bull': 78.8,
+    'alpine': 81.7, 'haas': 80.8, 'audi': 73.0, 'racing_bulls': 69.4,
+    'williams': 63.85, 'cadillac': 55.9, 'aston_martin': 28.5,
+}
+
+# f1_2026_cars.json as BASE_IDX and COMPONENT_RATES were fitted: (total bhp, weight kg, race completion %)
+BASE_SPECS = {
+    'ferrari': (1014, 770, 91), 'mclaren': (1005, 768, 96), 'mercedes': (1014, 768, 97),
+    'red_bull': (1009, 772, 90), 'alpine': (1005, 768, 87), 'haas': (1005, 768, 88),
+    'audi': (1009, 768, 82), 'racing_bulls': (1005, 768, 86), 'williams': (1005, 768, 90),
+    'cadillac': (1005, 770, None), 'aston_martin': (1005, 768, 92),
+}
+RELIABILITY_CLAMP = (0.5, 2.0)
+
+# DriverSkillMatrix
+SKILLS = {
+    'leclerc': {'street': 1.06, 'technical': 1.05, 'qualifying': 1.08, 'wet': 0.96, 'tire': 0.98, 'racecraft': 1.02},
+    'hamilton': {'street': 1.02, 'technical': 1.04, 'qualifying': 1.01, 'wet': 1.08, 'tire': 1.06, 'racecraft': 1.05},
+    'verstappen': {'street': 1.04, 'technical': 1.07, 'high_speed': 1.08, 'wet': 1.08, 'tire': 1.05, 'racecraft': 1.07},
+    'norris': {'street': 1.03, 'technical': 1.06, 'high_speed': 1.05, 'wet': 1.02, 'tire': 1.04, 'qualifying': 1.06},
+    'piastri': {'street': 1.04, 'technical': 1.04, 'high_speed': 1.06, 'racecraft': 1.05, 'consistency': 1.08},
+    'alonso': {'street': 1.05, 'racecraft': 1.08, 'tire': 1.07, 'consistency': 1.06, 'wet': 1.04},
+    'sainz': {'technical': 1.05, 'street': 1.04, 'racecraft': 1.03, 'tire': 1.04, 'consistency': 1.05},
+    'antonelli': {'street': 0.98, 'qualifying': 1.04, 'technical': 1.02, 'wet': 1.00, 'racecraft': 0.97},
+}
+
+# DriverPersonalityMatrix: aggression, tire_smoothness, defense, mistake_rate, overtake_risk, restart_skill
+PERSONALITY = {
+    'verstappen': (1.08, 1.04, 1.09, 0.90, 1.08, 1.09), 'hamilton': (1.04, 1.08, 1.06, 0.92, 1.03, 1.05),
+    'leclerc': (1.06, 1.02, 1.05, 1.04, 1.06, 1.04), 'norris': (1.05, 1.04, 1.04, 0.98, 1.04, 1.06),
+    'piastri': (1.02, 1.06, 1.05, 0.94, 1.01, 1.03), 'russell': (1.06, 1.01, 1.04, 1.02, 1.05, 1.04),
+    'alonso': (1.05, 1.07, 1.09, 0.92, 1.04, 1.08), 'sainz': (1.03, 1.05, 1.06, 0.95, 1.02, 1.03),
+    'gasly': (1.04, 1.02, 1.04, 1.02, 1.03, 1.02), 'ocon': (1.06, 1.01, 1.08, 1.03, 1.04, 1.01),
+    'albon': (1.02, 1.05, 1.04, 0.97, 1.01, 1.02), 'stroll': (1.05, 0.98, 1.02, 1.08, 1.04, 1.03),
+    'perez': (1.04, 1.05, 1.05, 1.05, 1.03, 0.98), 'bottas': (0.98, 1.02, 1.01, 0.96, 0.98, 0.97),
+    'hulkenberg': (1.02, 1.03, 1.05, 0.98, 1.01, 1.01),
+}
+DEFAULT_PERSONALITY = (1.0, 1.0, 1.0, 1.0, 1.0, 1.0)
+
+# TrackDominanceMemory
+DOMINANCE = {
+    'leclerc': ('monaco', 'baku'), 'verstappen': ('suzuka', 'spa'), 'hamilton': ('silverstone', 'hungary'),
+    'perez': ('jeddah', 'baku'), 'norris': ('zandvoort', 'singapore'), 'alonso': ('brazil',),
+}
+
+# TechnicalRegs2026
+AERO_EFFICIENCY = {
+    'ferrari': 0.97, 'mclaren': 0.96, 'mercedes': 0.95, 'red_bull': 0.93, 'alpine': 0.90, 'haas': 0.89,
+    'audi': 0.87, 'racing_bulls': 0.88, 'williams': 0.86, 'cadillac': 0.84, 'aston_martin': 0.82,
+}
+MGUK_RECOVERY = {
+    'ferrari': 0.96, 'mclaren': 0.94, 'mercedes': 0.97, 'red_bull': 0.91, 'alpine': 0.93, 'haas': 0.90,
+    'audi': 0.88, 'racing_bulls': 0.89, 'williams': 0.92, 'cadillac': 0.85, 'aston_martin': 0.87,
+}
+CLUTCH = {
+    'verstappen': 1.06, 'hamilton': 1.05, 'alonso': 1.05, 'norris': 1.04, 'leclerc': 1.04, 'sainz': 1.03,
+    'russell': 1.03, 'piastri': 1.02, 'gasly': 1.02, 'albon': 1.02, 'bearman': 1.01, 'ocon': 1.01,
+    'hulkenberg': 1.01, 'bottas': 1.00, 'colapinto': 1.00, 'bortoleto': 1.01, 'lawson': 1.01,
+    'hadjar': 1.00, 'lindblad': 0.99, 'stroll': 0.98, 'perez': 1.00, 'antonelli': 1.01,
+}
+
+# HistoricalPerformanceMatrix (2025/2024/2023 weighted 0.5/0.3/0.2): dev_traj, reli_trend
+HISTORY = {
+    'ferrari': ((1.05, 1.03, 0.98), (1.02, 0.98, 0.95)),
+    'mclaren': ((1.07, 1.06, 0.95), (1.0, 1.0, 0.98)),
+    'mercedes': ((1.02, 0.98, 0.97), (1.0, 1.02, 1.05)),
+    'red_bull': ((0.98, 1.02, 1.06), (0.95, 1.0, 1.05)),
+}
+HISTORY_WEIGHTS = (0.5, 0.3, 0.2)
+ROOKIE_FORM = 0.98       # rookie_prospect.wet_race
+ROOKIE_DNF = 1.10        # rookie_prospect.dnf_rate
+ADAPTIVE_BASE = 0.95     # RoundAdaptiveBase with no race or session deltas (its -5% clamp)
+# ReliabilityCalibrationEngine, keyed by team id as the site calls it
+SUPPLIER_COEFFICIENTS = {'ferrari': 0.95, 'mercedes': 0.96}
+HIST_DNF_RATE = 0.15
+
+# ComponentReliability.teams — engine, gearbox, cooling, hybrid per-race failure rates
+COMPONENT_RATES = {
+    'ferrari': (0.015, 0.010, 0.008, 0.012), 'mclaren': (0.012, 0.012, 0.010, 0.014),
+    'mercedes': (0.014, 0.014, 0.012, 0.010), 'red_bull': (0.013, 0.015, 0.010, 0.012),
+    'alpine': (0.020, 0.016, 0.014, 0.018), 'haas': (0.022, 0.018, 0.015, 0.020),
+    'audi': (0.028, 0.020, 0.018, 0.024), 'racing_bulls': (0.024, 0.018, 0.016, 0.020),
+    'williams': (0.022, 0.020, 0.015, 0.018), 'cadillac': (0.030, 0.025, 0.022, 0.028),
+    'aston_martin': (0.040, 0.035, 0.030, 0.038),
+}
+DEFAULT_COMPONENT_RATES = (0.025, 0.020, 0.018, 0.022)
+
+# StrategyEngine.EFF and PitCrewModel.crews (baseTime, sigma, errorRate, perfectRate)
+STRATEGY_EFF = {
+    'ferrari': 0.90, 'mclaren': 0.96, 'mercedes': 0.94, 'red_bull': 0.97, 'alpine': 0.81, 'haas': 0.85,
+    'audi': 0.84, 'racing_bulls': 0.82, 'williams': 0.86, 'cadillac': 0.80, 'aston_martin': 0.76,
+}
+PIT_CREWS = {
+    'ferrari': (2.1, 0.15, 0.03, 0.20), 'mclaren': (2.0, 0.12, 0.02, 0.25),
+    'mercedes': (2.1, 0.14, 0.025, 0.22), 'red_bull': (2.0, 0.10, 0.02, 0.28),
+    'alpine': (2.5, 0.20, 0.05, 0.10), 'haas': (2.6, 0.22, 0.06, 0.08),
+    'audi': (2.7, 0.25, 0.07, 0.06), 'racing_bulls': (2.5, 0.22, 0.05, 0.09),
+    'williams': (2.4, 0.20, 0.045, 0.12), 'cadillac': (2.8, 0.28, 0.08, 0.05),
+    'aston_martin': (3.0, 0.30, 0.10, 0.04),
+}
+DEFAULT_PIT_CREW = (2.7, 0.25, 0.06, 0.06)
+
+# GridRecoveryCurves posRetention, keyed by race['short'] as the site looks it up
+GRID_RETENTION = {
+    'monaco': 0.92, 'singapore': 0.85, 'baku': 0.75, 'jeddah': 0.72, 'las_vegas': 0.70, 'miami': 0.75,
+    'suzuka': 0.82, 'budapest': 0.85, 'zandvoort': 0.88, 'imola': 0.80, 'barcelona': 0.78,
+    'melbourne': 0.76, 'monza': 0.60, 'spa': 0.65, 'spielberg': 0.55, 'bahrain': 0.70,
+    'silverstone': 0.72, 'austin': 0.70, 'shanghai': 0.70, 'interlagos': 0.68, 'lusail': 0.72,
+    'yas_marina': 0.74, 'mexico': 0.70, 'montreal': 0.72, 'default': 0.75,
+}
+
+# TireDegradationModel / FuelMassModel inputs used by the offline pace profile
+TRACK_DEG = {'High': 1.35, 'Medium-High': 1.18, 'Medium': 1.0, 'Low-Medium': 0.85, 'Low': 0.70}
+OVERHEATING_2026 = 1.15
+
+# WeatherEngine.params: noise, dnfMod — index order below
+WEATHER_NAMES = ('dry', 'mixed', 'light_rain', 'wet', 'heavy_rain')
+DRY, MIXED, LIGHT_RAIN, WET, HEAVY_RAIN = range(len(WEATHER_NAMES))
+WEATHER_NOISE = np.array([0.06, 0.15, 0.09, 0.22, 0.35])
+WEATHER_DNF_MOD = np.array([1.0, 1.6, 1.2, 2.2, 3.5])
+RAIN_THRESHOLDS = ((HEAVY_RAIN, 0.15), (WET, 0.45), (LIGHT_RAIN, 0.70), (MIXED, 0.85))
+
+RACE_PHASE = (0.4, 0.8)  # early / late race, picked per sim
+Q2_SIZE, Q3_SIZE = 17, 12
+DNF_TIME = 9999.0
+SHARD = 250              # MonteCarloPool.SHARD: PU grid penalties carry to the next sim within a shard
+
+# MonteCarloEngine.MARKOV_WEIGHT and MarkovLapSimulator
+MARKOV_WEIGHT = 0.3
+MARKOV_PROFILES = {      # (DRS zones, overtake difficulty, per-lap SC probability), keyed by race['short']
+    'bahrain': (2, 0.25, 0.01), 'jeddah': (3, 0.30, 0.025), 'melbourne': (2, 0.45, 0.02),
+    'suzuka': (1, 0.55, 0.015), 'shanghai': (2, 0.30, 0.015), 'miami': (2, 0.35, 0.02),
+    'imola': (1, 0.55, 0.015), 'monaco': (1, 0.92, 0.03), 'montreal': (2, 0.30, 0.025),
+    'barcelona': (1, 0.50, 0.01), 'spielberg': (2, 0.20, 0.015), 'silverstone': (2, 0.35, 0.015),
+    'budapest': (1, 0.65, 0.01), 'spa': (2, 0.25, 0.02), 'zandvoort': (1, 0.70, 0.015),
+    'monza': (2, 0.20, 0.015), 'baku': (2, 0.25, 0.03), 'singapore': (2, 0.55, 0.035),
+    'austin': (2, 0.30, 0.02), 'mexico': (2, 0.25, 0.02), 'interlagos': (2, 0.25, 0.025),
+    'las_vegas': (2, 0.25, 0.02), 'lusail': (2, 0.30, 0.015), 'yas_marina': (2, 0.35, 0.015),
+    'default': (2, 0.40, 0.018),
+}
+# (baseGrip, degRate, cliff, peakLap)
+TIRES = {
+    'medium': (0.97, 0.028, 28, 3), 'hard': (0.93, 0.018, 40, 5),
+    'intermediate': (0.88, 0.035, 25, 2), 'wet': (0.80, 0.020, 35, 3),
+}
+MEDIUM, HARD, INTERMEDIATE, WET_TIRE = range(len(TIRES))
+FUEL_START_KG, FUEL_KG_PER_LAP, FUEL_TIME_PER_KG = 110, 1.55, 0.035
+
+RNG_M = 2147483647
+
+
+def _park_miller_first(seed: int) -> float:
+    """new RNG(seed).next() — WeekendFormEngine's one draw per driver and race."""
+    s = (seed or 1) % RNG_M
+    s = s * 16807 % RNG_M
+    return (s - 1) / (RNG_M - 1)
+
+
+def _stable_seed(race: dict) -> int:
+    """MonteCarloStabilityEngine.generateDeterministicSeed(track_type, round, "unknown", "race")."""
+    track = race.get('track_type')
+    h = 0
+    for ch in f"{'undefined' if track is None else track}-{race['round']}-unknown-race":
+        shifted = ((h << 5) & 0xFFFFFFFF)
+        shifted = shifted - (1 << 32) if shifted >= 1 << 31 else shifted
+        h = (shifted - h + ord(ch)) & 0xFFFFFFFF
+        h = h - (1 << 32) if h >= 1 << 31 else h
+    return abs(h) + 1
+
+
+def _js_round(x: float) -> int:
+    return math.floor(x + 0.5)
+
+
+# ============================================================
+# DRIVER / TEAM TABLE
+# ============================================================
+def load_db(path: Path = DB_PATH) -> dict | None:
+    """The scraper's car DB, or None when it has not been written yet."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _number(v) -> float | None:
+    return float(v) if isinstance(v, (int, float)) and not isinstance(v, bool) else None
+
+
+class DriverTable:
+    """Driver line-up plus per-team rating and reliability, from the car DB when given."""
+
+    def __init__(self, db: dict | None = None):
+        teams = {t['id']: t for t in (db or {}).get('teams', []) if t.get('id')}
+        self.team_rating = {t: BASE_IDX[t] for t in BASE_IDX}
+        self.reliability = {t: 1.0 for t in BASE_IDX}
+
+        seat = {name: tid for tid, t in teams.items() for name in t.get('drivers') or []}
+        if seat:
+            known = {full for _, full, _, _ in DRIVERS}
+            self.drivers = [(d, seat[full], r) for d, full, _, r in DRIVERS if full in seat]
+            self.drivers += [(full.split()[-1].lower(), tid, NEW_DRIVER_RATING)
+                             for full, tid in seat.items() if full not in known]
+        else:
+            self.drivers = [(d, t, r) for d, _, t, r in DRIVERS]
+
+        # Power-to-weight relative to the field, against the same ratio when BASE_IDX was fitted
+        def pw(bhp, kg):
+            return bhp / kg if bhp and kg else None
+        now = {tid: pw(_number(t.get('power_unit', {}).get('total_power_bhp')),
+                       _number(t.get('chassis_aero', {}).get('weight_kg'))) for tid, t in teams.items()}
+        now = {tid: v for tid, v in now.items() if v}
+        if now:
+            base = {tid: pw(bhp, kg) for tid, (bhp, kg, _) in BASE_SPECS.items()}
+            field_now = sum(now.values()) / len(now)
+            field_base = sum(base.values()) / len(base)
+            for tid, v in now.items():
+                if tid in BASE_IDX and tid in base:
+                    self.team_rating[tid] = BASE_IDX[tid] * (v / field_now) / (base[tid] / field_base)
+
+        # Component failure rates scale with the share of races not completed
+        for tid, t in teams.items():
+            pct = _number(t.get('reliability', {}).get('avg_race_completion_pct'))
+            base_pct = BASE_SPECS.get(tid, (None, None, None))[2]
+            if pct is not None and base_pct is not None and tid in self.reliability:
+                lo, hi = RELIABILITY_CLAMP
+                self.reliability[tid] = min(hi, max(lo, (100 - pct) / (100 - base_pct)))
+
+        self.ids = [d for d, _, _ in self.drivers]
+        self.teams = [t for _, t, _ in self.drivers]
+
+
+# ============================================================
+# PER-RACE MODEL (everything that does not depend on a sim's draws)
+# ============================================================
+def _trait(driver_id: str, trait: str) -> float:
+    return SKILLS.get(driver_id, {}).get(trait, 1.0)
+
+
+def _hist(team: str, idx: int) -> float:
+    h = HISTORY.get(team)
+    if not h:
+        return 1.0
+    return max(0.92, min(1.08, sum(v * w for v, w in zip(h[idx], HISTORY_WEIGHTS))))
+
+
+def _aero_pace_delta(gap_ahead: float, speed_trap: float, track_type: str) -> float:
+    """AeroDynamicsRaceModel.getAeroPaceDelta with 2026 active aero."""
+    dirty = drs = 0.0
+    if 0 < gap_ahead < 1.2:
+        dirty = 0.35 if track_type == 'high_speed' else 0.25 if track_type in ('street', 'monaco') else 0.15
+    if 0 < gap_ahead < 1.0:
+        drs = 0.45 if track_type == 'high_speed' else 0.20 if track_type in ('street', 'monaco') else 0.30
+        if speed_trap > 5.0:
+            drs += 0.05
+        drs *= 1.10
+    return dirty - drs
+
+
+def _tire_pace(code: int, laps: int) -> float:
+    """
+    MarkovLapSimulator tirePace at whole laps. _runBatch looks smoothness up under a key the
+    personality table does not have, so every car runs at 1.0.
+    """
+    grip, deg_rate, cliff, peak = list(TIRES.values())[code]
+    if laps <= peak:
+        deg = -0.02 * (peak - laps)
+    elif laps < cliff:
+        deg = deg_rate * (laps - peak) ** 1.15
+    else:
+        deg = deg_rate * (cliff - peak) ** 1.15 + (laps - cliff) * 0.12
+    return grip - min(deg * 0.01, 0.15)
+
+
+class RaceModel:
+    """Per-driver arrays for one race, in DriverTable order."""
+
+    def __init__(self, race: dict, table: DriverTable, total_rounds: int):
+        self.race = race
+        self.stable_seed = _stable_seed(race)
+        n = self.n = len(table.ids)
+        ids, teams = table.ids, table.teams
+        city = (race.get('city') or '').lower()
+        track_type = race.get('track_type')
+        laps = race.get('laps') or 57
+        stops = race.get('strategy_stops') or 1
+        rain = race.get('rain_probability', 0.0)
+        sc_p = race.get('sc_probability', 0.0)
+
+        # PressureEngine on level standings: past 40% of the season everyone is "the leader"
+        risk, error = (0.95, 0.95) if race['round'] > total_rounds * 0.4 else (1.0, 1.0)
+        pers = np.array([PERSONALITY.get(d, DEFAULT_PERSONALITY) for d in ids])
+        aggression, smoothness, _, mistake, overtake_risk, restart = pers.T
+        self.overtake_risk = overtake_risk * risk
+        self.restart = restart
+        self.aggression = aggression                  # incidents use the unpressured value
+        self.aggressive_quali = aggression > 1.05
+        self.rating = np.array([r for _, _, r in table.drivers], dtype=float)
+        self.team_idx = np.unique(teams, return_inverse=True)[1]
+        self.wet_elite = np.array([_trait(d, 'wet') >= 1.06 for d in ids])
+        # No results recorded: everyone has fewer than 3 finishes
+        self.rookie = np.ones(n, dtype=bool)
+
+        # ConfidenceEngine.calc with no races scored
+        conf = 72 - rain * 28 - (sc_p - 0.4) * 18
+        if race.get('confidence_modifier'):
+            conf *= race['confidence_modifier']
+        if track_type == 'monaco':
+            conf -= 10
+        conf = max(28, min(94, _js_round(conf)))
+        self.race_sd = WEATHER_NOISE * (1.2 - conf / 100)
+        self.quali_sd = self.race_sd * 0.6
+
+        # Pace profiles (buildPaceProfile): [weather, late, driver]
+        self.pace = np.empty((len(WEATHER_NAMES), 2, n))
+        self.pace_strategy = np.empty((len(WEATHER_NAMES), 2, n))
+        self.quali_pace = np.empty((len(WEATHER_NAMES), n))
+        self.strategy_chance = np.empty(n)
+        for i, (d, team) in enumerate(zip(ids, teams)):
+            for w, weather in enumerate(WEATHER_NAMES):
+                for late in (0, 1):
+                    base, strat, chance = self._profile(d, team, table, race, bool(late), weather, False)
+                    self.pace[w, late, i], self.pace_strategy[w, late, i] = base, strat
+                self.quali_pace[w, i] = self._profile(d, team, table, race, False, weather, True)[0]
+            self.strategy_chance[i] = chance
+
+        # TrackEvolutionEngine grip, [weather, late]
+        street = any(c in city for c in ('monaco', 'singapore', 'jeddah')) or track_type == 'street_hybrid'
+        hot = any(c in city for c in ('bahrain', 'sakhir', 'miami', 'qatar'))
+        self.grip = np.empty((len(WEATHER_NAMES), 2))
+        for w, weather in enumerate(WEATHER_NAMES):
+            evo = (0.025 if street else 0.012) * (0.3 if weather in ('wet', 'heavy_rain') else 1.0)
+            heat = -0.008 if hot else 0.0
+            for late, phase in enumerate(RACE_PHASE):
+                self.grip[w, late] = 1.0 + evo * phase + heat * phase
+        self.quali_street = street
+
+        # DNFEngine._rates: [weather, late, driver, component]
+        rel = np.array([table.reliability.get(t, 1.0) for t in teams])
+        comp = np.array([COMPONENT_RATES.get(t, DEFAULT_COMPONENT_RATES) for t in teams]) * rel[:, None]
+        hist_rel = np.array([_hist(t, 1) * (1 + HIST_DNF_RATE * 1.8) * SUPPLIER_COEFFICIENTS.get(t, 1.0)
+                             for t in teams])
+        rookie = np.where(self.rookie, ROOKIE_DNF, 1.0)
+        aggr_mod = 1 + (aggression * risk - 1) * 0.5
+        self.dnf_rates = np.empty((len(WEATHER_NAMES), 2, n, 4))
+        for w in range(len(WEATHER_NAMES)):
+            wm = WEATHER_DNF_MOD[w]
+            for late, phase in enumerate(RACE_PHASE):
+                err = mistake * error * (1.0 + (1.0 - phase) * 0.15)
+                self.dnf_rates[w, late] = np.stack([
+                    comp[:, 0] * wm * (2.0 - hist_rel) * rookie,
+                    comp[:, 1] * wm * aggr_mod * rookie,
+                    comp[:, 2] * (wm * 1.3 if wm > 1.5 else wm),
+                    comp[:, 3] * wm * err,
+                ], axis=1)
+
+        # Dirty air / DRS for pole (clear air) and for everyone else (0.8s behind)
+        speed_trap = (aggression * risk - 1.0) * 10
+        self.aero_pole = np.array([_aero_pace_delta(5.0, s, track_type) for s in speed_trap])
+        self.aero_pack = np.array([_aero_pace_delta(0.8, s, track_type) for s in speed_trap])
+        retention = GRID_RETENTION.get(race.get('short'), GRID_RETENTION['default'])
+        pos = np.arange(max(n, 22))
+        self.grid_curve = (pos / 21) ** 1.4 * retention * 0.12
+
+        # StrategyEngine.getDelta inputs
+        self.eff = np.array([STRATEGY_EFF.get(t, 0.83) for t in teams])
+        deg_mod = {'High': 1.4, 'Low': 0.7}.get(race.get('tire_deg'), 1.0)
+        self.tire_penalty = (1.2 - smoothness) * deg_mod * 2.5
+        self.crew = np.array([PIT_CREWS.get(t, DEFAULT_PIT_CREW) for t in teams]).T
+        self.stops = stops
+        self.gamble = self.overtake_risk > 1.1
+
+        # Incident chance between two drivers before the wet multiplier and the 4% cap
+        agg = aggression - 1.0
+        self.collision = 0.005 + (agg[:, None] + agg[None, :]) * 0.04
+        self.collision *= np.where(self.team_idx[:, None] == self.team_idx[None, :], 0.4, 1.0)
+
+        # Markov race
+        zones, difficulty, sc_lap = MARKOV_PROFILES.get(race.get('short'), MARKOV_PROFILES['default'])
+        self.mk_zones, self.mk_difficulty = zones, difficulty
+        self.mk_sc = sc_lap * ((race.get('sc_probability') or 0.4) / 0.4)
+        self.mk_laps = laps
+        self.mk_pit_lap = math.floor(laps * 0.4)
+        self.mk_grip = np.array([[_tire_pace(c, l) for l in range(laps + 2)] for c in range(len(TIRES))])
+
+    @staticmethod
+    def _profile(d: str, team: str, table: DriverTable, race: dict, late: bool, weather: str,
+                 quali: bool) -> tuple[float, float, float]:
+        """buildPaceProfile → (base, base with a won strategy roll, strategy roll chance)."""
+        city = (race.get('city') or '').lower()
+        name = (race.get('name') or '').lower()
+        track_type = race.get('track_type')
+        laps = race.get('laps') or 57
+        stops = race.get('strategy_stops') or 1
+
+        form = 0.96 + _park_miller_first(race['round'] * 313 + len(d) * 11) * 0.09
+        form = max(0.95, min(1.06, form)) * ROOKIE_FORM
+        rolling = table.team_rating.get(team, BASE_IDX.get(team) or 50) * _hist(team, 0) * ADAPTIVE_BASE
+
+        def t(k):
+            return _trait(d, k)
+        spec = 1.0
+        if 'monaco' in city or 'singapore' in city:
+            spec *= (t('qualifying') * 1.5 + t('street') * 1.5 + t('consistency')) / 4
+        elif 'hungary' in name or 'budapest' in city or 'zandvoort' in city:
+            spec *= (t('qualifying') * 1.2 + t('tire') * 1.2 + t('consistency')) / 3.4
+        elif 'spa' in city or 'suzuka' in city or 'silverstone' in city:
+            spec *= (t('high_speed') * 1.5 + t('technical') * 1.2) / 2.7
+        else:
+            if track_type == 'technical':
+                spec *= t('technical')
+            if track_type in ('street_hybrid', 'monaco') or 'street' in name:
+                spec *= (t('street') + t('racecraft')) / 2
+            if track_type == 'power':
+                spec *= t('high_speed')
+            if race.get('tire_deg') in ('High', 'Medium-High'):
+                spec *= t('tire')
+            if race.get('overtaking') in ('Low', 'Very Low'):
+                spec *= (t('qualifying') + t('racecraft')) / 2
+        if weather in ('wet', 'mixed', 'light_rain', 'heavy_rain'):
+            spec *= t('wet') * 1.3
+        spec = max(0.85, min(1.15, spec))
+
+        dominance = 1.0
+        where = f"{race.get('short') or ''} {city} {name}"
+        if any(track in where for track in DOMINANCE.get(d, ())):
+            dominance = 1.05
+            if spec * dominance > 1.15:
+                dominance = 1.15 / spec
+
+        cf = CLUTCH.get(d, 1.0)
+        clutch = cf if late else 1.0 + (cf - 1.0) * 0.5
+        if quali:
+            clutch *= t('qualifying')
+        rating = next(r for i, _, r in table.drivers if i == d)
+        skill = rating / 100 * spec * clutch * form * dominance
+
+        power_track = track_type == 'power' or race.get('downforce') == 'Low'
+        mguk = max(0.96, 1.0 - (1.0 - MGUK_RECOVERY.get(team, 0.88)) * 0.5) if power_track else 1.0
+        car = (rolling / 100 * mguk * ((race.get('team_mult') or {}).get(team) or 1.0)
+               * ((race.get('driver_specials') or {}).get(d) or 1.0))
+        eff = AERO_EFFICIENCY.get(team, 0.88)
+        aero = {'technical': 1.0 + (eff - 0.88) * 0.6, 'street_hybrid': 1.0 + (eff - 0.88) * 0.3}.get(track_type, 1.0)
+        base = skill * 0.40 + (0.65 + car * 0.35) * 0.42 + aero * spec * 0.18
+        if quali:
+            return base, base, 0.0
+
+        # StrategyWindowModel undercut (medium → hard at 35°C), weighted by pit wall efficiency
+        tire_laps = max(5, laps // (stops + 1))
+        undercut = (0.85 + (35 - 30) * 0.01 + 0.8) - (0.05 + tire_laps * 0.003)
+        success = 0.85 if undercut > 1.5 else 0.65 if undercut > 0.5 else 0.50 if undercut > 0 else 0.20
+        chance = success * STRATEGY_EFF.get(team, 0.85)
+
+        smooth = PERSONALITY[d][1] if d in PERSONALITY else 1.0
+        stint = math.floor(laps / (stops + 1) * 0.6)
+        tire_loss = ((0.008 + stint * 0.003) * (1 + (35 - 33) * 0.015) * TRACK_DEG.get(race.get('tire_deg') or 'Medium', 1.0)
+                     / smooth * OVERHEATING_2026 * (1 + 50 / 500))
+        tire_mod = min(0.4, max(0.0, tire_loss)) * 0.05
+        mid = math.floor(laps * 0.5)
+        burned = 75.0 - max(0.0, 75.0 - mid * 1.4)
+        fuel_mod = min(burned * 0.00022, mid * 0.03) * 0.01
+
+        def finish(p):
+            return p - tire_mod * 0.15 + fuel_mod * 0.2 + 50 * 0.022 * 0.0005
+        return finish(base), finish(base + 0.003), chance
+
+
+# ============================================================
+# SIMULATION
+# ============================================================
+def _qualify(m: RaceModel, weather: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """QualifyingEngine.simulate → driver index per grid slot, (sims, drivers)."""
+    b, n = len(weather), m.n
+    traffic, yellow = (0.18, 0.06) if m.quali_street else (0.08, 0.03)
+    improve = 0.55 + m.rating / 100 * 0.2
+
+    def session(evo, entrants):
+        pace = m.quali_pace[weather] + rng.standard_normal((b, n)) * m.quali_sd[weather][:, None]
+        pace *= evo
+        pace -= np.where(rng.random((b, n)) < traffic, rng.uniform(0.005, 0.02, (b, n)), 0.0)
+        pace += np.where(rng.random((b, n)) < improve, rng.uniform(0.002, 0.008, (b, n)), 0.0)
+        pace -= np.where(rng.random((b, n)) < yellow, rng.uniform(0.015, 0.04, (b, n)), 0.0)
+        rookie_slip = m.rookie & (rng.random((b, n)) < 0.12)
+        lock_up = ~rookie_slip & m.aggressive_quali & (rng.random((b, n)) < 0.06)
+        pace -= np.where(rookie_slip, rng.uniform(0.01, 0.03, (b, n)),
+                         np.where(lock_up, rng.uniform(0.005, 0.015, (b, n)), 0.0))
+        if entrants is not None:
+            pace = np.where(entrants, pace, -np.inf)
+        return np.argsort(-pace, axis=1, kind='stable')
+
+    def top(order, k):
+        mask = np.zeros((b, n), dtype=bool)
+        np.put_along_axis(mask, order[:, :k], True, axis=1)
+        return mask
+
+    q2_evo, q3_evo = (1.012, 1.022) if m.quali_street else (1.006, 1.012)
+    q1 = session(1.0, None)
+    q2 = session(q2_evo, top(q1, Q2_SIZE))
+    q3 = session(q3_evo, top(q2, Q3_SIZE))
+    return np.concatenate([q3[:, :Q3_SIZE], q2[:, Q3_SIZE:Q2_SIZE], q1[:, Q2_SIZE:]], axis=1)
+
+
+def _markov(m: RaceModel, grid: np.ndarray, base_pace: np.ndarray, weather: np.ndarray,
+            rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """MarkovLapSimulator.simulateBatch for every sim → (finishing order, DNF by driver)."""
+    b, n = grid.shape
+    weather_mod = np.where(weather == WET, 0.92, np.where(weather == MIXED, 0.96, 1.0))
+    wet = weather == WET
+    wet_prob = np.where(wet, 0.6, 1.0)
+    wet_phys = np.where(wet, 0.7, np.where(weather == MIXED, 0.85, 1.0))
+    # Every car starts on the same compound and pits on the same lap, so tire age is per sim:
+    # the fresher-tire and tire-delta overtake terms never apply
+    compound = np.where(weather == HEAVY_RAIN, WET_TIRE, np.where(weather == LIGHT_RAIN, INTERMEDIATE, MEDIUM))
+    laps_on_tire = 0
+    # Car state is position-major (positions × sims) and kept in running order, which starts
+    # as grid order; slot is each car's grid slot
+    slot = np.repeat(np.arange(n)[:, None], b, axis=1)
+    base = base_pace.T.copy()
+    total = np.zeros((n, b))
+    dnf = np.zeros((n, b), dtype=bool)
+    dnf_lap = np.zeros((n, b))
+    alive = np.full(b, n)
+    sc_active = np.zeros(b, dtype=bool)
+    sc_left = np.zeros(b, dtype=np.int64)
+    fuel = FUEL_START_KG
+    zones, difficulty = m.mk_zones, m.mk_difficulty
+    laps = m.mk_laps
+    pairs = np.arange(1, n)[:, None]
+
+    for lap in range(1, laps + 1):
+        start = ~sc_active & (rng.random(b) < m.mk_sc)
+        sc_left = np.where(start, np.floor(rng.random(b) * 4).astype(np.int64) + 2, sc_left)
+        sc_active |= start
+        sc_left -= sc_active
+        sc_active &= sc_left > 0
+
+        fuel = max(0.0, fuel - FUEL_KG_PER_LAP)
+        fuel_term = (FUEL_START_KG - fuel) * FUEL_TIME_PER_KG * 0.001
+        if lap == m.mk_pit_lap:
+            compound[:] = HARD
+            laps_on_tire = 0
+        laps_on_tire += 1
+        grip = m.mk_grip[compound, laps_on_tire] * weather_mod
+        lap_time = np.where(sc_active, 1.4, 2 - base * grip + fuel_term + (rng.random((n, b)) - 0.5) * 0.015)
+        total += np.where(dnf, 0.0, lap_time)
+
+        # Overtakes in running order, pair by pair from the front (green-flag laps only).
+        # Pairs are fixed at the start of the lap; only the totals change as they resolve.
+        perm = np.argsort(np.where(dnf, np.inf, total), axis=0, kind='stable')
+        total, lap_time = np.take_along_axis(total, perm, axis=0), np.take_along_axis(lap_time, perm, axis=0)
+        base, slot = np.take_along_axis(base, perm, axis=0), np.take_along_axis(slot, perm, axis=0)
+        dnf, dnf_lap = np.take_along_axis(dnf, perm, axis=0), np.take_along_axis(dnf_lap, perm, axis=0)
+        pace_delta = lap_time[:-1] - lap_time[1:]
+        attempt = ~sc_active & (pace_delta > 0) & (pairs < alive)
+        # Gap-independent parts of the blended chance, per pair
+        pace_term = np.minimum(0.20, pace_delta * 1.8)
+        base_prob = 0.08 + pace_delta * 2.5
+        draw = rng.random((n - 1, b))
+        scrap_draw = rng.random((n - 1, b))
+        for i in np.flatnonzero(attempt.any(axis=1)):
+            a = attempt[i]
+            t_a, t_b = total[i], total[i + 1]
+            gap = t_b - t_a
+            drs = (gap > 0) & (gap < 1.0)
+
+            prob = (base_prob[i] + np.where(drs, 0.12 * zones, 0.0)) * (1 - difficulty) * wet_prob
+            # OvertakePhysicsEngine.calculateOvertakeProbability, blended 50/50
+            phys = pace_term[i] + np.where(drs, np.minimum(0.55, 0.15 * zones + np.maximum(0.0, (1 - gap) * 0.15)), 0.0)
+            phys += np.where(gap < 0.5, 0.10, np.where(gap < 1.0, 0.05, 0.0))
+            phys *= (1 - difficulty * 0.7) * wet_phys
+            phys = np.clip(phys * 1.15 * 1.25, 0.005, 0.65)   # lapsRemaining is never set, so it reads 0
+            prob = np.clip((prob + phys) / 2, 0.01, 0.65)
+
+            passed = a & (draw[i] < prob)
+            # A failed attempt costs the leader 0.5-2.0s 1.5% of the time; the draw under 0.015,
+            # rescaled, is the uniform for the size of the loss
+            scrap = a & ~passed & (gap < 0.5) & (scrap_draw[i] < 0.015)
+            total[i] = np.where(passed, t_b + 0.3, t_a) + np.where(scrap, 0.5 + scrap_draw[i] / 0.015 * 1.5, 0.0)
+            total[i + 1] = np.where(passed, t_a, t_b)
+
+        retire = ~dnf & (rng.random((n, b)) < 0.0008 + (0.0004 if lap / laps > 0.7 else 0.0))
+        dnf |= retire
+        dnf_lap = np.where(retire, lap, dnf_lap)
+        total = np.where(retire, 99999.0, total)
+        alive -= retire.sum(axis=0)
+
+    # Finishers by total time, then retirements by lap, grid slot breaking ties
+    key = np.where(dnf, 1e12 + dnf_lap, total)
+    order = np.lexsort((slot, key), axis=0)
+    finish = np.take_along_axis(grid, np.take_along_axis(slot, order, axis=0).T, axis=1)
+    out = np.zeros((b, n), dtype=bool)
+    np.put_along_axis(out, finish, np.take_along_axis(dnf, order, axis=0).T, axis=1)
+    return finish, out
+
+
+def simulate_batch(m: RaceModel, first_sim: int, n_sims: int, rng: np.random.Generator) -> dict:
+    """
+    Run sims [first_sim, first_sim + n_sims) of one race. Returns the standard model's and the
+    Markov race's finishing orders (sims × positions → driver index), their DNF masks
+    (sims × drivers) and each sim's weather bucket.
+    """
+    race, n, b = m.race, m.n, n_sims
+    rows = np.arange(b)[:, None]
+    rain = race.get('rain_probability', 0.0)
+    sc_p = race.get('sc_probability', 0.0)
+
+    # The weather roll is the first draw of sim i's stream, seeded stable_seed + i. Consecutive
+    # seeds give nearly equal first draws, so the site's weather mix depends on which sims a
+    # round runs; it is reproduced exactly rather than sampled.
+    seeds = (m.stable_seed + first_sim + np.arange(b, dtype=np.int64)) % RNG_M
+    u = (seeds * 16807 % RNG_M - 1) / (RNG_M - 1)
+    weather = np.full(b, DRY)
+    for w, share in reversed(RAIN_THRESHOLDS):
+        weather[u < rain * share] = w
+
+    # Component failures; an engine failure books a 5-10 place drop for the next sim's grid
+    late = (rng.random(b) > 0.6).astype(np.int64)
+    fails = rng.random((b, n, 4)) < m.dnf_rates[weather, late]
+    out = fails.any(axis=2)
+    drop = np.where(fails[:, :, 0], np.floor(rng.uniform(5, 11, (b, n))), 0.0)
+    penalty = np.zeros((b, n))
+    penalty[1:] = drop[:-1]
+    penalty[(first_sim + np.arange(b)) % SHARD == 0] = 0.0
+
+    grid = _qualify(m, weather, rng)
+    slot_pos = np.arange(1, n + 1) + np.take_along_axis(penalty, grid, axis=1)
+    grid = np.take_along_axis(grid, np.argsort(np.minimum(22, slot_pos), axis=1, kind='stable'), axis=1)
+    grid_pos = np.empty((b, n))
+    np.put_along_axis(grid_pos, grid, np.arange(1, n + 1, dtype=float)[None, :], axis=1)
+
+    sc = rng.random(b) < sc_p
+    sc_chaos = np.where(sc, rng.uniform(0.05, 0.25, b), 0.0)
+    upset_rate = 0.05 + rain * 0.05 + sc_p * 0.05 + np.where(weather == HEAVY_RAIN, 0.15, 0.0)
+    chaos = rng.random(b) < upset_rate
+
+    # calculatePace, per driver
+    strat = rng.random((b, n)) < m.strategy_chance
+    pace = np.where(strat, m.pace_strategy[weather, late], m.pace[weather, late])
+    pace += rng.standard_normal((b, n)) * m.race_sd[weather][:, None]
+    pace *= m.grip[weather, late][:, None]
+    pace -= np.where((weather == HEAVY_RAIN)[:, None] & m.wet_elite, 0.05, 0.0)
+
+    dirty_air = np.where(grid_pos == 1, m.aero_pole, m.aero_pack)
+    grid_penalty = m.grid_curve[grid_pos.astype(np.int64) - 1] / m.overtake_risk
+    sc_effect = -(grid_pos / 20) * sc_chaos[:, None]
+    upset = np.where(chaos[:, None] & (rng.random((b, n)) < 0.2), rng.uniform(0.05, 0.25, (b, n)), 0.0)
+
+    # StrategyEngine.getDelta with PitCrewModel stops
+    base_time, sigma, err, perfect = (c[None, :] for c in m.crew)
+    pit = np.zeros((b, n))
+    for _ in range(m.stops):
+        stop = np.maximum(1.8, base_time + rng.standard_normal((b, n)) * sigma)
+        stop += np.where(rng.random((b, n)) < err, rng.uniform(1.5, 5.0, (b, n)), 0.0)
+        unsafe = rng.random((b, n)) < err * 0.3
+        stop += np.where(unsafe, 5.0, 0.0)
+        quick = ~unsafe & (rng.random((b, n)) < perfect)
+        pit += np.where(quick, np.minimum(stop, 1.9 + rng.random((b, n)) * 0.15), stop)
+    strategy = (1 - m.eff) * 5 + rng.standard_normal((b, n)) * (1 - m.eff) * 2
+    strategy += np.where(m.gamble, rng.standard_normal((b, n)) * 4, 0.0)
+    strategy -= np.where(rng.random((b, n)) < 0.05 * m.eff, rng.uniform(3, 8, (b, n)), 0.0)
+    strategy += m.tire_penalty + (pit - m.stops * 2.2) * 0.8
+
+    time = (2 - np.maximum(0.1, pace - dirty_air)) + grid_penalty + sc_effect + strategy / 50 - upset
+    time = np.where(out, DNF_TIME + rng.random((b, n)), time)
+
+    # Safety-car restart: finishers gain or lose on their restart skill
+    restart = rng.standard_normal((b, n)) * (m.restart - 1.0) * 0.4
+    time -= np.where(sc[:, None] & ~out, restart, 0.0)
+
+    # To grid-slot order, so stable sorts break ties by slot as _sortSlots does
+    time = np.take_along_axis(time, grid, axis=1)
+    order = np.argsort(time, axis=1, kind='stable')
+    t = np.take_along_axis(time, order, axis=1)
+    drv = np.take_along_axis(grid, order, axis=1)
+
+    # RivalryEngine incidents between adjacent finishers, front to back
+    wet_mult = np.where((weather == WET) | (weather == HEAVY_RAIN), 1.6, 1.0)
+    for k in range(n - 1):
+        t1, t2 = t[:, k], t[:, k + 1]
+        close = (t1 <= 9900) & (t2 <= 9900) & (t2 - t1 < 0.015)
+        if not close.any():
+            continue
+        d1, d2 = drv[:, k], drv[:, k + 1]
+        hit = close & (rng.random(b) < np.minimum(0.04, m.collision[d1, d2] * wet_mult))
+        severity = rng.random(b)
+        crash = hit & (severity < 0.3)
+        second_out = crash & (m.aggression[d2] > m.aggression[d1])
+        first_out = crash & ~second_out
+        t[:, k] = np.where(first_out, DNF_TIME + rng.random(b), t1)
+        t[:, k + 1] = np.where(second_out, DNF_TIME + rng.random(b), t2)
+        out[rows[:, 0], d1] |= first_out
+        out[rows[:, 0], d2] |= second_out
+        t[:, k + 1] += np.where(hit & (severity >= 0.3) & (severity < 0.6), rng.uniform(0.05, 0.15, b), 0.0)
+        t[:, k + 1] += np.where(hit & (severity >= 0.6), rng.uniform(0.01, 0.04, b), 0.0)
+
+    final = np.argsort(t, axis=1, kind='stable')
+    std_order = np.take_along_axis(drv, final, axis=1)
+    std_time = np.take_along_axis(t, final, axis=1)
+
+    # Markov race: grid order, pace from each driver's standard-model time
+    by_driver = np.empty((b, n))
+    np.put_along_axis(by_driver, std_order, std_time, axis=1)
+    mk_order, mk_dnf = _markov(m, grid, 2 - np.take_along_axis(by_driver, grid, axis=1), weather, rng)
+
+    return {'order': std_order, 'dnf': out, 'markov_order': mk_order, 'markov_dnf': mk_dnf, 'weather': weather}
+
+
+def simulate_round(race: dict, sims: int = DEFAULT_SIMS, table: DriverTable | None = None,
+                   total_rounds: int = 24, batch: int = BATCH_SIMS) -> dict:
+    """Aggregate wins/podiums/finishes/DNFs and a drivers × positions histogram for one round."""
+    table = table or DriverTable()
+    m = RaceModel(race, table, total_rounds)
+    n_drv = m.n
+    rng = np.random.default_rng(race['round'])
+    std = np.zeros((n_drv, n_drv))
+    mk = np.zeros((n_drv, n_drv))
+    dnfs = np.zeros(n_drv)
+    weather = np.zeros(len(WEATHER_NAMES), dtype=np.int64)
+
+    def histogram(order):
+        # hist[driver, position] += 1 for every (sim, position)
+        flat = order * n_drv + np.arange(n_drv)
+        return np.bincount(flat.ravel(), minlength=n_drv * n_drv).reshape(n_drv, n_drv)
+
+    for start in range(0, sims, batch):
+        res = simulate_batch(m, start, min(batch, sims - start), rng)
+        std += histogram(res['order'])
+        mk += histogram(res['markov_order'])
+        dnfs += res['dnf'].sum(axis=0) + MARKOV_WEIGHT * res['markov_dnf'].sum(axis=0)
+        weather += np.bincount(res['weather'], minlength=len(WEATHER_NAMES))
+
+    # Every sim counts 70% standard model, 30% its Markov race; standard DNFs count in full
+    hist = std * (1 - MARKOV_WEIGHT) + mk * MARKOV_WEIGHT
+    positions = np.arange(1, n_drv + 1)
+    return {
+        'round': race['round'],
+        'name': race.get('name'),
+        'sims': sims,
+        'weather': {name: int(n) for name, n in zip(WEATHER_NAMES, weather)},
+        'drivers': [
+            {
+                'id': table.ids[i],
+                'team': table.teams[i],
+                'wins': round(float(hist[i, 0]), 2),
+                'podiums': round(float(hist[i, :3].sum()), 2),
+                'dnfs': round(float(dnfs[i]), 2),
+                'finish_sum': round(float(hist[i] @ positions), 2),
+                'win_pct': round(hist[i, 0] / sims * 100, 3),
+                'podium_pct': round(hist[i, :3].sum() / sims * 100, 3),
+                'dnf_pct': round(dnfs[i] / sims * 100, 3),
+                'avg_finish': round(float(hist[i] @ positions) / sims, 3),
+                'positions': [round(float(v), 1) for v in hist[i]],
+            }
+            for i in range(n_drv)
+        ],
+    }
+
+
+def simulate_season(calendar: dict, sims: int = DEFAULT_SIMS, rounds: list[int] | None = None,
+                    table: DriverTable | None = None) -> dict:
+    table = table or DriverTable()
+    all_races = calendar.get('races', [])
+    races = [r for r in all_races if rounds is None or r['round'] in rounds]
+    return {
+        'generated': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'season': calendar.get('season'),
+        'model': 'MonteCarloEngine._runBatch (MonteCarloWorker.js), NumPy port',
+        'seed': 'numpy default_rng(round)',
+        'sims_per_round': sims,
+        'team_ratings': {t: round(r, 2) for t, r in table.team_rating.items()},
+        'rounds': [simulate_round(race, sims, table, len(all_races) or 24) for race in races],
+    }
+
+
+def write_predictions(calendar_path: Path = CALENDAR_PATH, out_path: Path = SIM_OUTPUT_PATH,
+                      sims: int = DEFAULT_SIMS, rounds: list[int] | None = None,
+                      db_path: Path = DB_PATH) -> dict:
+    with open(calendar_path, encoding='utf-8') as f:
+        calendar = json.load(f)
+    result = simulate_season(calendar, sims, rounds, DriverTable(load_db(db_path)))
+    tmp = out_path.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False)
+    tmp.replace(out_path)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorised headless Monte Carlo (MonteCarloEngine._runBatch model)")
+    parser.add_argument('--sims', type=int, default=DEFAULT_SIMS, help='Simulations per round')
+    parser.add_argument('--round', type=int, action='append', help='Only these rounds (repeatable)')
+    parser.add_argument('--db', type=Path, default=DB_PATH, help='Car DB the team ratings are derived from')
+    parser.add_argument('--out', type=Path, default=SIM_OUTPUT_PATH, help='Output JSON path')
+    args = parser.parse_args()
+
+    t0 = datetime.now()
+    result = write_predictions(out_path=args.out, sims=args.sims, rounds=args.round, db_path=args.db)
+    secs = (datetime.now() - t0).total_seconds()
+    print(f"{len(result['rounds'])} rounds × {args.sims} sims in {secs:.2f}s → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Database journal: journaled and plain runs against the same files."""
+import json
+import shutil
+from pathlib import Path
+
+import scraper
+
+DB_SOURCE = Path(scraper.DB_PATH)
+
+
+def _db(tmp_path, journal):
+    return scraper.Database(tmp_path / 'f1_2026_cars.json', journal=journal)
+
+
+def _bhp(db, team_id='alpine'):
+    return db.get_team(team_id)['power_unit']['total_power_bhp']
+
+
+def test_plain_save_after_journaled_save_is_not_undone(tmp_path):
+    shutil.copy(DB_SOURCE, tmp_path / 'f1_2026_cars.json')
+
+    journaled = _db(tmp_path, journal=True)
+    journaled.load()
+    journaled.update_team('alpine', {'power_unit': {'total_power_bhp': 999}})
+    journaled.save(journaled.get_data())
+
+    plain = _db(tmp_path, journal=False)
+    plain.load()
+    assert _bhp(plain) == 999   # a plain load sees the journaled write
+    plain.update_team('alpine', {'power_unit': {'total_power_bhp': 850}})
+    plain.save(plain.get_data())
+
+    for journal in (True, False):
+        db = _db(tmp_path, journal=journal)
+        db.load()
+        assert _bhp(db) == 850
+
+    # journaling continues after the folded entries, and as_of() still sees the history
+    journaled = _db(tmp_path, journal=True)
+    journaled.load()
+    journaled.update_team('alpine', {'power_unit': {'total_power_bhp': 900}})
+    journaled.save(journaled.get_data())
+    reloaded = _db(tmp_path, journal=False)
+    reloaded.load()
+    assert _bhp(reloaded) == 900
+    seqs = [e['seq'] for e in reloaded.journal_entries()]
+    assert seqs == sorted(set(seqs))
+    assert reloaded.as_of(1)['teams'][reloaded._index['alpine']]['power_unit']['total_power_bhp'] == 999
+
+
+def test_plain_save_records_folded_seq(tmp_path):
+    shutil.copy(DB_SOURCE, tmp_path / 'f1_2026_cars.json')
+    journaled = _db(tmp_path, journal=True)
+    journaled.load()
+    journaled.update_team('alpine', {'power_unit': {'total_power_bhp': 999}})
+    journaled.save(journaled.get_data())
+
+    plain = _db(tmp_path, journal=False)
+    plain.load()
+    plain.save(plain.get_data())
+    with open(tmp_path / 'f1_2026_cars.json', encoding='utf-8') as f:
+        assert json.load(f)['meta']['journal_seq'] == 1